@@ -43,6 +43,18 @@ bool is_switch_required(const RTDevice& curr_device, const RTDevice& engine_devi
   return false;
 }
 
+// Returns the memory format of Torch tensors bound to an engine input or output of the given format
+at::MemoryFormat get_memory_format(nvinfer1::TensorFormat format) {
+  switch (format) {
+    case nvinfer1::TensorFormat::kHWC:
+      return at::MemoryFormat::ChannelsLast;
+    case nvinfer1::TensorFormat::kDHWC:
+      return at::MemoryFormat::ChannelsLast3d;
+    default:
+      return at::MemoryFormat::Contiguous;
+  }
+}
+
 RTDevice select_rt_device(const RTDevice& engine_device, const RTDevice& curr_device, bool hardware_compatible) {
   auto new_target_device_opt = get_most_compatible_device(engine_device, curr_device, hardware_compatible);
 
@@ -143,7 +155,9 @@ std::vector<at::Tensor> execute_engine(std::vector<at::Tensor> inputs, c10::intr
       auto shape = core::util::toVec(dims);
       LOG_DEBUG("Input Name: " << name << " Shape: " << dims);
       compiled_engine->exec_ctx->setInputShape(name.c_str(), dims);
-      compiled_engine->exec_ctx->setTensorAddress(name.c_str(), inputs[i].view(shape).contiguous().data_ptr());
+      // Inputs are reformatted only if they are not in the format of the engine
+      auto format = get_memory_format(compiled_engine->exec_ctx->getEngine().getTensorFormat(name.c_str()));
+      compiled_engine->exec_ctx->setTensorAddress(name.c_str(), inputs[i].view(shape).contiguous(format).data_ptr());
     }
 
     TORCHTRT_CHECK(
@@ -167,7 +181,8 @@ std::vector<at::Tensor> execute_engine(std::vector<at::Tensor> inputs, c10::intr
       LOG_DEBUG("Output Name: " << name << " Shape: " << out_shape);
       auto dims = core::util::toVec(out_shape);
       auto type = util::TRTDataTypeToScalarType(compiled_engine->exec_ctx->getEngine().getTensorDataType(name.c_str()));
-      outputs[pyt_idx] = std::move(at::empty(dims, {at::kCUDA}).to(type).contiguous());
+      auto format = get_memory_format(compiled_engine->exec_ctx->getEngine().getTensorFormat(name.c_str()));
+      outputs[pyt_idx] = std::move(at::empty(dims, {at::kCUDA}).to(type).contiguous(format));
       compiled_engine->exec_ctx->setTensorAddress(name.c_str(), outputs[pyt_idx].data_ptr());
     }
   }
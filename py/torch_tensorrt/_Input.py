@@ -325,6 +325,15 @@ class Input(object):
             for t in ts
         ]
 
+    def _to_example_format(self, t: torch.Tensor) -> torch.Tensor:
+        """Lays out an example tensor in the memory format of the Input, so it is traced in that format"""
+        torch_format = self.format.try_to(torch.memory_format)
+        if (torch_format == torch.channels_last and t.dim() == 4) or (
+            torch_format == torch.channels_last_3d and t.dim() == 5
+        ):
+            return t.to(memory_format=torch_format)
+        return t
+
     def example_tensor(
         self, optimization_profile_field: Optional[str] = None
     ) -> torch.Tensor:
@@ -344,8 +353,10 @@ class Input(object):
                 )
             else:
                 if isinstance(self.shape, tuple):
-                    return torch.rand(self.shape).to(
-                        dtype=self.dtype.to(torch.dtype, use_default=True)
+                    return self._to_example_format(
+                        torch.rand(self.shape).to(
+                            dtype=self.dtype.to(torch.dtype, use_default=True)
+                        )
                     )
                 else:
                     RuntimeError(
@@ -364,8 +375,10 @@ class Input(object):
                     )
 
                 if isinstance(self.shape, dict):
-                    return torch.rand(self.shape[optimization_profile_field]).to(
-                        dtype=self.dtype.to(torch.dtype, use_default=True)
+                    return self._to_example_format(
+                        torch.rand(self.shape[optimization_profile_field]).to(
+                            dtype=self.dtype.to(torch.dtype, use_default=True)
+                        )
                     )
                 else:
                     raise RuntimeError(
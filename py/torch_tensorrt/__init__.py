@@ -1,8 +1,9 @@
 import ctypes
+import importlib
 import os
 import platform
 import sys
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from torch_tensorrt._version import (  # noqa: F401
     __cuda_version__,
@@ -123,14 +124,35 @@ from torch_tensorrt._enums import (  # noqa: F401
 from torch_tensorrt._Input import Input  # noqa: F401
 from torch_tensorrt.runtime import *  # noqa: F403
 
-if ENABLED_FEATURES.torchscript_frontend:
-    from torch_tensorrt import ts
 
-if ENABLED_FEATURES.fx_frontend:
-    from torch_tensorrt import fx
+# Frontends and the compilation API are imported on first access, since importing
+# them loads torch._dynamo and registers every converter, which is only needed
+# to compile a model and not to load and run a compiled one
+_LAZY_SUBMODULES = {
+    "ts": ENABLED_FEATURES.torchscript_frontend,
+    "fx": ENABLED_FEATURES.fx_frontend,
+    "dynamo": ENABLED_FEATURES.dynamo_frontend,
+}
+_LAZY_ATTRIBUTES = {
+    "compile": "torch_tensorrt._compile",
+    "convert_method_to_trt_engine": "torch_tensorrt._compile",
+    "save": "torch_tensorrt._compile",
+    "load": "torch_tensorrt._compile",
+}
 
-if ENABLED_FEATURES.dynamo_frontend:
-    from torch_tensorrt.dynamo import backend  # noqa: F401
-    from torch_tensorrt import dynamo  # noqa: F401
 
-from torch_tensorrt._compile import *  # noqa: F403
+def __getattr__(name: str) -> Any:
+    if _LAZY_SUBMODULES.get(name, False):
+        return importlib.import_module(f"torch_tensorrt.{name}")
+
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    lazy_names = [name for name, enabled in _LAZY_SUBMODULES.items() if enabled]
+    return sorted(set(globals()) | set(lazy_names) | set(_LAZY_ATTRIBUTES))
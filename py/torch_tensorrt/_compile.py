@@ -3,33 +3,20 @@ from __future__ import annotations
 import collections.abc
 import logging
 from enum import Enum
-from typing import Any, Callable, List, Optional, Sequence, Set
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Set
 
 import torch
 import torch.fx
+import torch_tensorrt
 from torch_tensorrt._enums import dtype
 from torch_tensorrt._features import ENABLED_FEATURES
 from torch_tensorrt._Input import Input
-from torch_tensorrt.dynamo import _defaults
-from torch_tensorrt.fx import InputTensorSpec
-from torch_tensorrt.fx.lower import compile as fx_compile
-from torch_tensorrt.fx.utils import LowerPrecision
 from typing_extensions import TypeGuard
 
-if ENABLED_FEATURES.torchscript_frontend:
-    import torch_tensorrt.ts
-    from torch_tensorrt.ts._compiler import compile as torchscript_compile
-    from torch_tensorrt.ts._compiler import (
-        convert_method_to_trt_engine as ts_convert_method_to_trt_engine,
-    )
-
-if ENABLED_FEATURES.dynamo_frontend:
-    from torch._export import ExportedProgram
-    from torch_tensorrt.dynamo._compiler import compile as dynamo_compile
-    from torch_tensorrt.dynamo._compiler import (
-        convert_module_to_trt_engine as dynamo_convert_module_to_trt_engine,
-    )
-    from torch_tensorrt.dynamo._tracer import trace as dynamo_trace
+# The frontends are imported when a module is compiled for them, so that saving and
+# loading compiled modules does not load the compilers
+if TYPE_CHECKING:
+    from torch_tensorrt.fx import InputTensorSpec
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +32,8 @@ def _non_fx_input_interface(
 def _fx_input_interface(
     inputs: Sequence[Input | torch.Tensor | InputTensorSpec],
 ) -> TypeGuard[List[InputTensorSpec | torch.Tensor]]:
+    from torch_tensorrt.fx import InputTensorSpec
+
     return all(isinstance(i, (torch.Tensor, InputTensorSpec)) for i in inputs)
 
 
@@ -75,7 +64,7 @@ def _parse_module_type(module: Any) -> _ModuleType:
         return _ModuleType.ts
     elif isinstance(module, torch.fx.GraphModule):
         return _ModuleType.fx
-    elif isinstance(module, ExportedProgram):
+    elif isinstance(module, torch.export.ExportedProgram):
         return _ModuleType.ep
     elif isinstance(module, torch.nn.Module):
         return _ModuleType.nn
@@ -188,6 +177,8 @@ def compile(
     Returns:
         torch.nn.Module: Compiled Module, when run it will execute via TensorRT
     """
+    from torch_tensorrt.dynamo import _defaults
+
     input_list = inputs if inputs is not None else []
     enabled_precisions_set: Set[dtype | torch.dtype] = (
         enabled_precisions
@@ -198,6 +189,8 @@ def compile(
     module_type = _parse_module_type(module)
     target_ir = _get_target_fe(module_type, ir)
     if target_ir == _IRType.ts:
+        from torch_tensorrt.ts._compiler import compile as torchscript_compile
+
         ts_mod = module
         if module_type == _ModuleType.nn:
             logger.info(
@@ -213,6 +206,9 @@ def compile(
         )
         return compiled_ts_module
     elif target_ir == _IRType.fx:
+        from torch_tensorrt.fx.lower import compile as fx_compile
+        from torch_tensorrt.fx.utils import LowerPrecision
+
         if (
             torch.float16 in enabled_precisions_set
             or torch_tensorrt.dtype.half in enabled_precisions_set
@@ -237,21 +233,28 @@ def compile(
         )
         return compiled_fx_module
     elif target_ir == _IRType.dynamo:
+        from torch_tensorrt.dynamo._compiler import compile as dynamo_compile
+        from torch_tensorrt.dynamo._tracer import trace as dynamo_trace
+
         # Prepare torch and torchtrt inputs
-        from torch_tensorrt.dynamo.utils import prepare_inputs
+        from torch_tensorrt.dynamo.utils import (
+            input_materialization_cache,
+            prepare_inputs,
+        )
 
         if not isinstance(input_list, collections.abc.Sequence):
             input_list = [input_list]
 
-        # Export the module
+        # Export the module, reusing the example inputs of the export in the compilation
         torchtrt_inputs = prepare_inputs(input_list)
-        exp_program = dynamo_trace(module, torchtrt_inputs, **kwargs)
-        trt_graph_module = dynamo_compile(
-            exp_program,
-            inputs=torchtrt_inputs,
-            enabled_precisions=enabled_precisions_set,
-            **kwargs,
-        )
+        with input_materialization_cache():
+            exp_program = dynamo_trace(module, torchtrt_inputs, **kwargs)
+            trt_graph_module = dynamo_compile(
+                exp_program,
+                inputs=torchtrt_inputs,
+                enabled_precisions=enabled_precisions_set,
+                **kwargs,
+            )
         return trt_graph_module
     elif target_ir == _IRType.torch_compile:
         return torch_compile(
@@ -322,6 +325,10 @@ def convert_method_to_trt_engine(
     module_type = _parse_module_type(module)
     target_ir = _get_target_fe(module_type, ir)
     if target_ir == _IRType.ts:
+        from torch_tensorrt.ts._compiler import (
+            convert_method_to_trt_engine as ts_convert_method_to_trt_engine,
+        )
+
         ts_mod = module
         if module_type == _ModuleType.nn:
             logger.info(
@@ -341,22 +348,30 @@ def convert_method_to_trt_engine(
             "convert_method_to_trt_engine call is not supported for ir=fx"
         )
     elif target_ir == _IRType.dynamo:
+        from torch_tensorrt.dynamo._compiler import (
+            convert_module_to_trt_engine as dynamo_convert_module_to_trt_engine,
+        )
+
         # Prepare torch and torchtrt inputs
-        from torch_tensorrt.dynamo.utils import prepare_inputs
+        from torch_tensorrt.dynamo.utils import (
+            input_materialization_cache,
+            prepare_inputs,
+        )
 
         if not isinstance(inputs, collections.abc.Sequence):
             inputs = [inputs]
 
-        # Export the module
+        # Export the module, reusing the example inputs of the export in the conversion
         torchtrt_inputs = prepare_inputs(inputs)
-        exp_program = torch_tensorrt.dynamo.trace(module, torchtrt_inputs, **kwargs)
-
-        return dynamo_convert_module_to_trt_engine(  # type: ignore[no-any-return]
-            exp_program,
-            inputs=inputs,
-            enabled_precisions=enabled_precisions_set,
-            **kwargs,
-        )
+        with input_materialization_cache():
+            exp_program = torch_tensorrt.dynamo.trace(module, torchtrt_inputs, **kwargs)
+
+            return dynamo_convert_module_to_trt_engine(  # type: ignore[no-any-return]
+                exp_program,
+                inputs=torchtrt_inputs,
+                enabled_precisions=enabled_precisions_set,
+                **kwargs,
+            )
     elif target_ir == _IRType.torch_compile:
         raise RuntimeError(
             "convert_method_to_trt_engine call is not supported for ir=torch_compile"
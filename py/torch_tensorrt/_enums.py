@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import functools
 import logging
 from enum import Enum, auto
-from typing import Any, Optional, Type, Union
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import numpy as np
 import torch
@@ -69,26 +81,13 @@ class dtype(Enum):
         t: Union[torch.dtype, trt.DataType, np.dtype, dtype, type],
         use_default: bool = False,
     ) -> dtype:
-        # TODO: Ideally implemented with match statement but need to wait for Py39 EoL
-        if isinstance(t, torch.dtype):
-            if t == torch.uint8:
-                return dtype.u8
-            elif t == torch.int8:
-                return dtype.i8
-            elif t == torch.long:
-                return dtype.i64
-            elif t == torch.int32:
-                return dtype.i32
-            elif t == torch.half:
-                return dtype.f16
-            elif t == torch.float:
-                return dtype.f32
-            elif t == torch.float64:
-                return dtype.f64
-            elif t == torch.bool:
-                return dtype.b
-            elif t == torch.bfloat16:
-                return dtype.bf16
+        if isinstance(t, dtype):
+            return t
+
+        elif isinstance(t, torch.dtype):
+            casted = _TORCH_TO_DTYPE.get(t)
+            if casted is not None:
+                return casted
             elif use_default:
                 logging.warning(
                     f"Given dtype that does not have direct mapping to Torch-TensorRT supported types ({t}), defaulting to torch_tensorrt.dtype.float"
@@ -98,45 +97,20 @@ class dtype(Enum):
                 raise TypeError(
                     f"Provided an unsupported data type as a data type for translation (support: bool, int, long, half, float, bfloat16), got: {t}"
                 )
+
         elif isinstance(t, trt.DataType):
-            if t == trt.uint8:
-                return dtype.u8
-            elif t == trt.int8:
-                return dtype.i8
-            elif t == trt.int32:
-                return dtype.i32
-            elif t == trt.int64:
-                return dtype.i64
-            elif t == trt.float16:
-                return dtype.f16
-            elif t == trt.float32:
-                return dtype.f32
-            elif t == trt.bool:
-                return dtype.b
-            elif t == trt.bf16:
-                return dtype.bf16
+            casted = _TRT_TO_DTYPE.get(t)
+            if casted is not None:
+                return casted
             else:
                 raise TypeError(
                     f"Provided an unsupported data type as a data type for translation (support: bool, int, half, float, bfloat16), got: {t}"
                 )
 
         elif dtype._is_np_obj(t):
-            if t == np.uint8:
-                return dtype.u8
-            elif t == np.int8:
-                return dtype.i8
-            elif t == np.int32:
-                return dtype.i32
-            elif t == np.int64:
-                return dtype.i64
-            elif t == np.float16:
-                return dtype.f16
-            elif t == np.float32:
-                return dtype.f32
-            elif t == np.float64:
-                return dtype.f64
-            elif t == np.bool:
-                return dtype.b
+            casted = _NP_TO_DTYPE.get(t)
+            if casted is not None:
+                return casted
             elif use_default:
                 logging.warning(
                     f"Given dtype that does not have direct mapping to Torch-TensorRT supported types ({t}), defaulting to torch_tensorrt.dtype.float"
@@ -148,29 +122,13 @@ class dtype(Enum):
                     + str(t)
                 )
 
-        elif isinstance(t, dtype):
-            return t
-
         elif ENABLED_FEATURES.torchscript_frontend:
             from torch_tensorrt import _C
 
             if isinstance(t, _C.dtype):
-                if t == _C.dtype.long:
-                    return dtype.i64
-                elif t == _C.dtype.int32:
-                    return dtype.i32
-                elif t == _C.dtype.int8:
-                    return dtype.i8
-                elif t == _C.dtype.half:
-                    return dtype.f16
-                elif t == _C.dtype.float:
-                    return dtype.f32
-                elif t == _C.dtype.double:
-                    return dtype.f64
-                elif t == _C.dtype.bool:
-                    return dtype.b
-                elif t == _C.dtype.unknown:
-                    return dtype.unknown
+                casted = cast(Optional[dtype], _ts_conversions()[_C.dtype][1].get(t))
+                if casted is not None:
+                    return casted
                 else:
                     raise TypeError(
                         f"Provided an unsupported data type as an input data type (support: bool, int32, long, half, float), got: {t}"
@@ -200,26 +158,10 @@ class dtype(Enum):
         t: Union[Type[torch.dtype], Type[trt.DataType], Type[np.dtype], Type[dtype]],
         use_default: bool = False,
     ) -> Union[torch.dtype, trt.DataType, np.dtype, dtype]:
-        # TODO: Ideally implemented with match statement but need to wait for Py39 EoL
         if t == torch.dtype:
-            if self == dtype.u8:
-                return torch.uint8
-            elif self == dtype.i8:
-                return torch.int8
-            elif self == dtype.i32:
-                return torch.int
-            elif self == dtype.i64:
-                return torch.long
-            elif self == dtype.f16:
-                return torch.half
-            elif self == dtype.f32:
-                return torch.float
-            elif self == dtype.f64:
-                return torch.double
-            elif self == dtype.b:
-                return torch.bool
-            elif self == dtype.bf16:
-                return torch.bfloat16
+            casted = _DTYPE_TO_TORCH.get(self)
+            if casted is not None:
+                return casted
             elif use_default:
                 logging.warning(
                     f"Given dtype that does not have direct mapping to torch ({self}), defaulting to torch.float"
@@ -229,44 +171,18 @@ class dtype(Enum):
                 raise TypeError(f"Unsupported torch dtype (had: {self})")
 
         elif t == trt.DataType:
-            if self == dtype.u8:
-                return trt.DataType.UINT8
-            if self == dtype.i8:
-                return trt.DataType.INT8
-            elif self == dtype.i32:
-                return trt.DataType.INT32
-            elif self == dtype.i64:
-                return trt.DataType.INT64
-            elif self == dtype.f16:
-                return trt.DataType.HALF
-            elif self == dtype.f32:
-                return trt.DataType.FLOAT
-            elif self == dtype.b:
-                return trt.DataType.BOOL
-            elif self == dtype.bf16:
-                return trt.DataType.BF16
+            casted = _DTYPE_TO_TRT.get(self)
+            if casted is not None:
+                return casted
             elif use_default:
                 return trt.DataType.FLOAT
             else:
                 raise TypeError("Unsupported tensorrt dtype")
 
         elif t == np.dtype:
-            if self == dtype.u8:
-                return np.uint8
-            elif self == dtype.i8:
-                return np.int8
-            elif self == dtype.i32:
-                return np.int32
-            elif self == dtype.i64:
-                return np.int64
-            elif self == dtype.f16:
-                return np.float16
-            elif self == dtype.f32:
-                return np.float32
-            elif self == dtype.f64:
-                return np.float64
-            elif self == dtype.b:
-                return np.bool_
+            casted = _DTYPE_TO_NP.get(self)
+            if casted is not None:
+                return casted
             elif use_default:
                 return np.float32
             else:
@@ -279,22 +195,9 @@ class dtype(Enum):
             from torch_tensorrt import _C
 
             if t == _C.dtype:
-                if self == dtype.i64:
-                    return _C.dtype.long
-                elif self == dtype.i8:
-                    return _C.dtype.int8
-                elif self == dtype.i32:
-                    return _C.dtype.int32
-                elif self == dtype.f16:
-                    return _C.dtype.half
-                elif self == dtype.f32:
-                    return _C.dtype.float
-                elif self == dtype.f64:
-                    return _C.dtype.double
-                elif self == dtype.b:
-                    return _C.dtype.bool
-                elif self == dtype.unknown:
-                    return _C.dtype.unknown
+                casted = _ts_conversions()[_C.dtype][0].get(self)
+                if casted is not None:
+                    return casted
                 else:
                     raise TypeError(
                         f"Provided an unsupported data type as an input data type (support: bool, int32, long, half, float), got: {self}"
@@ -320,11 +223,11 @@ class dtype(Enum):
             return None
 
     def __eq__(self, other: Union[torch.dtype, trt.DataType, np.dtype, dtype]) -> bool:
-        other_ = dtype._from(other)
-        return bool(self.value == other_.value)
+        # Members are singletons, aliases included
+        return self is dtype._from(other)
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        return hash(self._value_)
 
     # Putting aliases here that mess with mypy
     bool = b
@@ -357,62 +260,37 @@ class memory_format(Enum):
     def _from(
         cls, f: Union[torch.memory_format, trt.TensorFormat, memory_format]
     ) -> memory_format:
-        # TODO: Ideally implemented with match statement but need to wait for Py39 EoL
-        if isinstance(f, torch.memory_format):
-            if f == torch.contiguous_format:
-                return memory_format.contiguous
-            elif f == torch.channels_last:
-                return memory_format.channels_last
-            elif f == torch.channels_last_3d:
-                return memory_format.channels_last_3d
+        if isinstance(f, memory_format):
+            return f
+
+        elif isinstance(f, torch.memory_format):
+            casted = _TORCH_TO_MEMORY_FORMAT.get(f)
+            if casted is not None:
+                return casted
             else:
                 raise TypeError(
                     f"Provided an unsupported memory format for tensor, got: {dtype}"
                 )
 
-        elif isinstance(f, trt.DataType):
-            if f == trt.TensorFormat.LINEAR:
-                return memory_format.linear
-            elif f == trt.TensorFormat.CHW2:
-                return memory_format.chw2
-            elif f == trt.TensorFormat.HWC8:
-                return memory_format.hwc8
-            elif f == trt.TensorFormat.CHW4:
-                return memory_format.chw4
-            elif f == trt.TensorFormat.CHW16:
-                return memory_format.chw16
-            elif f == trt.TensorFormat.CHW32:
-                return memory_format.chw32
-            elif f == trt.TensorFormat.DHWC8:
-                return memory_format.dhwc8
-            elif f == trt.TensorFormat.CDHW32:
-                return memory_format.cdhw32
-            elif f == trt.TensorFormat.HWC:
-                return memory_format.hwc
-            elif f == trt.TensorFormat.DLA_LINEAR:
-                return memory_format.dla_linear
-            elif f == trt.TensorFormat.DLA_HWC4:
-                return memory_format.dla_hwc4
-            elif f == trt.TensorFormat.HWC16:
-                return memory_format.hwc16
-            elif f == trt.TensorFormat.DHWC:
-                return memory_format.dhwc
+        elif isinstance(f, trt.TensorFormat):
+            casted = _TRT_TO_MEMORY_FORMAT.get(f)
+            if casted is not None:
+                return casted
             else:
                 raise TypeError(
                     f"Provided an unsupported tensor format for tensor, got: {dtype}"
                 )
 
-        elif isinstance(f, memory_format):
-            return f
-
         elif ENABLED_FEATURES.torchscript_frontend:
             from torch_tensorrt import _C
 
             if isinstance(f, _C.TensorFormat):
-                if f == _C.TensorFormat.contiguous:
-                    return memory_format.contiguous
-                elif f == _C.TensorFormat.channels_last:
-                    return memory_format.channels_last
+                casted = cast(
+                    Optional[memory_format],
+                    _ts_conversions()[_C.TensorFormat][1].get(f),
+                )
+                if casted is not None:
+                    return casted
                 else:
                     raise ValueError(
                         "Provided an unsupported tensor format (support: NCHW/contiguous_format, NHWC/channel_last)"
@@ -441,42 +319,16 @@ class memory_format(Enum):
         ],
     ) -> Union[torch.memory_format, trt.TensorFormat, memory_format]:
         if t == torch.memory_format:
-            if self == memory_format.contiguous:
-                return torch.contiguous_format
-            elif self == memory_format.channels_last:
-                return torch.channels_last
-            elif self == memory_format.channels_last_3d:
-                return torch.channels_last_3d
+            casted = _MEMORY_FORMAT_TO_TORCH.get(self)
+            if casted is not None:
+                return casted
             else:
                 raise TypeError("Unsupported torch dtype")
 
         elif t == trt.TensorFormat:
-            if self == memory_format.linear:
-                return trt.TensorFormat.LINEAR
-            elif self == memory_format.chw2:
-                return trt.TensorFormat.CHW2
-            elif self == memory_format.hwc8:
-                return trt.TensorFormat.HWC8
-            elif self == memory_format.chw4:
-                return trt.TensorFormat.CHW4
-            elif self == memory_format.chw16:
-                return trt.TensorFormat.CHW16
-            elif self == memory_format.chw32:
-                return trt.TensorFormat.CHW32
-            elif self == memory_format.dhwc8:
-                return trt.TensorFormat.DHWC8
-            elif self == memory_format.cdhw32:
-                return trt.TensorFormat.CDHW32
-            elif self == memory_format.hwc:
-                return trt.TensorFormat.HWC
-            elif self == memory_format.dla_linear:
-                return trt.TensorFormat.DLA_LINEAR
-            elif self == memory_format.dla_hwc4:
-                return trt.TensorFormat.DLA_HWC4
-            elif self == memory_format.hwc16:
-                return trt.TensorFormat.HWC16
-            elif self == memory_format.dhwc:
-                return trt.TensorFormat.DHWC
+            casted = _MEMORY_FORMAT_TO_TRT.get(self)
+            if casted is not None:
+                return casted
             else:
                 raise TypeError("Unsupported tensorrt memory format")
 
@@ -487,10 +339,9 @@ class memory_format(Enum):
             from torch_tensorrt import _C
 
             if t == _C.TensorFormat:
-                if self == memory_format.contiguous:
-                    return _C.TensorFormat.contiguous
-                elif self == memory_format.channels_last:
-                    return _C.TensorFormat.channels_last
+                casted = _ts_conversions()[_C.TensorFormat][0].get(self)
+                if casted is not None:
+                    return casted
                 else:
                     raise ValueError(
                         "Provided an unsupported tensor format (support: NCHW/contiguous_format, NHWC/channel_last)"
@@ -519,11 +370,10 @@ class memory_format(Enum):
     def __eq__(
         self, other: Union[torch.memory_format, trt.TensorFormat, memory_format]
     ) -> bool:
-        other_ = memory_format._from(other)
-        return self.value == other_.value
+        return self is memory_format._from(other)
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        return hash(self._value_)
 
 
 class DeviceType(Enum):
@@ -533,27 +383,27 @@ class DeviceType(Enum):
 
     @classmethod
     def _from(cls, d: Union[trt.DeviceType, DeviceType]) -> DeviceType:
-        if isinstance(d, trt.DeviceType):
-            if d == trt.DeviceType.GPU:
-                return DeviceType.GPU
-            elif d == trt.DeviceType.DLA:
-                return DeviceType.DLA
+        if isinstance(d, DeviceType):
+            return d
+
+        elif isinstance(d, trt.DeviceType):
+            casted = _TRT_TO_DEVICE_TYPE.get(d)
+            if casted is not None:
+                return casted
             else:
                 raise ValueError(
                     "Provided an unsupported device type (support: GPU/DLA)"
                 )
 
-        elif isinstance(d, DeviceType):
-            return d
-
         elif ENABLED_FEATURES.torchscript_frontend:
             from torch_tensorrt import _C
 
             if isinstance(d, _C.DeviceType):
-                if d == _C.DeviceType.GPU:
-                    return DeviceType.GPU
-                elif d == _C.DeviceType.DLA:
-                    return DeviceType.DLA
+                casted = cast(
+                    Optional[DeviceType], _ts_conversions()[_C.DeviceType][1].get(d)
+                )
+                if casted is not None:
+                    return casted
                 else:
                     raise ValueError(
                         "Provided an unsupported device type (support: GPU/DLA)"
@@ -579,10 +429,9 @@ class DeviceType(Enum):
         use_default: bool = False,
     ) -> Union[trt.DeviceType, DeviceType]:
         if t == trt.DeviceType:
-            if self == DeviceType.GPU:
-                return trt.DeviceType.GPU
-            elif self == DeviceType.DLA:
-                return trt.DeviceType.DLA
+            casted = _DEVICE_TYPE_TO_TRT.get(self)
+            if casted is not None:
+                return casted
             elif use_default:
                 return trt.DeviceType.GPU
             else:
@@ -597,10 +446,9 @@ class DeviceType(Enum):
             from torch_tensorrt import _C
 
             if t == _C.DeviceType:
-                if self == DeviceType.GPU:
-                    return _C.DeviceType.GPU
-                elif self == DeviceType.DLA:
-                    return _C.DeviceType.DLA
+                casted = _ts_conversions()[_C.DeviceType][0].get(self)
+                if casted is not None:
+                    return casted
                 else:
                     raise ValueError(
                         "Provided an unsupported device type (support: GPU/DLA)"
@@ -626,11 +474,10 @@ class DeviceType(Enum):
             return None
 
     def __eq__(self, other: Union[trt.DeviceType, DeviceType]) -> bool:
-        other_ = DeviceType._from(other)
-        return bool(self.value == other_.value)
+        return self is DeviceType._from(other)
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        return hash(self._value_)
 
 
 class EngineCapability(Enum):
@@ -642,29 +489,26 @@ class EngineCapability(Enum):
     def _from(
         cls, c: Union[trt.EngineCapability, EngineCapability]
     ) -> EngineCapability:
-        if isinstance(c, trt.EngineCapability):
-            if c == trt.EngineCapability.STANDARD:
-                return EngineCapability.STANDARD
-            elif c == trt.EngineCapability.SAFETY:
-                return EngineCapability.SAFETY
-            elif c == trt.EngineCapability.DLA_STANDALONE:
-                return EngineCapability.DLA_STANDALONE
+        if isinstance(c, EngineCapability):
+            return c
+
+        elif isinstance(c, trt.EngineCapability):
+            casted = _TRT_TO_ENGINE_CAPABILITY.get(c)
+            if casted is not None:
+                return casted
             else:
                 raise ValueError("Provided an unsupported engine capability")
 
-        elif isinstance(c, EngineCapability):
-            return c
-
         elif ENABLED_FEATURES.torchscript_frontend:
             from torch_tensorrt import _C
 
             if isinstance(c, _C.EngineCapability):
-                if c == _C.EngineCapability.STANDARD:
-                    return EngineCapability.STANDARD
-                elif c == _C.EngineCapability.SAFETY:
-                    return EngineCapability.SAFETY
-                elif c == _C.EngineCapability.DLA_STANDALONE:
-                    return EngineCapability.DLA_STANDALONE
+                casted = cast(
+                    Optional[EngineCapability],
+                    _ts_conversions()[_C.EngineCapability][1].get(c),
+                )
+                if casted is not None:
+                    return casted
                 else:
                     raise ValueError("Provided an unsupported engine capability")
         # else: # commented out for mypy
@@ -690,12 +534,9 @@ class EngineCapability(Enum):
         self, t: Union[Type[trt.EngineCapability], Type[EngineCapability]]
     ) -> Union[trt.EngineCapability, EngineCapability]:
         if t == trt.EngineCapability:
-            if self == EngineCapability.STANDARD:
-                return trt.EngineCapability.STANDARD
-            elif self == EngineCapability.SAFETY:
-                return trt.EngineCapability.SAFETY
-            elif self == EngineCapability.DLA_STANDALONE:
-                return trt.EngineCapability.DLA_STANDALONE
+            casted = _ENGINE_CAPABILITY_TO_TRT.get(self)
+            if casted is not None:
+                return casted
             else:
                 raise ValueError("Provided an unsupported engine capability")
 
@@ -706,12 +547,9 @@ class EngineCapability(Enum):
             from torch_tensorrt import _C
 
             if t == _C.EngineCapability:
-                if self == EngineCapability.STANDARD:
-                    return _C.EngineCapability.STANDARD
-                elif self == EngineCapability.SAFETY:
-                    return _C.EngineCapability.SAFETY
-                elif self == EngineCapability.DLA_STANDALONE:
-                    return _C.EngineCapability.DLA_STANDALONE
+                casted = _ts_conversions()[_C.EngineCapability][0].get(self)
+                if casted is not None:
+                    return casted
                 else:
                     raise ValueError("Provided an unsupported engine capability")
         # else: # commented out for mypy
@@ -733,8 +571,149 @@ class EngineCapability(Enum):
             return None
 
     def __eq__(self, other: Union[trt.EngineCapability, EngineCapability]) -> bool:
-        other_ = EngineCapability._from(other)
-        return bool(self.value == other_.value)
+        return self is EngineCapability._from(other)
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        return hash(self._value_)
+
+
+Conversions = Tuple[Dict[Any, Any], Dict[Any, Any]]
+
+EnumT = TypeVar("EnumT", bound=Enum)
+
+
+def _bidirectional(
+    pairs: Sequence[Tuple[EnumT, Any]]
+) -> Tuple[Dict[EnumT, Any], Dict[Any, EnumT]]:
+    """Builds the lookup tables from members of an enum to the equivalent values of
+    another framework and back, skipping values missing from the installed version.
+    A member listed with several values converts to the first of them
+    """
+    to_values: Dict[EnumT, Any] = {}
+    from_values: Dict[Any, EnumT] = {}
+    for member, value in pairs:
+        if value is not None:
+            to_values.setdefault(member, value)
+            from_values.setdefault(value, member)
+    return to_values, from_values
+
+
+def _np_pairs(pairs: List[Tuple[dtype, Any]]) -> List[Tuple[dtype, Any]]:
+    """Adds the np.dtype of each numpy scalar type, which compare equal but hash differently"""
+    return pairs + [(member, np.dtype(value)) for member, value in pairs]
+
+
+# Conversions between the enums and TensorRT, PyTorch and numpy, built once at import
+_DTYPE_TO_TORCH, _TORCH_TO_DTYPE = _bidirectional(
+    [
+        (dtype.u8, torch.uint8),
+        (dtype.i8, torch.int8),
+        (dtype.i32, torch.int32),
+        (dtype.i64, torch.int64),
+        (dtype.f16, torch.float16),
+        (dtype.f32, torch.float32),
+        (dtype.f64, torch.float64),
+        (dtype.b, torch.bool),
+        (dtype.bf16, torch.bfloat16),
+    ]
+)
+
+_DTYPE_TO_TRT, _TRT_TO_DTYPE = _bidirectional(
+    [
+        (dtype.u8, getattr(trt.DataType, "UINT8", None)),
+        (dtype.i8, trt.DataType.INT8),
+        (dtype.i32, trt.DataType.INT32),
+        (dtype.i64, getattr(trt.DataType, "INT64", None)),
+        (dtype.f16, trt.DataType.HALF),
+        (dtype.f32, trt.DataType.FLOAT),
+        (dtype.b, trt.DataType.BOOL),
+        (dtype.bf16, getattr(trt.DataType, "BF16", None)),
+    ]
+)
+
+_DTYPE_TO_NP, _NP_TO_DTYPE = _bidirectional(
+    _np_pairs(
+        [
+            (dtype.u8, np.uint8),
+            (dtype.i8, np.int8),
+            (dtype.i32, np.int32),
+            (dtype.i64, np.int64),
+            (dtype.f16, np.float16),
+            (dtype.f32, np.float32),
+            (dtype.f64, np.float64),
+            (dtype.b, np.bool_),
+        ]
+    )
+)
+
+_MEMORY_FORMAT_TO_TORCH, _TORCH_TO_MEMORY_FORMAT = _bidirectional(
+    [
+        (memory_format.contiguous, torch.contiguous_format),
+        (memory_format.channels_last, torch.channels_last),
+        (memory_format.channels_last_3d, torch.channels_last_3d),
+    ]
+)
+
+_MEMORY_FORMAT_TO_TRT, _TRT_TO_MEMORY_FORMAT = _bidirectional(
+    [
+        (member, getattr(trt.TensorFormat, member.name.upper(), None))
+        for member in memory_format
+    ]
+)
+
+_DEVICE_TYPE_TO_TRT, _TRT_TO_DEVICE_TYPE = _bidirectional(
+    [
+        (DeviceType.GPU, trt.DeviceType.GPU),
+        (DeviceType.DLA, trt.DeviceType.DLA),
+    ]
+)
+
+_ENGINE_CAPABILITY_TO_TRT, _TRT_TO_ENGINE_CAPABILITY = _bidirectional(
+    [
+        (EngineCapability.STANDARD, trt.EngineCapability.STANDARD),
+        (EngineCapability.SAFETY, trt.EngineCapability.SAFETY),
+        (EngineCapability.DLA_STANDALONE, trt.EngineCapability.DLA_STANDALONE),
+    ]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _ts_conversions() -> Dict[Type[Any], Conversions]:
+    """Conversions between the enums and the TorchScript frontend, by the type of the
+    TorchScript enum, which are built on first use so the frontend is loaded lazily
+    """
+    from torch_tensorrt import _C
+
+    return {
+        _C.dtype: _bidirectional(
+            [
+                (dtype.i64, _C.dtype.long),
+                (dtype.i8, _C.dtype.int8),
+                (dtype.i32, _C.dtype.int32),
+                (dtype.f16, _C.dtype.half),
+                (dtype.f32, _C.dtype.float),
+                (dtype.f64, _C.dtype.double),
+                (dtype.b, _C.dtype.bool),
+                (dtype.unknown, _C.dtype.unknown),
+            ]
+        ),
+        _C.TensorFormat: _bidirectional(
+            [
+                (memory_format.contiguous, _C.TensorFormat.contiguous),
+                (memory_format.channels_last, _C.TensorFormat.channels_last),
+            ]
+        ),
+        _C.DeviceType: _bidirectional(
+            [
+                (DeviceType.GPU, _C.DeviceType.GPU),
+                (DeviceType.DLA, _C.DeviceType.DLA),
+            ]
+        ),
+        _C.EngineCapability: _bidirectional(
+            [
+                (EngineCapability.STANDARD, _C.EngineCapability.STANDARD),
+                (EngineCapability.SAFETY, _C.EngineCapability.SAFETY),
+                (EngineCapability.DLA_STANDALONE, _C.EngineCapability.DLA_STANDALONE),
+            ]
+        ),
+    }
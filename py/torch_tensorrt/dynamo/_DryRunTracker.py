@@ -24,6 +24,8 @@ class PerSubgraphData:
         subgraph_input_dtypes (Any): Input data types of the subgraph
         subgraph_output_shapes (Any): Shapes of output Tensors of the subgraph
         subgraph_output_dtypes (Any): Output data types of the subgraph
+        subgraph_boundary_reformats (int): Number of inputs and outputs of the subgraph which are reformatted
+            at the engine boundary, since the engine binds them in a different format than they were traced in
     """
 
     subgraph_name: str = ""
@@ -32,6 +34,7 @@ class PerSubgraphData:
     subgraph_input_dtypes: Any = field(default_factory=list)
     subgraph_output_shapes: Any = field(default_factory=list)
     subgraph_output_dtypes: Any = field(default_factory=list)
+    subgraph_boundary_reformats: int = 0
 
 
 @dataclass
@@ -105,6 +108,7 @@ def dryrun_stats_display(
     #       Engine Inputs: List[Tensor: (1, 3, 224, 224)@float32]
     #       Number of Operators in Engine: 1
     #       Engine Outputs: Tensor: (1, 64, 112, 112)@float32
+    #       Boundary Reformats of Engine: 0
     #    ...
     #   Outputs: List[Tensor: (1, 1000)@float32]
     #
@@ -132,6 +136,10 @@ def dryrun_stats_display(
             " " * 5
             + f"Engine Outputs: {input_formatter(trt_subgraph_data.subgraph_output_shapes, trt_subgraph_data.subgraph_output_dtypes)}\n"
         )
+        formatted_stats += (
+            " " * 5
+            + f"Boundary Reformats of Engine: {trt_subgraph_data.subgraph_boundary_reformats}\n"
+        )
 
     formatted_stats += " " * 4 + "...\n"
     formatted_stats += (
@@ -157,6 +165,10 @@ def dryrun_stats_display(
             trt_subgraph.subgraph_op_count
             for trt_subgraph in dryrun_tracker.per_subgraph_data
         )
+        total_boundary_reformats = sum(
+            trt_subgraph.subgraph_boundary_reformats
+            for trt_subgraph in dryrun_tracker.per_subgraph_data
+        )
 
         formatted_stats += "\n" + " " * 2 + "-" * 25 + " Aggregate Stats " + "-" * 25
         formatted_stats += (
@@ -172,6 +184,12 @@ def dryrun_stats_display(
             + "Most Operators in a TRT Engine: "
             + f"{most_ops_in_an_engine}"
         )
+        formatted_stats += (
+            "\n"
+            + " " * 3
+            + "Total Boundary Reformats of TRT Engines: "
+            + f"{total_boundary_reformats}"
+        )
 
         formatted_stats += "\n\n" + " " * 2 + "*" * 10 + " Recommendations " + "*" * 10
         formatted_stats += (
@@ -197,6 +215,15 @@ def dryrun_stats_display(
             + f"{min_ops_in_an_engine} which generates "
             + f"{len([1 for trt_subgraph in dryrun_tracker.per_subgraph_data if trt_subgraph.subgraph_op_count >= min_ops_in_an_engine])} TRT engine(s)"
         )
+        if (
+            total_boundary_reformats > 0
+            and not dryrun_tracker.compilation_settings.channels_last
+        ):
+            formatted_stats += (
+                "\n"
+                + " " * 3
+                + "- To avoid reformatting channels-last tensors at engine boundaries, select channels_last=True"
+            )
     else:
         formatted_stats += (
             "\n"
@@ -12,3 +12,6 @@ if version.parse(sanitized_torch_version()) >= version.parse("2.1.dev"):
     from ._settings import CompilationSettings
     from ._SourceIR import SourceIR
     from ._tracer import trace
+
+    # Registers the torch.compile backends
+    from . import backend  # noqa: F401
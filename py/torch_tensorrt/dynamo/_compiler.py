@@ -3,7 +3,17 @@ from __future__ import annotations
 import collections.abc
 import logging
 import warnings
-from typing import Any, Collection, List, Optional, Sequence, Set, Tuple, Union
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import torch
 from torch.export import ExportedProgram
@@ -28,9 +38,11 @@ from torch_tensorrt.dynamo.conversion import (
 from torch_tensorrt.dynamo.conversion._ConverterRegistry import (
     DYNAMO_CONVERTERS as CONVERTERS,
 )
+from torch_tensorrt.dynamo.conversion.converter_utils import count_boundary_reformats
 from torch_tensorrt.dynamo.lowering import apply_lowering_passes, get_decompositions
 from torch_tensorrt.dynamo.utils import (
     get_torch_inputs,
+    input_materialization_cache,
     parse_complex_tensor_structs,
     prepare_inputs,
     set_log_level,
@@ -41,6 +53,7 @@ from torch_tensorrt.dynamo.utils import (
 logger = logging.getLogger(__name__)
 
 
+@input_materialization_cache()
 def compile(
     exported_program: ExportedProgram,
     inputs: Tuple[Any, ...],
@@ -73,6 +86,9 @@ def compile(
     enable_experimental_decompositions: bool = _defaults.ENABLE_EXPERIMENTAL_DECOMPOSITIONS,
     dryrun: bool = _defaults.DRYRUN,
     hardware_compatible: bool = _defaults.HARDWARE_COMPATIBLE,
+    fallback_backend: Optional[str] = _defaults.FALLBACK_BACKEND,
+    fallback_backend_options: Optional[Dict[str, Any]] = None,
+    channels_last: bool = _defaults.CHANNELS_LAST,
     **kwargs: Any,
 ) -> torch.fx.GraphModule:
     """Compile an ExportedProgram module for NVIDIA GPUs using TensorRT
@@ -131,6 +147,9 @@ def compile(
         enable_experimental_decompositions (bool): Use the full set of operator decompositions. These decompositions may not be tested but serve to make the grap easier to covert to TensorRT, potentially increasing the amount of graphs run in TensorRT.
         dryrun (bool): Toggle for "Dryrun" mode, running everything except conversion to TRT and logging outputs
         hardware_compatible (bool): Build the TensorRT engines compatible with GPU architectures other than that of the GPU on which the engine was built (currently works for NVIDIA Ampere and newer)
+        fallback_backend (Optional[str]): ``torch.compile`` backend (e.g. "inductor") used to compile the segments of the graph which run in Torch. If None, those segments run as eager FX code
+        fallback_backend_options (Optional[Dict[str, Any]]): Options passed through to ``fallback_backend``
+        channels_last (bool): Bind 4-D and 5-D floating point engine inputs and outputs in channels-last format, unless they were traced in contiguous format, so channels-last models are not reformatted at engine boundaries
         **kwargs: Any,
     Returns:
         torch.fx.GraphModule: Compiled FX Module, when run it will execute via TensorRT
@@ -176,12 +195,16 @@ def compile(
         get_decompositions(enable_experimental_decompositions)
     )
     gm = exported_program.module()
-    logger.debug("Input graph: " + str(gm.graph))
+    logger.debug("Input graph: %s", gm.graph)
     # Apply lowering on the graph module
     torch_inputs = get_torch_inputs(inputs, device)
+    # Torch-executed ops must be known to the lowering passes
+    CONVERTERS.set_disallowed_targets(
+        torch_executed_ops if torch_executed_ops is not None else set()
+    )
     gm = apply_lowering_passes(gm, torch_inputs)
 
-    logger.debug("Lowered Input graph: " + str(gm.graph))
+    logger.debug("Lowered Input graph: %s", gm.graph)
 
     compilation_options = {
         "enabled_precisions": (
@@ -213,6 +236,11 @@ def compile(
         "dla_global_dram_size": dla_global_dram_size,
         "dryrun": dryrun,
         "hardware_compatible": hardware_compatible,
+        "fallback_backend": fallback_backend,
+        "fallback_backend_options": (
+            fallback_backend_options if fallback_backend_options is not None else {}
+        ),
+        "channels_last": channels_last,
     }
 
     settings = CompilationSettings(**compilation_options)
@@ -221,6 +249,7 @@ def compile(
     return trt_gm
 
 
+@input_materialization_cache()
 def compile_module(
     gm: torch.fx.GraphModule,
     sample_inputs: Sequence[Input],
@@ -330,8 +359,17 @@ def compile_module(
     if not settings.use_fast_partitioner:
         dryrun_tracker.to_run_in_torch.extend(parse_non_trt_nodes(partitioned_module))
 
+        if settings.fallback_backend is not None:
+            logger.warning(
+                f"fallback_backend={settings.fallback_backend} was specified, but the global "
+                "partitioner does not segment Torch-executed operators into submodules. "
+                "Those operators will run as eager FX code."
+            )
+
     # Store TRT replicas of Torch subgraphs
     trt_modules = {}
+    # Store Torch-executed subgraphs compiled with the fallback backend
+    fallback_modules = {}
     # Iterate over all components that can be accelerated
     # Generate the corresponding TRT Module for those
     for name, _ in partitioned_module.named_children():
@@ -339,6 +377,14 @@ def compile_module(
         # Criteria for a module to be convertible to TRT
         if settings.use_fast_partitioner and "_run_on_acc" not in name:
             dryrun_tracker.to_run_in_torch.extend(parse_non_trt_nodes(submodule))
+
+            # Compile the Torch-executed segment with the secondary backend, if requested
+            if settings.fallback_backend is not None and not settings.dryrun:
+                fallback_modules[name] = partitioning.compile_fallback_submodule(
+                    submodule,
+                    settings.fallback_backend,
+                    settings.fallback_backend_options,
+                )
             continue
 
         subgraph_data = PerSubgraphData()
@@ -356,9 +402,9 @@ def compile_module(
 
         logger.debug(
             "Submodule name: %s\n Input shapes: %s\n %s",
-            str(name),
+            name,
             [input.shape for input in submodule_inputs],
-            str(submodule.graph),
+            submodule.graph,
         )
 
         assert submodule_inputs is not None
@@ -393,6 +439,9 @@ def compile_module(
         subgraph_data.subgraph_output_dtypes = parse_complex_tensor_structs(
             submodule_outputs, "dtype"
         )
+        subgraph_data.subgraph_boundary_reformats = count_boundary_reformats(
+            submodule, settings.channels_last
+        )
 
         dryrun_tracker.tensorrt_graph_count += 1
         dryrun_tracker.per_subgraph_data.append(subgraph_data)
@@ -426,6 +475,10 @@ def compile_module(
     for name, trt_module in trt_modules.items():
         setattr(partitioned_module, name, trt_module)
 
+    # Replace Torch-executed FX Modules with their fallback-compiled counterparts
+    for name, fallback_module in fallback_modules.items():
+        setattr(partitioned_module, name, fallback_module)
+
     # Reset settings object to user specification after fallback to global partitioning mode
     if fast_partitioner_failed:
         settings.use_fast_partitioner = True
@@ -435,6 +488,7 @@ def compile_module(
     return partitioned_module
 
 
+@input_materialization_cache()
 def convert_module_to_trt_engine(
     exported_program: ExportedProgram,
     inputs: Tuple[Any, ...],
@@ -580,12 +634,13 @@ def convert_module_to_trt_engine(
         get_decompositions(enable_experimental_decompositions)
     )
     gm = exported_program.module()
-    logger.debug("Input graph: " + str(gm.graph))
+    logger.debug("Input graph: %s", gm.graph)
 
     # Apply lowering on the graph module
     torch_inputs = get_torch_inputs(input_list, device)
+    CONVERTERS.set_disallowed_targets(torch_executed_ops)
     gm = apply_lowering_passes(gm, torch_inputs)
-    logger.debug("Lowered Input graph: " + str(gm.graph))
+    logger.debug("Lowered Input graph: %s", gm.graph)
 
     settings = CompilationSettings(**compilation_options)
     logger.info("Compilation Settings: %s\n", settings)
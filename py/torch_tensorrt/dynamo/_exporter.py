@@ -3,6 +3,7 @@ import operator
 from typing import Any, Dict, Sequence, Tuple, cast
 
 import torch
+from torch._dynamo.eval_frame import OptimizedModule
 from torch._guards import detect_fake_mode
 from torch._subclasses.fake_tensor import FakeTensor
 from torch.export import ExportedProgram, ExportGraphSignature
@@ -209,6 +210,9 @@ def inline_torch_modules(gm: torch.fx.GraphModule) -> torch.fx.GraphModule:
     for gm_node in gm.graph.nodes:
         if gm_node.op == "call_module" and "_run_on_gpu" in gm_node.name:
             submodule = getattr(gm, gm_node.name)
+            # Segments compiled with a fallback backend wrap the original FX module
+            if isinstance(submodule, OptimizedModule):
+                submodule = submodule._orig_mod
             with gm.graph.inserting_before(gm_node):
                 # Get inputs of submodule node which are most likely outputs of a previous TRT node
                 # or a placeholder of the main graph
@@ -1,10 +1,11 @@
 from dataclasses import dataclass, field
-from typing import Collection, Optional, Set, Union
+from typing import Any, Collection, Dict, Optional, Set, Union
 
 from torch.fx.node import Target
 from torch_tensorrt._Device import Device
 from torch_tensorrt._enums import EngineCapability, dtype
 from torch_tensorrt.dynamo._defaults import (
+    CHANNELS_LAST,
     DEBUG,
     DISABLE_TF32,
     DLA_GLOBAL_DRAM_SIZE,
@@ -14,6 +15,7 @@ from torch_tensorrt.dynamo._defaults import (
     ENABLE_EXPERIMENTAL_DECOMPOSITIONS,
     ENABLED_PRECISIONS,
     ENGINE_CAPABILITY,
+    FALLBACK_BACKEND,
     HARDWARE_COMPATIBLE,
     MAX_AUX_STREAMS,
     MIN_BLOCK_SIZE,
@@ -69,6 +71,11 @@ class CompilationSettings:
             TRT Engines. Prints detailed logs of the graph structure and nature of partitioning. Optionally saves the
             ouptut to a file if a string path is specified
         hardware_compatible (bool): Build the TensorRT engines compatible with GPU architectures other than that of the GPU on which the engine was built (currently works for NVIDIA Ampere and newer)
+        fallback_backend (Optional[str]): ``torch.compile`` backend (e.g. "inductor") used to compile the Torch-executed
+            segments left over after partitioning. If None, those segments run as eager FX code
+        fallback_backend_options (Dict[str, Any]): Options passed through to the fallback backend
+        channels_last (bool): Bind 4-D and 5-D floating point engine inputs and outputs in channels-last format, unless
+            they were traced in contiguous format, so channels-last models are not reformatted at engine boundaries
     """
 
     enabled_precisions: Set[dtype] = field(default_factory=lambda: ENABLED_PRECISIONS)
@@ -98,3 +105,6 @@ class CompilationSettings:
     dla_global_dram_size: int = DLA_GLOBAL_DRAM_SIZE
     dryrun: Union[bool, str] = DRYRUN
     hardware_compatible: bool = HARDWARE_COMPATIBLE
+    fallback_backend: Optional[str] = FALLBACK_BACKEND
+    fallback_backend_options: Dict[str, Any] = field(default_factory=dict)
+    channels_last: bool = CHANNELS_LAST
@@ -7,11 +7,17 @@ import torch
 from torch.export import Dim, export
 from torch_tensorrt._Input import Input
 from torch_tensorrt.dynamo._defaults import DEBUG, default_device
-from torch_tensorrt.dynamo.utils import get_torch_inputs, set_log_level, to_torch_device
+from torch_tensorrt.dynamo.utils import (
+    get_torch_inputs,
+    input_materialization_cache,
+    set_log_level,
+    to_torch_device,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@input_materialization_cache()
 def trace(
     mod: torch.nn.Module | torch.fx.GraphModule,
     inputs: Tuple[Any, ...],
@@ -10,6 +10,9 @@ from torch._dynamo.utils import detect_fake_mode
 from torch._functorch.aot_autograd import aot_export_joint_simple
 from torch_tensorrt.dynamo import CompilationSettings
 from torch_tensorrt.dynamo._compiler import compile_module
+from torch_tensorrt.dynamo.conversion._ConverterRegistry import (
+    DYNAMO_CONVERTERS as CONVERTERS,
+)
 from torch_tensorrt.dynamo.lowering import (
     apply_lowering_passes,
     get_decompositions,
@@ -66,7 +69,7 @@ def _pretraced_backend(
         Compiled FX GraphModule
     """
     try:
-        logger.debug("Pre-AOT Autograd graph:\n" + str(gm.graph))
+        logger.debug("Pre-AOT Autograd graph:\n%s", gm.graph)
 
         fake_mode = detect_fake_mode(sample_inputs)
 
@@ -92,8 +95,10 @@ def _pretraced_backend(
                 ),
             )
 
-            logger.debug("Post-AOT Autograd graph:\n" + str(gm.graph))
+            logger.debug("Post-AOT Autograd graph:\n%s", gm.graph)
 
+            # Torch-executed ops must be known to the lowering passes
+            CONVERTERS.set_disallowed_targets(settings.torch_executed_ops)
             gm = apply_lowering_passes(gm, torch_inputs)
 
             torchtrt_inputs = prepare_inputs(
@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
 
+import torch
 from torch_tensorrt.dynamo._settings import CompilationSettings
-from torch_tensorrt.fx.types import TRTNetwork
+from torch_tensorrt.fx.types import TRTDataType, TRTNetwork, TRTTensor
 
 
 @dataclass
@@ -11,9 +13,20 @@ class ConversionContext:
     Args:
         net: TensorRT Network being built
         compilation_settings: Settings selected by the user for compilation
+        folded_nodes: Number of nodes evaluated at conversion time by evaluators,
+            which add no layers to the network
+        casts: Casts added to the network, by the name of the cast tensor and the
+            data type it is cast to, so each tensor is cast to a data type only once
+        skipped_casts: Number of cast layers avoided by reusing casts and by the
+            data types planned for the graph
+        current_node: Node being converted, whose planned data type converters consult
     """
 
     net: TRTNetwork
     compilation_settings: CompilationSettings = field(
         default_factory=CompilationSettings
     )
+    folded_nodes: int = 0
+    casts: Dict[Tuple[str, TRTDataType], TRTTensor] = field(default_factory=dict)
+    skipped_casts: int = 0
+    current_node: Optional[torch.fx.Node] = None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib
 import logging
 from dataclasses import dataclass, field
 from enum import Enum, auto
@@ -86,6 +87,27 @@ class ConverterSupport:
 # Each converter maps to a sequence of at least one ConverterSupport object(s)
 DYNAMO_ATEN_CONVERTERS: Dict[Target, Sequence[ConverterSupport]] = {}
 
+# Modules registering the Torch-TensorRT converters, which are imported on the first
+# access to the converter registry instead of when Torch-TensorRT is imported
+CONVERTER_MODULES = (
+    "torch_tensorrt.dynamo.conversion.aten_ops_converters",
+    "torch_tensorrt.dynamo.conversion.ops_evaluators",
+    "torch_tensorrt.dynamo.conversion.prims_ops_converters",
+)
+_converter_modules_loaded = False
+
+
+def load_converter_modules() -> None:
+    """Imports the modules registering the Torch-TensorRT converters, if not yet imported"""
+    global _converter_modules_loaded
+    if _converter_modules_loaded:
+        return
+
+    # Set beforehand, since the converter modules register through this module
+    _converter_modules_loaded = True
+    for module in CONVERTER_MODULES:
+        importlib.import_module(module)
+
 
 def dynamo_tensorrt_converter(
     key: Target,
@@ -115,6 +137,10 @@ def dynamo_tensorrt_converter(
         """Helper function to register the converter, then return it"""
         assert callable(converter), "Converter function must be callable"
 
+        # User converters are registered after the Torch-TensorRT converters, so
+        # converters of the same priority are checked in the same order as before
+        load_converter_modules()
+
         # If no capability_validator function is specified, use the default function - always return true
         if capability_validator is None:
             converter_support = ConverterSupport(converter_implementation=converter)
@@ -185,6 +211,8 @@ class ConverterRegistry:
         registry_names: Optional list of names for each registry
         registry_calling_conventions: Optional list of calling conventions
             for each registry
+        registry_loader: Optional function populating the registries, which is
+            called before the registries are first accessed
     """
 
     def __init__(
@@ -194,6 +222,7 @@ class ConverterRegistry:
         ],
         registry_names: Optional[Sequence[str]] = None,
         registry_calling_conventions: Optional[Sequence[CallingConvention]] = None,
+        registry_loader: Optional[Callable[[], None]] = None,
     ):
         # Copy reference to each dictionary object into attribute list
         self.registries = list(registries)
@@ -214,10 +243,17 @@ class ConverterRegistry:
                 CallingConvention.CTX for _ in range(len(self.registries))
             ]
 
+        self.registry_loader = registry_loader
         self.disallowed_targets: Collection[Target] = set()
 
         self.validate_invariants()
 
+    def load_registries(self) -> None:
+        """Populates the registries on first access, if a loader was provided"""
+        if self.registry_loader is not None:
+            registry_loader, self.registry_loader = self.registry_loader, None
+            registry_loader()
+
     def set_disallowed_targets(self, torch_executed_ops: Collection[Target]) -> None:
         self.disallowed_targets = torch_executed_ops
 
@@ -261,6 +297,7 @@ class ConverterRegistry:
                 + "made with node targets. Try accessing the registry with node.target"
             )
 
+        self.load_registries()
         self.validate_invariants()
 
         if (
@@ -303,6 +340,7 @@ class ConverterRegistry:
                 + "or use get_unvalidated to access without node validation."
             )
 
+        self.load_registries()
         self.validate_invariants()
         key = node.target
 
@@ -384,6 +422,7 @@ class ConverterRegistry:
 
         Returns a list of all converterts having the specified target
         """
+        self.load_registries()
         self.validate_invariants()
         converters_with_target = []
 
@@ -427,10 +466,12 @@ class ConverterRegistry:
 
     def __len__(self) -> int:
         """Returns the sum of lengths of all registries stored"""
+        self.load_registries()
         return sum(len(registry) for registry in self.registries)
 
     def unique_targets(self) -> Set[Target]:
         """Returns the set of unique converter targets stored across all registries"""
+        self.load_registries()
         return set.union(*[set(registry.keys()) for registry in self.registries])
 
     @staticmethod
@@ -470,4 +511,5 @@ DYNAMO_CONVERTERS: ConverterRegistry = ConverterRegistry(
     [DYNAMO_ATEN_CONVERTERS, FX_CONVERTERS],  # type: ignore[list-item]
     ["Dynamo ATen Converters Registry", "FX Legacy ATen Converters Registry"],
     [CallingConvention.CTX, CallingConvention.LEGACY],
+    load_converter_modules,
 )
@@ -21,8 +21,10 @@ from torch_tensorrt.dynamo.conversion._ConverterRegistry import (
 from torch_tensorrt.dynamo.conversion._ConverterRegistry import CallingConvention
 from torch_tensorrt.dynamo.conversion.converter_utils import (
     get_node_name,
+    get_tensor_format,
     get_trt_tensor,
 )
+from torch_tensorrt.dynamo.conversion.dtype_planning import plan_dtypes
 from torch_tensorrt.fx.observer import Observer
 from torch_tensorrt.logging import TRT_LOGGER
 
@@ -105,7 +107,30 @@ class TRTInterpreter(torch.fx.Interpreter):  # type: ignore[misc]
             [dtype._from(o) for o in output_dtypes] if output_dtypes else None
         )
 
-        _LOGGER.debug(f"Graph to be compiled to TensorRT: {self.module.graph}")
+        _LOGGER.debug("Graph to be compiled to TensorRT: %s", self.module.graph)
+
+    @property
+    def folded_nodes(self) -> int:
+        """Number of nodes evaluated at conversion time, which added no layers"""
+        folded_nodes: int = self.ctx.folded_nodes
+        return folded_nodes
+
+    @property
+    def cast_layers(self) -> int:
+        """Number of layers in the network which change the data type of a tensor"""
+        cast_layer_types = {
+            trt.LayerType.IDENTITY,
+            getattr(trt.LayerType, "CAST", trt.LayerType.IDENTITY),
+        }
+        cast_layers = 0
+        for i in range(self.ctx.net.num_layers):
+            layer = self.ctx.net.get_layer(i)
+            if (
+                layer.type in cast_layer_types
+                and layer.get_input(0).dtype != layer.get_output(0).dtype
+            ):
+                cast_layers += 1
+        return cast_layers
 
     def validate_conversion(self) -> Set[str]:
         missing_converters: Set[str] = set()
@@ -304,11 +329,21 @@ class TRTInterpreter(torch.fx.Interpreter):  # type: ignore[misc]
         TRT_INTERPRETER_CALL_PRE_OBSERVER.observe(self.module)
 
         self.input_specs_iter = 0
+        self.ctx.folded_nodes = 0
+        self.ctx.casts.clear()
+        self.ctx.skipped_casts = 0
+        plan_dtypes(self.module, self.compilation_settings)
         run_module_start_time = datetime.now()
         super().run()
         _LOGGER.info(
             f"TRT INetwork construction elapsed time: {datetime.now() - run_module_start_time}"
         )
+        _LOGGER.info(f"Evaluated {self.folded_nodes} node(s) at conversion time")
+        _LOGGER.info(
+            f"Network contains {self.cast_layers} cast layer(s), "
+            f"{self.ctx.skipped_casts} more were avoided by the planned data types "
+            "and by reusing casts"
+        )
         build_engine_start_time = datetime.now()
 
         builder_config = self._populate_trt_builder_config(
@@ -338,6 +373,7 @@ class TRTInterpreter(torch.fx.Interpreter):  # type: ignore[misc]
     def run_node(self, n: torch.fx.Node) -> torch.fx.Node:
         self._cur_node_name = get_node_name(n)
         self._cur_node = n
+        self.ctx.current_node = n
         # add "_itensor_to_tensor_meta"
         kwargs = dict(n.kwargs)
         kwargs["_itensor_to_tensor_meta"] = self._itensor_to_tensor_meta
@@ -393,11 +429,23 @@ class TRTInterpreter(torch.fx.Interpreter):  # type: ignore[misc]
         _LOGGER.debug(
             f"Adding input to in-progress INetwork: {target} [shape={shape}, dtype={trt_input_dtype}]"
         )
-        return self.ctx.net.add_input(
+        trt_input = self.ctx.net.add_input(
             name=target,
             shape=tuple(shape),
             dtype=trt_input_dtype,
         )
+        self._set_tensor_format(trt_input, self._cur_node)
+        return trt_input
+
+    def _set_tensor_format(self, tensor: trt.ITensor, node: Any) -> None:
+        """Restricts an engine input or output to the format it is bound in"""
+        tensor_format = get_tensor_format(
+            node.meta.get("val") if isinstance(node, torch.fx.Node) else None,
+            self.compilation_settings.channels_last,
+        )
+        if tensor_format != trt.TensorFormat.LINEAR:
+            tensor.allowed_formats = 1 << int(tensor_format)
+            _LOGGER.debug(f"Binding {tensor.name} in {tensor_format} format")
 
     def call_module(
         self, target: str, args: Any, kwargs: Any
@@ -415,9 +463,11 @@ class TRTInterpreter(torch.fx.Interpreter):  # type: ignore[misc]
         converter, calling_convention = converter_packet
 
         assert self._cur_node_name is not None
-        _LOGGER.debug(
-            f"Converting node {self._cur_node_name} (kind: {target}, args: {TRTInterpreter._args_str(args)})"
-        )
+        # Formatting the arguments of every node is costly, so only done if logged
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                f"Converting node {self._cur_node_name} (kind: {target}, args: {TRTInterpreter._args_str(args)})"
+            )
         if calling_convention is CallingConvention.LEGACY:
             return converter(self.ctx.net, submod, args, kwargs, self._cur_node_name)
         else:
@@ -434,9 +484,10 @@ class TRTInterpreter(torch.fx.Interpreter):  # type: ignore[misc]
         converter, calling_convention = converter_packet
 
         assert self._cur_node_name is not None
-        _LOGGER.debug(
-            f"Converting node {self._cur_node_name} (kind: {target}, args: {TRTInterpreter._args_str(args)})"
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                f"Converting node {self._cur_node_name} (kind: {target}, args: {TRTInterpreter._args_str(args)})"
+            )
         if calling_convention is CallingConvention.LEGACY:
             return converter(self.ctx.net, target, args, kwargs, self._cur_node_name)
         else:
@@ -468,9 +519,10 @@ class TRTInterpreter(torch.fx.Interpreter):  # type: ignore[misc]
         converter, calling_convention = converter_packet
 
         assert self._cur_node_name is not None
-        _LOGGER.debug(
-            f"Converting node {self._cur_node_name} (kind: {target}, args: {TRTInterpreter._args_str(args)})"
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                f"Converting node {self._cur_node_name} (kind: {target}, args: {TRTInterpreter._args_str(args)})"
+            )
         if calling_convention is CallingConvention.LEGACY:
             return converter(self.ctx.net, target, args, kwargs, self._cur_node_name)
         else:
@@ -502,11 +554,24 @@ class TRTInterpreter(torch.fx.Interpreter):  # type: ignore[misc]
                 f"Specified output dtypes ({len(self.output_dtypes)}) differ from number of outputs ({len(outputs)})"
             )
 
+        assert self._cur_node is not None
+        output_nodes = self._cur_node.args[0]
+        if not isinstance(output_nodes, (list, tuple)):
+            output_nodes = (output_nodes,)
+
         for i, output in enumerate(outputs):
             name = f"output{i}"
 
+            # The output types inferred from the graph take precedence, the layer
+            # name is only used to recognize boolean outputs without them
             output_dtype = dtype.unknown
-            if any(
+            if self.output_dtypes is not None:
+                output_dtype = self.output_dtypes[i]
+                # Outputs which are already 64-bit integers need no cast
+                int64_dtype = dtype.i64.to(trt.DataType)
+                if output_dtype == dtype.i64 and output.dtype != int64_dtype:
+                    output = self.ctx.net.add_cast(output, int64_dtype).get_output(0)
+            elif any(
                 op_name in output.name.split("_")
                 for op_name in (
                     "eq",
@@ -523,19 +588,12 @@ class TRTInterpreter(torch.fx.Interpreter):  # type: ignore[misc]
                 )
             ):
                 output_dtype = dtype.b
-            elif self.output_dtypes is not None:
-                if self.output_dtypes[i] == dtype.i64:
-                    output = self.ctx.net.add_cast(
-                        output, dtype.i64.to(trt.DataType)
-                    ).get_output(0)
-                    output_dtype = dtype.i64
-                else:
-                    output_dtype = self.output_dtypes[i]
 
             self.ctx.net.mark_output(output)
             if output_dtype is not dtype.unknown:
                 output.dtype = output_dtype.to(trt.DataType, use_default=True)
             output.name = name
+            self._set_tensor_format(output, output_nodes[i])
 
             self._output_names.append(name)
             _LOGGER.debug(
@@ -1,4 +1,5 @@
-from . import aten_ops_converters, ops_evaluators, prims_ops_converters
+# Converter implementations are imported first, since converter_utils imports them
+from . import impl  # noqa: F401  # usort: skip
 from ._conversion import convert_module, interpret_module_to_result
 from ._ConversionContext import ConversionContext
 from ._ConverterRegistry import *  # noqa: F403
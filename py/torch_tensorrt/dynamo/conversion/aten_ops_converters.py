@@ -2,7 +2,7 @@
 
 import logging
 import operator
-from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+from typing import Callable, Dict, Sequence, Tuple, Union
 
 import numpy as np
 import torch
@@ -14,21 +14,19 @@ from torch_tensorrt.dynamo.conversion._ConverterRegistry import (
     dynamo_tensorrt_converter,
 )
 from torch_tensorrt.dynamo.conversion.converter_utils import (
+    args_bounds_check,
     dynamic_unsupported_with_args,
     enforce_tensor_types,
+    get_positive_dim,
+    get_trt_tensor,
     is_only_operator_on_placeholder,
+    to_numpy,
 )
 from torch_tensorrt.fx.types import TRTTensor
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 
-def args_bounds_check(
-    args: Tuple[Argument, ...], i: int, replacement: Optional[Any] = None
-) -> Any:
-    return args[i] if len(args) > i else replacement
-
-
 def get_ir(target: Target) -> SourceIR:
     target_module = getattr(target, "__module__", "None")
     if any(
@@ -154,8 +152,18 @@ def aten_ops_layer_norm(
     )
 
 
+def group_norm_validator(node: Node) -> bool:
+    # Groups are formed from a static number of channels
+    input_meta = (
+        node.args[0].meta.get("val") if isinstance(node.args[0], Node) else None
+    )
+    return input_meta is None or isinstance(input_meta.shape[1], int)
+
+
 @dynamo_tensorrt_converter(
-    torch.ops.aten.native_group_norm.default, capability_validator=one_user_validator
+    torch.ops.aten.native_group_norm.default,
+    capability_validator=lambda node: one_user_validator(node)
+    and group_norm_validator(node),
 )
 @enforce_tensor_types(
     {
@@ -168,6 +176,47 @@ def aten_ops_native_group_norm(
     args: Tuple[Argument, ...],
     kwargs: Dict[str, Argument],
     name: str,
+) -> Union[TRTTensor, Sequence[TRTTensor]]:
+    # Only the normalized output is used, so the mean and rstd are not computed
+    output = impl.normalization.native_group_norm(
+        ctx,
+        target,
+        SourceIR.ATEN,
+        name,
+        input=args[0],
+        weight=args[1],
+        bias=args[2],
+        N=args[3],
+        C=args[4],
+        HxW=args[5],
+        group=args[6],
+        eps=args[7],
+        return_mean_rstd=False,
+    )
+    return output, None, None
+
+
+def getitem_users_validator(node: Node) -> bool:
+    # Validate that all users are getitem nodes, which access elements of the output tuple
+    return all(user.target == operator.getitem for user in node.users)
+
+
+@dynamo_tensorrt_converter(
+    torch.ops.aten.native_group_norm.default,
+    capability_validator=lambda node: getitem_users_validator(node)
+    and group_norm_validator(node),
+)
+@enforce_tensor_types(
+    {
+        0: (TRTTensor,),
+    }
+)
+def aten_ops_native_group_norm_with_mean_rstd(
+    ctx: ConversionContext,
+    target: Target,
+    args: Tuple[Argument, ...],
+    kwargs: Dict[str, Argument],
+    name: str,
 ) -> Union[TRTTensor, Sequence[TRTTensor]]:
     return impl.normalization.native_group_norm(
         ctx,
@@ -185,8 +234,12 @@ def aten_ops_native_group_norm(
     )
 
 
-@dynamo_tensorrt_converter(torch.ops.aten.group_norm.default)
-@dynamo_tensorrt_converter(torch.ops.aten.group_norm)
+@dynamo_tensorrt_converter(
+    torch.ops.aten.group_norm.default, capability_validator=group_norm_validator
+)
+@dynamo_tensorrt_converter(
+    torch.ops.aten.group_norm, capability_validator=group_norm_validator
+)
 @enforce_tensor_types(
     {
         0: (TRTTensor,),
@@ -220,7 +273,24 @@ def aten_ops_cat(
     args: Tuple[Argument, ...],
     kwargs: Dict[str, Argument],
     name: str,
-) -> Union[TRTTensor, Sequence[TRTTensor]]:
+) -> Union[TRTTensor, Sequence[TRTTensor], np.ndarray]:
+    # Concatenations of constants, such as static sizes, are evaluated
+    if not any(isinstance(input, TRTTensor) for input in args[0]):
+        constants = [np.asarray(to_numpy(input)) for input in args[0]]
+        output = np.concatenate(
+            constants,
+            axis=get_positive_dim(args_bounds_check(args, 1, 0), constants[0].ndim),
+        )
+
+        # Outputs of the engine must be tensors, so they are added as constants
+        if ctx.current_node is not None and any(
+            user.op == "output" for user in ctx.current_node.users
+        ):
+            return get_trt_tensor(ctx, output, name)
+
+        ctx.folded_nodes += 1
+        return output
+
     return impl.cat.cat(
         ctx,
         target,
@@ -370,22 +440,6 @@ def aten_ops_sigmoid(
     )
 
 
-@enforce_tensor_types(
-    {
-        0: (TRTTensor,),
-    }
-)
-@dynamo_tensorrt_converter(torch.ops.aten.sym_size.int)
-def aten_ops_symsize_int(
-    ctx: ConversionContext,
-    target: Target,
-    args: Tuple[Argument, ...],
-    kwargs: Dict[str, Argument],
-    name: str,
-) -> Union[TRTTensor, Sequence[TRTTensor]]:
-    return impl.shape.shape(ctx, target, SourceIR.ATEN, name, args[0], args[1])
-
-
 def index_dtype_validator(node: Node) -> bool:
     index = node.args[1]
     for ind in index:
@@ -2355,8 +2409,17 @@ def aten_ops_max_pool(
 
 
 def attention_validator(node: Node) -> bool:
-    # Currently, `attn_mask` is not supported
-    return args_bounds_check(node.args, 3) is None
+    # Causal masks are built from the static sequence lengths of the query and key
+    if not (args_bounds_check(node.args, 5, False) or node.kwargs.get("is_causal")):
+        return True
+
+    query_meta, key_meta = (
+        arg.meta.get("val") if isinstance(arg, Node) else None for arg in node.args[:2]
+    )
+    return not any(
+        meta is not None and not isinstance(meta.shape[-2], int)
+        for meta in (query_meta, key_meta)
+    )
 
 
 @dynamo_tensorrt_converter(
@@ -2378,8 +2441,9 @@ def tensorrt_scaled_dot_product_attention(
         args[0],
         args[1],
         args[2],
-        args_bounds_check(args, 5, False),
+        args_bounds_check(args, 5, kwargs.get("is_causal", False)),
         kwargs.get("scale", None),
+        attn_mask=args_bounds_check(args, 3, kwargs.get("attn_mask", None)),
     )
 
 
@@ -15,6 +15,7 @@ from torch_tensorrt.dynamo.conversion._ConverterRegistry import (
     ConverterRegistry,
     DynamoConverterImplSignature,
 )
+from torch_tensorrt.dynamo.conversion.dtype_planning import PLANNED_DTYPE
 from torch_tensorrt.fx.converters.converter_utils import (
     broadcast,
     get_axes_for_reduce_op,
@@ -26,6 +27,12 @@ import tensorrt as trt
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 
+def args_bounds_check(
+    args: Tuple[Argument, ...], i: int, replacement: Optional[Any] = None
+) -> Any:
+    return args[i] if len(args) > i else replacement
+
+
 def get_node_name(node: torch.fx.Node) -> str:
     # nn_module_stack preserves the call stack of pytorch nn.modules
     # The call stack contains a detailed name of the module
@@ -131,7 +138,8 @@ def cast_trt_tensor(
 
     Adds an Identity layer to the network which performs the conversion
     if the input's dtype is different from the cast type. Otherwise returns
-    input unchanged
+    input unchanged. Casts already added for the input are reused, so each
+    tensor is cast to a given dtype only once
 
     Args:
         ctx (ConversionContext): A ConversionContext containing the TensorRT network
@@ -146,6 +154,10 @@ def cast_trt_tensor(
     trt_dtype = _enums.dtype._from(dtype).to(trt.DataType)
 
     if input_val.dtype != trt_dtype:
+        if (input_val.name, trt_dtype) in ctx.casts:
+            ctx.skipped_casts += 1
+            return ctx.casts[(input_val.name, trt_dtype)]
+
         source_ir = source_ir if source_ir is not None else SourceIR.UNKNOWN
         target_str = ConverterRegistry.qualified_name_or_str(target)
         target_name = f"{source_ir}_ops{('.' + target_str) if target_str else ''}"
@@ -153,16 +165,35 @@ def cast_trt_tensor(
         identity_layer = ctx.net.add_identity(input_val)
         identity_layer.set_output_type(0, trt_dtype)
         identity_layer.name = f"Cast ITensor {input_val.name} from {input_val.dtype} to {trt_dtype} - [{target_name}]-[{name}]"
+        ctx.casts[(input_val.name, trt_dtype)] = identity_layer.get_output(0)
         return identity_layer.get_output(0)
     else:
         return input_val
 
 
+def get_planned_dtype(ctx: ConversionContext, target: Target) -> Optional[TRTDataType]:
+    """Returns the data type planned for the node being converted, if any
+
+    The plan only applies to the operation of the node itself, so it is only
+    returned for the target of the node being converted
+    Args:
+        ctx (ConversionContext): A ConversionContext object
+        target (Target): Target of the calling converter
+    Returns:
+        The TRT data type planned for the node, or None if there is none
+    """
+    node = ctx.current_node
+    if node is None or node.target != target or PLANNED_DTYPE not in node.meta:
+        return None
+    return _enums.dtype._from(node.meta[PLANNED_DTYPE]).to(trt.DataType)
+
+
 def cast_int_int_div_trt_tensor(
     ctx: ConversionContext,
     lhs_val: TRTTensor,
     rhs_val: TRTTensor,
     name: str,
+    target: Target = "",
 ) -> List[TRTTensor]:
     """
     Given two `int` data type TRT Tensor to div operation, cast the TRT Tensor to float type
@@ -171,12 +202,18 @@ def cast_int_int_div_trt_tensor(
         lhs_val (TRTTensor): A TRT Tensor numerator
         rhs_val (TRTTensor): A TRT Tensor numerator
         name (str): Name of calling layer
+        target (Target): Target of calling node, whose planned data type is used if
+            it is a floating point type, float32 otherwise
     Returns:
         A list of lhs_val and rhs_val casted to the approriate datatype
     """
-    if lhs_val.dtype == trt.int32 and rhs_val.dtype == trt.int32:
-        lhs_val = cast_trt_tensor(ctx, lhs_val, trt.float32, name)
-        rhs_val = cast_trt_tensor(ctx, rhs_val, trt.float32, name)
+    int_dtypes = (trt.int32, trt.int64)
+    if lhs_val.dtype in int_dtypes and rhs_val.dtype in int_dtypes:
+        float_dtype = get_planned_dtype(ctx, target)
+        if float_dtype not in (trt.float16, trt.float32):
+            float_dtype = trt.float32
+        lhs_val = cast_trt_tensor(ctx, lhs_val, float_dtype, name)
+        rhs_val = cast_trt_tensor(ctx, rhs_val, float_dtype, name)
     return [lhs_val, rhs_val]
 
 
@@ -711,3 +748,74 @@ def set_item(
         0,
     )
     return ans
+
+
+# Channels-last formats of engine inputs and outputs, by tensor rank
+CHANNELS_LAST_FORMATS = {4: trt.TensorFormat.HWC, 5: trt.TensorFormat.DHWC}
+
+# Types of engine inputs and outputs which may be bound in a channels-last format
+CHANNELS_LAST_DTYPES = {torch.float32, torch.float16}
+
+
+def get_traced_format(val: Any) -> Optional[trt.TensorFormat]:
+    """Returns the format of a tensor as traced, which it is expected to have at runtime
+
+    Tensors which are contiguous in both or neither of the linear and channels-last
+    formats (such as those with a single channel) have no single format
+    """
+    if not isinstance(val, torch.Tensor):
+        return None
+
+    channels_last = val.dim() in CHANNELS_LAST_FORMATS and val.is_contiguous(
+        memory_format=(
+            torch.channels_last if val.dim() == 4 else torch.channels_last_3d
+        )
+    )
+    if channels_last == val.is_contiguous():
+        return None
+
+    return (
+        CHANNELS_LAST_FORMATS[val.dim()] if channels_last else trt.TensorFormat.LINEAR
+    )
+
+
+def get_tensor_format(val: Any, channels_last: bool) -> trt.TensorFormat:
+    """Returns the format in which an engine input or output is bound
+
+    In channels-last mode, 4-D and 5-D floating point tensors are bound in a
+    channels-last format unless they were traced in the linear format, so each
+    tensor keeps its format across the engine boundary
+    """
+    if (
+        channels_last
+        and isinstance(val, torch.Tensor)
+        and val.dim() in CHANNELS_LAST_FORMATS
+        and val.dtype in CHANNELS_LAST_DTYPES
+        and get_traced_format(val) != trt.TensorFormat.LINEAR
+    ):
+        return CHANNELS_LAST_FORMATS[val.dim()]
+
+    return trt.TensorFormat.LINEAR
+
+
+def count_boundary_reformats(module: torch.fx.GraphModule, channels_last: bool) -> int:
+    """Returns the number of inputs and outputs of the engine built from a module which
+    are bound in a different format than they were traced in
+
+    Each of these tensors is reformatted by the runtime when the engine is executed
+    """
+    vals = []
+    for node in module.graph.nodes:
+        if node.op == "placeholder":
+            vals.append(node.meta.get("val"))
+        elif node.op == "output":
+            torch.fx.node.map_arg(node.args, lambda n: vals.append(n.meta.get("val")))
+
+    return len(
+        [
+            val
+            for val in vals
+            if get_traced_format(val)
+            not in (None, get_tensor_format(val, channels_last))
+        ]
+    )
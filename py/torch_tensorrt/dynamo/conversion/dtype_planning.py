@@ -0,0 +1,116 @@
+import functools
+import logging
+from typing import Any, Optional
+
+import torch
+from torch.fx.node import Argument
+from torch_tensorrt.dynamo._settings import CompilationSettings
+
+logger = logging.getLogger(__name__)
+
+# Key in the node metadata under which the planned data type of a node is stored
+PLANNED_DTYPE = "planned_dtype"
+
+# Elementwise operators whose converters compute in the promoted type of their
+# operands, and which consult the planned data type instead of promoting locally
+PLANNED_OPS = {
+    torch.ops.aten.add.Tensor,
+    torch.ops.aten.add.Scalar,
+    torch.ops.aten.sub.Tensor,
+    torch.ops.aten.sub.Scalar,
+    torch.ops.aten.mul.Tensor,
+    torch.ops.aten.mul.Scalar,
+    torch.ops.aten.div.Tensor,
+    torch.ops.aten.div.Scalar,
+    torch.ops.aten.maximum.default,
+    torch.ops.aten.minimum.default,
+    torch.ops.aten.eq.Tensor,
+    torch.ops.aten.eq.Scalar,
+    torch.ops.aten.ne.Tensor,
+    torch.ops.aten.ne.Scalar,
+    torch.ops.aten.gt.Tensor,
+    torch.ops.aten.gt.Scalar,
+    torch.ops.aten.lt.Tensor,
+    torch.ops.aten.lt.Scalar,
+}
+
+
+def plan_dtypes(
+    gm: torch.fx.GraphModule, compilation_settings: CompilationSettings
+) -> int:
+    """Plans the data type each elementwise node of the graph computes in
+
+    The data type is inferred once from the graph metadata, following the type
+    promotion of Torch, and stored in the metadata of the node. Converters create
+    the constant operands of the node in this type directly, instead of casting
+    them after the fact
+
+    Args:
+        gm: FX GraphModule to convert
+        compilation_settings: Settings of the compilation, for double truncation
+    Returns:
+        Number of nodes for which a data type was planned
+    """
+    planned_nodes = 0
+
+    for node in gm.graph.nodes:
+        node.meta.pop(PLANNED_DTYPE, None)
+        if node.op != "call_function" or node.target not in PLANNED_OPS:
+            continue
+
+        planned_dtype = _promoted_dtype(gm, *node.args[:2])
+
+        # TensorRT has no double type, so doubles are computed in float32 if truncated
+        if planned_dtype == torch.float64:
+            planned_dtype = (
+                torch.float32 if compilation_settings.truncate_double else None
+            )
+        # True division of integers computes in the default floating point type
+        elif (
+            node.target in (torch.ops.aten.div.Tensor, torch.ops.aten.div.Scalar)
+            and planned_dtype is not None
+            and not planned_dtype.is_floating_point
+        ):
+            planned_dtype = torch.get_default_dtype()
+
+        if planned_dtype is not None:
+            node.meta[PLANNED_DTYPE] = planned_dtype
+            planned_nodes += 1
+
+    logger.debug(f"Planned the data types of {planned_nodes} node(s)")
+    return planned_nodes
+
+
+def _promoted_dtype(
+    gm: torch.fx.GraphModule, lhs: Argument, rhs: Argument
+) -> Optional[torch.dtype]:
+    """Returns the type Torch promotes the operands to, if known from the metadata"""
+    lhs_operand, rhs_operand = _operand(gm, lhs), _operand(gm, rhs)
+    if lhs_operand is None or rhs_operand is None:
+        return None
+
+    try:
+        return torch.result_type(lhs_operand, rhs_operand)
+    except (RuntimeError, TypeError):
+        return None
+
+
+def _operand(gm: torch.fx.GraphModule, arg: Argument) -> Any:
+    """Returns a value standing in for an operand in type promotion, if known"""
+    if isinstance(arg, (bool, int, float)):
+        return arg
+    if not isinstance(arg, torch.fx.Node):
+        return None
+
+    val = arg.meta.get("val", arg.meta.get("tensor_meta"))
+    if val is None and arg.op == "get_attr":
+        val = functools.reduce(getattr, str(arg.target).split("."), gm)
+    if isinstance(val, torch.SymInt):
+        return 0
+    elif isinstance(val, torch.SymFloat):
+        return 0.0
+    elif hasattr(val, "dtype") and hasattr(val, "shape"):
+        # Promotion only depends on the type and whether the tensor has dimensions
+        return torch.empty((0,) * len(val.shape), dtype=val.dtype, device="meta")
+
+    return None
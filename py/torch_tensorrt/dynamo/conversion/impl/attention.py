@@ -1,15 +1,79 @@
+import logging
 import math
-from typing import Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import tensorrt as trt
+import torch
 from torch.fx.node import Target
-from torch_tensorrt._enums import dtype
 from torch_tensorrt.dynamo.conversion import impl
 from torch_tensorrt.dynamo.conversion._ConversionContext import ConversionContext
-from torch_tensorrt.dynamo.conversion.converter_utils import SourceIR, get_trt_tensor
+from torch_tensorrt.dynamo.conversion.converter_utils import (
+    SourceIR,
+    cast_trt_tensor,
+    get_trt_tensor,
+)
+from torch_tensorrt.fx.converters.converter_utils import broadcast, set_layer_name
 from torch_tensorrt.fx.types import TRTTensor
 
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# Input types for which TensorRT fuses attention into a multi-head attention kernel
+MHA_FUSION_DTYPES = {trt.float16, trt.bfloat16}
+
+# Largest head size supported by the fused multi-head attention kernels
+MHA_FUSION_MAX_HEAD_SIZE = 512
+
+
+def mha_fusion_blockers(
+    query: TRTTensor, key: TRTTensor, value: TRTTensor
+) -> List[str]:
+    """
+    Returns the reasons why TensorRT is not expected to fuse attention over the given
+    inputs into a multi-head attention kernel, which avoids materializing the attention
+    scores. This is a prediction from the known requirements of the fused kernels, not
+    an inspection of the built engine, in which TensorRT makes the final decision. An
+    empty list means that the attention is expected to be fused
+    """
+    blockers = []
+
+    if not len(query.shape) == len(key.shape) == len(value.shape) == 4:
+        blockers.append("inputs are not of shape (batch, heads, sequence, head size)")
+
+    if not all(t.dtype in MHA_FUSION_DTYPES for t in (query, key, value)):
+        blockers.append(
+            f"inputs are of type {query.dtype}, {key.dtype} and {value.dtype}, "
+            "not float16 or bfloat16"
+        )
+
+    head_sizes = {query.shape[-1], key.shape[-1], value.shape[-1]}
+    if any(head_size < 0 for head_size in head_sizes):
+        blockers.append("the head size is dynamic")
+    elif len(head_sizes) != 1:
+        blockers.append(f"the query, key and value head sizes {head_sizes} differ")
+    elif query.shape[-1] % 8 or query.shape[-1] > MHA_FUSION_MAX_HEAD_SIZE:
+        blockers.append(
+            f"the head size {query.shape[-1]} is not a multiple of 8 up to "
+            f"{MHA_FUSION_MAX_HEAD_SIZE}"
+        )
+
+    return blockers
+
+
+def causal_mask_indices(L: int, S: int, rank: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the key positions, of shape (1, ..., 1, S), and the query positions plus
+    one, of shape (1, ..., L, 1), such that query i may attend to key j if j < i + 1.
+    Comparing these broadcasts to the causal mask without storing L x S constants
+    """
+    key_positions: np.ndarray = np.arange(S, dtype=np.int32).reshape(
+        (1,) * (rank - 1) + (S,)
+    )
+    query_positions: np.ndarray = np.arange(1, L + 1, dtype=np.int32).reshape(
+        (1,) * (rank - 2) + (L, 1)
+    )
+    return key_positions, query_positions
+
 
 def scaled_dot_product_attention(
     ctx: ConversionContext,
@@ -21,9 +85,24 @@ def scaled_dot_product_attention(
     value: TRTTensor,
     is_causal: bool,
     scale: Optional[float],
+    attn_mask: Optional[Union[TRTTensor, np.ndarray, torch.Tensor]] = None,
 ) -> TRTTensor:
+    """
+    Emits attention as BMM -> scale -> mask -> softmax -> BMM, the pattern which
+    TensorRT fuses into a multi-head attention kernel. The scale is a single
+    multiplication and masks are applied elementwise, with the causal mask computed
+    from O(L + S) position constants, so no pointwise operation blocks the fusion
+    """
     L, S = query.shape[-2], key.shape[-2]
 
+    blockers = mha_fusion_blockers(query, key, value)
+    if blockers:
+        _LOGGER.warning(
+            f"Scaled dot product attention {name} is not expected to be fused into a "
+            f"multi-head attention kernel, since {', '.join(blockers)}. This is "
+            "predicted from the inputs, the built engine is not inspected"
+        )
+
     mm = impl.matmul.matrix_multiply(
         ctx,
         target,
@@ -33,34 +112,58 @@ def scaled_dot_product_attention(
         key,
         other_matrix_op=trt.MatrixOperation.TRANSPOSE,
     )
+
     if scale is None:
-        scaled = impl.elementwise.div(
+        scale = 1 / math.sqrt(query.shape[-1])
+    scaled = impl.elementwise.mul(
+        ctx,
+        target,
+        source_ir,
+        name + "_scale",
+        mm,
+        scale,
+    )
+
+    if is_causal:
+        key_positions, query_positions = causal_mask_indices(L, S, len(scaled.shape))
+        causal_mask = impl.elementwise.lt(
             ctx,
             target,
             source_ir,
-            name + "_scale",
-            mm,
-            math.sqrt(query.shape[-1]),
+            name + "_causal_mask",
+            get_trt_tensor(ctx, key_positions, name + "_key_positions"),
+            get_trt_tensor(ctx, query_positions, name + "_query_positions"),
         )
-    else:
-        scaled = impl.elementwise.mul(
-            ctx,
-            target,
-            source_ir,
-            name + "_scale",
-            mm,
-            scale,
+        scaled = _mask_scores(
+            ctx, target, source_ir, name + "_causal", scaled, causal_mask
         )
 
-    if is_causal:
-        attn_bias = np.zeros((L, S), dtype=dtype._from(query.dtype).to(np.dtype))
-        temp_mask = np.logical_not(np.tril(np.ones((L, S), dtype=np.bool_), k=0))
-        attn_bias = np.ma.array(attn_bias, mask=temp_mask).filled(float("-inf"))
-        attn_bias = get_trt_tensor(ctx, attn_bias, name + "_attn_bias")
+    if attn_mask is not None:
+        if not isinstance(attn_mask, TRTTensor):
+            attn_mask = get_trt_tensor(ctx, attn_mask, name + "_attn_mask")
 
-        scaled = impl.elementwise.add(
-            ctx, target, source_ir, name + "_attn_bias_add", scaled, attn_bias
-        )
+        if attn_mask.dtype == trt.bool:
+            # Boolean masks select the positions which take part in the attention
+            attn_mask, _ = broadcast(
+                ctx.net, attn_mask, scaled, name + "_attn_mask", name + "_scaled"
+            )
+            scaled = _mask_scores(
+                ctx, target, source_ir, name + "_attn_mask", scaled, attn_mask
+            )
+        else:
+            # Floating point masks are added to the attention scores
+            if attn_mask.dtype != query.dtype:
+                attn_mask = cast_trt_tensor(
+                    ctx,
+                    attn_mask,
+                    query.dtype,
+                    name + "_attn_mask_cast",
+                    target,
+                    source_ir,
+                )
+            scaled = impl.elementwise.add(
+                ctx, target, source_ir, name + "_attn_mask_add", scaled, attn_mask
+            )
 
     softmax = impl.normalization.softmax(
         ctx, target, source_ir, name + "_softmax", scaled, -1
@@ -75,3 +178,30 @@ def scaled_dot_product_attention(
     )
 
     return out
+
+
+def _mask_scores(
+    ctx: ConversionContext,
+    target: Union[Target, str],
+    source_ir: Optional[SourceIR],
+    name: str,
+    scores: TRTTensor,
+    mask: TRTTensor,
+) -> TRTTensor:
+    # Masked scores are replaced with negative infinity by a select layer, which
+    # broadcasts the mask instead of expanding it to the shape of the scores
+    masked_value = cast_trt_tensor(
+        ctx,
+        get_trt_tensor(
+            ctx,
+            np.full((1,) * len(scores.shape), -np.inf, dtype=np.float32),
+            name + "_masked_value",
+        ),
+        scores.dtype,
+        name + "_masked_value_cast",
+        target,
+        source_ir,
+    )
+    select_layer = ctx.net.add_select(mask, scores, masked_value)
+    set_layer_name(select_layer, target, name + "_select", source_ir)
+    return select_layer.get_output(0)
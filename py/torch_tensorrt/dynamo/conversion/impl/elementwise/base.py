@@ -12,6 +12,7 @@ from torch_tensorrt.dynamo.conversion._ConversionContext import ConversionContex
 from torch_tensorrt.dynamo.conversion.converter_utils import (
     broadcast_to_same_shape,
     cast_trt_tensor,
+    get_planned_dtype,
     get_trt_tensor,
 )
 from torch_tensorrt.fx.converters.converter_utils import (
@@ -19,7 +20,7 @@ from torch_tensorrt.fx.converters.converter_utils import (
     has_dynamic_shape,
     set_layer_name,
 )
-from torch_tensorrt.fx.types import TRTElementWiseOp, TRTTensor
+from torch_tensorrt.fx.types import TRTDataType, TRTElementWiseOp, TRTTensor
 
 
 def get_python_op_from_trt_elementwise_op(
@@ -57,6 +58,34 @@ def get_python_op_from_trt_elementwise_op(
         raise RuntimeError(f"{trt_op} is not supported yet!")
 
 
+def _promote_trt_dtypes(lhs: TRTDataType, rhs: TRTDataType) -> TRTDataType:
+    "Returns the TRT data type Torch promotes two TRT data types to"
+    promoted_type: TRTDataType = _enums.dtype._from(
+        torch.promote_types(
+            _enums.dtype._from(lhs).to(torch.dtype),
+            _enums.dtype._from(rhs).to(torch.dtype),
+        )
+    ).to(trt.DataType)
+    return promoted_type
+
+
+def _is_integer(trt_dtype: TRTDataType) -> bool:
+    return trt_dtype in (trt.int8, trt.int32, trt.int64)
+
+
+def _constant_needs_cast(
+    ctx: ConversionContext, val: Any, trt_dtype: TRTDataType
+) -> bool:
+    "Returns whether a constant created in its own type needs a cast to trt_dtype"
+    if not isinstance(val, (torch.Tensor, np.ndarray)):
+        return False
+
+    val_dtype = _enums.dtype._from(val.dtype)
+    if val_dtype == _enums.dtype.f64 and ctx.compilation_settings.truncate_double:
+        val_dtype = _enums.dtype.f32
+    return bool(val_dtype != _enums.dtype._from(trt_dtype))
+
+
 def convert_binary_elementwise(
     ctx: ConversionContext,
     target: Target,
@@ -111,6 +140,23 @@ def convert_binary_elementwise(
         )
         return get_python_op_from_trt_elementwise_op(op_type)(lhs_val, rhs_val)
 
+    # If a data type is planned for the node, constant operands are created in the
+    # type the operation computes in, so only tensors of a different kind are cast.
+    # Integer tensors keep their width, since TensorRT computes shapes in int32
+    planned_dtype = get_planned_dtype(ctx, target)
+    if planned_dtype is not None:
+        tensor_dtype = lhs_dtype if rhs_dtype is None else rhs_dtype
+        if lhs_dtype is not None and rhs_dtype is not None:
+            tensor_dtype = _promote_trt_dtypes(lhs_dtype, rhs_dtype)
+        compute_dtype = _promote_trt_dtypes(tensor_dtype, planned_dtype)
+        if _is_integer(tensor_dtype) and _is_integer(planned_dtype):
+            compute_dtype = tensor_dtype
+
+        for val, val_dtype in ((lhs_val, lhs_dtype), (rhs_val, rhs_dtype)):
+            if val_dtype is None and _constant_needs_cast(ctx, val, compute_dtype):
+                ctx.skipped_casts += 1
+        lhs_dtype = rhs_dtype = compute_dtype
+
     # If the following conditions are true:
     #  1. the network has implicit batch dimension,
     #  2. one operand has shape [] (real shape is [batch_size]),
@@ -133,13 +179,7 @@ def convert_binary_elementwise(
     lhs_val = get_trt_tensor(ctx, lhs_val, f"{name}_lhs", lhs_dtype)
     rhs_val = get_trt_tensor(ctx, rhs_val, f"{name}_rhs", rhs_dtype)
 
-    promoted_type = _enums.dtype._from(
-        torch.promote_types(
-            _enums.dtype._from(lhs_val.dtype).to(torch.dtype),
-            _enums.dtype._from(rhs_val.dtype).to(torch.dtype),
-        )
-    )
-    trt_promoted_type = promoted_type.to(trt.DataType)
+    trt_promoted_type = _promote_trt_dtypes(lhs_val.dtype, rhs_val.dtype)
 
     if trt_promoted_type != lhs_val.dtype:
         lhs_val = cast_trt_tensor(
@@ -1,6 +1,5 @@
-import functools
 import time
-from typing import Optional, Sequence, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import tensorrt as trt
@@ -55,6 +54,42 @@ def embedding(
     return gather_layer.get_output(0)
 
 
+def embedding_bag_gather_indices(
+    offsets: np.ndarray, num_indices: int
+) -> Tuple[List[np.ndarray], np.ndarray, np.ndarray]:
+    """Computes the positions of the embeddings of each bag, grouped by bag size
+
+    Bags are grouped into buckets whose sizes are within a factor of two, and each bag
+    is padded to the longest bag of its bucket. However uneven the bags are, at most
+    about twice the number of embeddings is gathered.
+
+    Given offsets ending with the total number of embeddings, returns a (bucket_bags,
+    max_bag_size) matrix of positions into the embeddings for each bucket, in which
+    padding points to the position `num_indices` past the last embedding; the row of
+    each bag in the concatenated buckets; and the size of each bag
+    """
+    bag_sizes = np.maximum(offsets[1:] - offsets[:-1], 0).astype(np.int64)
+    buckets = np.ceil(np.log2(np.maximum(bag_sizes, 1))).astype(np.int64)
+
+    bucket_indices = []
+    bucket_bags = []
+    for bucket in np.unique(buckets):
+        bags = np.flatnonzero(buckets == bucket)
+        max_bag_size = max(int(bag_sizes[bags].max()), 1)
+
+        positions = offsets[bags, None].astype(np.int64) + np.arange(max_bag_size)
+        gather_indices = np.where(
+            np.arange(max_bag_size) < bag_sizes[bags, None], positions, num_indices
+        )
+        bucket_indices.append(gather_indices.astype(np.int32))
+        bucket_bags.append(bags)
+
+    bag_rows: np.ndarray = np.empty(len(bag_sizes), dtype=np.int32)
+    if bucket_bags:
+        bag_rows[np.concatenate(bucket_bags)] = np.arange(len(bag_sizes))
+    return bucket_indices, bag_rows, bag_sizes
+
+
 def embedding_bag_with_traversable_offsets(
     ctx: ConversionContext,
     target: Target,
@@ -65,27 +100,6 @@ def embedding_bag_with_traversable_offsets(
     mode: int,
     include_last_offset: bool,
 ) -> Tuple[TRTTensor, TRTTensor, TRTTensor, TRTTensor]:
-    reduce_name = ""
-    if mode == 0:  # sum
-        reduce_op = functools.partial(
-            impl.reduce.sum, ctx=ctx, target=target, source_ir=source_ir
-        )
-        reduce_name = "sum"
-    elif mode == 1:  # mean
-        reduce_op = functools.partial(
-            impl.reduce.mean, ctx=ctx, target=target, source_ir=source_ir
-        )
-        reduce_name = "mean"
-    elif mode == 2:  # max
-        reduce_op = functools.partial(
-            impl.reduce.max,
-            ctx=ctx,
-            target=target,
-            source_ir=source_ir,
-            return_indices=False,
-        )
-        reduce_name = "max"
-
     offsets: np.ndarray = to_numpy(offsets_list)
     len_embed = embed.shape[0]
 
@@ -99,37 +113,102 @@ def embedding_bag_with_traversable_offsets(
         # add the end index to offsets
         offsets = np.append(offsets, len_embed)
 
-    zero_tensor = get_trt_tensor(
-        ctx, np.zeros((1, embed.shape[1]), dtype=np.float32), f"{name}_zero_tensor"
+    def embed_constant(value: np.ndarray, constant_name: str) -> TRTTensor:
+        """Creates a constant of the data type of the embeddings"""
+        return cast_trt_tensor(
+            ctx,
+            get_trt_tensor(ctx, value, f"{name}_{constant_name}"),
+            embed.dtype,
+            f"{name}_{constant_name}_cast",
+            target,
+            source_ir,
+        )
+
+    # Since the offsets are known, bags are reduced at once, independent of their
+    # number: the embeddings of the bags of each bucket are gathered into a (bucket_bags,
+    # max_bag_size, embedding_dim) tensor, in which shorter bags are padded with a row
+    # that does not affect the reduction, zeros for sum and mean, negative infinity for max
+    bucket_indices, bag_rows, bag_sizes = embedding_bag_gather_indices(
+        offsets, len_embed
     )
 
-    # separately reduce embeddings for different bags
-    reduced_embed_bags = []
-    len_offsets = offsets.shape[0]
-    for i in range(len_offsets - 1):
-        if offsets[i] < offsets[i + 1]:
-            sliced_embed = impl.slice.slice_op(
+    padding_row = embed_constant(
+        np.full((1, embed.shape[1]), -np.inf if mode == 2 else 0, dtype=np.float32),
+        "padding_row",
+    )
+    padded_embed = impl.cat.cat(
+        ctx, target, source_ir, f"{name}_pad_embed", [embed, padding_row], 0
+    )
+
+    bucket_outputs = []
+    for i, gather_indices in enumerate(bucket_indices):
+        gather_layer = ctx.net.add_gather(
+            padded_embed,
+            get_trt_tensor(ctx, gather_indices, f"{name}_gather_indices_{i}"),
+            axis=0,
+        )
+        set_layer_name(gather_layer, target, f"{name}_gather_bags_{i}", source_ir)
+        embed_bags = gather_layer.get_output(0)
+
+        if mode == 2:  # max
+            bucket_out = impl.reduce.max(
                 ctx,
                 target,
                 source_ir,
-                f"{name}_slice_embed_{i}",
-                embed,
-                0,
-                int(offsets[i]),
-                int(offsets[i + 1]),
-                1,
+                f"{name}_max_{i}",
+                embed_bags,
+                dim=1,
+                keepdim=False,
+                return_indices=False,
             )
-            reduced_one_bag = reduce_op(
-                name=f"{name}_{reduce_name}_{i}",
-                input_val=sliced_embed,
-                dim=0,
-                keepdim=True,
+        else:  # sum and mean
+            bucket_out = impl.reduce.sum(
+                ctx,
+                target,
+                source_ir,
+                f"{name}_sum_{i}",
+                embed_bags,
+                dim=1,
+                keepdim=False,
             )
-            reduced_embed_bags.append(reduced_one_bag)
-        else:  # offsets[i] == offsets[i + 1]
-            reduced_embed_bags.append(zero_tensor)
+        bucket_outputs.append(bucket_out)
+
+    out = bucket_outputs[0]
+    if len(bucket_outputs) > 1:
+        # Restore the order of the bags from the concatenated buckets
+        out = impl.cat.cat(
+            ctx, target, source_ir, f"{name}_cat_buckets", bucket_outputs, 0
+        )
+        gather_layer = ctx.net.add_gather(
+            out, get_trt_tensor(ctx, bag_rows, f"{name}_bag_rows"), axis=0
+        )
+        set_layer_name(gather_layer, target, f"{name}_gather_bag_rows", source_ir)
+        out = gather_layer.get_output(0)
+
+    if mode == 1:  # mean
+        # Empty bags are all zeros, so their size is clamped to avoid dividing by zero
+        out = impl.elementwise.div(
+            ctx,
+            target,
+            source_ir,
+            f"{name}_mean",
+            out,
+            embed_constant(
+                np.maximum(bag_sizes, 1).astype(np.float32)[:, None], "bag_sizes"
+            ),
+        )
+    elif mode == 2 and (bag_sizes == 0).any():
+        # The maximum of an empty bag is all zeros, not negative infinity
+        out = impl.condition.where(
+            ctx,
+            target,
+            source_ir,
+            f"{name}_empty_bags",
+            out,
+            embed_constant(np.zeros((1, embed.shape[1]), dtype=np.float32), "zeros"),
+            (bag_sizes > 0)[:, None],
+        )
 
-    out = impl.cat.cat(ctx, target, source_ir, f"{name}_cat", reduced_embed_bags, 0)
     return out, None, None, None
 
 
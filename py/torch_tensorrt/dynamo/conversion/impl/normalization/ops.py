@@ -150,6 +150,33 @@ def native_group_norm(
     eps: float,
     return_mean_rstd: bool = True,
 ) -> Union[TRTTensor, Sequence[TRTTensor]]:
+    """
+    Group normalization returning the mean and reciprocal standard deviation of each
+    group, of shape (N, group). The normalization layer does not produce these, so they
+    are computed from reduce and elementwise layers, which are only emitted if the mean
+    and rstd are returned; otherwise, the normalization layer is used
+    """
+    if not return_mean_rstd:
+        return group_norm(
+            ctx, target, source_ir, name, input, group, weight, bias, eps, True
+        )
+
+    return _decomposed_group_norm(
+        ctx, target, source_ir, name, input, weight, bias, group, eps
+    )
+
+
+def _decomposed_group_norm(
+    ctx: ConversionContext,
+    target: Target,
+    source_ir: Optional[SourceIR],
+    name: str,
+    input: TRTTensor,
+    weight: Optional[Union[torch.Tensor, np.ndarray]],
+    bias: Optional[Union[torch.Tensor, np.ndarray]],
+    group: int,
+    eps: float,
+) -> Tuple[TRTTensor, TRTTensor, TRTTensor]:
     assert (
         len(input.shape) >= 3
     ), f"The input dimension should not be less than 3, got {len(input.shape)}!"
@@ -299,11 +326,25 @@ def native_group_norm(
         reshaped_bias,
     )
 
-    if return_mean_rstd:
-        # return fake mean and rstd for now
-        return output, None, None
+    # The mean and rstd of each group, of shape (N, group)
+    mean = impl.shuffle.reshape(
+        ctx,
+        target,
+        source_ir,
+        f"{name}_reshape_mean",
+        mean_trt,
+        (B, group),
+    )
+    rstd = impl.shuffle.reshape(
+        ctx,
+        target,
+        source_ir,
+        f"{name}_reshape_rstd",
+        impl.unary.recip(ctx, target, source_ir, f"{name}_rstd", sqrt_trt),
+        (B, group),
+    )
 
-    return output
+    return output, mean, rstd
 
 
 def group_norm(
@@ -318,21 +359,82 @@ def group_norm(
     eps: float,
     cudnn_enabled: bool,
 ) -> Union[TRTTensor, Sequence[TRTTensor]]:
-    return native_group_norm(
-        ctx,
-        target,
-        source_ir,
-        name,
-        input,
-        weight,
-        bias,
-        0,
-        0,
-        0,
-        num_groups,
-        eps,
-        return_mean_rstd=False,
+    """
+    Group normalization with a single normalization layer over the spatial dimensions.
+    The layer applies a scale and bias per group, so it normalizes with a unit scale and
+    the affine transformation of each channel is applied to its output. TensorRT
+    versions without the normalization layer use reduce and elementwise layers instead
+    """
+    if not hasattr(ctx.net, "add_normalization"):
+        output, _, _ = _decomposed_group_norm(
+            ctx, target, source_ir, name, input, weight, bias, num_groups, eps
+        )
+        return output
+
+    rank = len(input.shape)
+    assert rank >= 3, f"The input dimension should not be less than 3, got {rank}!"
+
+    C = input.shape[1]
+    assert (
+        C == -1 or C % num_groups == 0
+    ), f"The num of channels ({C}) should be divisible by num_groups ({num_groups})!"
+
+    group_shape = (1, num_groups) + (1,) * (rank - 2)
+    scale, shift = [
+        cast_trt_tensor(
+            ctx,
+            get_trt_tensor(
+                ctx,
+                np.full(group_shape, value, dtype=np.float32),
+                f"{name}_group_{kind}",
+            ),
+            input.dtype,
+            f"{name}_group_{kind}_cast",
+            target,
+            source_ir,
+        )
+        for kind, value in (("scale", 1.0), ("shift", 0.0))
+    ]
+
+    layer = ctx.net.add_normalization(
+        input, scale, shift, get_axes_for_reduce_op(list(range(2, rank)))
     )
+    layer.num_groups = num_groups
+    layer.epsilon = eps
+    # Statistics are accumulated in float32, which avoids overflowing in float16
+    layer.compute_precision = trt.float32
+    set_layer_name(layer, target, f"{name}_group_norm", source_ir)
+    output = layer.get_output(0)
+
+    # Apply the scale and bias of each channel
+    channel_shape = (1, C) + (1,) * (rank - 2)
+    for kind, param, elementwise_op in (
+        ("weight", weight, impl.elementwise.mul),
+        ("bias", bias, impl.elementwise.add),
+    ):
+        if param is None:
+            continue
+
+        if isinstance(param, TRTTensor):
+            param = impl.shuffle.reshape(
+                ctx, target, source_ir, f"{name}_reshape_{kind}", param, channel_shape
+            )
+        else:
+            param_val = to_numpy(param)
+            assert param_val is not None
+            param = get_trt_tensor(
+                ctx, param_val.reshape(channel_shape), f"{name}_{kind}"
+            )
+        if param.dtype != output.dtype:
+            param = cast_trt_tensor(
+                ctx, param, output.dtype, f"{name}_{kind}_cast", target, source_ir
+            )
+
+        output = elementwise_op(
+            ctx, target, source_ir, f"{name}_{kind}_affine", output, param
+        )
+
+    return output
 
 
 def softmax(
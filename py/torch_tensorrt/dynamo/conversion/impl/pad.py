@@ -1,10 +1,15 @@
 from typing import Optional, Sequence, Union
 
+import numpy as np
 import tensorrt as trt
 from torch.fx.node import Target
 from torch_tensorrt.dynamo._SourceIR import SourceIR
+from torch_tensorrt.dynamo.conversion import impl
 from torch_tensorrt.dynamo.conversion._ConversionContext import ConversionContext
-from torch_tensorrt.dynamo.conversion.converter_utils import get_trt_tensor
+from torch_tensorrt.dynamo.conversion.converter_utils import (
+    cast_trt_tensor,
+    get_trt_tensor,
+)
 from torch_tensorrt.fx.converters.converter_utils import (
     has_dynamic_shape,
     set_layer_name,
@@ -18,18 +23,22 @@ mode and clamp, and supports padding output with dynamic shape.
 """
 
 
-def constant_padNd(
+def pad_slice(
     ctx: ConversionContext,
     target: Union[Target, str],
     source_ir: Optional[SourceIR],
     name: str,
     input: TRTTensor,
     pad: Sequence[int],
-    value: Union[int, float] = 0,
+    mode: trt.SampleMode,
+    value: Optional[Union[int, float]] = None,
 ) -> TRTTensor:
-    if has_dynamic_shape(input.shape):
-        assert input.shape[1] != -1, "Channel dim can't be dynamic for padding."
-
+    """
+    Pads the last len(pad) // 2 dimensions of the input with a single slice layer, which
+    samples the input out of its bounds in the given mode. The start of the slice is
+    static, and its size is the input shape plus the padding of each dimension, which is
+    computed from the shape of the input at runtime if it is dynamic
+    """
     rank = len(input.shape)
 
     if len(pad) // 2 > rank:
@@ -37,64 +46,79 @@ def constant_padNd(
             f"Trying to pad last {len(pad) // 2} dimension but the input only has {rank} dimension."
         )
 
-    start_list = [0] * rank
-    new_shape = list(input.shape)
-
-    for i in range(0, len(pad) // 2):
-        start_list[-i - 1] = -pad[i * 2]
-        new_shape[-i - 1] += pad[i * 2] + pad[i * 2 + 1]
+    start = [0] * rank
+    padding = [0] * rank
+    for i in range(len(pad) // 2):
+        start[-i - 1] = -pad[i * 2]
+        padding[-i - 1] = pad[i * 2] + pad[i * 2 + 1]
 
-    stride_list = [1] * rank
+    dynamic_shape = has_dynamic_shape(input.shape)
     layer = ctx.net.add_slice(
         input,
-        start=tuple(start_list),
-        shape=tuple(new_shape),
-        stride=tuple(stride_list),
+        start=tuple(start),
+        shape=(
+            []
+            if dynamic_shape
+            else tuple(size + p for size, p in zip(input.shape, padding))
+        ),
+        stride=(1,) * rank,
     )
-    value_const = get_trt_tensor(ctx, value, f"{name}_value", input.dtype)
-    layer.set_input(4, value_const)
-    layer.mode = trt.SampleMode.FILL
+
+    if dynamic_shape:
+        shape_layer = ctx.net.add_shape(input)
+        set_layer_name(shape_layer, target, f"{name}_shape", source_ir)
+        input_shape = cast_trt_tensor(
+            ctx,
+            shape_layer.get_output(0),
+            trt.int32,
+            f"{name}_shape_casted",
+            target,
+            source_ir,
+        )
+        output_shape = impl.elementwise.add(
+            ctx,
+            target,
+            source_ir,
+            f"{name}_padded_shape",
+            input_shape,
+            np.array(padding, dtype=np.int32),
+        )
+        layer.set_input(2, output_shape)
+
+    if mode == trt.SampleMode.FILL:
+        value_const = get_trt_tensor(ctx, value, f"{name}_value", input.dtype)
+        layer.set_input(4, value_const)
+    layer.mode = mode
 
     set_layer_name(layer, target, name, source_ir)
     return layer.get_output(0)
 
 
-def reflection_padNd(
+def constant_padNd(
     ctx: ConversionContext,
     target: Union[Target, str],
     source_ir: Optional[SourceIR],
     name: str,
     input: TRTTensor,
-    padding: Sequence[int],
+    pad: Sequence[int],
+    value: Union[int, float] = 0,
 ) -> TRTTensor:
-    if has_dynamic_shape(input.shape):
-        assert input.shape[1] != -1, "Channel dim can't be dynamic for padding."
-
-    rank = len(input.shape)
-
-    if len(padding) // 2 > rank:
-        raise RuntimeError(
-            f"Trying to pad last {len(padding) // 2} dimension but the input only has {rank} dimension."
-        )
-
-    start_list = [0] * rank
-    new_shape = list(input.shape)
+    return pad_slice(
+        ctx, target, source_ir, name, input, pad, trt.SampleMode.FILL, value
+    )
 
-    for i in range(0, len(padding) // 2):
-        start_list[-i - 1] = -padding[i * 2]
-        new_shape[-i - 1] += padding[i * 2] + padding[i * 2 + 1]
 
-    stride_list = [1] * rank
-    layer = ctx.net.add_slice(
-        input,
-        start=tuple(start_list),
-        shape=tuple(new_shape),
-        stride=tuple(stride_list),
+def reflection_padNd(
+    ctx: ConversionContext,
+    target: Union[Target, str],
+    source_ir: Optional[SourceIR],
+    name: str,
+    input: TRTTensor,
+    padding: Sequence[int],
+) -> TRTTensor:
+    return pad_slice(
+        ctx, target, source_ir, name, input, padding, trt.SampleMode.REFLECT
     )
-    layer.mode = trt.SampleMode.REFLECT
-
-    set_layer_name(layer, target, name, source_ir)
-    return layer.get_output(0)
 
 
 def replication_padNd(
@@ -105,34 +129,7 @@ def replication_padNd(
     input: TRTTensor,
     padding: Sequence[int],
 ) -> TRTTensor:
-    if has_dynamic_shape(input.shape):
-        assert input.shape[1] != -1, "Channel dim can't be dynamic for padding."
-
-    rank = len(input.shape)
-
-    if len(padding) // 2 > rank:
-        raise RuntimeError(
-            f"Trying to pad last {len(padding) // 2} dimension but the input only has {rank} dimension."
-        )
-
-    start_list = [0] * rank
-    new_shape = list(input.shape)
-
-    for i in range(0, len(padding) // 2):
-        start_list[-i - 1] = -padding[i * 2]
-        new_shape[-i - 1] += padding[i * 2] + padding[i * 2 + 1]
-
-    stride_list = [1] * rank
-    layer = ctx.net.add_slice(
-        input,
-        start=tuple(start_list),
-        shape=tuple(new_shape),
-        stride=tuple(stride_list),
-    )
-    layer.mode = trt.SampleMode.CLAMP
-
-    set_layer_name(layer, target, name, source_ir)
-    return layer.get_output(0)
+    return pad_slice(ctx, target, source_ir, name, input, padding, trt.SampleMode.CLAMP)
 
 
 def circular_padNd(
@@ -143,34 +140,7 @@ def circular_padNd(
     input: TRTTensor,
     pad: Sequence[int],
 ) -> TRTTensor:
-    if has_dynamic_shape(input.shape):
-        assert input.shape[1] != -1, "Channel dim can't be dynamic for padding."
-
-    rank = len(input.shape)
-
-    if len(pad) // 2 > rank:
-        raise RuntimeError(
-            f"Trying to pad last {len(pad) // 2} dimension but the input only has {rank} dimension."
-        )
-
-    start_list = [0] * rank
-    new_shape = list(input.shape)
-
-    for i in range(0, len(pad) // 2):
-        start_list[-i - 1] = -pad[i * 2]
-        new_shape[-i - 1] += pad[i * 2] + pad[i * 2 + 1]
-
-    stride_list = [1] * rank
-    layer = ctx.net.add_slice(
-        input,
-        start=tuple(start_list),
-        shape=tuple(new_shape),
-        stride=tuple(stride_list),
-    )
-    layer.mode = trt.SampleMode.WRAP
-
-    set_layer_name(layer, target, name, source_ir)
-    return layer.get_output(0)
+    return pad_slice(ctx, target, source_ir, name, input, pad, trt.SampleMode.WRAP)
 
 
 def pad(
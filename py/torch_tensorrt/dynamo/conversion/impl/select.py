@@ -1,15 +1,15 @@
 import logging
-from typing import Optional, Sequence, Union, cast
+from typing import List, Optional, Sequence, Union, cast
 
 import numpy as np
 import tensorrt as trt
 import torch
+import torch_tensorrt.dynamo.conversion.impl as impl
 from torch.fx.node import Target
 from torch_tensorrt.dynamo._SourceIR import SourceIR
 from torch_tensorrt.dynamo.conversion._ConversionContext import ConversionContext
 from torch_tensorrt.dynamo.conversion.converter_utils import (
     broadcastable,
-    cast_trt_tensor,
     get_positive_dim,
     get_trt_tensor,
     to_numpy,
@@ -79,8 +79,6 @@ def index(
 ) -> TRTTensor:
     adv_indx_indices = []
     tensor_indices = []
-    # check if the input is dynamic
-    dynamic_shape = has_dynamic_shape(input.shape)
     # is_numpy is a flag to specify if all the indices are numpy or torchTensor.
     # If any is not this flag will be set to False
     _LOGGER.debug(
@@ -126,252 +124,199 @@ def index(
         gather_layer = ctx.net.add_gather(input, indices_tensor, index)
         set_layer_name(gather_layer, target, name + "_index_gather", source_ir)
         return gather_layer.get_output(0)
+    elif is_numpy:
+        # Every index was converted to a numpy array above
+        numpy_indices = [ind for ind in tensor_indices if isinstance(ind, np.ndarray)]
+        return index_nd(
+            ctx, target, source_ir, name, input, adv_indx_indices, numpy_indices
+        )
     else:
-        input_shape = input.shape
-        _LOGGER.debug(f"The input shape is {input.shape}")
-        if dynamic_shape:
-            input_shape = get_shape_with_dynamic_shape(
-                ctx.net, target, source_ir, name, input_shape, input
-            )
-        rank = len(input_shape)
-        adv_indx_count = len(adv_indx_indices)
-        dim_tensor_list = []
-
-        for i in range(rank):
-            dim = input_shape[i]
-            dim_tensor = get_trt_tensor(ctx, dim, name + f"_individual_dim_{i}")
-            # dim_tensor_list is a list of tensors
-            dim_tensor_list.append(dim_tensor)
-
-        # for cases like
-        # t: [x_1, y_1, y_2, ..., x_m, ..., y_n] -> t: [x_1, x_2, ..., x_m, y_1, y_2, ..., y_n],
-        # where t is a tensor of rank m+n, {x_i} are axes where tensor index is provided, and {y_i} are axes
-        # for ":"
-        # Examples: x.shape = (10,20,30,40,50)
-        # ind_1, ind_2 broadcasted to (2,3,4)
-        # x[:, ind_1, ind_2] = 10, 2, 3, 4, 40, 50
-        # x[:,ind_1, :, ind_2] = 2, 3, 4, 10, 30, 50
-        transpose_layer = ctx.net.add_shuffle(input)
-        new_order = []
-        for i in range(adv_indx_count):
-            new_order.append(adv_indx_indices[i])
-        for i in range(rank):
-            if i not in adv_indx_indices:
-                new_order.append(i)
-        _LOGGER.debug(f"The new transpose order is {new_order}")
-
-        transpose_layer.second_transpose = tuple(new_order)
-        set_layer_name(transpose_layer, target, name + "_index_transpose", source_ir)
-        transpose_tensor = transpose_layer.get_output(0)
-
-        # Flatten [x_1, x_2,.......x_m, y_1, y_2,.....y_n]
-        # transpose_tensor_shape = ctx.net.add_shape(transpose_tensor)
-        transpose_tensor_shape = transpose_tensor.shape
-        _LOGGER.debug(f"The shape of transpose tensor is {transpose_tensor_shape}")
-        mult_d0 = 1
-        for i in range(adv_indx_count):
-            mult_d0 = mult_d0 * transpose_tensor_shape[i]
-        mult_d1 = 1
-        for i in range(adv_indx_count, rank):
-            mult_d1 = mult_d1 * transpose_tensor_shape[i]
-
-        concat_tensor_layer = ctx.net.add_concatenation(
-            [
-                get_trt_tensor(ctx, mult_d0, name + "_d0_shape"),
-                get_trt_tensor(ctx, mult_d1, name + "_d1_shape"),
-            ]
+        return index_linear(
+            ctx, target, source_ir, name, input, adv_indx_indices, tensor_indices
         )
-        set_layer_name(concat_tensor_layer, target, name + "_index_Concat", source_ir)
-        concat_tensor = concat_tensor_layer.get_output(0)
-
-        reshape_layer = ctx.net.add_shuffle(transpose_tensor)
-        reshape_layer.set_input(1, concat_tensor)
-        flatten_tensor = reshape_layer.get_output(0)
-
-        _LOGGER.debug(f"The flatten tensor shape is {flatten_tensor.shape}")
-
-        # tensor index = \sum_{i=1}^m (ind_i * \prod_{j=i+1}^m (x_j)),  ind_i is input indices[i], x_j is the
-        # // j dimension of input x.
-        if is_numpy:
-            multiplier = input_shape[adv_indx_indices[adv_indx_count - 1]]
-            cum_adv_index = tensor_indices[adv_indx_count - 1]
-            for i in range(adv_indx_count - 2, -1, -1):
-                adv_index = multiplier * tensor_indices[i]
-                cum_adv_index = cum_adv_index + adv_index
-                multiplier = multiplier * input_shape[adv_indx_indices[i]]
-            cum_adv_index = get_trt_tensor(
-                ctx, cum_adv_index, name + "_index_sum_intermediate"
-            )
-        else:
-            multiplier = get_trt_tensor(
-                ctx,
-                dim_tensor_list[adv_indx_indices[adv_indx_count - 1]],
-                name + "_dim_last",
-            )
-            cum_adv_index = tensor_indices[adv_indx_count - 1]
-            for i in range(adv_indx_count - 2, -1, -1):
-                adv_index = convert_binary_elementwise(
-                    ctx,
-                    target,
-                    source_ir,
-                    name + f"_index_intermediate_{i}",
-                    trt.ElementWiseOperation.PROD,
-                    multiplier,
-                    tensor_indices[i],
-                )
-                cum_adv_index = convert_binary_elementwise(
-                    ctx,
-                    target,
-                    source_ir,
-                    name + f"_index_sum_intermediate_{i}",
-                    trt.ElementWiseOperation.SUM,
-                    cum_adv_index,
-                    adv_index,
-                )
-                multiplier = convert_binary_elementwise(
-                    ctx,
-                    target,
-                    source_ir,
-                    name + f"_index_intermediate_xj_{i}",
-                    trt.ElementWiseOperation.PROD,
-                    multiplier,
-                    dim_tensor_list[adv_indx_indices[i]],
-                )
-
-        gather_layer_element = ctx.net.add_gather(flatten_tensor, cum_adv_index, 0)
-        set_layer_name(
-            gather_layer_element, target, name + "_index_gather_element", source_ir
+
+
+def index_output_permutation(
+    rank: int, adv_indx_indices: Sequence[int], adv_indx_rank: int
+) -> List[int]:
+    """
+    Returns the permutation of an indexed tensor of shape (*advanced, *remaining),
+    where advanced are the broadcast index dimensions and remaining are the
+    non-indexed dimensions of the input, into the order of PyTorch's result.
+    Consecutive advanced indices replace their dimensions in place, otherwise
+    the advanced dimensions come first, e.g. for x.shape = (10, 20, 30, 40, 50)
+    and indices broadcast to (2, 3, 4):
+    x[:, ind_1, ind_2] => (10, 2, 3, 4, 40, 50)
+    x[:, ind_1, :, ind_2] => (2, 3, 4, 10, 30, 50)
+    """
+    output_rank = adv_indx_rank + rank - len(adv_indx_indices)
+    first = adv_indx_indices[0]
+    if len(adv_indx_indices) != adv_indx_indices[-1] - first + 1:
+        return list(range(output_rank))
+
+    return (
+        list(range(adv_indx_rank, adv_indx_rank + first))
+        + list(range(adv_indx_rank))
+        + list(range(adv_indx_rank + first, output_rank))
+    )
+
+
+def index_nd_indices(indices: Sequence[np.ndarray], shape: Sequence[int]) -> np.ndarray:
+    """
+    Stacks constant advanced indices into the index tensor of an ND gather, of shape
+    (*broadcast index shape, len(indices)), where shape holds the sizes of the
+    indexed dimensions. Negative indices are wrapped for dimensions of static size
+    """
+    wrapped = [
+        np.where(ind < 0, ind + size, ind) if size >= 0 else ind
+        for ind, size in zip(indices, shape)
+    ]
+    stacked: np.ndarray = np.stack(np.broadcast_arrays(*wrapped), axis=-1)
+    return stacked.astype(np.int32)
+
+
+def index_nd(
+    ctx: ConversionContext,
+    target: Target,
+    source_ir: Optional[SourceIR],
+    name: str,
+    input: TRTTensor,
+    adv_indx_indices: Sequence[int],
+    tensor_indices: Sequence[np.ndarray],
+) -> TRTTensor:
+    """
+    Indexes with multiple constant advanced indices using a single ND gather.
+    The indexed dimensions are moved to the front and the broadcast indices are
+    stacked into one constant at conversion time, so each index tuple selects a
+    slice of the remaining dimensions
+    """
+    rank = len(input.shape)
+    remaining = [i for i in range(rank) if i not in adv_indx_indices]
+    order = list(adv_indx_indices) + remaining
+    if order != list(range(rank)):
+        input = impl.permutation.permute(
+            ctx, target, source_ir, name + "_index_transpose", input, order
+        )
+
+    nd_indices = index_nd_indices(
+        tensor_indices, [input.shape[i] for i in range(len(adv_indx_indices))]
+    )
+    _LOGGER.debug(f"The stacked ND gather indices have shape {nd_indices.shape}")
+    indices_tensor = get_trt_tensor(ctx, nd_indices, name + "_index_nd_indices")
+
+    gather_layer = ctx.net.add_gather_v2(input, indices_tensor, trt.GatherMode.ND)
+    gather_layer.num_elementwise_dims = 0
+    set_layer_name(gather_layer, target, name + "_index_gather_nd", source_ir)
+
+    permutation = index_output_permutation(
+        rank, adv_indx_indices, len(nd_indices.shape) - 1
+    )
+    if permutation == list(range(len(permutation))):
+        return gather_layer.get_output(0)
+
+    return impl.permutation.permute(
+        ctx,
+        target,
+        source_ir,
+        name + "_index_output_transpose",
+        gather_layer.get_output(0),
+        permutation,
+    )
+
+
+def index_linear(
+    ctx: ConversionContext,
+    target: Target,
+    source_ir: Optional[SourceIR],
+    name: str,
+    input: TRTTensor,
+    adv_indx_indices: Sequence[int],
+    tensor_indices: Sequence[TRTTensor],
+) -> TRTTensor:
+    r"""
+    Indexes with multiple advanced index tensors using a single gather. The
+    indexed dimensions are moved to the back and flattened by one shuffle, and
+    the indices are combined into a linear index of the flattened dimension:
+    \sum_{i=1}^m (ind_i * \prod_{j=i+1}^m (x_j)), where x_j is the size of the
+    j-th indexed dimension. The elementwise layers broadcast the index shapes
+    """
+    rank = len(input.shape)
+    remaining = [i for i in range(rank) if i not in adv_indx_indices]
+
+    # The remaining dimensions are copied with placeholder zeros when dynamic
+    flatten_layer = ctx.net.add_shuffle(input)
+    flatten_layer.first_transpose = tuple(remaining + list(adv_indx_indices))
+    flatten_layer.reshape_dims = tuple(
+        [input.shape[i] if input.shape[i] >= 0 else 0 for i in remaining] + [-1]
+    )
+    set_layer_name(flatten_layer, target, name + "_index_flatten", source_ir)
+    flatten_tensor = flatten_layer.get_output(0)
+
+    def dim_size(i: int) -> Union[int, TRTTensor]:
+        if input.shape[i] >= 0:
+            return int(input.shape[i])
+        return impl.shape.shape(
+            ctx, target, source_ir, name + f"_index_dim_{i}", input, i
         )
-        gather_out = gather_layer_element.get_output(0)
-        _LOGGER.debug(f"The shape after cumultative gather is {gather_out.shape}")
-        _LOGGER.debug(f"The shape for cumulative adv index is {cum_adv_index}")
 
-        cum_adv_index_shape_layer = ctx.net.add_shape(cum_adv_index)
-        set_layer_name(
-            cum_adv_index_shape_layer, target, name + "_cum_adv_index_shape", source_ir
+    def multiply(
+        lhs: Union[int, TRTTensor], rhs: Union[int, TRTTensor], suffix: str
+    ) -> Union[int, TRTTensor]:
+        if isinstance(lhs, int) and isinstance(rhs, int):
+            return lhs * rhs
+        return convert_binary_elementwise(
+            ctx,
+            target,
+            source_ir,
+            name + suffix,
+            trt.ElementWiseOperation.PROD,
+            lhs,
+            rhs,
         )
-        cum_adv_index_shape_tensor = cum_adv_index_shape_layer.get_output(0)
-        cum_adv_index_shape_tensor = cast_trt_tensor(
+
+    adv_indx_count = len(adv_indx_indices)
+    linear_index = tensor_indices[-1]
+    stride = dim_size(adv_indx_indices[-1])
+    for i in range(adv_indx_count - 2, -1, -1):
+        linear_index = convert_binary_elementwise(
             ctx,
-            cum_adv_index_shape_tensor,
-            trt.int32,
-            name + "_cum_adv_index_shape_casted",
+            target,
+            source_ir,
+            name + f"_index_linear_sum_{i}",
+            trt.ElementWiseOperation.SUM,
+            linear_index,
+            multiply(tensor_indices[i], stride, f"_index_linear_prod_{i}"),
         )
-        cum_adv_index_shape = cum_adv_index.shape
-        _LOGGER.debug(f"The shape for cumulative adv index is {cum_adv_index_shape}")
-        # check if all advanced indices are consecutive
-        concat_tensor_reshape = []
-        if (
-            adv_indx_count
-            == adv_indx_indices[adv_indx_count - 1] - adv_indx_indices[0] + 1
-        ):
-            _LOGGER.debug("The indices are continuous in this case")
-            concat_tensor_reshape.append(
-                get_trt_tensor(ctx, -1, name + "_dynamic_concat")
-            )
-            for i in range(0, rank):
-                if i not in adv_indx_indices:
-                    curr_dim = dim_tensor_list[i]
-                    concat_tensor_reshape.append(curr_dim)
-
-            concat_tensor_layer = ctx.net.add_concatenation(concat_tensor_reshape)
-            set_layer_name(
-                concat_tensor_layer, target, name + "_index_Concat_reshape", source_ir
-            )
-            concat_tensor = concat_tensor_layer.get_output(0)
-
-            regular_index_shuffle_layer = ctx.net.add_shuffle(gather_out)
-            regular_index_shuffle_layer.set_input(1, concat_tensor)
-            set_layer_name(
-                regular_index_shuffle_layer,
-                target,
-                name + "_index_regular_index",
-                source_ir,
-            )
-            unfold_tensor = regular_index_shuffle_layer.get_output(0)
-            _LOGGER.debug("The tensor is unfolded now")
-            _LOGGER.debug(f"The unfolded tensor shape is {unfold_tensor.shape}")
-
-            # Transpose folded advanced indexed axis to its original location.
-            transpose_advanced_shuffle_layer = ctx.net.add_shuffle(unfold_tensor)
-            new_order = []
-            for i in range(1, adv_indx_indices[0] + 1):
-                new_order.append(i)
-            new_order.append(0)
-            for i in range(adv_indx_indices[0] + 1, rank - adv_indx_count + 1):
-                new_order.append(i)
-            _LOGGER.debug(f"Transposing the indices to correct position {new_order}")
-
-            transpose_advanced_shuffle_layer.second_transpose = tuple(new_order)
-            set_layer_name(
-                transpose_advanced_shuffle_layer,
-                target,
-                name + "_index_advanced_shuffle_transpose",
-                source_ir,
+        if i > 0:
+            stride = multiply(
+                stride, dim_size(adv_indx_indices[i]), f"_index_stride_{i}"
             )
-            transpose_tensor = transpose_advanced_shuffle_layer.get_output(0)
-
-            # unfold advanced layer
-            concat_final_tensor = []
-            for i in range(0, adv_indx_indices[0]):
-                current_dim = dim_tensor_list[i]
-                concat_final_tensor.append(current_dim)
-
-            concat_final_tensor.append(cum_adv_index_shape_tensor)
-            for i in range(adv_indx_indices[0], rank):
-                if i not in (adv_indx_indices):
-                    current_dim = dim_tensor_list[i]
-                    concat_final_tensor.append(current_dim)
-
-            concat_final_shape_layer = ctx.net.add_concatenation(concat_final_tensor)
-            set_layer_name(
-                concat_final_shape_layer,
-                target,
-                name + "_index_continuous_concat_final_shape_layer",
-                source_ir,
-            )
-            concat_final_tensor = concat_final_shape_layer.get_output(0)
-
-            unfold_advanced_shuffle_layer = ctx.net.add_shuffle(transpose_tensor)
-            # check this
-            unfold_advanced_shuffle_layer.set_input(1, concat_final_tensor)
-            set_layer_name(
-                unfold_advanced_shuffle_layer,
-                target,
-                name + "_unfold_advanced_index",
-                source_ir,
-            )
-            reshape_output = unfold_advanced_shuffle_layer.get_output(0)
-
-        else:
-            _LOGGER.debug("The indices are not continuous in this case")
-            concat_final_tensor = []
-            concat_final_tensor.append(cum_adv_index_shape_tensor)
-            for i in range(0, rank):
-                if i not in adv_indx_indices:
-                    curr_dim = dim_tensor_list[i]
-                    concat_final_tensor.append(curr_dim)
-
-            concat_final_shape_layer = ctx.net.add_concatenation(concat_final_tensor)
-            set_layer_name(
-                concat_final_shape_layer,
-                target,
-                name + "_index_non_continuous_concat_final_shape_layer",
-                source_ir,
-            )
-            concat_final_tensor = concat_final_shape_layer.get_output(0)
-
-            reshape_layer = ctx.net.add_shuffle(gather_out)
-            reshape_layer.set_input(1, concat_final_tensor)
-            set_layer_name(
-                reshape_layer,
-                target,
-                name + "_index_non_continuous_shuffle_final_shape_layer",
-                source_ir,
-            )
-            reshape_output = reshape_layer.get_output(0)
 
-        return reshape_output
+    gather_layer = ctx.net.add_gather(flatten_tensor, linear_index, len(remaining))
+    set_layer_name(gather_layer, target, name + "_index_gather_linear", source_ir)
+    gather_out = gather_layer.get_output(0)
+    _LOGGER.debug(f"The shape after the linear index gather is {gather_out.shape}")
+
+    # The gather output is (*remaining, *advanced), which is permuted to the
+    # order of PyTorch's result
+    adv_indx_rank = len(linear_index.shape)
+    output_permutation = index_output_permutation(rank, adv_indx_indices, adv_indx_rank)
+    remaining_rank = rank - adv_indx_count
+    permutation = [
+        dim + remaining_rank if dim < adv_indx_rank else dim - adv_indx_rank
+        for dim in output_permutation
+    ]
+    if permutation == list(range(len(permutation))):
+        return gather_out
+
+    return impl.permutation.permute(
+        ctx,
+        target,
+        source_ir,
+        name + "_index_output_transpose",
+        gather_out,
+        permutation,
+    )
 
 
 def index_select(
@@ -3,7 +3,9 @@ from typing import Optional, Sequence
 
 import numpy as np
 import tensorrt as trt
+import torch
 from torch.fx.node import Target
+from torch_tensorrt import _enums
 from torch_tensorrt.dynamo._SourceIR import SourceIR
 from torch_tensorrt.dynamo.conversion import impl
 from torch_tensorrt.dynamo.conversion._ConversionContext import ConversionContext
@@ -159,6 +161,29 @@ def chunk(
     return result
 
 
+# Longest scan for which cumsum multiplies with a triangular matrix of ones, which
+# costs length x length weights
+CUMSUM_MATMUL_MAX_LENGTH = 1024
+
+CUMSUM_MATMUL_DTYPES = {_enums.dtype.f32, _enums.dtype.f16, _enums.dtype.bf16}
+
+
+def cumsum_strategy(length: int, dtype: _enums.dtype) -> str:
+    """Chooses how to compute a cumulative sum of the given static length and dtype
+
+    Returns one of:
+        "matmul": a single multiplication with a triangular matrix of ones, for short floating point scans
+        "scan": a log-depth Hillis-Steele scan of shifted additions, for longer or integer scans
+        "loop": a sequential TensorRT loop, for scans of dynamic length
+    """
+    if length == -1:
+        return "loop"
+    elif length <= CUMSUM_MATMUL_MAX_LENGTH and dtype in CUMSUM_MATMUL_DTYPES:
+        return "matmul"
+    else:
+        return "scan"
+
+
 def cumsum(
     ctx: ConversionContext,
     target: Target,
@@ -169,6 +194,13 @@ def cumsum(
 ) -> TRTTensor:
     input_shape = input.shape
     dim = get_positive_dim(dim, len(input_shape))
+    strategy = cumsum_strategy(input_shape[dim], _enums.dtype._from(input.dtype))
+
+    if strategy == "matmul":
+        return cumsum_matmul(ctx, target, source_ir, name, input, dim)
+    elif strategy == "scan":
+        return cumsum_scan(ctx, target, source_ir, name, input, dim)
+
     loop = ctx.net.add_loop()
     axis = np.array(input_shape[dim])
     trip_limit = get_trt_tensor(ctx, axis, f"{name}_trip_limit")
@@ -199,6 +231,101 @@ def cumsum(
     return loop_output.get_output(0)
 
 
+def cumsum_matmul(
+    ctx: ConversionContext,
+    target: Target,
+    source_ir: Optional[SourceIR],
+    name: str,
+    input: TRTTensor,
+    dim: int,
+) -> TRTTensor:
+    """Computes the cumulative sum along a static dimension as one matrix multiplication"""
+    rank = len(input.shape)
+    dim = get_positive_dim(dim, rank)
+
+    # Moving the scanned dimension last makes it the reduced dimension of the product
+    permutation = list(range(rank))
+    permutation[dim], permutation[-1] = permutation[-1], permutation[dim]
+    if dim != rank - 1:
+        input = impl.permutation.permute(
+            ctx, target, source_ir, f"{name}_permute", input, permutation
+        )
+
+    # Column i sums the elements up to and including i
+    length = input.shape[-1]
+    upper_triangular = get_trt_tensor(
+        ctx,
+        np.triu(np.ones((length, length), dtype=np.float32)),
+        f"{name}_upper_triangular",
+        dtype=_enums.dtype._from(input.dtype).to(torch.dtype),
+    )
+    output = impl.matmul.matrix_multiply(
+        ctx, target, source_ir, f"{name}_matmul", input, upper_triangular
+    )
+
+    if dim != rank - 1:
+        output = impl.permutation.permute(
+            ctx, target, source_ir, f"{name}_permute_back", output, permutation
+        )
+
+    return output
+
+
+def cumsum_scan(
+    ctx: ConversionContext,
+    target: Target,
+    source_ir: Optional[SourceIR],
+    name: str,
+    input: TRTTensor,
+    dim: int,
+) -> TRTTensor:
+    """Computes the cumulative sum along a static dimension with a Hillis-Steele scan
+
+    After step k, each element holds the sum of the 2^k elements ending at it. Each step
+    adds the partial sums shifted by 2^k, where shifting in zeros is a slice starting
+    before the tensor in fill mode
+    """
+    rank = len(input.shape)
+    dim = get_positive_dim(dim, rank)
+    length = input.shape[dim]
+
+    # The shifted partial sums have the shape of the input, which is read at runtime
+    # if any of the other dimensions is dynamic
+    dynamic_shape = has_dynamic_shape(input.shape)
+    if dynamic_shape:
+        shape_layer = ctx.net.add_shape(input)
+        set_layer_name(shape_layer, target, f"{name}_shape", source_ir)
+        input_shape = shape_layer.get_output(0)
+
+    output = input
+    offset = 1
+    while offset < length:
+        start = [0] * rank
+        start[dim] = -offset
+        shift_layer = ctx.net.add_slice(
+            output,
+            tuple(start),
+            () if dynamic_shape else tuple(output.shape),
+            (1,) * rank,
+        )
+        if dynamic_shape:
+            shift_layer.set_input(2, input_shape)
+        shift_layer.mode = trt.SampleMode.FILL
+        set_layer_name(shift_layer, target, f"{name}_shift_{offset}", source_ir)
+
+        output = impl.elementwise.add(
+            ctx,
+            target,
+            source_ir,
+            f"{name}_add_{offset}",
+            output,
+            shift_layer.get_output(0),
+        )
+        offset *= 2
+
+    return output
+
+
 def tile(
     ctx: ConversionContext,
     target: Target,
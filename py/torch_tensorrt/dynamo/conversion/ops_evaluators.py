@@ -1,15 +1,24 @@
+# mypy: disallow-untyped-decorators=False
+
 import logging
 import operator
 from typing import Dict, Sequence, Tuple, Union
 
 import numpy as np
+import tensorrt as trt
 import torch
 from torch.fx.node import Argument, Node, Target
+from torch_tensorrt.dynamo._SourceIR import SourceIR
+from torch_tensorrt.dynamo.conversion import impl
 from torch_tensorrt.dynamo.conversion._ConversionContext import ConversionContext
 from torch_tensorrt.dynamo.conversion._ConverterRegistry import (
     ConverterRegistry,
     dynamo_tensorrt_converter,
 )
+from torch_tensorrt.dynamo.conversion.converter_utils import (
+    enforce_tensor_types,
+    get_positive_dim,
+)
 from torch_tensorrt.fx.types import TRTTensor
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -38,6 +47,78 @@ def generic_evaluator(
     return target(*args)
 
 
+@enforce_tensor_types(
+    {
+        0: (TRTTensor,),
+    }
+)
+@dynamo_tensorrt_converter(torch.ops.aten.sym_size.int)
+def aten_ops_sym_size_int(
+    ctx: ConversionContext,
+    target: Target,
+    args: Tuple[Argument, ...],
+    kwargs: Dict[str, Argument],
+    name: str,
+) -> Union[TRTTensor, int]:
+    # Static dimensions are evaluated, only dynamic ones require a shape layer
+    dim = get_positive_dim(args[1], len(args[0].shape))
+    if args[0].shape[dim] >= 0:
+        ctx.folded_nodes += 1
+        return int(args[0].shape[dim])
+
+    return impl.shape.shape(ctx, target, SourceIR.ATEN, name, args[0], args[1])
+
+
+# Python operators applied to symbolic sizes, with their TensorRT equivalents
+SYM_INT_OPERATORS = {
+    operator.add: trt.ElementWiseOperation.SUM,
+    operator.sub: trt.ElementWiseOperation.SUB,
+    operator.mul: trt.ElementWiseOperation.PROD,
+    operator.floordiv: trt.ElementWiseOperation.FLOOR_DIV,
+}
+
+
+def sym_int_validator(sym_int_node: Node) -> bool:
+    # Only arithmetic on sizes is converted, not arbitrary Python objects
+    val = sym_int_node.meta.get("val", None)
+    if val is not None:
+        return isinstance(val, (int, torch.SymInt)) and not isinstance(val, bool)
+
+    # Without metadata, the operands must be integers or sizes
+    return all(
+        (isinstance(arg, int) and not isinstance(arg, bool))
+        or (
+            isinstance(arg, Node)
+            and (
+                arg.target == torch.ops.aten.sym_size.int
+                or (arg.target in SYM_INT_OPERATORS and sym_int_validator(arg))
+            )
+        )
+        for arg in sym_int_node.args
+    )
+
+
+@dynamo_tensorrt_converter(operator.add, capability_validator=sym_int_validator)
+@dynamo_tensorrt_converter(operator.sub, capability_validator=sym_int_validator)
+@dynamo_tensorrt_converter(operator.mul, capability_validator=sym_int_validator)
+@dynamo_tensorrt_converter(operator.floordiv, capability_validator=sym_int_validator)
+def sym_int_evaluator(
+    ctx: ConversionContext,
+    target: Target,
+    args: Tuple[Argument, ...],
+    kwargs: Dict[str, Argument],
+    name: str,
+) -> Union[TRTTensor, int]:
+    # Sizes known at conversion time are evaluated, dynamic ones use elementwise layers
+    if not any(isinstance(arg, TRTTensor) for arg in args):
+        ctx.folded_nodes += 1
+        return target(*args)
+
+    return impl.elementwise.convert_binary_elementwise(
+        ctx, target, SourceIR.UNKNOWN, name, SYM_INT_OPERATORS[target], *args
+    )
+
+
 @dynamo_tensorrt_converter(torch.ops.aten.arange.start_step)
 def aten_ops_arange_start_step(
     ctx: ConversionContext,
@@ -25,6 +25,6 @@ def remove_sym_nodes(gm: torch.fx.GraphModule) -> torch.fx.GraphModule:
 
     gm.graph.lint()
     gm.recompile()
-    logger.debug(f"Removed SymInt placeholders:\n{gm.graph}")
+    logger.debug("Removed SymInt placeholders:\n%s", gm.graph)
 
     return gm
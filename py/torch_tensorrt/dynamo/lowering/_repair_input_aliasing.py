@@ -33,6 +33,6 @@ def repair_input_aliasing(gm: torch.fx.GraphModule) -> torch.fx.GraphModule:
 
     gm.graph.lint()
     gm.recompile()
-    logger.debug(f"Inserted auxiliary clone nodes for placeholders:\n{gm.graph}")
+    logger.debug("Inserted auxiliary clone nodes for placeholders:\n%s", gm.graph)
 
     return gm
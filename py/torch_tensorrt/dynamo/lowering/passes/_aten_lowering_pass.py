@@ -3,12 +3,17 @@ from typing import Callable, Optional, Sequence, Union
 
 import torch
 
+from .canonicalize_layout_chains import canonicalize_layout_chains
 from .constant_folding import constant_fold
+from .fuse_pad_into_convolution import fuse_pad_into_convolution
 from .fuse_prims_broadcast import fuse_prims_broadcast
+from .fuse_sibling_linear import fuse_sibling_linear
 from .lower_linear import lower_linear
 from .lower_scaled_dot_product_attention import lower_scaled_dot_product_attention
 from .pass_manager import DynamoPassManager
+from .remove_common_subexpressions import remove_common_subexpressions
 from .remove_input_alias_fixing_clones import remove_input_alias_fixing_clones
+from .remove_redundant_casts import remove_redundant_casts
 from .repair_input_as_output import repair_input_as_output
 from .replace_max_pool_with_indices import replace_max_pool_with_indices
 from .view_to_reshape import view_to_reshape
@@ -16,13 +21,18 @@ from .view_to_reshape import view_to_reshape
 ATEN_LOWERING_PASSES = DynamoPassManager.build_from_passlist(
     [
         remove_input_alias_fixing_clones,
+        remove_common_subexpressions,
+        remove_redundant_casts,
         constant_fold,
         repair_input_as_output,
         lower_scaled_dot_product_attention,
         lower_linear,
+        fuse_sibling_linear,
         fuse_prims_broadcast,
+        fuse_pad_into_convolution,
         replace_max_pool_with_indices,
         view_to_reshape,
+        canonicalize_layout_chains,
     ]
 )
 
@@ -0,0 +1,482 @@
+import logging
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+import torch
+from torch_tensorrt.dynamo.lowering.passes.pass_utils import (
+    clean_up_graph_after_modifications,
+    is_torch_executed,
+    set_fake_tensor_metadata,
+)
+
+logger = logging.getLogger(__name__)
+
+# Operators which only change the shape or the order of the elements of a tensor.
+# aten.expand is left out: it repeats elements rather than reordering them, which
+# no composition of reshapes and permutes can express, so chains end at an expand
+LAYOUT_OPS = {
+    torch.ops.aten.reshape.default,
+    torch.ops.aten.view.default,
+    torch.ops.aten._unsafe_view.default,
+    torch.ops.aten.permute.default,
+    torch.ops.aten.squeeze.default,
+    torch.ops.aten.squeeze.dim,
+    torch.ops.aten.squeeze.dims,
+    torch.ops.aten.unsqueeze.default,
+}
+
+# A layout operation, as (target, arguments following the input tensor)
+LayoutOp = Tuple[Any, Tuple[Any, ...]]
+
+# A factor of the element order, as (size, stride in the input elements)
+Factor = Tuple[int, int]
+
+# The element order of a tensor, as the factors of each dimension, outermost first.
+# Unit dimensions have no factors
+Layout = List[List[Factor]]
+
+
+def canonicalize_layout_chains(
+    gm: torch.fx.GraphModule, sample_inputs: Sequence[torch.Tensor]
+) -> torch.fx.GraphModule:
+    """Replace chains of consecutive reshape and permute operators with a minimal equivalent
+
+    Each chain is composed into at most one reshape, one permute and one reshape, and
+    is removed entirely when its operators cancel. Since every layout operator becomes
+    a separate shuffle layer, this reduces the number of layers in the engine. Chains
+    end at expands, which repeat elements and cannot be composed this way
+    """
+    layout_nodes_before = _count_layout_nodes(gm)
+    modified_graph = False
+
+    for chain in _find_layout_chains(gm):
+        modified_graph |= _canonicalize_chain(gm, chain)
+
+    if modified_graph:
+        gm = clean_up_graph_after_modifications(gm)
+        logger.info(
+            "Canonicalized layout chains, reducing %d layout operators to %d",
+            layout_nodes_before,
+            _count_layout_nodes(gm),
+        )
+        logger.debug("Graph after canonicalizing layout chains:\n%s", gm.graph)
+
+    return gm
+
+
+def _count_layout_nodes(gm: torch.fx.GraphModule) -> int:
+    return len([node for node in gm.graph.nodes if node.target in LAYOUT_OPS])
+
+
+def _is_layout_node(node: Any) -> bool:
+    return (
+        isinstance(node, torch.fx.Node)
+        and node.target in LAYOUT_OPS
+        and not is_torch_executed(node)
+    )
+
+
+def _find_layout_chains(gm: torch.fx.GraphModule) -> List[List[torch.fx.Node]]:
+    """Returns maximal chains of layout nodes, in which each node is the only user of its input"""
+    chains = []
+
+    for node in gm.graph.nodes:
+        if not _is_layout_node(node):
+            continue
+
+        # Only begin chains at their first node
+        input = node.args[0]
+        if _is_layout_node(input) and len(input.users) == 1:
+            continue
+
+        chain = [node]
+        while len(chain[-1].users) == 1 and _is_layout_node(
+            next(iter(chain[-1].users))
+        ):
+            chain.append(next(iter(chain[-1].users)))
+
+        chains.append(chain)
+
+    return chains
+
+
+def _get_static_shape(node: Any) -> Optional[Tuple[int, ...]]:
+    """Returns the shape of a node from its metadata, if it is static"""
+    if not isinstance(node, torch.fx.Node):
+        return None
+
+    if "val" in node.meta and isinstance(node.meta["val"], torch.Tensor):
+        shape = node.meta["val"].shape
+    elif "tensor_meta" in node.meta and hasattr(node.meta["tensor_meta"], "shape"):
+        shape = node.meta["tensor_meta"].shape
+    else:
+        return None
+
+    if not all(isinstance(dim, int) for dim in shape):
+        return None
+
+    return tuple(shape)
+
+
+def _canonicalize_chain(gm: torch.fx.GraphModule, chain: List[torch.fx.Node]) -> bool:
+    """Replaces a chain of layout nodes with a shorter equivalent, returning whether it did"""
+    input = chain[0].args[0]
+    input_shape = _get_static_shape(input)
+    if input_shape is None:
+        return False
+
+    # Layout operators with dynamic arguments cannot be composed
+    ops = [(node.target, tuple(node.args[1:])) for node in chain]
+    if any(node.kwargs for node in chain) or not all(
+        _is_static(args) for _, args in ops
+    ):
+        return False
+
+    # Compose the element order of the chain from the shapes alone
+    layout = _trace_layout(input_shape, ops)
+    if layout is None:
+        return False
+
+    replacement = _minimal_layout_ops(input_shape, layout)
+    if replacement is None or len(replacement) >= len(chain):
+        return False
+
+    # The graph may not return its inputs directly
+    if not replacement and (
+        input.op == "placeholder"
+        and any(user.op == "output" for user in chain[-1].users)
+    ):
+        return False
+
+    with gm.graph.inserting_before(chain[-1]):
+        output = input
+        for target, args in replacement:
+            output = gm.graph.call_function(target, args=(output, *args))
+            set_fake_tensor_metadata(output)
+
+    if output is not input:
+        output.meta.update(chain[-1].meta)
+
+    chain[-1].replace_all_uses_with(output)
+    for node in reversed(chain):
+        gm.graph.erase_node(node)
+
+    return True
+
+
+def _is_static(arg: Any) -> bool:
+    if isinstance(arg, (list, tuple)):
+        return all(_is_static(elt) for elt in arg)
+    return isinstance(arg, int)
+
+
+def _initial_layout(shape: Sequence[int]) -> Layout:
+    """Returns the layout of a contiguous tensor of the given shape"""
+    return [
+        [(size, stride)] if size != 1 else []
+        for size, stride in zip(shape, _contiguous_strides(shape))
+    ]
+
+
+def _layout_shape(layout: Layout) -> Tuple[int, ...]:
+    return tuple(math.prod(size for size, _ in dim) for dim in layout)
+
+
+def _merge_factors(factors: Sequence[Factor]) -> List[Factor]:
+    """Merges adjacent factors which are also adjacent in the input"""
+    merged: List[Factor] = []
+
+    for size, stride in factors:
+        if merged and merged[-1][1] == size * stride:
+            merged[-1] = (merged[-1][0] * size, stride)
+        else:
+            merged.append((size, stride))
+
+    return merged
+
+
+def _reshape_layout(layout: Layout, shape: Sequence[int]) -> Optional[Layout]:
+    """Regroups the factors of a layout into the given shape
+
+    Factors are split where a dimension boundary falls within them. Returns None if a
+    boundary does not evenly divide a factor
+    """
+    factors = _merge_factors([factor for dim in layout for factor in dim])
+    numel = math.prod(size for size, _ in factors)
+
+    if -1 in shape:
+        known = math.prod(size for size in shape if size != -1)
+        if known == 0 or numel % known:
+            return None
+        shape = [numel // known if size == -1 else size for size in shape]
+    if math.prod(shape) != numel:
+        return None
+
+    reshaped = []
+    for size in shape:
+        dim = []
+        while size > 1:
+            factor_size, factor_stride = factors[0]
+            if factor_size <= size:
+                if size % factor_size:
+                    return None
+                dim.append(factors.pop(0))
+                size //= factor_size
+            else:
+                if factor_size % size:
+                    return None
+                dim.append((size, factor_stride * (factor_size // size)))
+                factors[0] = (factor_size // size, factor_stride)
+                size = 1
+        reshaped.append(dim)
+
+    return reshaped
+
+
+def _trace_layout(
+    input_shape: Tuple[int, ...], ops: Sequence[LayoutOp]
+) -> Optional[Layout]:
+    """Composes the layout produced by applying the layout ops to a contiguous input
+
+    Returns None if the element order cannot be expressed in factors of the input
+    """
+    layout: Optional[Layout] = _initial_layout(input_shape)
+
+    for target, args in ops:
+        if layout is None:
+            return None
+        rank = len(layout)
+
+        if target == torch.ops.aten.permute.default:
+            dims = [dim % rank for dim in args[0]]
+            if sorted(dims) != list(range(rank)):
+                return None
+            layout = [layout[dim] for dim in dims]
+        elif target in (
+            torch.ops.aten.reshape.default,
+            torch.ops.aten.view.default,
+            torch.ops.aten._unsafe_view.default,
+        ):
+            layout = _reshape_layout(layout, args[0])
+        elif target == torch.ops.aten.unsqueeze.default:
+            dim = args[0] % (rank + 1)
+            layout = layout[:dim] + [[]] + layout[dim:]
+        else:
+            # Squeezes remove unit dimensions, which have no factors
+            if target == torch.ops.aten.squeeze.default:
+                squeezed = set(range(rank))
+            elif target == torch.ops.aten.squeeze.dim:
+                squeezed = {args[0] % max(rank, 1)}
+            else:
+                squeezed = {dim % max(rank, 1) for dim in args[0]}
+            layout = [dim for i, dim in enumerate(layout) if dim or i not in squeezed]
+
+    return layout
+
+
+def _element_order(layout: Layout) -> Tuple[Tuple[int, ...], List[Factor]]:
+    """Returns the shape and the merged factors of a layout, which identify its element order"""
+    return _layout_shape(layout), _merge_factors(
+        [factor for dim in layout for factor in dim]
+    )
+
+
+def _minimal_layout_ops(
+    input_shape: Tuple[int, ...], layout: Layout
+) -> Optional[List[LayoutOp]]:
+    """Returns the shortest sequence of layout ops producing the layout
+
+    The candidates, from shortest to longest, are: nothing, a reshape, a permute,
+    a permute followed by a reshape, a reshape followed by a permute and finally
+    a reshape, a permute and a reshape
+    """
+    output_shape, factors = _element_order(layout)
+
+    # Factors merge into a single one of unit stride when the order is unchanged
+    if [stride for _, stride in factors] in ([], [1]):
+        if output_shape == input_shape:
+            return []
+        return [(torch.ops.aten.reshape.default, (list(output_shape),))]
+
+    # Digits of (radix, input stride, output stride), innermost first
+    digits = []
+    output_stride = 1
+    for size, stride in reversed(factors):
+        digits.append((size, stride, output_stride))
+        output_stride *= size
+
+    candidates = []
+
+    # Permutations of the input dimensions, optionally followed by a reshape
+    input_digits = _refine_digits(digits, _contiguous_strides(input_shape), None)
+    permutation = _input_permutation(input_shape, input_digits, output_shape)
+    if permutation is not None:
+        candidates.append([(torch.ops.aten.permute.default, (permutation,))])
+    permutation = _input_permutation(input_shape, input_digits, None)
+    if permutation is not None:
+        candidates.append(
+            [
+                (torch.ops.aten.permute.default, (permutation,)),
+                (torch.ops.aten.reshape.default, (list(output_shape),)),
+            ]
+        )
+
+    # A reshape followed by a permutation into the output shape
+    output_digits = _refine_digits(digits, None, _contiguous_strides(output_shape))
+    reshape_permute = _reshape_permute(output_digits, output_shape)
+    if reshape_permute is not None:
+        candidates.append(reshape_permute)
+
+    # The general case, permuting the coarsest dimensions in between two reshapes
+    reshape_permute = _reshape_permute(digits, None)
+    if reshape_permute is not None:
+        candidates.append(
+            reshape_permute + [(torch.ops.aten.reshape.default, (list(output_shape),))]
+        )
+
+    # Candidates are verified by composing their layouts as well
+    verified: List[List[LayoutOp]] = []
+    for candidate in candidates:
+        candidate_layout = _trace_layout(input_shape, candidate)
+        if candidate_layout is not None and _element_order(
+            candidate_layout
+        ) == _element_order(layout):
+            verified.append(_drop_identities(input_shape, candidate))
+
+    if not verified:
+        return None
+    return min(verified, key=len)
+
+
+def _contiguous_strides(shape: Sequence[int]) -> List[int]:
+    return [math.prod(shape[i + 1 :]) for i in range(len(shape))]
+
+
+def _refine_digits(
+    digits: List[Tuple[int, int, int]],
+    input_strides: Optional[Sequence[int]],
+    output_strides: Optional[Sequence[int]],
+) -> List[Tuple[int, int, int]]:
+    """Splits digits at the dimension boundaries of the input or output shape"""
+    refined = []
+
+    for radix, input_stride, output_stride in digits:
+        if input_strides is not None:
+            stride, boundaries = input_stride, input_strides
+        else:
+            assert output_strides is not None
+            stride, boundaries = output_stride, output_strides
+
+        inner = 1
+        for boundary in sorted(boundaries):
+            factor = boundary // stride
+            if (
+                boundary % stride == 0
+                and inner < factor < radix
+                and radix % factor == 0
+                and factor % inner == 0
+            ):
+                refined.append(
+                    (factor // inner, input_stride * inner, output_stride * inner)
+                )
+                inner = factor
+
+        refined.append((radix // inner, input_stride * inner, output_stride * inner))
+
+    return refined
+
+
+def _input_permutation(
+    input_shape: Tuple[int, ...],
+    digits: List[Tuple[int, int, int]],
+    output_shape: Optional[Tuple[int, ...]],
+) -> Optional[List[int]]:
+    """Returns the permutation of the input dimensions, one per digit, producing the order
+
+    If an output shape is given, unit dimensions are placed to produce it exactly
+    """
+    input_strides = _contiguous_strides(input_shape)
+    dims_by_stride = {
+        (input_strides[dim], input_shape[dim]): dim
+        for dim in range(len(input_shape))
+        if input_shape[dim] != 1
+    }
+    if len(dims_by_stride) != len(digits):
+        return None
+
+    # Outermost digits come first in the output
+    dims = []
+    for radix, input_stride, _ in reversed(digits):
+        if (input_stride, radix) not in dims_by_stride:
+            return None
+        dims.append(dims_by_stride[(input_stride, radix)])
+
+    unit_dims = [dim for dim in range(len(input_shape)) if input_shape[dim] == 1]
+    if output_shape is None:
+        return unit_dims + dims
+
+    if len(output_shape) != len(input_shape):
+        return None
+
+    permutation = []
+    for size in output_shape:
+        source = unit_dims if size == 1 else dims
+        if not source:
+            return None
+        permutation.append(source.pop(0))
+
+    return permutation
+
+
+def _reshape_permute(
+    digits: List[Tuple[int, int, int]], output_shape: Optional[Tuple[int, ...]]
+) -> Optional[List[LayoutOp]]:
+    """Returns a reshape into the digits, ordered by input stride, and their permutation
+
+    If an output shape is given, the permutation must produce it exactly
+    """
+    # Outermost digits come first in the output, and in the reshaped input
+    output_order = list(reversed(digits))
+    input_order = sorted(output_order, key=lambda digit: -digit[1])
+    reshaped = [radix for radix, _, _ in input_order]
+    permutation = [input_order.index(digit) for digit in output_order]
+
+    if output_shape is not None:
+        # Unit dimensions of the output are appended to the reshaped input
+        if [size for size in output_shape if size != 1] != [
+            radix for radix, _, _ in output_order
+        ]:
+            return None
+
+        dims = iter(permutation)
+        unit_dims = iter(range(len(reshaped), len(output_shape)))
+        reshaped += [1] * (len(output_shape) - len(output_order))
+        permutation = [
+            next(unit_dims) if size == 1 else next(dims) for size in output_shape
+        ]
+
+    return [
+        (torch.ops.aten.reshape.default, (reshaped,)),
+        (torch.ops.aten.permute.default, (permutation,)),
+    ]
+
+
+def _drop_identities(
+    input_shape: Tuple[int, ...], ops: List[LayoutOp]
+) -> List[LayoutOp]:
+    """Removes reshapes into the current shape and identity permutations"""
+    shape = list(input_shape)
+    minimal = []
+
+    for target, args in ops:
+        if target == torch.ops.aten.reshape.default:
+            if list(args[0]) == shape:
+                continue
+            shape = list(args[0])
+        else:
+            if list(args[0]) == list(range(len(shape))):
+                continue
+            shape = [shape[dim] for dim in args[0]]
+        minimal.append((target, args))
+
+    return minimal
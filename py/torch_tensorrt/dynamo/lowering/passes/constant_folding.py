@@ -49,7 +49,7 @@ def constant_fold(
 
     gm = clean_up_graph_after_modifications(gm)
 
-    logger.debug(f"Graph after constant folding:\n{gm.graph}")
+    logger.debug("Graph after constant folding:\n%s", gm.graph)
 
     return gm
 
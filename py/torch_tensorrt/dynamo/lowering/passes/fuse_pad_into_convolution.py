@@ -0,0 +1,88 @@
+import logging
+from typing import List, Optional, Sequence
+
+import torch
+from torch_tensorrt.dynamo.lowering.passes.pass_utils import (
+    clean_up_graph_after_modifications,
+    is_torch_executed,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def fuse_pad_into_convolution(
+    gm: torch.fx.GraphModule, sample_inputs: Sequence[torch.Tensor]
+) -> torch.fx.GraphModule:
+    """Fold zero padding of the input of a convolution into the padding of the convolution
+
+    Explicit padding is converted to a separate slice layer, which materializes the
+    padded input, whereas TensorRT pads convolutions within the convolution kernel.
+    Symmetric zero padding of the spatial dimensions is therefore added to the padding
+    of the convolution which consumes it
+    """
+    fused_pads = 0
+
+    for node in gm.graph.nodes:
+        if node.target != torch.ops.aten.convolution.default or is_torch_executed(node):
+            continue
+
+        pad_node, padding, transposed = node.args[0], node.args[4], node.args[6]
+        spatial_padding = _get_spatial_padding(pad_node, len(padding))
+        if spatial_padding is None or transposed or len(pad_node.users) != 1:
+            continue
+
+        node.args = (
+            pad_node.args[0],
+            *node.args[1:4],
+            [p + q for p, q in zip(padding, spatial_padding)],
+            *node.args[5:],
+        )
+        gm.graph.erase_node(pad_node)
+        fused_pads += 1
+
+    if fused_pads:
+        gm = clean_up_graph_after_modifications(gm)
+        logger.debug(
+            "Fused %d pad(s) into convolutions, graph after:\n%s", fused_pads, gm.graph
+        )
+
+    return gm
+
+
+def _get_spatial_padding(
+    node: torch.fx.node.Argument, num_spatial_dims: int
+) -> Optional[List[int]]:
+    """Returns the padding of the spatial dimensions by a constant zero pad node
+
+    The padding must be symmetric, non-negative and only cover the spatial dimensions
+    """
+    if not isinstance(node, torch.fx.Node) or is_torch_executed(node):
+        return None
+
+    if node.target == torch.ops.aten.constant_pad_nd.default:
+        pad = node.args[1]
+        value = node.args[2] if len(node.args) > 2 else node.kwargs.get("value", 0)
+    elif node.target == torch.ops.aten.pad.default:
+        mode = node.args[2] if len(node.args) > 2 else node.kwargs.get("mode")
+        if mode not in (None, "constant"):
+            return None
+        pad = node.args[1]
+        value = node.args[3] if len(node.args) > 3 else node.kwargs.get("value")
+    else:
+        return None
+
+    if (
+        value not in (None, 0)
+        or len(pad) % 2
+        or len(pad) // 2 > num_spatial_dims
+        or not all(isinstance(p, int) and p >= 0 for p in pad)
+        or any(pad[i] != pad[i + 1] for i in range(0, len(pad), 2))
+    ):
+        return None
+
+    # Pads are listed from the last dimension, before and after each dimension
+    padding = [0] * num_spatial_dims
+    for i in range(len(pad) // 2):
+        padding[-i - 1] = pad[i * 2]
+
+    return padding
@@ -0,0 +1,181 @@
+import logging
+import operator
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import torch
+from torch_tensorrt.dynamo.lowering.passes.pass_utils import (
+    clean_up_graph_after_modifications,
+    is_torch_executed,
+    set_fake_tensor_metadata,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def fuse_sibling_linear(
+    gm: torch.fx.GraphModule, sample_inputs: Sequence[torch.Tensor]
+) -> torch.fx.GraphModule:
+    """Fuse linear layers which share an input into a single GEMM followed by a split
+
+    Sibling projections, such as the Q, K and V projections of attention blocks,
+    read the same activation with constant weights of identical input dimension.
+    Their weights (and biases) are concatenated along the output dimension, so a
+    single, wider GEMM is built instead of one GEMM per projection
+    """
+    groups: Dict[Tuple[Any, ...], List[torch.fx.Node]] = defaultdict(list)
+
+    for node in gm.graph.nodes:
+        operands = _get_linear_operands(node)
+        if operands is None or is_torch_executed(node):
+            continue
+
+        input, weight_node, bias_node = operands
+        weight = _get_constant(gm, weight_node, dim=2)
+        bias = _get_constant(gm, bias_node, dim=1) if bias_node is not None else None
+        if weight is None or (bias_node is not None and bias is None):
+            continue
+
+        groups[
+            (input, bias is not None, weight.shape[1], weight.dtype, weight.device)
+        ].append(node)
+
+    fused_groups = 0
+    fused_constants: Set[str] = set()
+    for siblings in groups.values():
+        if len(siblings) > 1:
+            fused_constants.update(_fuse_linear_nodes(gm, siblings))
+            fused_groups += 1
+
+    if fused_groups:
+        gm = clean_up_graph_after_modifications(gm)
+        _delete_unused_attributes(gm, fused_constants)
+        logger.debug(
+            "Fused %d group(s) of sibling linear layers, graph after:\n%s",
+            fused_groups,
+            gm.graph,
+        )
+
+    return gm
+
+
+def _get_linear_operands(
+    node: torch.fx.Node,
+) -> Optional[Tuple[torch.fx.Node, torch.fx.Node, Optional[torch.fx.Node]]]:
+    """Returns the input, weight and bias nodes of a linear layer
+
+    Linear layers are either aten.linear nodes, or bias-free aten.mm nodes
+    multiplying with a transposed weight, which are not lowered to aten.linear
+    """
+    if node.target == torch.ops.aten.linear.default:
+        bias = node.args[2] if len(node.args) > 2 else node.kwargs.get("bias")
+        if isinstance(node.args[0], torch.fx.Node) and (
+            bias is None or isinstance(bias, torch.fx.Node)
+        ):
+            return node.args[0], node.args[1], bias
+
+    elif (
+        node.target == torch.ops.aten.mm.default
+        and isinstance(node.args[0], torch.fx.Node)
+        and isinstance(node.args[1], torch.fx.Node)
+        and node.args[1].target == torch.ops.aten.permute.default
+        and list(node.args[1].args[1]) == [1, 0]
+    ):
+        return node.args[0], node.args[1].args[0], None
+
+    return None
+
+
+def _get_constant(
+    gm: torch.fx.GraphModule, node: torch.fx.Node, dim: int
+) -> Optional[torch.Tensor]:
+    """Returns the constant tensor of a get_attr node, if it has the given rank"""
+    if not (isinstance(node, torch.fx.Node) and node.op == "get_attr"):
+        return None
+
+    constant = operator.attrgetter(node.target)(gm)
+    if not isinstance(constant, torch.Tensor) or constant.dim() != dim:
+        return None
+
+    return constant
+
+
+def _fuse_linear_nodes(
+    gm: torch.fx.GraphModule, linear_nodes: List[torch.fx.Node]
+) -> Set[str]:
+    """Replaces the linear nodes with one linear node over the concatenated constants
+
+    Returns the names of the original constants
+    """
+    operands = []
+    for node in linear_nodes:
+        node_operands = _get_linear_operands(node)
+        assert node_operands is not None
+        operands.append(node_operands)
+
+    weights = [operator.attrgetter(weight.target)(gm) for _, weight, _ in operands]
+    biases = [
+        operator.attrgetter(bias.target)(gm)
+        for _, _, bias in operands
+        if bias is not None
+    ]
+
+    with torch.no_grad():
+        fused_weight = torch.cat(weights, dim=0)
+        fused_bias = torch.cat(biases, dim=0) if biases else None
+
+    # The linear nodes appear in graph order, so the first one succeeds the shared
+    # input, and the fused computation can be placed before it
+    with gm.graph.inserting_before(linear_nodes[0]):
+        weight_node = _register_constant(gm, fused_weight)
+        bias_node = (
+            _register_constant(gm, fused_bias) if fused_bias is not None else None
+        )
+        fused_node = gm.graph.call_function(
+            torch.ops.aten.linear.default,
+            args=(operands[0][0], weight_node, bias_node),
+        )
+        split_node = gm.graph.call_function(
+            torch.ops.aten.split_with_sizes.default,
+            args=(fused_node, [weight.shape[0] for weight in weights], -1),
+        )
+        set_fake_tensor_metadata(fused_node)
+        set_fake_tensor_metadata(split_node)
+
+        for i, node in enumerate(linear_nodes):
+            output_node = gm.graph.call_function(operator.getitem, args=(split_node, i))
+            output_node.meta.update(node.meta)
+            node.replace_all_uses_with(output_node)
+
+    for node in linear_nodes:
+        gm.graph.erase_node(node)
+
+    return {
+        constant.target
+        for _, weight, bias in operands
+        for constant in (weight, bias)
+        if constant is not None
+    }
+
+
+def _register_constant(
+    gm: torch.fx.GraphModule, constant: torch.Tensor
+) -> torch.fx.Node:
+    """Registers a fused constant on the graph module and returns a get_attr node for it"""
+    i = 0
+    while hasattr(gm, f"_fused_linear_param{i}"):
+        i += 1
+
+    qualname = f"_fused_linear_param{i}"
+    gm.register_parameter(qualname, torch.nn.Parameter(constant, requires_grad=False))
+    return gm.graph.get_attr(qualname)
+
+
+def _delete_unused_attributes(gm: torch.fx.GraphModule, names: Set[str]) -> None:
+    """Deletes the given constants from the graph module if they are no longer referenced"""
+    referenced = {node.target for node in gm.graph.nodes if node.op == "get_attr"}
+
+    for name in names - referenced:
+        owner_name, _, attr = name.rpartition(".")
+        owner = gm.get_submodule(owner_name) if owner_name else gm
+        delattr(owner, attr)
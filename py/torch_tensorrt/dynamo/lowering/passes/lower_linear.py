@@ -1,3 +1,4 @@
+import functools
 import logging
 from typing import Callable, Sequence, Tuple
 
@@ -5,6 +6,7 @@ import torch
 from torch_tensorrt.dynamo.lowering.passes.pass_utils import (
     clean_up_graph_after_modifications,
 )
+from torch_tensorrt.fx.passes.pattern_rewriter import PatternRewriter
 
 logger = logging.getLogger(__name__)
 
@@ -13,15 +15,22 @@ def lower_linear(
     gm: torch.fx.GraphModule, sample_inputs: Sequence[torch.Tensor]
 ) -> torch.fx.GraphModule:
     """Replace aten.linear with an equivalent implementation which can be easily converted to TRT"""
-    orig, replacement = linear_replacement()
-
-    if torch.fx.subgraph_rewriter.replace_pattern(gm, orig, replacement):
+    if _linear_rewriter()(gm):
         gm = clean_up_graph_after_modifications(gm)
-        logger.debug(f"Graph after lowering linear:\n{gm.graph}")
+        logger.debug("Graph after lowering linear:\n%s", gm.graph)
 
     return gm
 
 
+@functools.lru_cache(maxsize=None)
+def _linear_rewriter() -> PatternRewriter:
+    """Traces the linear pattern once and caches the resulting rewriter"""
+    orig, replacement = linear_replacement()
+    rewriter = PatternRewriter()
+    rewriter.register(orig, replacement)
+    return rewriter
+
+
 def linear_replacement() -> Tuple[
     torch.fx.GraphModule,
     Callable[[torch.Tensor, torch.Tensor, torch.Tensor], torch.Tensor],
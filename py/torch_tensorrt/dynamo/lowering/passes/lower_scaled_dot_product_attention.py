@@ -1,12 +1,14 @@
+import functools
 import logging
 import operator
 from typing import Callable, Sequence, Tuple
 
 import torch
-from torch_tensorrt.dynamo.conversion.aten_ops_converters import args_bounds_check
+from torch_tensorrt.dynamo.conversion.converter_utils import args_bounds_check
 from torch_tensorrt.dynamo.lowering.passes.pass_utils import (
     clean_up_graph_after_modifications,
 )
+from torch_tensorrt.fx.passes.pattern_rewriter import PatternRewriter
 
 logger = logging.getLogger(__name__)
 REPLACEABLE_ATEN_OPS = {
@@ -21,17 +23,8 @@ def lower_scaled_dot_product_attention(
     """Replace specific versions of scaled_dot_product_attention with an equivalent
     implementation which can be easily converted to TRT
     """
-    original_fns, replacement = scaled_dot_product_attention_replacement()
-    replaced_nodes = []
-
-    # For each original function, search for it in the graph and replace
-    for original in original_fns:
-        replaced_nodes += torch.fx.subgraph_rewriter.replace_pattern_with_filters(
-            gm,
-            original,
-            replacement,
-            ignore_literals=True,
-        )
+    # Match all attention variants in a single traversal of the graph
+    replaced_nodes = _scaled_dot_product_attention_rewriter()(gm)
 
     if replaced_nodes:
         # Repair instances which use the kwargs field (specifically the "scale" kwarg)
@@ -87,16 +80,28 @@ def lower_scaled_dot_product_attention(
             ) and args_bounds_check(attention_node_replaced.args, 3) is not None:
                 new_attention_node.args = (
                     new_attention_node.args[:3]
-                    + attention_node_replaced.args[3]
+                    + (attention_node_replaced.args[3],)
                     + new_attention_node.args[4:]
                 )
 
         gm = clean_up_graph_after_modifications(gm)
-        logger.debug(f"Graph after lowering scaled dot product attention:\n{gm.graph}")
+        logger.debug("Graph after lowering scaled dot product attention:\n%s", gm.graph)
 
     return gm
 
 
+@functools.lru_cache(maxsize=None)
+def _scaled_dot_product_attention_rewriter() -> PatternRewriter:
+    """Traces the attention patterns once and caches the resulting rewriter"""
+    original_fns, replacement = scaled_dot_product_attention_replacement()
+    rewriter = PatternRewriter()
+
+    for original in original_fns:
+        rewriter.register(original, replacement, ignore_literals=True)
+
+    return rewriter
+
+
 def scaled_dot_product_attention_replacement() -> Tuple[
     Sequence[Callable[[torch.Tensor, torch.Tensor, torch.Tensor], torch.Tensor]],
     Callable[[torch.Tensor, torch.Tensor, torch.Tensor], torch.Tensor],
@@ -1,6 +1,10 @@
-from typing import Any, List
+import operator
+from typing import Any, Dict, List
 
 import torch
+from torch._guards import detect_fake_mode
+from torch.fx.node import _get_qualified_name, map_arg
+from torch_tensorrt.dynamo.conversion._ConverterRegistry import DYNAMO_CONVERTERS
 
 
 def clean_up_graph_after_modifications(
@@ -13,6 +17,48 @@ def clean_up_graph_after_modifications(
     return gm
 
 
+def is_torch_executed(node: torch.fx.Node) -> bool:
+    """Returns whether the user requested the operator of the node to run in Torch"""
+    disallowed_targets = DYNAMO_CONVERTERS.disallowed_targets
+    if not disallowed_targets:
+        return False
+
+    return node.target in disallowed_targets or (
+        not isinstance(node.target, str)
+        and _get_qualified_name(node.target) in disallowed_targets
+    )
+
+
+def set_fake_tensor_metadata(node: torch.fx.Node) -> None:
+    """Sets meta["val"] of a node inserted by a lowering pass, in-place
+
+    The target of the node is run on the fake tensors of its inputs. Constants read by
+    get_attr inputs are converted to fake tensors, and their nodes annotated as well.
+    The node is left unannotated if its inputs carry no fake tensors
+    """
+    if node.op != "call_function" or not callable(node.target):
+        return
+
+    fake_mode = detect_fake_mode(
+        tuple(input.meta.get("val") for input in node.all_input_nodes)
+    )
+    if fake_mode is None:
+        return
+
+    values: Dict[torch.fx.Node, Any] = {}
+    for input in node.all_input_nodes:
+        if "val" not in input.meta and input.op == "get_attr":
+            constant = operator.attrgetter(input.target)(input.graph.owning_module)
+            input.meta["val"] = fake_mode.from_tensor(constant, static_shapes=True)
+        if "val" not in input.meta:
+            return
+        values[input] = input.meta["val"]
+
+    args, kwargs = map_arg((node.args, node.kwargs), values.__getitem__)
+    with fake_mode:
+        node.meta["val"] = node.target(*args, **kwargs)
+
+
 def get_tensor_placeholders(
     gm: torch.fx.GraphModule,
 ) -> List[torch.fx.Node]:
@@ -0,0 +1,92 @@
+import logging
+from typing import Any, Dict, Hashable, Sequence, Tuple
+
+import torch
+from torch_tensorrt.dynamo.lowering.passes.pass_utils import (
+    clean_up_graph_after_modifications,
+    is_torch_executed,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _hashable_argument(arg: Any) -> Hashable:
+    """Converts a node argument into a hashable key, visiting each element once"""
+    if isinstance(arg, (list, tuple)):
+        return (type(arg), tuple(_hashable_argument(elt) for elt in arg))
+    elif isinstance(arg, dict):
+        return (
+            dict,
+            tuple(sorted((k, _hashable_argument(v)) for k, v in arg.items())),
+        )
+    elif isinstance(arg, slice):
+        return (slice, arg.start, arg.stop, arg.step)
+    # Tensors hash by identity, but compare elementwise, so they are keyed by id
+    elif isinstance(arg, torch.Tensor):
+        return (torch.Tensor, id(arg))
+    # Python scalars of different types compare equal (1 == 1.0 == True),
+    # so the type is included in the key
+    elif isinstance(arg, (bool, int, float)):
+        return (type(arg), arg)
+
+    return arg
+
+
+def _is_eliminable(node: torch.fx.Node) -> bool:
+    """Determines whether a node may be deduplicated against an identical node"""
+    if node.op not in ("call_function", "call_method") or node.is_impure():
+        return False
+
+    if isinstance(node.target, torch._ops.OpOverload):
+        # Mutating or randomized operators are not deterministic functions of their inputs
+        if node.target._schema.is_mutable or (
+            torch.Tag.nondeterministic_seeded in node.target.tags
+        ):
+            return False
+
+    # Operators the user requested to run in Torch are left untouched
+    if is_torch_executed(node):
+        return False
+
+    return True
+
+
+def remove_common_subexpressions(
+    gm: torch.fx.GraphModule, sample_inputs: Sequence[torch.Tensor]
+) -> torch.fx.GraphModule:
+    """Replace identical pure operations on identical inputs with a single node
+
+    Nodes are visited once in topological order, so the inputs of each node have
+    already been deduplicated when the node itself is hashed
+    """
+    seen_nodes: Dict[Tuple[Any, ...], torch.fx.Node] = {}
+    removed_nodes = 0
+
+    for node in list(gm.graph.nodes):
+        if not _is_eliminable(node):
+            continue
+
+        key = (
+            node.op,
+            node.target,
+            _hashable_argument(node.args),
+            _hashable_argument(node.kwargs),
+        )
+
+        try:
+            existing_node = seen_nodes.setdefault(key, node)
+        except TypeError:
+            # Arguments which cannot be hashed are never deduplicated
+            continue
+
+        if existing_node is not node:
+            node.replace_all_uses_with(existing_node)
+            gm.graph.erase_node(node)
+            removed_nodes += 1
+
+    if removed_nodes:
+        gm = clean_up_graph_after_modifications(gm)
+        logger.info("Removed %d common subexpression node(s)", removed_nodes)
+        logger.debug("Graph after removing common subexpressions:\n%s", gm.graph)
+
+    return gm
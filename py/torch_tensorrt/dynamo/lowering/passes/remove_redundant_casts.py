@@ -0,0 +1,147 @@
+import logging
+from typing import Optional, Sequence
+
+import torch
+from torch_tensorrt.dynamo.lowering.passes.pass_utils import (
+    clean_up_graph_after_modifications,
+    is_torch_executed,
+)
+
+logger = logging.getLogger(__name__)
+
+# Operators which only change the data type of a tensor, given benign keyword arguments
+CAST_OPS = {
+    torch.ops.aten._to_copy.default,
+    torch.ops.prims.convert_element_type.default,
+}
+
+# Mantissa bits (including the implicit bit) of floating point types, which bound
+# the integers they represent exactly
+MANTISSA_BITS = {
+    torch.float16: 11,
+    torch.bfloat16: 8,
+    torch.float32: 24,
+    torch.float64: 53,
+}
+
+
+def remove_redundant_casts(
+    gm: torch.fx.GraphModule, sample_inputs: Sequence[torch.Tensor]
+) -> torch.fx.GraphModule:
+    """Remove casts which do not change the data type and collapse chains of casts
+
+    The data type of each tensor is read from the graph metadata, so each value is
+    cast at most once: a cast to the type a tensor already has is removed, and a
+    cast of a cast which was exact is applied to the original tensor instead
+    """
+    casts_before = _count_cast_nodes(gm)
+    modified_graph = False
+
+    for node in gm.graph.nodes:
+        cast_dtype = _get_cast_dtype(node)
+        if cast_dtype is None:
+            continue
+
+        # Skip intermediate casts which do not lose information
+        input = node.args[0]
+        while (
+            _get_cast_dtype(input) is not None
+            and _get_dtype(input.args[0]) is not None
+            and is_exact_cast(_get_dtype(input.args[0]), _get_cast_dtype(input))
+        ):
+            input = input.args[0]
+
+        if _get_dtype(input) == cast_dtype:
+            node.replace_all_uses_with(input)
+            modified_graph = True
+        elif input is not node.args[0]:
+            node.replace_input_with(node.args[0], input)
+            modified_graph = True
+
+    if modified_graph:
+        gm = clean_up_graph_after_modifications(gm)
+        logger.debug(
+            "Removed redundant casts, reducing %d cast nodes in the graph to %d, "
+            "graph after:\n%s",
+            casts_before,
+            _count_cast_nodes(gm),
+            gm.graph,
+        )
+
+    return gm
+
+
+def is_exact_cast(src: torch.dtype, dst: torch.dtype) -> bool:
+    """Returns whether every value of type src is represented exactly in type dst"""
+    if src == dst or src == torch.bool:
+        return True
+    if dst == torch.bool or src.is_complex or dst.is_complex:
+        return False
+
+    if not src.is_floating_point:
+        src_info = torch.iinfo(src)
+        if dst.is_floating_point:
+            return max(-src_info.min, src_info.max) <= 2 ** MANTISSA_BITS.get(dst, 0)
+
+        dst_info = torch.iinfo(dst)
+        return dst_info.min <= src_info.min and src_info.max <= dst_info.max
+
+    if not dst.is_floating_point or src not in MANTISSA_BITS:
+        return False
+
+    src_finfo, dst_finfo = torch.finfo(src), torch.finfo(dst)
+    return (
+        MANTISSA_BITS.get(dst, 0) >= MANTISSA_BITS[src]
+        and dst_finfo.max >= src_finfo.max
+        and dst_finfo.smallest_normal <= src_finfo.smallest_normal
+    )
+
+
+def _get_dtype(node: torch.fx.node.Argument) -> Optional[torch.dtype]:
+    """Returns the data type of a node from its metadata, if known"""
+    if not isinstance(node, torch.fx.Node):
+        return None
+
+    if "val" in node.meta and isinstance(node.meta["val"], torch.Tensor):
+        return node.meta["val"].dtype
+    elif "tensor_meta" in node.meta and hasattr(node.meta["tensor_meta"], "dtype"):
+        return node.meta["tensor_meta"].dtype
+
+    return None
+
+
+def _get_cast_dtype(node: torch.fx.node.Argument) -> Optional[torch.dtype]:
+    """Returns the target data type of a node which only casts its input, if it is one"""
+    if (
+        not isinstance(node, torch.fx.Node)
+        or node.target not in CAST_OPS
+        or is_torch_executed(node)
+        or not isinstance(node.args[0], torch.fx.Node)
+    ):
+        return None
+
+    if node.target == torch.ops.prims.convert_element_type.default:
+        return node.args[1] if len(node.args) > 1 else None
+
+    # Copies which change the device, layout or memory format are not only casts
+    if len(node.args) > 1 or not set(node.kwargs).issubset(
+        {"dtype", "device", "layout", "memory_format", "non_blocking", "pin_memory"}
+    ):
+        return None
+    input_val = node.args[0].meta.get("val")
+    device = node.kwargs.get("device")
+    if device is not None and (
+        not isinstance(input_val, torch.Tensor)
+        or torch.device(device) != input_val.device
+    ):
+        return None
+    if node.kwargs.get("layout") not in (None, torch.strided) or node.kwargs.get(
+        "memory_format"
+    ) not in (None, torch.preserve_format):
+        return None
+
+    return node.kwargs.get("dtype", _get_dtype(node.args[0]))
+
+
+def _count_cast_nodes(gm: torch.fx.GraphModule) -> int:
+    return len([node for node in gm.graph.nodes if node.target in CAST_OPS])
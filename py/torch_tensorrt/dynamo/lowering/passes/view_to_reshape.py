@@ -31,7 +31,7 @@ def view_to_reshape(
 
     if torch.fx.subgraph_rewriter.replace_pattern(gm, orig, replacement):
         gm = clean_up_graph_after_modifications(gm)
-        logger.debug(f"Graph after replacing view with reshape:\n{gm.graph}")
+        logger.debug("Graph after replacing view with reshape:\n%s", gm.graph)
 
     # Copy the orig_op's metadata to the replacement op
     set_metadata(gm, replacement_op, metadata)
@@ -1,5 +1,6 @@
 from ._adjacency_partitioner import partition as fast_partition
 from ._global_partitioner import partition as global_partition
+from .common import compile_fallback_submodule as compile_fallback_submodule
 from .common import (
     construct_submodule_inputs,
     get_graph_converter_support,
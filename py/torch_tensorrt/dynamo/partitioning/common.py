@@ -170,3 +170,35 @@ def get_graph_converter_support(
         op_support.print_support_overview(print_node_support=True)
 
     return number_of_supported_nodes, total_functional_nodes
+
+
+# Backends which would recursively route the fallback segments back into Torch-TensorRT
+_RECURSIVE_BACKENDS = {"tensorrt", "torch_tensorrt", "aot_torch_tensorrt_aten"}
+
+
+def compile_fallback_submodule(
+    submodule: torch.fx.GraphModule,
+    backend: str,
+    options: Optional[Dict[str, Any]] = None,
+) -> torch.nn.Module:
+    """Compiles a Torch-executed submodule with a secondary ``torch.compile`` backend
+
+    Args:
+        submodule: FX GraphModule left to run in Torch after partitioning
+        backend: Name of the ``torch.compile`` backend to use, e.g. "inductor"
+        options: Backend-specific options, passed through to ``torch.compile``
+    Returns:
+        The compiled submodule, which is compiled lazily upon its first invocation
+    """
+    if backend in _RECURSIVE_BACKENDS:
+        raise ValueError(
+            f"Fallback backend {backend} is not supported, since it would compile "
+            "the Torch-executed segments with Torch-TensorRT again. Choose a "
+            'backend such as "inductor" instead.'
+        )
+
+    logger.debug(f"Compiling Torch-executed submodule with the {backend} backend")
+
+    return torch.compile(
+        submodule, backend=backend, options=options if options else None
+    )
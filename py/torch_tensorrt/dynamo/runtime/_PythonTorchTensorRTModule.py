@@ -9,7 +9,7 @@ import torch
 import torch_tensorrt
 from torch.nn import Module
 from torch_tensorrt._Device import Device
-from torch_tensorrt._enums import dtype
+from torch_tensorrt._enums import dtype, memory_format
 from torch_tensorrt.dynamo.runtime.tools import (
     _is_switch_required,
     _select_rt_device,
@@ -71,6 +71,12 @@ class PythonTorchTensorRTModule(Module):  # type: ignore[misc]
         self.input_shapes = [
             self.engine.get_tensor_shape(input_name) for input_name in self.input_names
         ]
+        self.input_formats = [
+            memory_format._from(self.engine.get_tensor_format(input_name)).to(
+                torch.memory_format
+            )
+            for input_name in self.input_names
+        ]
         self.output_dtypes = [
             dtype._from(self.engine.get_tensor_dtype(output_name))
             for output_name in self.output_names
@@ -79,6 +85,12 @@ class PythonTorchTensorRTModule(Module):  # type: ignore[misc]
             self.engine.get_tensor_shape(output_name)
             for output_name in self.output_names
         ]
+        self.output_formats = [
+            memory_format._from(self.engine.get_tensor_format(output_name)).to(
+                torch.memory_format
+            )
+            for output_name in self.output_names
+        ]
 
     def _check_initialized(self) -> None:
         if not self.initialized:
@@ -173,7 +185,11 @@ class PythonTorchTensorRTModule(Module):  # type: ignore[misc]
                     self.input_names
                 ), f"Wrong number of inputs, expect {len(self.input_names)} get {len(inputs)}."
 
-                contiguous_inputs: List[torch.Tensor] = [i.contiguous() for i in inputs]
+                # Inputs are reformatted only if they are not in the format of the engine
+                contiguous_inputs: List[torch.Tensor] = [
+                    input.contiguous(memory_format=input_format)
+                    for input, input_format in zip(inputs, self.input_formats)
+                ]
                 bindings = []
                 for i, input_name in enumerate(self.input_names):
                     if not contiguous_inputs[i].is_cuda:
@@ -215,6 +231,7 @@ class PythonTorchTensorRTModule(Module):  # type: ignore[misc]
                         size=shape,
                         dtype=self.output_dtypes[i].to(torch.dtype),
                         device=torch.cuda.current_device(),
+                        memory_format=self.output_formats[i],
                     )
                     bindings.append(output.data_ptr())
                     outputs.append(output)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import logging
 from dataclasses import fields, replace
-from typing import Any, Callable, Dict, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple, Union
 
 import torch
 from torch_tensorrt._Device import Device
@@ -15,6 +17,13 @@ from packaging import version
 
 logger = logging.getLogger(__name__)
 
+# Example tensors of the Inputs of the current compilation, by the id of the Input,
+# the mode and the device, if an input_materialization_cache is entered. Each thread
+# or task compiling a model has its own cache
+_MATERIALIZED_INPUTS: contextvars.ContextVar[
+    Optional[Dict[Tuple[int, str, torch.device], Tuple[Input, torch.Tensor]]]
+] = contextvars.ContextVar("_MATERIALIZED_INPUTS", default=None)
+
 COSINE_THRESHOLD = 0.99
 
 
@@ -72,23 +81,58 @@ def input_is_dynamic(inputs: Sequence[Union[Input, torch.Tensor]]) -> bool:
     )
 
 
+@contextlib.contextmanager
+def input_materialization_cache() -> Iterator[None]:
+    """
+    Materialize the example tensor of each Input, mode and device at most once
+    within the context, which spans one compilation. Nested contexts share the
+    cache of the outermost one, which releases the tensors on exit. Compilations
+    in other threads or tasks do not share the cache.
+    """
+    if _MATERIALIZED_INPUTS.get() is not None:
+        yield
+        return
+
+    token = _MATERIALIZED_INPUTS.set({})
+    try:
+        yield
+    finally:
+        _MATERIALIZED_INPUTS.reset(token)
+
+
+def _materialize_input(input: Input, mode: str, device: torch.device) -> torch.Tensor:
+    materialized_inputs = _MATERIALIZED_INPUTS.get()
+    key = (id(input), mode, device)
+    if materialized_inputs is not None and key in materialized_inputs:
+        cached_input, tensor = materialized_inputs[key]
+        if cached_input is input:
+            return tensor
+
+    tensor = (input.example_tensor(mode) if mode else input.torch_tensor).to(device)
+    if materialized_inputs is not None:
+        # The Input is kept alive with the tensor so its id is not reused
+        materialized_inputs[key] = (input, tensor)
+    return tensor
+
+
 def get_torch_inputs(
     inputs: Sequence[Input], device: Union[Device, torch.device, str], mode: str = ""
 ) -> Sequence[torch.tensor]:
     """
     Return the torch_tensor from the Input object. If mode is set, this implies
     user is using dynamic shaped inputs and return the corresponding input based
-    on the mode requested.
+    on the mode requested. Within an input_materialization_cache, the tensors of
+    each Input are reused instead of generated and copied to the device again.
     """
     device = to_torch_device(device)
     if mode:
         return [
-            input.example_tensor(mode).to(device)
+            _materialize_input(input, mode, device)
             for input in inputs
             if isinstance(input, Input)
         ]
     return [
-        input.torch_tensor.to(device) if isinstance(input, Input) else input
+        _materialize_input(input, mode, device) if isinstance(input, Input) else input
         for input in inputs
     ]
 
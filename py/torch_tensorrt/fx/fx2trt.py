@@ -247,6 +247,13 @@ class TRTInterpreter(torch.fx.Interpreter):
             for optimization_profile in self.optimization_profiles:
                 builder_config.add_optimization_profile(optimization_profile)
 
+            # Let the execution contexts of each stream share the profiles, which
+            # is the default from TensorRT 10
+            if hasattr(getattr(trt, "PreviewFeature", None), "PROFILE_SHARING_0806"):
+                builder_config.set_preview_feature(
+                    trt.PreviewFeature.PROFILE_SHARING_0806, True
+                )
+
         if algorithm_selector:
             builder_config.set_flag(trt.BuilderFlag.DISABLE_TIMING_CACHE)
             builder_config.algorithm_selector = algorithm_selector
@@ -3,7 +3,22 @@ from typing import Any, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 import torch
 
 from .types import Shape, ShapeRange
-from .utils import get_dynamic_dims
+from .utils import get_dynamic_dims, supports_profile_sharing
+
+
+def get_opt_profile_replica(lower_setting) -> int:
+    """
+    Returns the number of optimization profile replicas to build for the
+    execution contexts requested by the lower setting. An explicit
+    opt_profile_replica is used as is. Otherwise a single profile is built
+    if TensorRT can share it between execution contexts, and a replica per
+    execution context if it can't.
+    """
+    if lower_setting.opt_profile_replica is not None:
+        return lower_setting.opt_profile_replica
+    if supports_profile_sharing():
+        return 1
+    return max(lower_setting.num_execution_contexts, 1)
 
 
 def generate_input_specs(inputs, lower_setting, additional_inputs=None):
@@ -31,7 +46,7 @@ def generate_input_specs(inputs, lower_setting, additional_inputs=None):
                 lower_setting.max_batch_size,
                 lower_setting.max_batch_size,
             ),
-            lower_setting.opt_profile_replica,
+            get_opt_profile_replica(lower_setting),
             batch_dims,
         )
     else:
@@ -60,7 +75,7 @@ def generate_input_specs(inputs, lower_setting, additional_inputs=None):
                 lower_setting.max_batch_size,
                 lower_setting.max_batch_size,
             ),
-            lower_setting.opt_profile_replica,
+            get_opt_profile_replica(lower_setting),
             batch_dims,
         )
 
@@ -143,9 +158,10 @@ class InputTensorSpec(NamedTuple):
                 the smallest batch size allowed. The second integer indiceates
                 the batch size that we'll optimize for. The third integer indicates
                 the largest batch size allowed.
-            opt_profile_replica (int): If dynamic shape is enabled, each execution
-                context requires a different optimization profile. This arg determines
-                how many optimization profile replicas we want to produce.
+            opt_profile_replica (int): If dynamic shape is enabled and TensorRT can't
+                share optimization profiles, each execution context requires a different
+                optimization profile. This arg determines how many optimization profile
+                replicas we want to produce.
             batch_dims (Optional[List[int]]): The batch dim might not be the leading dim
                 and allow user to specify the batch dims using this arg. Default we treat
                 dim 0 as the batch dim.
@@ -169,7 +185,9 @@ class InputTensorSpec(NamedTuple):
                     batch_dim
                 ), f"The {i}th tensor (shape: {tensor.shape}) doesn't have the correct batch size: {batch_size}."
                 shape[batch_dim] = -1
-                shape_ranges: List[ShapeRange] = [tuple(tuple(shape[0:batch_dim] + [bs] + shape[batch_dim + 1 :]) for bs in batch_size_range)] * opt_profile_replica  # type: ignore[list-item]
+                # The replicas refer to the same shape range
+                shape_range: ShapeRange = tuple(tuple(shape[0:batch_dim] + [bs] + shape[batch_dim + 1 :]) for bs in batch_size_range)  # type: ignore[assignment]
+                shape_ranges: List[ShapeRange] = [shape_range] * opt_profile_replica
                 input_specs.append(
                     cls(tuple(shape), tensor.dtype, tensor.device, shape_ranges)
                 )
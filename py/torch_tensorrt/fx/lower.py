@@ -13,7 +13,7 @@ from torch.fx.passes.splitter_base import SplitResult
 from .fx2trt import TRTInterpreter, TRTInterpreterResult
 from .lower_setting import LowerSetting
 from .passes.lower_pass_manager_builder import LowerPassManagerBuilder
-from .passes.pass_utils import PassFunc, validate_inference
+from .passes.pass_utils import PassFunc, validate_inference, validation_context
 from .tools.timing_cache_utils import TimingCacheManager
 from .tools.trt_splitter import TRTSplitter, TRTSplitterSetting
 from .tracer.acc_tracer import acc_tracer
@@ -209,6 +209,7 @@ def default_lower_pass(
                 input_names=interp_res.input_names,
                 output_names=interp_res.output_names,
                 cuda_graph_batch_size=lower_setting.cuda_graph_batch_size,
+                num_execution_contexts=lower_setting.num_execution_contexts,
             )
             return trt_module
 
@@ -256,6 +257,7 @@ class Lowerer:
                         inputs,  # type: ignore[arg-type]
                         ast_rewriter_allow_list=lower_setting.ast_rewriter_allow_list,
                         leaf_module_list=lower_setting.leaf_module_list,
+                        use_fake_tensors=lower_setting.use_fake_tensors,
                     ),
                     split_func=split_func,
                     lower_func=default_lower_pass(interpreter_builder),
@@ -318,4 +320,9 @@ class Lowerer:
             lower_result = pm(module)
             return lower_result
 
-        return do_lower(module, inputs)
+        with validation_context(
+            batch_size=lower_setting.validation_batch_size,
+            max_outputs=lower_setting.validation_max_outputs,
+            report=lower_setting.report_validation_forwards,
+        ):
+            return do_lower(module, inputs)
@@ -28,6 +28,8 @@ class LowerSettingBasic:
     leaf_module_list (Optional[Set[nn.Module]]): Optional leaf module list where
     modules will not be traced into.
     verbose_profile (bool): verbosity of profiler, default to False.
+    use_fake_tensors (bool): run the shape prop of acc_tracer on fake tensors rather
+    than the sample inputs, except for ops which cannot run on fake tensors.
     """
 
     max_batch_size: int = 2048
@@ -37,6 +39,7 @@ class LowerSettingBasic:
     leaf_module_list: Optional[Set[Type[nn.Module]]] = None
     verbose_profile: bool = False
     is_aten: bool = False
+    use_fake_tensors: bool = False
 
 
 @dc.dataclass
@@ -66,13 +69,23 @@ class LowerSetting(LowerSettingBasic):
     cuda_graph_batch_size (int): Cuda graph batch size, default to be -1.
     preset_lowerer (str): when specified, use a preset logic to build the
     instance of Lowerer.
-    only used by explicit batch dim with dynamic shape mode. In general, we use 2 GPU setting with
-    2 stream on each. Set total number to 8 as a safe default value.
+    num_execution_contexts: number of execution contexts, i.e. streams, which run the engine
+    concurrently. The TRTModule creates at most this many execution contexts, which further streams
+    share. In explicit batch dim with dynamic shape mode, it also determines the number of
+    optimization profiles, which is 1 if TensorRT can share optimization profiles.
+    opt_profile_replica: number of optimization profile replicas, default to None, meaning
+    the number derived from num_execution_contexts.
     dynamic_batch: enable the dynamic shape in TRT with dim=-1 for the 1st dimension.
     tactic_sources: tactic sources for TensorRT kernel selection. Default to None,
     meaning all possible tactic sources.
     correctness_atol: absolute tolerance for correctness check
     correctness_rtol: relative tolerance for correctness check
+    validation_batch_size: if positive, run the correctness checks on the first
+    validation_batch_size samples of the inputs rather than on all of them.
+    validation_max_outputs: if positive, compare at most validation_max_outputs tensor
+    outputs in the correctness checks.
+    report_validation_forwards: log how many model runs of the correctness checks were
+    run, and how many were skipped by reusing reference outputs.
     use_experimental_rt: Uses the next generation TRTModule which supports both Python and TorchScript based execution (including in C++).
     """
 
@@ -95,9 +108,13 @@ class LowerSetting(LowerSettingBasic):
     save_timing_cache: bool = False
     cuda_graph_batch_size: int = -1
     preset_lowerer: str = ""
-    opt_profile_replica: int = 8
+    num_execution_contexts: int = 1
+    opt_profile_replica: Optional[int] = None
     dynamic_batch: bool = True
     tactic_sources: Optional[int] = None
     correctness_atol: float = 0.1
     correctness_rtol: float = 0.1
+    validation_batch_size: int = -1
+    validation_max_outputs: int = -1
+    report_validation_forwards: bool = False
     use_experimental_rt: bool = False
@@ -1,8 +1,9 @@
 import copy
+import functools
 import logging
 import operator
 import warnings
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 import torch
 import torch.fx
@@ -14,6 +15,7 @@ from ..observer import observable
 from ..tracer.acc_tracer import acc_ops
 from ..tracer.acc_tracer.acc_utils import get_attr
 from .pass_utils import log_before_after, validate_inference
+from .pattern_rewriter import PatternRewriter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,6 +75,36 @@ def run_const_fold(traced_mod: torch.fx.GraphModule) -> torch.fx.GraphModule:
     return const_split_mod
 
 
+def inline_const_folded_attrs(
+    folded_mod: torch.fx.GraphModule,
+) -> torch.fx.GraphModule:
+    """
+    Returns a GraphModule with the graph of a module after constant folding, which
+    reads each folded constant with its own get_attr node, as retracing it would.
+    The nodes of the graph are kept, along with their metadata.
+    """
+    for node in list(folded_mod.graph.nodes):
+        if (
+            node.op == "call_function"
+            and node.target == operator.getitem
+            and isinstance(node.args[0], torch.fx.Node)
+            and node.args[0].op == "get_attr"
+            and isinstance(
+                getattr(folded_mod, node.args[0].target, None), torch.nn.ParameterList
+            )
+        ):
+            with folded_mod.graph.inserting_before(node):
+                attr_node = folded_mod.graph.get_attr(
+                    f"{node.args[0].target}.{node.args[1]}"
+                )
+            attr_node.meta = node.meta
+            node.replace_all_uses_with(attr_node)
+            folded_mod.graph.erase_node(node)
+
+    folded_mod.graph.eliminate_dead_code()
+    return torch.fx.GraphModule(folded_mod, folded_mod.graph)
+
+
 def replace_op_with_indices(module: torch.fx.GraphModule) -> torch.fx.GraphModule:
     for n in module.graph.nodes:
         if n.op == "call_function" and n.target in (
@@ -211,6 +243,96 @@ def check_permute(node: torch.fx.Node):
     return permutation == allowed_permutation
 
 
+def _match_transposing_permutes(match, original_graph, pattern_graph) -> bool:
+    """Match filter accepting only permutes which transpose the last two dimensions"""
+    return all(
+        check_permute(gn)
+        for pn, gn in match.nodes_map.items()
+        if pn.op == "call_function" and pn.target == acc_ops.permute
+    )
+
+
+def _permute_pattern_graphs(
+    lhs_transposed: bool, rhs_transposed: bool, linear: bool
+) -> Tuple[torch.fx.Graph, torch.fx.Graph]:
+    """Builds the pattern and replacement graphs for a permute + linear/matmul fusion
+
+    The permutations are matched through placeholders, which are left unused by the
+    replacement graph
+    """
+    pattern = torch.fx.Graph()
+    replacement = torch.fx.Graph()
+    names = ("input", "weight", "bias") if linear else ("lhs", "rhs")
+    transposed = (lhs_transposed, rhs_transposed, False)
+
+    pattern_args = []
+    replacement_args = []
+    for name, is_transposed in zip(names, transposed):
+        pattern_arg = pattern.placeholder(name)
+        replacement_args.append(replacement.placeholder(name))
+        if is_transposed:
+            pattern_arg = pattern.call_function(
+                acc_ops.permute,
+                kwargs={
+                    "input": pattern_arg,
+                    "permutation": pattern.placeholder(f"{name}_permutation"),
+                },
+            )
+            replacement.placeholder(f"{name}_permutation")
+        pattern_args.append(pattern_arg)
+
+    if linear:
+        pattern.output(
+            pattern.call_function(acc_ops.linear, kwargs=dict(zip(names, pattern_args)))
+        )
+        replacement.output(
+            replacement.call_function(
+                trt_transposed_linear, args=tuple(replacement_args)
+            )
+        )
+    else:
+        pattern.output(
+            pattern.call_function(
+                acc_ops.matmul,
+                kwargs={"input": pattern_args[0], "other": pattern_args[1]},
+            )
+        )
+        replacement.output(
+            replacement.call_function(
+                trt_transposed_matmul,
+                args=(*replacement_args, lhs_transposed, rhs_transposed),
+            )
+        )
+
+    return pattern, replacement
+
+
+@functools.lru_cache(maxsize=None)
+def _permute_linear_rewriter() -> PatternRewriter:
+    rewriter = PatternRewriter()
+    rewriter.register(
+        *_permute_pattern_graphs(True, False, linear=True),
+        match_filters=[_match_transposing_permutes],
+        allow_external_users=True,
+        name="permute_linear",
+    )
+    return rewriter
+
+
+@functools.lru_cache(maxsize=None)
+def _permute_matmul_rewriter() -> PatternRewriter:
+    rewriter = PatternRewriter()
+    # Patterns permuting both operands take precedence over single-operand patterns
+    for lhs_transposed, rhs_transposed in ((True, True), (True, False), (False, True)):
+        rewriter.register(
+            *_permute_pattern_graphs(lhs_transposed, rhs_transposed, linear=False),
+            match_filters=[_match_transposing_permutes],
+            allow_external_users=True,
+            name=f"permute_matmul_{int(lhs_transposed)}{int(rhs_transposed)}",
+        )
+    return rewriter
+
+
 @observable()
 @log_before_after
 @validate_inference(atol=1e-3, rtol=1e-2)
@@ -218,18 +340,7 @@ def fuse_permute_linear(gm: torch.fx.GraphModule, input: Input):
     """
     Fuse pattern like permute + linear if permute is transposing the last two dimension.
     """
-    for node in gm.graph.nodes:
-        if node.target == acc_ops.linear:
-            inp = node.kwargs["input"]
-            if inp.target == acc_ops.permute and check_permute(inp):
-                inp = inp.kwargs["input"]
-                weight = node.kwargs["weight"]
-                bias = node.kwargs["bias"]
-                with gm.graph.inserting_before(node):
-                    fused_node = gm.graph.call_function(
-                        trt_transposed_linear, args=(inp, weight, bias)
-                    )
-                    node.replace_all_uses_with(fused_node)
+    _permute_linear_rewriter()(gm)
 
     gm.graph.eliminate_dead_code()
     gm.graph.lint()
@@ -244,27 +355,7 @@ def fuse_permute_matmul(gm: torch.fx.GraphModule, input: Input):
     """
     Fuse pattern like permute + matmul if permute is transposing the last two dimension.
     """
-    for node in gm.graph.nodes:
-        if node.target == acc_ops.matmul:
-            lhs, rhs = node.kwargs["input"], node.kwargs["other"]
-            lhs_transposed = rhs_tranposed = False
-            skip = False
-
-            if lhs.target == acc_ops.permute and check_permute(lhs):
-                lhs_transposed = True
-                lhs = lhs.kwargs["input"]
-
-            if rhs.target == acc_ops.permute and check_permute(rhs):
-                rhs_tranposed = True
-                rhs = rhs.kwargs["input"]
-
-            if (not skip) and (lhs_transposed or rhs_tranposed):
-                with gm.graph.inserting_before(node):
-                    fused_node = gm.graph.call_function(
-                        trt_transposed_matmul,
-                        args=(lhs, rhs, lhs_transposed, rhs_tranposed),
-                    )
-                node.replace_all_uses_with(fused_node)
+    _permute_matmul_rewriter()(gm)
 
     gm.graph.eliminate_dead_code()
     gm.graph.lint()
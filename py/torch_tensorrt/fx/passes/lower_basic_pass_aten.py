@@ -1,12 +1,15 @@
+import functools
 import logging
 import operator
-from typing import Any
+from typing import Any, Callable, Tuple
 
 import torch
 import torch.fx
 from torch.fx.experimental.const_fold import split_const_subgraphs
 from torch.fx.passes.infra.pass_base import PassResult
 
+from .pattern_rewriter import PatternRewriter
+
 _LOGGER = logging.getLogger(__name__)
 
 # Create an alias for module input type to avoid littering pyre-ignore for Any
@@ -403,52 +406,98 @@ def aten_compose_bmm_3d(flat_args_1, flat_args_2):
     return view_2
 
 
+def _compose_bmm_pattern_graphs(
+    compose_fn: Callable[..., Any], output_target: Callable[..., Any]
+) -> Tuple[torch.fx.Graph, torch.fx.Graph]:
+    """Builds the pattern and replacement graphs of a decomposed bmm (matmul)
+
+    The output of the bmm is reshaped by output_target, which is either a view or,
+    for bmms decomposed from matmul, an _unsafe_view
+    """
+    pattern = torch.fx.Graph()
+    input_n = pattern.placeholder("input")
+    other_n = pattern.placeholder("other")
+    sizes = [
+        pattern.placeholder(name)
+        for name in (
+            "input_expand_size",
+            "input_view_size",
+            "other_expand_size",
+            "other_view_size",
+            "output_view_size",
+        )
+    ]
+    input_view = pattern.call_function(
+        torch.ops.aten.view.default,
+        args=(
+            pattern.call_function(
+                torch.ops.aten.expand.default, args=(input_n, sizes[0])
+            ),
+            sizes[1],
+        ),
+    )
+    other_view = pattern.call_function(
+        torch.ops.aten.view.default,
+        args=(
+            pattern.call_function(
+                torch.ops.aten.expand.default, args=(other_n, sizes[2])
+            ),
+            sizes[3],
+        ),
+    )
+    bmm = pattern.call_function(
+        torch.ops.aten.bmm.default, args=(input_view, other_view)
+    )
+    pattern.output(pattern.call_function(output_target, args=(bmm, sizes[4])))
+
+    replacement = torch.fx.Graph()
+    input_r = replacement.placeholder("input")
+    other_r = replacement.placeholder("other")
+    for _ in sizes:
+        replacement.placeholder("size")
+    replacement.output(replacement.call_function(compose_fn, args=(input_r, other_r)))
+
+    return pattern, replacement
+
+
+def _match_other_rank(rank: int) -> Callable[..., bool]:
+    """Match filter accepting decomposed bmms whose second operand has the given rank"""
+
+    def match_filter(match, original_graph, pattern_graph) -> bool:
+        other = match.placeholder_nodes[1]
+        return (
+            isinstance(other, torch.fx.Node)
+            and "val" in other.meta
+            and len(other.meta["val"].size()) == rank
+        )
+
+    return match_filter
+
+
+@functools.lru_cache(maxsize=None)
+def _compose_bmm_rewriter() -> PatternRewriter:
+    rewriter = PatternRewriter()
+    for output_target in (
+        torch.ops.aten.view.default,
+        torch.ops.aten._unsafe_view.default,
+    ):
+        for rank, compose_fn in ((2, aten_compose_bmm_2d), (3, aten_compose_bmm_3d)):
+            rewriter.register(
+                *_compose_bmm_pattern_graphs(compose_fn, output_target),
+                match_filters=[_match_other_rank(rank)],
+                allow_external_users=True,
+                name=compose_fn.__name__,
+            )
+    return rewriter
+
+
 def compose_bmm(
     module: torch.fx.GraphModule,
 ) -> torch.fx.GraphModule:
     """
     combine decomposed bmm (matmul)
     """
-    modified = False
-    for n in module.graph.nodes:
-        if n.op == "call_function" and n.target in (torch.ops.aten.bmm.default,):
-            modified = True
-            node = n
-            input_n = node.all_input_nodes[0]
-            other_n = node.all_input_nodes[1]
-            output = next(iter(node.users))
-            input_input_n = input_n.all_input_nodes[0]
-            if (
-                input_input_n.target != torch.ops.aten.expand.default
-                and input_n.target != torch.ops.aten.view.default
-            ):
-                raise RuntimeError(
-                    "Bmm is addressed in fixed pattern. A new pattern is met!"
-                )
-            real_input = input_input_n.all_input_nodes[0]
-            input_other_n = other_n.all_input_nodes[0]
-            if (
-                input_other_n.target != torch.ops.aten.expand.default
-                and other_n.target != torch.ops.aten.view.default
-            ):
-                raise RuntimeError(
-                    "Bmm is addressed in fixed pattern. A new pattern is met!"
-                )
-            real_other = input_other_n.all_input_nodes[0]
-            if len(real_other.meta["val"].size()) == 2:
-                new_func = aten_compose_bmm_2d
-            if len(real_other.meta["val"].size()) == 3:
-                new_func = aten_compose_bmm_3d
-
-            with module.graph.inserting_after(node):
-                new_args = (real_input, real_other)
-                new_node = module.graph.create_node(
-                    "call_function",
-                    new_func,
-                    args=new_args,
-                    kwargs=None,
-                )
-            output.replace_all_uses_with(new_node)
+    modified = bool(_compose_bmm_rewriter()(module))
 
     module.graph.eliminate_dead_code()
     module.recompile()
@@ -464,61 +513,62 @@ def aten_compose_chunk(flat_args_1, chunk, dim):
     return split
 
 
+def _compose_chunk_pattern_graphs(
+    sym_size_target: Callable[..., Any]
+) -> Tuple[torch.fx.Graph, torch.fx.Graph]:
+    """Builds the pattern and replacement graphs of a decomposed chunk
+
+    The constant subtracted from the rounded-up size and the dimension passed to split
+    are matched through placeholders, which are left unused by the replacement graph
+    """
+    pattern = torch.fx.Graph()
+    input_n = pattern.placeholder("input")
+    chunk = pattern.placeholder("chunk")
+    dim = pattern.placeholder("dim")
+    sub_const = pattern.placeholder("sub_const")
+    split_dim = pattern.placeholder("split_dim")
+    sym_size = pattern.call_function(sym_size_target, args=(input_n, dim))
+    add = pattern.call_function(operator.add, args=(sym_size, chunk))
+    sub = pattern.call_function(operator.sub, args=(add, sub_const))
+    floordiv = pattern.call_function(operator.floordiv, args=(sub, chunk))
+    pattern.output(
+        pattern.call_function(
+            torch.ops.aten.split.Tensor, args=(input_n, floordiv, split_dim)
+        )
+    )
+
+    replacement = torch.fx.Graph()
+    input_r = replacement.placeholder("input")
+    chunk_r = replacement.placeholder("chunk")
+    dim_r = replacement.placeholder("dim")
+    replacement.placeholder("sub_const")
+    replacement.placeholder("split_dim")
+    replacement.output(
+        replacement.call_function(aten_compose_chunk, args=(input_r, chunk_r, dim_r))
+    )
+
+    return pattern, replacement
+
+
+@functools.lru_cache(maxsize=None)
+def _compose_chunk_rewriter() -> PatternRewriter:
+    rewriter = PatternRewriter()
+    for sym_size_target in (torch.ops.aten.sym_size, torch.ops.aten.sym_size.int):
+        rewriter.register(
+            *_compose_chunk_pattern_graphs(sym_size_target),
+            allow_external_users=True,
+            name="aten_compose_chunk",
+        )
+    return rewriter
+
+
 def compose_chunk(
     module: torch.fx.GraphModule,
 ) -> torch.fx.GraphModule:
     """
     combine decomposed chunk
     """
-
-    def match_pattern(module, node):
-        if node.op == "call_function" and node.target in (torch.ops.aten.split.Tensor,):
-            div = node.args[1]
-            input = node.args[0]
-            if isinstance(div, int):
-                return (False,)
-            if div.target != operator.floordiv:
-                return (False,)
-            else:
-                div_const = div.args[1]
-                sub = div.args[0]
-                if sub.target != operator.sub:
-                    return (False,)
-                else:
-                    add = sub.args[0]
-                    if add.target != operator.add:
-                        return (False,)
-                    else:
-                        add_const = add.args[1]
-                        if add_const != div_const:
-                            return (False,)
-                        symsize = add.args[0]
-                        if symsize.target != torch.ops.aten.sym_size:
-                            return (False,)
-                        else:
-                            symsize_input = symsize.args[0]
-                            dim = symsize.args[1]
-                            if symsize_input != input:
-                                return (False,)
-
-            return (True, div_const, dim)
-        else:
-            return (False,)
-
-    modified = False
-    for node in module.graph.nodes:
-        res = match_pattern(module, node)
-        if res[0]:
-            modified = True
-            with module.graph.inserting_after(node):
-                new_args = (node.args[0], res[1], res[2])
-                new_node = module.graph.create_node(
-                    "call_function",
-                    aten_compose_chunk,
-                    args=new_args,
-                    kwargs=None,
-                )
-            node.replace_all_uses_with(new_node)
+    modified = bool(_compose_chunk_rewriter()(module))
 
     module.graph.eliminate_dead_code()
     module.recompile()
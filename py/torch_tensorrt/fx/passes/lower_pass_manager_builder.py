@@ -8,7 +8,10 @@ from torch import nn
 from torch.fx.passes.pass_manager import PassManager, inplace_wrapper
 from torch.fx.passes.shape_prop import ShapeProp
 from torch.fx.passes.splitter_base import SplitResult, generate_inputs_for_submodules
-from torch_tensorrt.fx.passes.pass_utils import apply_bfloat_float_conversion
+from torch_tensorrt.fx.passes.pass_utils import (
+    IncrementalShapeProp,
+    apply_bfloat_float_conversion,
+)
 from torch_tensorrt.fx.utils import LowerPrecision
 
 from ..input_tensor_spec import generate_input_specs
@@ -19,6 +22,7 @@ from .graph_opts import common_subexpression_elimination
 from .lower_basic_pass import (  # noqa
     fix_clamp_numerical_limits_to_fp16,
     fix_reshape_batch_dim,
+    inline_const_folded_attrs,
     replace_mutable_op,
     replace_op_with_indices,
     run_const_fold,
@@ -58,11 +62,16 @@ LOWER_SPLIT_POST_OBSERVER: Observer[Callable[[str, nn.Module, Input], None]] = O
 # ----------------------------------------------------------------------
 
 
-def wrapper(fn: Callable, input) -> Callable:
+def wrapper(
+    fn: Callable, input, shape_prop: Optional[IncrementalShapeProp] = None
+) -> Callable:
     @wraps(fn)
     def wrapped_fn(gm):
         if isinstance(gm, torch.fx.GraphModule):
-            ShapeProp(gm).propagate(*input)
+            if shape_prop is not None:
+                shape_prop.propagate(gm)
+            else:
+                ShapeProp(gm).propagate(*input)
         return fn(gm, input)
 
     return wrapped_fn
@@ -74,7 +83,8 @@ class LowerPassManagerBuilder:
 
      Attributes:
         lower_setting: Setting that will be used during process of lowering, see lower_setting.py for the details.
-        _trace_func: fx trace function for TRT conversion.
+        _trace_func: fx trace function for TRT conversion. The module is traced once per
+            pipeline, and the traced graph is carried through the following passes.
         _split_func: the fx2trt split function.
         _lower_func: function to create and run `TRTInterpreter` to convert `fx.GraphModule`
             into a TensorRT engine.
@@ -92,22 +102,42 @@ class LowerPassManagerBuilder:
         self._trace_func = trace_func
         self._split_func = split_func
         self._lower_func = lower_func
+        self._traced_module: Optional[nn.Module] = None
+
+    def _trace(self, module: nn.Module) -> nn.Module:
+        """Traces the module, unless it is the output of an earlier trace in the pipeline"""
+        if module is not self._traced_module:
+            self._traced_module = self._trace_func(module, self._input)
+        return self._traced_module
+
+    def _inline_const_folded_attrs(self, module: nn.Module) -> nn.Module:
+        self._traced_module = inline_const_folded_attrs(module)
+        return self._traced_module
+
+    def _wrap(self, fn: Callable) -> Callable:
+        return wrapper(fn, self._input, self._shape_prop)
+
+    def _release_shape_prop(self, module: nn.Module) -> nn.Module:
+        # The values kept for shape propagation are not needed to build the engines
+        self._shape_prop.clear()
+        return module
 
     def _const_fold_pass(self) -> PassManager:
         passes = [
-            wrapper(self._trace_func, self._input),
+            self._trace,
             run_const_fold,
+            self._inline_const_folded_attrs,
         ]
         return PassManager.build_from_passlist(passes)
 
     def graph_optimization_pass(self) -> PassManager:
         passes = [
-            wrapper(self._trace_func, self._input),
+            self._trace,
         ]
         for p in self.lower_setting.customized_fuse_pass.passes:
-            passes.append(wrapper(p, self._input))
+            passes.append(self._wrap(p))
         for p in self.lower_setting.lower_basic_fuse_pass.passes:
-            passes.append(wrapper(p, self._input))
+            passes.append(self._wrap(p))
         if (
             hasattr(self.lower_setting, "lower_precision")
             and self.lower_setting.lower_precision is LowerPrecision.FP16
@@ -115,13 +145,14 @@ class LowerPassManagerBuilder:
             hasattr(self.lower_setting, "precision")
             and self.lower_setting.precision is LowerPrecision.FP16
         ):
-            passes.append(wrapper(fix_clamp_numerical_limits_to_fp16, self._input))
+            passes.append(self._wrap(fix_clamp_numerical_limits_to_fp16))
 
         passes.append(inplace_wrapper(common_subexpression_elimination))
         passes.append(
             inplace_wrapper(lambda m: FUSE_PASSES_POST_OBSERVER.observe(m, self._input))
         )
         passes.append(fix_reshape_batch_dim)
+        passes.append(self._release_shape_prop)
 
         return PassManager.build_from_passlist(passes)
 
@@ -129,9 +160,9 @@ class LowerPassManagerBuilder:
         passes = []
 
         for p in self.lower_setting.customized_fuse_pass.passes:
-            passes.append(wrapper(p, self._input))
+            passes.append(self._wrap(p))
         for p in self.lower_setting.lower_basic_fuse_pass.passes:
-            passes.append(wrapper(p, self._input))
+            passes.append(self._wrap(p))
         # TODO fix this pass for aten graph
         # if (
         #     hasattr(self.lower_setting, "lower_precision")
@@ -147,6 +178,7 @@ class LowerPassManagerBuilder:
         )
         # TODO we most likely do not need it for aten
         # passes.append(fix_reshape_batch_dim)
+        passes.append(self._release_shape_prop)
 
         return PassManager.build_from_passlist(passes)
 
@@ -268,6 +300,8 @@ class LowerPassManagerBuilder:
     ) -> PassManager:
         self._input = input
         self._additional_input = additional_input
+        self._traced_module = None
+        self._shape_prop = IncrementalShapeProp(input)
         passes = []
 
         passes.append(self._default_replace_mutable_op_pass())
@@ -284,10 +318,10 @@ class LowerPassManagerBuilder:
     ) -> PassManager:
         self._input = input
         self._additional_input = additional_input
+        self._traced_module = None
+        self._shape_prop = IncrementalShapeProp(input)
         passes = []
-        passes.append(
-            wrapper(self._trace_func, self._input),
-        )
+        passes.append(self._trace)
         passes.append(self.graph_optimization_pass_aten())
         passes.append(self._split_pass())
         passes.append(self._trt_lower_pass())
@@ -300,6 +334,8 @@ class LowerPassManagerBuilder:
     ) -> PassManager:
         self._input = input
         self._additional_input = additional_input
+        self._traced_module = None
+        self._shape_prop = IncrementalShapeProp(input)
         passes = []
 
         passes.append(self._default_replace_mutable_op_pass())
@@ -1,18 +1,26 @@
 import contextlib
 import io
+import itertools
 import json
 import logging
+import math
 import tempfile
+from collections import OrderedDict
 from datetime import datetime
 from functools import wraps
 from traceback import TracebackException
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import torch
 import torch_tensorrt.fx.diagnostics as diagnostics
 from torch import fx
+from torch._subclasses.fake_tensor import FakeTensor, FakeTensorMode
 from torch.fx.node import Node
-from torch.fx.passes.shape_prop import ShapeProp
+from torch.fx.passes.shape_prop import (
+    ShapeProp,
+    TensorMetadata,
+    _extract_tensor_metadata,
+)
 
 # Create an alias for module input type to avoid littering pyre-ignore for Any
 # throughout the file.
@@ -30,6 +38,11 @@ ALTERNATIVE_BATCH_SIZE_OVERRIDE: Optional[int] = None
 # If exception during validate_variable_batch_sizes should be thrown
 ALTERNATIVE_BATCH_SIZE_EXCEPTION_SHOULD_THROW: bool = False
 
+# The ValidationContext used by the validation decorators, set via validation_context
+VALIDATION_CONTEXT: Optional["ValidationContext"] = None
+# Number of module outputs which a ValidationContext keeps for reuse
+VALIDATION_CACHE_SIZE: int = 4
+
 
 class RelaxAccuracyCheckMode:
     """
@@ -133,15 +146,323 @@ def override_alternative_batch_size_exception_should_throw(
         ALTERNATIVE_BATCH_SIZE_EXCEPTION_SHOULD_THROW = old_value
 
 
+class ValidationContext:
+    """
+    Runs the modules validated by validate_inference and validate_variable_batch_sizes,
+    caching their outputs so that each reference output is computed once per set of
+    inputs. In particular, the output of the module after a pass is the reference
+    output of the module before the next pass, so it is not computed again.
+
+    Outputs are only reused for GraphModules, whose forward is determined by their
+    generated code, submodules and tensors, and are invalidated when any of these
+    change. Leaf submodules are assumed not to hold state other than tensors.
+    """
+
+    def __init__(self, batch_size: int = -1, max_outputs: int = -1):
+        """
+        Arguments:
+        batch_size: if positive, validate with the first batch_size samples of the
+        inputs rather than all of them. Only applies when the inputs are tensors of
+        the same, larger batch size.
+        max_outputs: if positive, compare at most max_outputs evenly spaced tensor
+        outputs of the modules.
+        """
+        self.batch_size = batch_size
+        self.max_outputs = max_outputs
+        self.num_forwards = 0
+        self.num_skipped_forwards = 0
+        self._outputs: "OrderedDict[Any, Tuple[Any, Any]]" = OrderedDict()
+        self._sliced_inputs: Dict[Tuple[int, int], Tuple[Input, Input]] = {}
+
+    def sample_input(self, input: Input) -> Input:
+        """
+        Returns the inputs to validate with, which are the first batch_size samples
+        of input if the batch size is reduced. The same inputs are returned for the
+        same input, so that outputs computed for them can be reused
+        """
+        if self.batch_size <= 0 or not isinstance(input, (list, tuple)):
+            return input
+        if not all(isinstance(x, torch.Tensor) and len(x.shape) > 0 for x in input):
+            return input
+        if {x.shape[0] for x in input} != {input[0].shape[0]} or (
+            input[0].shape[0] <= self.batch_size
+        ):
+            return input
+
+        return self.slice_input(input, self.batch_size)
+
+    def slice_input(self, input: Input, batch_size: int) -> Input:
+        """
+        Returns the first batch_size samples of each tensor in input. The same
+        inputs are returned for the same input and batch size, so that outputs
+        computed for them can be reused
+        """
+        key = (id(input), batch_size)
+        if key not in self._sliced_inputs:
+            # Keep a reference to the input, so that its id is not reused
+            self._sliced_inputs[key] = (
+                input,
+                [x[:batch_size, ...] for x in input],
+            )
+        return self._sliced_inputs[key][1]
+
+    def sample_outputs(self, num_outputs: int) -> range:
+        """Returns the indices of the tensor outputs to compare"""
+        if self.max_outputs <= 0 or num_outputs <= self.max_outputs:
+            return range(num_outputs)
+        return range(0, num_outputs, math.ceil(num_outputs / self.max_outputs))
+
+    def run(self, module: torch.nn.Module, input: Input) -> Any:
+        """Returns the output of module on input, reusing it if it was computed"""
+        key = self._get_key(module, input)
+        if key is not None and key in self._outputs:
+            self._outputs.move_to_end(key)
+            self.num_skipped_forwards += 1
+            return self._outputs[key][1]
+
+        output = module(*input)
+        self.num_forwards += 1
+
+        if key is not None:
+            # Keep references to the module and input, so that their ids are not reused
+            self._outputs[key] = ((module, input), output)
+            if len(self._outputs) > VALIDATION_CACHE_SIZE:
+                self._outputs.popitem(last=False)
+        return output
+
+    def _get_key(self, module: torch.nn.Module, input: Input) -> Any:
+        if not isinstance(module, fx.GraphModule) or not isinstance(
+            input, (list, tuple)
+        ):
+            return None
+
+        return (
+            tuple(
+                (id(x), x._version) if isinstance(x, torch.Tensor) else id(x)
+                for x in input
+            ),
+            tuple(
+                (id(m), m.code if isinstance(m, fx.GraphModule) else None)
+                for m in module.modules()
+            ),
+            tuple(
+                (id(t), t._version)
+                for t in itertools.chain(module.parameters(), module.buffers())
+            ),
+        )
+
+
+@contextlib.contextmanager
+def validation_context(
+    batch_size: int = -1, max_outputs: int = -1, report: bool = False
+):
+    """
+    A context manager within which the validation decorators share a
+    ValidationContext, which reuses reference outputs across passes
+
+    Arguments:
+    batch_size: if positive, validate with the first batch_size samples of the inputs.
+    max_outputs: if positive, compare at most max_outputs tensor outputs.
+    report: log how many validation forwards were run and skipped on exit.
+
+    Example:
+
+    >>> with validation_context(batch_size=1, report=True):
+    >>>     lowerer(module, inputs)
+    """
+    global VALIDATION_CONTEXT
+    old_context = VALIDATION_CONTEXT
+    context = ValidationContext(batch_size, max_outputs)
+    VALIDATION_CONTEXT = context
+    try:
+        yield context
+    finally:
+        VALIDATION_CONTEXT = old_context
+        if report:
+            _LOGGER.info(
+                f"Validation ran {context.num_forwards} module forwards and skipped "
+                f"{context.num_skipped_forwards} by reusing reference outputs"
+            )
+
+
+class IncrementalShapeProp:
+    """
+    Propagates shapes through a graph module as it is rewritten by a sequence of passes.
+    What each node is computed from is kept between propagations, so a propagation only
+    runs the nodes which were added or modified since the previous one, and the nodes
+    depending on them. These are run on fake tensors, and the inputs they take from
+    unchanged nodes are fake tensors rebuilt from the recorded shapes and types, so no
+    values are kept between propagations. If the changed nodes can't be run on fake
+    tensors, the module is run on the sample inputs instead.
+
+    Args:
+        sample_inputs: Sample inputs with which to run shape prop.
+    """
+
+    def __init__(self, sample_inputs: Input):
+        self.sample_inputs = sample_inputs
+        self.signatures: Dict[Node, Any] = {}
+        # Number of nodes run by the last propagation
+        self.num_run_nodes = 0
+
+    def propagate(self, module: fx.GraphModule) -> None:
+        """
+        Records the shape and type of each node of the module
+        """
+        shape_prop = _CachedShapeProp(module, self.signatures, self.sample_inputs)
+        if shape_prop.changed_nodes:
+            try:
+                shape_prop.run(*self.sample_inputs)
+                self.num_run_nodes = len(shape_prop.run_nodes)
+            except Exception as e:
+                _LOGGER.debug(
+                    f"Can't propagate shapes with fake tensors ({e}), running all nodes"
+                )
+                ShapeProp(module).propagate(*self.sample_inputs)
+                self.num_run_nodes = len(module.graph.nodes)
+        else:
+            self.num_run_nodes = 0
+
+        # Only keep the signatures of the current nodes, so erased nodes are released
+        self.signatures = shape_prop.new_signatures
+        _LOGGER.debug(
+            f"Propagated shapes through {self.num_run_nodes} of "
+            f"{len(module.graph.nodes)} nodes"
+        )
+
+    def clear(self) -> None:
+        """Forgets the signatures of the nodes, so the next propagation runs every node"""
+        self.signatures = {}
+
+
+class _CachedShapeProp(fx.Interpreter):
+    """
+    ShapeProp which only runs the nodes which changed since the signatures were
+    recorded and the nodes depending on them, on fake tensors. The values of the
+    other nodes they use are rebuilt from their recorded shapes and types
+    """
+
+    def __init__(
+        self,
+        module: fx.GraphModule,
+        signatures: Dict[Node, Any],
+        sample_inputs: Input,
+    ):
+        super().__init__(module)
+        self.new_signatures = {n: self._signature(n) for n in module.graph.nodes}
+        self.fake_mode = FakeTensorMode(allow_non_fake_inputs=True)
+        self.device = next(
+            (t.device for t in sample_inputs if isinstance(t, torch.Tensor)),
+            torch.device("cpu"),
+        )
+
+        # Nodes whose shapes are recomputed, because they or their inputs changed
+        self.changed_nodes: Set[Node] = set()
+        for n in module.graph.nodes:
+            if (
+                "type" not in n.meta
+                or signatures.get(n) != self.new_signatures[n]
+                or any(i in self.changed_nodes for i in n.all_input_nodes)
+            ):
+                self.changed_nodes.add(n)
+
+        # Unchanged nodes whose values can't be rebuilt from their shapes and types
+        # are run as well, when a node which is run takes them as input
+        self.required_nodes = set(self.changed_nodes)
+        for n in reversed(module.graph.nodes):
+            if n in self.required_nodes:
+                self.required_nodes.update(
+                    i for i in n.all_input_nodes if not self._is_rebuildable(i)
+                )
+
+        # Nodes which were run, besides fetching placeholders and attributes
+        self.run_nodes: Set[Node] = set()
+
+    def run_node(self, n: Node) -> Any:
+        if n not in self.required_nodes:
+            # Placeholders are always run, to consume their sample input
+            if n.op in ("placeholder", "get_attr"):
+                return super().run_node(n)
+            if not any(u in self.required_nodes for u in n.users):
+                return None
+            tensor_meta = n.meta["tensor_meta"]
+            with self.fake_mode:
+                return torch.empty_strided(
+                    tensor_meta.shape,
+                    tensor_meta.stride,
+                    dtype=tensor_meta.dtype,
+                    device=self.device,
+                    requires_grad=tensor_meta.requires_grad,
+                )
+
+        self.run_nodes.add(n)
+        with self.fake_mode:
+            result = super().run_node(n)
+
+        # Record the shape and type of the value as ShapeProp does, with the type the
+        # value has when run on real tensors
+        found_tensor = False
+
+        def extract_tensor_meta(obj: Any) -> Any:
+            nonlocal found_tensor
+            if isinstance(obj, torch.Tensor):
+                found_tensor = True
+                return _extract_tensor_metadata(obj)
+            return obj
+
+        tensor_meta = fx.node.map_aggregate(result, extract_tensor_meta)
+        if found_tensor:
+            n.meta["tensor_meta"] = tensor_meta
+        n.meta["type"] = (
+            torch.Tensor if isinstance(result, FakeTensor) else type(result)
+        )
+        return result
+
+    def _is_rebuildable(self, n: Node) -> bool:
+        """Returns whether the value of a node can be rebuilt from its metadata"""
+        return n.op in ("placeholder", "get_attr") or (
+            isinstance(n.meta.get("tensor_meta"), TensorMetadata)
+            and not n.meta["tensor_meta"].is_quantized
+        )
+
+    def _signature(self, n: Node) -> Any:
+        """
+        Returns what the value of a node is computed from, besides its input nodes.
+        Tensors are identified by their object and version, which in-place updates bump
+        """
+
+        def freeze(x: Any) -> Any:
+            if isinstance(x, torch.Tensor):
+                return (id(x), x._version)
+            return x
+
+        signature = (n.op, n.target, fx.node.map_aggregate((n.args, n.kwargs), freeze))
+        if n.op == "get_attr":
+            return signature + (freeze(self.fetch_attr(n.target)),)
+        if n.op == "call_module":
+            submodule = self.fetch_attr(n.target)
+            return signature + (
+                id(submodule),
+                tuple(
+                    freeze(t)
+                    for t in itertools.chain(
+                        submodule.parameters(), submodule.buffers()
+                    )
+                ),
+            )
+        return signature
+
+
 def chain_passes(*passes: PassFunc) -> PassFunc:
     """
     Chains a sequence of pass functions to form a single pass function
     """
 
     def parent_pass(module: fx.GraphModule, input: Input) -> fx.GraphModule:
+        shape_prop = IncrementalShapeProp(input)
         for pass_ in passes:
             if isinstance(module, torch.fx.GraphModule):
-                ShapeProp(module).propagate(*input)
+                shape_prop.propagate(module)
             module = pass_(module, input)
         return module
 
@@ -181,15 +502,18 @@ def validate_inference(
             *args,
             **kwargs,
         ) -> fx.GraphModule:
-            res0 = module(*input)
+            context = VALIDATION_CONTEXT or ValidationContext()
+            validation_input = context.sample_input(input)
+            res0 = context.run(module, validation_input)
             processed_module = pass_(module, input, *args, **kwargs)
-            res1 = processed_module(*input)
+            res1 = context.run(processed_module, validation_input)
 
             tensor_res_0 = _collect_tensors(res0)
             tensor_res_1 = _collect_tensors(res1)
             relax_accuracy_check_failure = RELAX_ACCURACY_FAILURE
 
-            for kk, (x, y) in enumerate(zip(tensor_res_0, tensor_res_1)):
+            for kk in context.sample_outputs(min(len(tensor_res_0), len(tensor_res_1))):
+                x, y = tensor_res_0[kk], tensor_res_1[kk]
                 kwargs2 = {"equal_nan": True}
                 if rtol:
                     kwargs2["rtol"] = rtol
@@ -299,7 +623,8 @@ def validate_variable_batch_sizes(run_alternative_batch_size: int = -1) -> "Deco
                 _run_alternative_batch_size <= batch_size
             ), f"{_run_alternative_batch_size=} must be smaller or equal to {batch_size=}"
 
-            input_alt_bs = [x[:_run_alternative_batch_size, ...] for x in input]
+            context = VALIDATION_CONTEXT or ValidationContext()
+            input_alt_bs = context.slice_input(input, _run_alternative_batch_size)
 
             def run_module(mod, stage: str):
                 """Run module with full bs and alternative bs"""
@@ -307,8 +632,8 @@ def validate_variable_batch_sizes(run_alternative_batch_size: int = -1) -> "Deco
                     f"Running {stage} model at alternative batch size: {_run_alternative_batch_size}"
                 )
                 try:
-                    mod(*input)
-                    mod(*input_alt_bs)
+                    context.run(mod, input)
+                    context.run(mod, input_alt_bs)
                 except Exception as e:
                     _LOGGER.warning(
                         f"Failed running {stage} module at full or alternative batch size: {e}"
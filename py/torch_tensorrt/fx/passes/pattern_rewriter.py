@@ -0,0 +1,422 @@
+import copy
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import torch
+from torch.fx.graph import Graph
+from torch.fx.graph_module import GraphModule
+from torch.fx.node import Node, Target
+from torch.fx.passes.utils.matcher_utils import InternalMatch
+from torch.fx.subgraph_rewriter import ReplacedPatterns
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+MatchFilter = Callable[[InternalMatch, Graph, Graph], bool]
+PatternSpec = Union[Callable[..., Any], Graph, GraphModule]
+
+# Path from a pattern anchor to one of its producers, as a sequence of
+# argument indices (see `_flat_args`) and indices into list arguments
+ArgPath = Tuple[int, ...]
+
+
+def _to_graph(spec: PatternSpec) -> Graph:
+    if isinstance(spec, GraphModule):
+        return spec.graph
+    elif isinstance(spec, Graph):
+        return spec
+    return torch.fx.symbolic_trace(spec).graph
+
+
+def _flat_args(node: Node) -> List[Any]:
+    """Returns the arguments of a node as a single flat list
+
+    Arguments of OpOverloads are normalized against the operator schema, so that
+    positional arguments, keyword arguments and defaults compare equal. Keyword
+    arguments of other targets are ordered by name
+    """
+    if node.op == "call_function" and isinstance(node.target, torch._ops.OpOverload):
+        flat_args = []
+        for i, schema in enumerate(node.target._schema.arguments):
+            if schema.name in node.kwargs:
+                flat_args.append(node.kwargs[schema.name])
+            elif not schema.kwarg_only and i < len(node.args):
+                flat_args.append(node.args[i])
+            else:
+                flat_args.append(schema.default_value)
+        return flat_args
+
+    return list(node.args) + [node.kwargs[key] for key in sorted(node.kwargs)]
+
+
+def _is_computation(node: Node) -> bool:
+    return node.op in ("call_function", "call_method", "call_module")
+
+
+@dataclass
+class _CompiledPattern:
+    """A pattern and its replacement, traced once upon registration"""
+
+    name: str
+    pattern_graph: Graph
+    replacement_graph: Graph
+    anchor: Node
+    placeholders: List[Node]
+    returning_nodes: List[Node]
+    match_filters: Sequence[MatchFilter]
+    ignore_literals: bool
+    allow_external_users: bool
+
+
+@dataclass
+class _TrieNode:
+    """Node of the op-target trie
+
+    Edges are keyed by the path of a producer relative to the anchor and the
+    producer's op target. Patterns are stored at the node where their key ends
+    """
+
+    children: Dict[ArgPath, Dict[Tuple[str, Target], "_TrieNode"]] = field(
+        default_factory=dict
+    )
+    patterns: List[int] = field(default_factory=list)
+
+
+class PatternRewriter:
+    """Rewrites several subgraph patterns in a single traversal of a graph
+
+    Patterns and replacements are traced once, when registered. Every pattern
+    is keyed in an op-target trie by its anchor (the single returned node) and
+    the op targets of its producers, in depth-first order. Each node of the
+    rewritten graph is then checked only against the patterns whose producer
+    targets agree with its own, before the full structural match is attempted.
+
+    Matching follows the semantics of ``torch.fx.subgraph_rewriter``: placeholders
+    are wildcards, intermediate nodes of a match may not be used outside of it,
+    overlapping matches are discarded, and match filters receive the
+    ``InternalMatch`` along with the original and pattern graphs.
+    """
+
+    def __init__(self) -> None:
+        self._patterns: List[_CompiledPattern] = []
+        self._trie: Dict[Tuple[str, Target], _TrieNode] = {}
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def register(
+        self,
+        pattern: PatternSpec,
+        replacement: PatternSpec,
+        *,
+        match_filters: Optional[Sequence[MatchFilter]] = None,
+        ignore_literals: bool = False,
+        allow_external_users: bool = False,
+        name: Optional[str] = None,
+    ) -> None:
+        """Registers a pattern and its replacement
+
+        Patterns registered earlier take precedence when several patterns match
+        at the same anchor
+
+        Args:
+            pattern: Callable to trace, or Graph describing the subgraph to match
+            replacement: Callable to trace, or Graph to substitute for each match
+            match_filters: Callables which must all accept a match for it to be replaced
+            ignore_literals: Whether literal arguments in the pattern match any value
+            allow_external_users: Whether intermediate nodes of a match may be used outside
+                of it. If so, only the anchor is replaced, and the intermediate nodes are left
+                in the graph for dead-code elimination
+            name: Name of the pattern, used for logging
+        """
+        pattern_graph = _to_graph(pattern)
+        replacement_graph = _to_graph(replacement)
+
+        placeholders = [n for n in pattern_graph.nodes if n.op == "placeholder"]
+        output_node = next(iter(reversed(pattern_graph.nodes)))
+        returning_nodes = output_node.all_input_nodes
+
+        if len(returning_nodes) != 1 or not _is_computation(returning_nodes[0]):
+            raise ValueError(
+                "PatternRewriter only supports patterns returning a single computed node"
+            )
+
+        for node in pattern_graph.nodes:
+            if node.op != "output" and not node.users:
+                raise ValueError(
+                    "PatternRewriter cannot register a pattern with dead code"
+                )
+
+        replacement_placeholders = [
+            n for n in replacement_graph.nodes if n.op == "placeholder"
+        ]
+        if len(replacement_placeholders) != len(placeholders):
+            raise ValueError(
+                "Pattern and replacement must have the same number of placeholders"
+            )
+
+        anchor = returning_nodes[0]
+        index = len(self._patterns)
+        self._patterns.append(
+            _CompiledPattern(
+                name=name if name is not None else getattr(pattern, "__name__", ""),
+                pattern_graph=pattern_graph,
+                replacement_graph=replacement_graph,
+                anchor=anchor,
+                placeholders=placeholders,
+                returning_nodes=returning_nodes,
+                match_filters=list(match_filters) if match_filters else [],
+                ignore_literals=ignore_literals,
+                allow_external_users=allow_external_users,
+            )
+        )
+
+        # Insert the pattern into the trie, keyed by its producers in depth-first order
+        trie_node = self._trie.setdefault((anchor.op, anchor.target), _TrieNode())
+        for path, producer in self._producers(anchor):
+            trie_node = trie_node.children.setdefault(path, {}).setdefault(
+                (producer.op, producer.target), _TrieNode()
+            )
+        trie_node.patterns.append(index)
+
+    @staticmethod
+    def _producers(anchor: Node) -> List[Tuple[ArgPath, Node]]:
+        """Lists the computational producers of a pattern anchor in depth-first order"""
+        producers: List[Tuple[ArgPath, Node]] = []
+        visited: Set[Node] = {anchor}
+
+        def visit(value: Any, path: ArgPath) -> None:
+            if isinstance(value, (list, tuple)):
+                for i, item in enumerate(value):
+                    visit(item, path + (i,))
+            elif (
+                isinstance(value, Node)
+                and _is_computation(value)
+                and value not in visited
+            ):
+                visited.add(value)
+                producers.append((path, value))
+                for i, arg in enumerate(_flat_args(value)):
+                    visit(arg, path + (i,))
+
+        for i, arg in enumerate(_flat_args(anchor)):
+            visit(arg, (i,))
+
+        return producers
+
+    def _candidates(
+        self, node: Node, flat_args_cache: Dict[Node, List[Any]]
+    ) -> List[int]:
+        """Returns the indices of patterns whose trie keys agree with the producers of node"""
+        root = self._trie.get((node.op, node.target), None)
+        if root is None:
+            return []
+
+        def flat_args(n: Node) -> List[Any]:
+            if n not in flat_args_cache:
+                flat_args_cache[n] = _flat_args(n)
+            return flat_args_cache[n]
+
+        def resolve(path: ArgPath) -> Optional[Node]:
+            value: Any = node
+            for i in path:
+                if isinstance(value, Node):
+                    value = flat_args(value)
+                if not isinstance(value, (list, tuple)) or i >= len(value):
+                    return None
+                value = value[i]
+            return value if isinstance(value, Node) else None
+
+        candidates: List[int] = []
+        stack = [root]
+        while stack:
+            trie_node = stack.pop()
+            candidates.extend(trie_node.patterns)
+            for path, edges in trie_node.children.items():
+                producer = resolve(path)
+                if producer is not None and _is_computation(producer):
+                    child = edges.get((producer.op, producer.target), None)
+                    if child is not None:
+                        stack.append(child)
+
+        return sorted(candidates)
+
+    def _match(
+        self, pattern: _CompiledPattern, anchor: Node
+    ) -> Optional[InternalMatch]:
+        """Attempts to match a pattern whose anchor is mapped to the given node"""
+        match = InternalMatch(anchors=[pattern.anchor])
+        matched_graph_nodes: Set[Node] = set()
+
+        def match_literals(pn: Any, gn: Any) -> bool:
+            if isinstance(pn, Node) and not isinstance(gn, Node):
+                if pn.op == "placeholder":
+                    if pn in match.nodes_map:
+                        return match.nodes_map[pn] == gn
+                    match.nodes_map[pn] = gn
+                    return True
+                return False
+            elif not isinstance(pn, Node) and isinstance(gn, Node):
+                return False
+            return type(gn) == type(pn) and gn == pn
+
+        def match_args(pattern_args: Sequence[Any], graph_args: Sequence[Any]) -> bool:
+            if len(pattern_args) != len(graph_args):
+                return False
+
+            for pa, ga in zip(pattern_args, graph_args):
+                if isinstance(pa, Node) and isinstance(ga, Node):
+                    matched = match_nodes(pa, ga)
+                elif isinstance(pa, (list, tuple)) and isinstance(ga, (list, tuple)):
+                    matched = match_args(pa, ga)
+                else:
+                    matched = match_literals(pa, ga) or pattern.ignore_literals
+
+                if not matched:
+                    return False
+
+            return True
+
+        def match_nodes(pn: Node, gn: Node) -> bool:
+            if pn in match.nodes_map:
+                return match.nodes_map[pn] == gn
+
+            # Placeholders are wildcards, and may be bound to any node
+            if pn.op == "placeholder":
+                match.nodes_map[pn] = gn
+                return True
+
+            if gn in matched_graph_nodes or pn.op != gn.op or pn.target != gn.target:
+                return False
+
+            match.nodes_map[pn] = gn
+            matched_graph_nodes.add(gn)
+
+            if pn.op == "call_function" and isinstance(
+                pn.target, torch._ops.OpOverload
+            ):
+                return match_args(_flat_args(pn), _flat_args(gn))
+            elif len(pn.args) == len(gn.args) and pn.kwargs.keys() == gn.kwargs.keys():
+                return match_args(_flat_args(pn), _flat_args(gn))
+            return False
+
+        if not match_nodes(pattern.anchor, anchor):
+            return None
+
+        # Intermediate nodes of the match may not be consumed outside of it
+        if not pattern.allow_external_users:
+            for gn in matched_graph_nodes:
+                if gn is anchor:
+                    continue
+                if any(user not in matched_graph_nodes for user in gn.users):
+                    return None
+
+        match.placeholder_nodes = [match.nodes_map[pn] for pn in pattern.placeholders]
+        match.returning_nodes = [anchor]
+        return match
+
+    def rewrite(self, gm: GraphModule) -> List[ReplacedPatterns]:
+        """Matches all registered patterns in a single traversal of gm, then replaces them
+
+        Args:
+            gm: GraphModule to rewrite in-place
+        Returns:
+            The list of replaced patterns, in graph order
+        """
+        graph = gm.graph
+        flat_args_cache: Dict[Node, List[Any]] = {}
+        claimed_nodes: Set[Node] = set()
+        matches: List[Tuple[_CompiledPattern, InternalMatch]] = []
+
+        # Traverse from the outputs, so that patterns anchored at consumers take
+        # precedence over patterns anchored at their producers
+        for node in reversed(graph.nodes):
+            if not _is_computation(node) or node in claimed_nodes:
+                continue
+
+            for index in self._candidates(node, flat_args_cache):
+                pattern = self._patterns[index]
+                match = self._match(pattern, node)
+
+                if match is None or not all(
+                    match_filter(match, graph, pattern.pattern_graph)
+                    for match_filter in pattern.match_filters
+                ):
+                    continue
+
+                # Discard matches overlapping with previously found matches
+                if pattern.allow_external_users:
+                    matched_nodes = {node}
+                else:
+                    matched_nodes = {
+                        gn
+                        for pn, gn in match.nodes_map.items()
+                        if pn.op not in ("placeholder", "output")
+                    }
+                if matched_nodes & claimed_nodes:
+                    continue
+
+                claimed_nodes |= matched_nodes
+                matches.append((pattern, match))
+                break
+
+        replaced = []
+        # As nodes are replaced, later matches may refer to replaced returning nodes
+        match_changed_node: Dict[Node, Node] = {}
+
+        for pattern, match in reversed(matches):
+            replacement_placeholders = [
+                n for n in pattern.replacement_graph.nodes if n.op == "placeholder"
+            ]
+
+            val_map: Dict[Node, Any] = {}
+            for rn, pn in zip(replacement_placeholders, pattern.placeholders):
+                gn = match.nodes_map[pn]
+                if isinstance(gn, Node) and gn in match_changed_node:
+                    gn = match_changed_node[gn]
+                    match.nodes_map[pn] = gn
+                val_map[rn] = gn
+            match.placeholder_nodes = [
+                match.nodes_map[pn] for pn in pattern.placeholders
+            ]
+
+            # All producers of the match precede its anchor, so the replacement
+            # can be inserted directly in front of it
+            anchor = match.returning_nodes[0]
+            with graph.inserting_before(anchor):
+                copied_returning_node = graph.graph_copy(
+                    pattern.replacement_graph, val_map
+                )
+
+            replacement_nodes = [
+                v
+                for v in val_map.values()
+                if isinstance(v, Node) and v not in match.placeholder_nodes
+            ]
+
+            anchor.replace_all_uses_with(copied_returning_node)
+            match_changed_node[anchor] = copied_returning_node
+
+            if pattern.allow_external_users:
+                graph.erase_node(anchor)
+            else:
+                for pn in reversed(pattern.pattern_graph.nodes):
+                    if pn.op not in ("placeholder", "output"):
+                        graph.erase_node(match.nodes_map[pn])
+
+            _LOGGER.debug(f"Replaced pattern {pattern.name} anchored at {anchor}")
+
+            replaced.append(
+                ReplacedPatterns(
+                    anchor=pattern.anchor,
+                    nodes_map=copy.copy(match.nodes_map),
+                    replacements=replacement_nodes,
+                )
+            )
+
+        if replaced:
+            gm.recompile()
+
+        return replaced
+
+    __call__ = rewrite
@@ -5,6 +5,7 @@ from typing import List, Optional
 import torch
 from torch.testing._internal.common_utils import run_tests, TestCase
 from torch_tensorrt.fx import generate_input_specs, InputTensorSpec, LowerSetting
+from torch_tensorrt.fx.utils import supports_profile_sharing
 
 
 class TestTRTModule(TestCase):
@@ -121,6 +122,22 @@ class TestTRTModule(TestCase):
                 self._validate_spec(spec, tensor, dynamic_dims=[0])
             self.assertEqual(len(spec.shape_ranges), lower_setting.opt_profile_replica)
 
+    def test_generate_input_specs_for_execution_contexts(self):
+        inputs = [torch.randn(2, 3)]
+        lower_setting = LowerSetting(max_batch_size=4, num_execution_contexts=3)
+        num_profiles = 1 if supports_profile_sharing() else 3
+
+        specs = generate_input_specs(inputs, lower_setting)
+        for spec, tensor in zip(specs, inputs):
+            self._validate_spec(spec, tensor, dynamic_dims=[0])
+            self.assertEqual(len(spec.shape_ranges), num_profiles)
+            self.assertEqual(spec.shape_ranges[0], ((0, 3), (4, 3), (4, 3)))
+
+        # An explicit number of replicas takes precedence
+        lower_setting.opt_profile_replica = 2
+        specs = generate_input_specs(inputs, lower_setting)
+        self.assertEqual(len(specs[0].shape_ranges), 2)
+
 
 if __name__ == "__main__":
     run_tests()
@@ -8,7 +8,8 @@ import torch.fx
 
 import torch_tensorrt.fx.tracer.acc_tracer.acc_tracer as acc_tracer
 from torch.testing._internal.common_utils import run_tests, TestCase
-from torch_tensorrt.fx import InputTensorSpec, TRTInterpreter, TRTModule
+from torch_tensorrt.fx import InputTensorSpec, LowerSetting, TRTInterpreter, TRTModule
+from torch_tensorrt.fx.input_tensor_spec import get_opt_profile_replica
 
 # from torch_tensorrt.dynamo._TorchTensorRTModule import TorchTensorRTModule
 # from torch_tensorrt import Device
@@ -57,6 +58,45 @@ class TestTRTModule(TestCase):
             new_trt_mod(inputs[0].cuda()).cpu(), ref_output, rtol=1e-04, atol=1e-04
         )
 
+    def test_execution_context_per_stream(self):
+        class TestModule(torch.nn.Module):
+            def forward(self, x):
+                return x + x
+
+        inputs = [torch.randn(2, 3)]
+        mod = TestModule().eval()
+        ref_output = mod(*inputs)
+
+        mod = acc_tracer.trace(mod, inputs)
+        lower_setting = LowerSetting(num_execution_contexts=2)
+        input_specs = InputTensorSpec.from_tensors_with_dynamic_batch_size(
+            inputs, (1, 2, 4), get_opt_profile_replica(lower_setting)
+        )
+        interp = TRTInterpreter(
+            mod, input_specs=input_specs, explicit_batch_dimension=True
+        )
+        interp_res = interp.run(lower_precision=LowerPrecision.FP32)
+        trt_mod = TRTModule(
+            interp_res.engine,
+            interp_res.input_names,
+            interp_res.output_names,
+            num_execution_contexts=lower_setting.num_execution_contexts,
+        )
+
+        streams = [torch.cuda.Stream(), torch.cuda.Stream(), torch.cuda.Stream()]
+        for stream in streams:
+            with torch.cuda.stream(stream):
+                output = trt_mod(inputs[0].cuda())
+            stream.synchronize()
+            torch.testing.assert_close(output.cpu(), ref_output)
+
+        # Contexts are only created for the streams the module ran on, up to
+        # num_execution_contexts, and shared by the streams beyond it
+        self.assertEqual(len(trt_mod.contexts), len(streams))
+        self.assertEqual(
+            len(trt_mod.execution_contexts), lower_setting.num_execution_contexts
+        )
+
 
 # TODO add unittest.skip later
 # class TestTorchTensorRTModule(TestCase):
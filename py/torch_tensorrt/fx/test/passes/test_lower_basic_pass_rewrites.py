@@ -0,0 +1,286 @@
+# Owner(s): ["oncall: gpu_enablement"]
+
+import copy
+import operator
+
+import torch
+import torch_tensorrt.fx.tracer.acc_tracer.acc_ops as acc_ops
+from parameterized import parameterized
+from torch.fx.experimental.proxy_tensor import make_fx
+from torch.testing._internal.common_utils import run_tests, TestCase
+from torch_tensorrt.fx.passes.lower_basic_pass import (
+    check_permute,
+    fuse_permute_linear,
+    fuse_permute_matmul,
+    trt_transposed_linear,
+    trt_transposed_matmul,
+)
+from torch_tensorrt.fx.passes.lower_basic_pass_aten import (
+    aten_compose_bmm_2d,
+    aten_compose_bmm_3d,
+    aten_compose_chunk,
+    compose_bmm,
+    compose_chunk,
+)
+from torch_tensorrt.fx.tracer.acc_tracer import acc_tracer
+
+# Implementations of the passes before they were migrated to PatternRewriter,
+# which the migrated passes are checked against
+
+
+def reference_fuse_permute_linear(gm: torch.fx.GraphModule) -> torch.fx.GraphModule:
+    for node in gm.graph.nodes:
+        if node.target == acc_ops.linear:
+            inp = node.kwargs["input"]
+            if inp.target == acc_ops.permute and check_permute(inp):
+                inp = inp.kwargs["input"]
+                weight = node.kwargs["weight"]
+                bias = node.kwargs["bias"]
+                with gm.graph.inserting_before(node):
+                    fused_node = gm.graph.call_function(
+                        trt_transposed_linear, args=(inp, weight, bias)
+                    )
+                    node.replace_all_uses_with(fused_node)
+
+    gm.graph.eliminate_dead_code()
+    gm.recompile()
+    return gm
+
+
+def reference_fuse_permute_matmul(gm: torch.fx.GraphModule) -> torch.fx.GraphModule:
+    for node in gm.graph.nodes:
+        if node.target == acc_ops.matmul:
+            lhs, rhs = node.kwargs["input"], node.kwargs["other"]
+            lhs_transposed = rhs_tranposed = False
+
+            if lhs.target == acc_ops.permute and check_permute(lhs):
+                lhs_transposed = True
+                lhs = lhs.kwargs["input"]
+
+            if rhs.target == acc_ops.permute and check_permute(rhs):
+                rhs_tranposed = True
+                rhs = rhs.kwargs["input"]
+
+            if lhs_transposed or rhs_tranposed:
+                with gm.graph.inserting_before(node):
+                    fused_node = gm.graph.call_function(
+                        trt_transposed_matmul,
+                        args=(lhs, rhs, lhs_transposed, rhs_tranposed),
+                    )
+                node.replace_all_uses_with(fused_node)
+
+    gm.graph.eliminate_dead_code()
+    gm.recompile()
+    return gm
+
+
+def reference_compose_bmm(module: torch.fx.GraphModule) -> torch.fx.GraphModule:
+    for node in list(module.graph.nodes):
+        if node.op == "call_function" and node.target == torch.ops.aten.bmm.default:
+            input_n, other_n = node.all_input_nodes[0], node.all_input_nodes[1]
+            output = next(iter(node.users))
+            real_input = input_n.all_input_nodes[0].all_input_nodes[0]
+            real_other = other_n.all_input_nodes[0].all_input_nodes[0]
+            if len(real_other.meta["val"].size()) == 2:
+                new_func = aten_compose_bmm_2d
+            if len(real_other.meta["val"].size()) == 3:
+                new_func = aten_compose_bmm_3d
+
+            with module.graph.inserting_after(node):
+                new_node = module.graph.call_function(
+                    new_func, args=(real_input, real_other)
+                )
+            output.replace_all_uses_with(new_node)
+
+    module.graph.eliminate_dead_code()
+    module.recompile()
+    return module
+
+
+def reference_compose_chunk(module: torch.fx.GraphModule) -> torch.fx.GraphModule:
+    for node in list(module.graph.nodes):
+        if node.op != "call_function" or node.target != torch.ops.aten.split.Tensor:
+            continue
+        div = node.args[1]
+        if not isinstance(div, torch.fx.Node) or div.target != operator.floordiv:
+            continue
+        div_const, sub = div.args[1], div.args[0]
+        if sub.target != operator.sub or sub.args[0].target != operator.add:
+            continue
+        add = sub.args[0]
+        symsize = add.args[0]
+        if add.args[1] != div_const or symsize.args[0] != node.args[0]:
+            continue
+
+        with module.graph.inserting_after(node):
+            new_node = module.graph.call_function(
+                aten_compose_chunk, args=(node.args[0], div_const, symsize.args[1])
+            )
+        node.replace_all_uses_with(new_node)
+
+    module.graph.eliminate_dead_code()
+    module.recompile()
+    return module
+
+
+def graph_structure(gm: torch.fx.GraphModule):
+    """Returns the outputs of gm as expression trees, independent of node order and names"""
+
+    def expression(arg):
+        if isinstance(arg, torch.fx.Node):
+            if arg.op in ("placeholder", "get_attr"):
+                return (arg.op, arg.target)
+            return (
+                arg.target,
+                expression(list(arg.args)),
+                expression(dict(arg.kwargs)),
+            )
+        elif isinstance(arg, (list, tuple)):
+            return tuple(expression(a) for a in arg)
+        elif isinstance(arg, dict):
+            return tuple((k, expression(v)) for k, v in sorted(arg.items()))
+        return arg
+
+    output = next(iter(reversed(gm.graph.nodes)))
+    return expression(output.args[0])
+
+
+class TestLowerBasicPassRewrites(TestCase):
+    def _count(self, gm, target):
+        return len([n for n in gm.graph.nodes if n.target == target])
+
+    @parameterized.expand(
+        [
+            ("transpose_input", lambda x: x.transpose(-1, -2), 1),
+            ("permute_input", lambda x: x.permute(0, 2, 1), 1),
+            ("non_transposing_permute", lambda x: x.permute(1, 0, 2), 0),
+        ]
+    )
+    def test_fuse_permute_linear(self, _, permute_op, num_fused):
+        class PermuteLinear(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.linear = torch.nn.Linear(3, 6)
+
+            def forward(self, x):
+                return self.linear(permute_op(x))
+
+        inputs = [torch.randn(3, 3, 3)]
+        gm = acc_tracer.trace(PermuteLinear().eval(), inputs)
+        expected = reference_fuse_permute_linear(copy.deepcopy(gm))
+        fused = fuse_permute_linear(gm, inputs)
+
+        self.assertEqual(graph_structure(fused), graph_structure(expected))
+        self.assertEqual(self._count(fused, trt_transposed_linear), num_fused)
+        torch.testing.assert_close(fused(*inputs), expected(*inputs))
+
+    @parameterized.expand(
+        [
+            ("transpose_lhs", (3, 3, 2), (3, 3, 4), True, False),
+            ("transpose_rhs", (3, 2, 3), (3, 4, 3), False, True),
+            ("transpose_both", (3, 3, 2), (3, 4, 3), True, True),
+            ("transpose_none", (3, 2, 3), (3, 3, 4), False, False),
+        ]
+    )
+    def test_fuse_permute_matmul(
+        self, _, lhs_shape, rhs_shape, lhs_transposed, rhs_transposed
+    ):
+        class PermuteMatmul(torch.nn.Module):
+            def forward(self, x, y):
+                if lhs_transposed:
+                    x = x.transpose(-1, -2)
+                if rhs_transposed:
+                    y = y.permute(0, 2, 1)
+                return torch.matmul(x, y)
+
+        inputs = [torch.randn(*lhs_shape), torch.randn(*rhs_shape)]
+        gm = acc_tracer.trace(PermuteMatmul().eval(), inputs)
+        expected = reference_fuse_permute_matmul(copy.deepcopy(gm))
+        fused = fuse_permute_matmul(gm, inputs)
+
+        self.assertEqual(graph_structure(fused), graph_structure(expected))
+        self.assertEqual(
+            self._count(fused, trt_transposed_matmul),
+            int(lhs_transposed or rhs_transposed),
+        )
+        torch.testing.assert_close(fused(*inputs), expected(*inputs))
+
+    @parameterized.expand(
+        [
+            ("bmm_view", torch.bmm, (2, 3, 4), (2, 4, 5), aten_compose_bmm_3d),
+            ("matmul_unsafe_view", torch.matmul, (2, 3, 4), (2, 4, 5), None),
+            ("matmul_broadcast", torch.matmul, (3, 4), (2, 4, 5), None),
+        ]
+    )
+    def test_compose_bmm(self, _, op, lhs_shape, rhs_shape, compose_fn):
+        inputs = [torch.randn(*lhs_shape), torch.randn(*rhs_shape)]
+
+        def decomposed_bmm(x, y):
+            if op is torch.bmm:
+                x = torch.ops.aten.view.default(
+                    torch.ops.aten.expand.default(x, list(lhs_shape)), list(lhs_shape)
+                )
+                y = torch.ops.aten.view.default(
+                    torch.ops.aten.expand.default(y, list(rhs_shape)), list(rhs_shape)
+                )
+                out = torch.ops.aten.bmm.default(x, y)
+                return torch.ops.aten.view.default(out, list(out.shape))
+            return op(x, y)
+
+        gm = make_fx(decomposed_bmm)(*inputs)
+        expected = reference_compose_bmm(copy.deepcopy(gm))
+        result = compose_bmm(gm)
+
+        self.assertTrue(result.modified)
+        self.assertEqual(
+            graph_structure(result.graph_module), graph_structure(expected)
+        )
+        self.assertEqual(
+            self._count(result.graph_module, torch.ops.aten.bmm.default), 0
+        )
+        if compose_fn is not None:
+            self.assertEqual(self._count(result.graph_module, compose_fn), 1)
+
+    @parameterized.expand(
+        [
+            ("dim_0", 2, 0),
+            ("dim_1", 3, 1),
+        ]
+    )
+    def test_compose_chunk(self, _, chunks, dim):
+        inputs = [torch.randn(8, 9)]
+        gm = make_fx(lambda x: torch.chunk(x, chunks, dim), tracing_mode="symbolic")(
+            *inputs
+        )
+        self.assertEqual(self._count(gm, torch.ops.aten.split.Tensor), 1)
+
+        expected = reference_compose_chunk(copy.deepcopy(gm))
+        result = compose_chunk(gm)
+
+        self.assertTrue(result.modified)
+        self.assertEqual(
+            graph_structure(result.graph_module), graph_structure(expected)
+        )
+        self.assertEqual(self._count(result.graph_module, aten_compose_chunk), 1)
+        self.assertEqual(
+            self._count(result.graph_module, torch.ops.aten.split.Tensor), 0
+        )
+
+    def test_compose_chunk_subtracted_constant(self):
+        # The rounded-up size may be computed with a constant other than 1
+        def decomposed_chunk(x):
+            size = torch.ops.aten.sym_size(x, 0)
+            return torch.ops.aten.split.Tensor(x, (size + 4 - 2) // 4)
+
+        gm = torch.fx.symbolic_trace(decomposed_chunk)
+        expected = reference_compose_chunk(copy.deepcopy(gm))
+        result = compose_chunk(gm)
+
+        self.assertTrue(result.modified)
+        self.assertEqual(
+            graph_structure(result.graph_module), graph_structure(expected)
+        )
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,195 @@
+import unittest
+
+import torch
+import torch_tensorrt.fx.tracer.acc_tracer.acc_ops as acc_ops
+import torch_tensorrt.fx.tracer.acc_tracer.acc_tracer as acc_tracer
+from torch.fx.passes.shape_prop import ShapeProp
+from torch_tensorrt.fx.lower import default_split_function
+from torch_tensorrt.fx.lower_setting import LowerSetting
+from torch_tensorrt.fx.passes.lower_pass_manager_builder import LowerPassManagerBuilder
+from torch_tensorrt.fx.passes.pass_utils import IncrementalShapeProp
+
+
+class SampleModule(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.weight = torch.nn.Parameter(torch.randn(8, 8))
+        self.bias = torch.nn.Parameter(torch.randn(8))
+
+    def forward(self, x):
+        y = torch.relu(x @ (self.weight.t() * 2))
+        z = torch.sigmoid(y + self.bias)
+        return torch.flatten(z + y, 1)
+
+
+# Number of calls of counted_relu, which counts the nodes a propagation runs
+num_relu_calls = 0
+
+
+@torch.fx.wrap
+def counted_relu(x):
+    global num_relu_calls
+    num_relu_calls += 1
+    return torch.relu(x)
+
+
+class ReluChain(torch.nn.Module):
+    def forward(self, x):
+        for _ in range(100):
+            x = counted_relu(x)
+        return x
+
+
+class IncrementalShapePropTest(unittest.TestCase):
+    def setUp(self):
+        torch.manual_seed(0)
+
+    def _tensor_metas(self, gm):
+        return {node.name: node.meta.get("tensor_meta") for node in gm.graph.nodes}
+
+    def test_unchanged_graph_is_not_run(self):
+        inputs = [torch.randn(2, 4, 8)]
+        gm = acc_tracer.trace(SampleModule().eval(), inputs)
+
+        shape_prop = IncrementalShapeProp(inputs)
+        shape_prop.propagate(gm)
+        self.assertEqual(shape_prop.num_run_nodes, len(gm.graph.nodes))
+
+        shape_prop.propagate(gm)
+        self.assertEqual(shape_prop.num_run_nodes, 0)
+
+    def test_only_modified_nodes_are_run(self):
+        inputs = [torch.randn(2, 4, 8)]
+        gm = acc_tracer.trace(SampleModule().eval(), inputs)
+
+        shape_prop = IncrementalShapeProp(inputs)
+        shape_prop.propagate(gm)
+
+        # Replace the sigmoid with a reduction, which changes its shape and the
+        # shapes of the nodes depending on it
+        (sigmoid,) = [n for n in gm.graph.nodes if n.target == acc_ops.sigmoid]
+        with gm.graph.inserting_before(sigmoid):
+            reduced = gm.graph.call_function(
+                acc_ops.sum,
+                kwargs={"input": sigmoid.kwargs["input"], "dim": 1, "keepdim": True},
+            )
+        sigmoid.replace_all_uses_with(reduced)
+        gm.graph.erase_node(sigmoid)
+        gm.recompile()
+
+        shape_prop.propagate(gm)
+        dependents = {reduced}
+        for node in gm.graph.nodes:
+            if any(input in dependents for input in node.all_input_nodes):
+                dependents.add(node)
+        self.assertEqual(shape_prop.num_run_nodes, len(dependents))
+
+        incremental_metas = self._tensor_metas(gm)
+        ShapeProp(gm).propagate(*inputs)
+        self.assertEqual(incremental_metas, self._tensor_metas(gm))
+
+    def test_only_dependents_of_modified_nodes_are_run(self):
+        global num_relu_calls
+        inputs = [torch.randn(2, 4, 8)]
+        gm = torch.fx.symbolic_trace(ReluChain())
+
+        shape_prop = IncrementalShapeProp(inputs)
+        shape_prop.propagate(gm)
+        self.assertEqual(shape_prop.num_run_nodes, len(gm.graph.nodes))
+
+        # Flatten the output of the last relu, so only the flatten and the output
+        # are run, on the recorded shape of the last relu
+        output = next(iter(reversed(gm.graph.nodes)))
+        last_relu = output.args[0]
+        with gm.graph.inserting_after(last_relu):
+            flatten = gm.graph.call_function(torch.flatten, (last_relu, 1))
+        output.replace_input_with(last_relu, flatten)
+        gm.recompile()
+
+        num_relu_calls = 0
+        shape_prop.propagate(gm)
+        self.assertEqual(num_relu_calls, 0)
+        self.assertEqual(shape_prop.num_run_nodes, 2)
+
+        incremental_metas = self._tensor_metas(gm)
+        ShapeProp(gm).propagate(*inputs)
+        self.assertEqual(incremental_metas, self._tensor_metas(gm))
+
+    def test_data_dependent_nodes_run_all_nodes(self):
+        inputs = [torch.randn(2, 4, 8)]
+        gm = acc_tracer.trace(SampleModule().eval(), inputs)
+
+        shape_prop = IncrementalShapeProp(inputs)
+        shape_prop.propagate(gm)
+
+        # The shape of a nonzero depends on the values of its input, which fake
+        # tensors don't have
+        output = next(iter(reversed(gm.graph.nodes)))
+        with gm.graph.inserting_before(output):
+            nonzero = gm.graph.call_function(torch.nonzero, (output.args[0],))
+        output.replace_input_with(output.args[0], nonzero)
+        gm.recompile()
+
+        shape_prop.propagate(gm)
+        self.assertEqual(shape_prop.num_run_nodes, len(gm.graph.nodes))
+        self.assertEqual(nonzero.meta["tensor_meta"].shape, gm(*inputs).shape)
+
+    def test_modified_attributes_are_run(self):
+        inputs = [torch.randn(2, 4, 8)]
+        gm = acc_tracer.trace(SampleModule().eval(), inputs)
+
+        shape_prop = IncrementalShapeProp(inputs)
+        shape_prop.propagate(gm)
+
+        with torch.no_grad():
+            gm.bias.add_(1)
+        shape_prop.propagate(gm)
+        self.assertGreater(shape_prop.num_run_nodes, 0)
+
+    def test_modified_module_buffers_are_run(self):
+        inputs = [torch.randn(2, 4, 8, 8)]
+        gm = torch.fx.symbolic_trace(
+            torch.nn.Sequential(torch.nn.BatchNorm2d(4, affine=False)).eval()
+        )
+
+        shape_prop = IncrementalShapeProp(inputs)
+        shape_prop.propagate(gm)
+
+        # The batch norm has buffers but no parameters
+        with torch.no_grad():
+            gm.get_submodule("0").running_mean.add_(1)
+        shape_prop.propagate(gm)
+        self.assertGreater(shape_prop.num_run_nodes, 0)
+
+
+class LowerPassManagerBuilderTest(unittest.TestCase):
+    def test_trace_once(self):
+        traced_modules = []
+
+        def trace_func(module, inputs):
+            traced_modules.append(module)
+            return acc_tracer.trace(module, inputs)
+
+        builder = LowerPassManagerBuilder(
+            lower_setting=LowerSetting(),
+            trace_func=trace_func,
+            split_func=default_split_function,
+            lower_func=lambda module, *args: module,
+        )
+
+        model = SampleModule().eval()
+        inputs = [torch.randn(2, 4, 8)]
+        pm = builder.build_trt_lower_pipeline(inputs)
+
+        # Run the passes up to the split of the graph
+        module = model
+        for pass_ in pm.passes[:3]:
+            module = pass_(module)
+
+        self.assertEqual(len(traced_modules), 1)
+        self.assertIsInstance(module, torch.fx.GraphModule)
+        torch.testing.assert_close(module(*inputs), model(*inputs))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,9 @@ import torch_tensorrt.fx.diagnostics as diagnostics
 from torch_tensorrt.fx.passes.pass_utils import (
     override_alternative_batch_size,
     override_alternative_batch_size_exception_should_throw,
+    validate_inference,
     validate_variable_batch_sizes,
+    validation_context,
 )
 
 diagnostics.set_current_collector(
@@ -94,3 +96,99 @@ class PassUtilsTest(unittest.TestCase):
             # thrown, because of no
             # `override_alternative_batch_size_exception_should_throw`
             model_transform_pass_bad(model, input)
+
+
+class ValidationContextTest(unittest.TestCase):
+    def setUp(self):
+        torch.manual_seed(0)
+
+    @staticmethod
+    def _trace_module():
+        class TestModule(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.linear = torch.nn.Linear(8, 8)
+
+            def forward(self, x):
+                return torch.relu(self.linear(x)), torch.sigmoid(x)
+
+        return torch.fx.symbolic_trace(TestModule())
+
+    @staticmethod
+    @validate_inference(atol=1e-6, rtol=1e-6)
+    def _clone_outputs_pass(gm, input):
+        """Clones the outputs of the module, which changes its code but not its outputs"""
+        output = next(n for n in gm.graph.nodes if n.op == "output")
+        with gm.graph.inserting_before(output):
+            clones = [gm.graph.call_function(torch.clone, (x,)) for x in output.args[0]]
+        output.args = (tuple(clones),)
+        gm.recompile()
+        return gm
+
+    def test_reference_outputs_reused(self):
+        gm = self._trace_module()
+        input = [torch.randn(4, 8)]
+
+        with validation_context() as context:
+            for _ in range(3):
+                gm = self._clone_outputs_pass(gm, input)
+
+        # The module after each pass is the module before the next one
+        self.assertEqual(context.num_forwards, 4)
+        self.assertEqual(context.num_skipped_forwards, 2)
+
+    def test_alternative_batch_size_outputs_reused(self):
+        @validate_variable_batch_sizes(1)
+        def clone_outputs_pass(gm, input):
+            return self._clone_outputs_pass.__wrapped__(gm, input)
+
+        gm = self._trace_module()
+        input = [torch.randn(4, 8)]
+
+        with validation_context() as context:
+            for _ in range(3):
+                gm = clone_outputs_pass(gm, input)
+
+        # Both batch sizes reuse the outputs of the module before each pass
+        self.assertEqual(context.num_forwards, 8)
+        self.assertEqual(context.num_skipped_forwards, 4)
+
+    def test_modified_parameters_invalidate_outputs(self):
+        gm = self._trace_module()
+        input = [torch.randn(4, 8)]
+
+        with validation_context() as context:
+            gm = self._clone_outputs_pass(gm, input)
+            with torch.no_grad():
+                gm.linear.weight.add_(1)
+            gm = self._clone_outputs_pass(gm, input)
+
+        self.assertEqual(context.num_forwards, 4)
+        self.assertEqual(context.num_skipped_forwards, 0)
+
+    def test_failed_check_with_sampled_validation(self):
+        gm = self._trace_module()
+        input = [torch.randn(4, 8)]
+
+        @validate_inference(atol=1e-6, rtol=1e-6)
+        def bad_pass(gm, input):
+            with torch.no_grad():
+                gm.linear.bias.add_(1)
+            return gm
+
+        with validation_context(batch_size=1, max_outputs=1) as context:
+            self.assertEqual(context.sample_input(input)[0].shape, (1, 8))
+            self.assertEqual(list(context.sample_outputs(5)), [0])
+            self.assertRaises(AssertionError, lambda: bad_pass(gm, input))
+
+    def test_report(self):
+        gm = self._trace_module()
+        input = [torch.randn(4, 8)]
+
+        with self.assertLogs(
+            "torch_tensorrt.fx.passes.pass_utils", level="INFO"
+        ) as logs:
+            with validation_context(report=True):
+                self._clone_outputs_pass(gm, input)
+                self._clone_outputs_pass(gm, input)
+        self.assertIn("ran 3 module forwards and skipped 1", "".join(logs.output))
@@ -0,0 +1,153 @@
+# Owner(s): ["oncall: gpu_enablement"]
+
+import copy
+
+import torch
+from torch.testing._internal.common_utils import run_tests, TestCase
+from torch_tensorrt.fx.passes.pattern_rewriter import PatternRewriter
+
+
+def addmm_pattern(input, weight, bias):
+    weight_t = torch.ops.aten.permute.default(weight, [1, 0])
+    return torch.ops.aten.addmm.default(bias, input, weight_t)
+
+
+def addmm_replacement(input, weight, bias):
+    return torch.ops.aten.linear.default(input, weight, bias)
+
+
+def relu_mul_pattern(x, y):
+    return torch.ops.aten.relu.default(torch.ops.aten.mul.Tensor(x, y))
+
+
+def relu_mul_replacement(x, y):
+    return torch.ops.aten.clamp_min.default(torch.ops.aten.mul.Tensor(x, y), 0)
+
+
+class TestPatternRewriter(TestCase):
+    def _count(self, gm, target):
+        return len([n for n in gm.graph.nodes if n.target == target])
+
+    def test_matches_subgraph_rewriter(self):
+        class MultiLinear(torch.nn.Module):
+            def forward(self, x, w1, b1, w2, b2):
+                out = torch.ops.aten.addmm.default(
+                    b1, x, torch.ops.aten.permute.default(w1, [1, 0])
+                )
+                out = torch.ops.aten.relu.default(out)
+                return torch.ops.aten.addmm.default(
+                    b2, out, torch.ops.aten.permute.default(w2, [1, 0])
+                )
+
+        gm = torch.fx.symbolic_trace(MultiLinear())
+        reference_gm = copy.deepcopy(gm)
+        inputs = [
+            torch.randn(4, 8),
+            torch.randn(16, 8),
+            torch.randn(16),
+            torch.randn(8, 16),
+            torch.randn(8),
+        ]
+        reference = gm(*inputs)
+
+        rewriter = PatternRewriter()
+        rewriter.register(addmm_pattern, addmm_replacement)
+        replaced = rewriter(gm)
+        gm.graph.eliminate_dead_code()
+        gm.recompile()
+
+        expected = torch.fx.subgraph_rewriter.replace_pattern(
+            reference_gm, addmm_pattern, addmm_replacement
+        )
+
+        self.assertEqual(len(replaced), len(expected))
+        self.assertEqual(self._count(gm, torch.ops.aten.linear.default), 2)
+        self.assertEqual(self._count(gm, torch.ops.aten.addmm.default), 0)
+        torch.testing.assert_close(gm(*inputs), reference)
+
+    def test_multiple_patterns_single_traversal(self):
+        class Mixed(torch.nn.Module):
+            def forward(self, x, y, w, b):
+                out = torch.ops.aten.addmm.default(
+                    b, x, torch.ops.aten.permute.default(w, [1, 0])
+                )
+                return torch.ops.aten.relu.default(torch.ops.aten.mul.Tensor(out, y))
+
+        gm = torch.fx.symbolic_trace(Mixed())
+        inputs = [
+            torch.randn(4, 8),
+            torch.randn(4, 16),
+            torch.randn(16, 8),
+            torch.randn(16),
+        ]
+        reference = gm(*inputs)
+
+        rewriter = PatternRewriter()
+        rewriter.register(addmm_pattern, addmm_replacement)
+        rewriter.register(relu_mul_pattern, relu_mul_replacement)
+        self.assertEqual(len(rewriter), 2)
+
+        replaced = rewriter(gm)
+        gm.graph.eliminate_dead_code()
+        gm.recompile()
+
+        self.assertEqual(len(replaced), 2)
+        self.assertEqual(self._count(gm, torch.ops.aten.linear.default), 1)
+        self.assertEqual(self._count(gm, torch.ops.aten.clamp_min.default), 1)
+        self.assertEqual(self._count(gm, torch.ops.aten.relu.default), 0)
+        torch.testing.assert_close(gm(*inputs), reference)
+
+    def test_external_users_and_filters(self):
+        class SharedPermute(torch.nn.Module):
+            def forward(self, x, w, b):
+                w_t = torch.ops.aten.permute.default(w, [1, 0])
+                out = torch.ops.aten.addmm.default(b, x, w_t)
+                return out, w_t
+
+        inputs = [torch.randn(4, 8), torch.randn(16, 8), torch.randn(16)]
+
+        # The permute is used outside of the pattern, so it may not be matched
+        gm = torch.fx.symbolic_trace(SharedPermute())
+        rewriter = PatternRewriter()
+        rewriter.register(addmm_pattern, addmm_replacement)
+        self.assertEqual(len(rewriter(gm)), 0)
+
+        # Unless the pattern allows external users of its intermediate nodes
+        rewriter = PatternRewriter()
+        rewriter.register(addmm_pattern, addmm_replacement, allow_external_users=True)
+        replaced = rewriter(gm)
+        self.assertEqual(len(replaced), 1)
+        self.assertEqual(self._count(gm, torch.ops.aten.permute.default), 1)
+        torch.testing.assert_close(
+            gm(*inputs), SharedPermute()(*inputs), msg="Outputs do not match"
+        )
+
+        # Match filters may reject matches
+        gm = torch.fx.symbolic_trace(SharedPermute())
+        rewriter = PatternRewriter()
+        rewriter.register(
+            addmm_pattern,
+            addmm_replacement,
+            allow_external_users=True,
+            match_filters=[lambda match, original_graph, pattern_graph: False],
+        )
+        self.assertEqual(len(rewriter(gm)), 0)
+
+    def test_ignore_literals(self):
+        class Transposes(torch.nn.Module):
+            def forward(self, x, w, b):
+                w_t = torch.ops.aten.permute.default(w, [0, 1])
+                return torch.ops.aten.addmm.default(b, x, w_t)
+
+        gm = torch.fx.symbolic_trace(Transposes())
+        rewriter = PatternRewriter()
+        rewriter.register(addmm_pattern, addmm_replacement)
+        self.assertEqual(len(rewriter(gm)), 0)
+
+        rewriter = PatternRewriter()
+        rewriter.register(addmm_pattern, addmm_replacement, ignore_literals=True)
+        self.assertEqual(len(rewriter(gm)), 1)
+
+
+if __name__ == "__main__":
+    run_tests()
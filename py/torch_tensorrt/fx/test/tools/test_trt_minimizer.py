@@ -0,0 +1,138 @@
+import concurrent.futures
+import unittest
+
+import torch
+import torch.fx
+from torch import nn
+from torch_tensorrt.fx.tools import trt_minimizer
+from torch_tensorrt.fx.tools.trt_minimizer import (
+    TensorRTMinimizer,
+    TensorRTMinizerSetting,
+)
+
+# Targets of the nodes which fail to lower, and which lower to inaccurate modules
+FAILING_TARGETS = {torch.sigmoid}
+INACCURATE_TARGETS = {torch.tanh}
+
+# Modules lowered by stub_lower_fn in this process
+lowered_modules = []
+
+
+class TestModel(nn.Module):
+    def forward(self, x):
+        x = torch.relu(x)
+        x = torch.sigmoid(x) + x
+        x = torch.tanh(x) * 2
+        return torch.cos(x) - x
+
+
+def stub_lower_fn(mod, inputs, batch_size, use_experimental_rt):
+    """Lowers a module to itself, failing or adding an error for some targets"""
+    lowered_modules.append(mod)
+    targets = {node.target for node in mod.graph.nodes}
+    if targets & FAILING_TARGETS:
+        raise RuntimeError("Unsupported target")
+    if targets & INACCURATE_TARGETS:
+        return lambda *args: mod(*args) + 1
+    return mod
+
+
+def compare_fn(a, b, names):
+    return (a - b).abs().max().item(), torch.allclose(a, b)
+
+
+class ThreadedMinimizer(TensorRTMinimizer):
+    """Runs the candidates of the parallel search in threads of this process"""
+
+    def _create_executor(self):
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.settings.num_workers,
+            initializer=trt_minimizer._init_worker,
+            initargs=(self,),
+        )
+
+
+class TensorRTMinimizerTest(unittest.TestCase):
+    def setUp(self):
+        torch.manual_seed(0)
+        lowered_modules.clear()
+
+    def _minimize(self, minimizer_class, traverse_method, find_all, num_workers):
+        settings = TensorRTMinizerSetting(num_workers=num_workers)
+        settings.traverse_method = traverse_method
+        settings.find_all = find_all
+        minimizer = minimizer_class(
+            torch.fx.symbolic_trace(TestModel()),
+            [torch.randn(4, 8)],
+            compare_fn,
+            settings,
+            lower_fn=stub_lower_fn,
+        )
+        culprits = minimizer.minimize()
+        return minimizer, {node.name for node in culprits}
+
+    def test_parallel_sequential_traverse(self):
+        for find_all in (True, False):
+            _, culprits = self._minimize(TensorRTMinimizer, "sequential", find_all, 0)
+            _, parallel_culprits = self._minimize(
+                ThreadedMinimizer, "sequential", find_all, 2
+            )
+            self.assertEqual(culprits, parallel_culprits)
+        self.assertEqual(culprits, {"sigmoid"})
+
+    def test_parallel_binary_traverse(self):
+        _, culprits = self._minimize(TensorRTMinimizer, "binary", False, 0)
+        _, parallel_culprits = self._minimize(ThreadedMinimizer, "binary", False, 2)
+        self.assertEqual(culprits, {"sigmoid"})
+        self.assertEqual(parallel_culprits, {"sigmoid"})
+
+        _, parallel_culprits = self._minimize(ThreadedMinimizer, "binary", True, 2)
+        self.assertEqual(parallel_culprits, {"sigmoid", "tanh"})
+
+    def test_candidate_results_reused(self):
+        minimizer, culprits = self._minimize(ThreadedMinimizer, "sequential", True, 2)
+        self.assertEqual(culprits, {"sigmoid", "tanh"})
+
+        num_lowered = len(lowered_modules)
+        minimizer.iteration = 0
+        self.assertEqual(
+            {node.name for node in minimizer.minimize()}, {"sigmoid", "tanh"}
+        )
+        self.assertEqual(len(lowered_modules), num_lowered)
+
+    def test_lowered_modules_reused(self):
+        settings = TensorRTMinizerSetting()
+        minimizer = TensorRTMinimizer(
+            torch.fx.symbolic_trace(TestModel()),
+            [torch.randn(4, 8)],
+            compare_fn,
+            settings,
+            lower_fn=stub_lower_fn,
+        )
+        mod = torch.fx.symbolic_trace(nn.ReLU())
+        minimizer.run_b(mod, [torch.randn(4, 8)])
+        minimizer.run_b(mod, [torch.randn(4, 8)])
+        self.assertEqual(len(lowered_modules), 1)
+
+    def test_worker_processes(self):
+        _, culprits = self._minimize(TensorRTMinimizer, "sequential", True, 2)
+        self.assertEqual(culprits, {"sigmoid", "tanh"})
+        # Candidates are lowered in the worker processes
+        self.assertEqual(lowered_modules, [])
+
+    def test_unpicklable_compare_fn(self):
+        settings = TensorRTMinizerSetting(num_workers=2)
+        settings.traverse_method = "sequential"
+        minimizer = TensorRTMinimizer(
+            torch.fx.symbolic_trace(TestModel()),
+            [torch.randn(4, 8)],
+            lambda a, b, names: compare_fn(a, b, names),
+            settings,
+            lower_fn=stub_lower_fn,
+        )
+        with self.assertRaisesRegex(ValueError, "picklable"):
+            minimizer.minimize()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -96,3 +96,54 @@ class AccShapePropTest(unittest.TestCase):
                 self.assertEqual(node.meta["tensor_meta"][1].dtype, torch.float16)
             else:
                 self.assertEqual(node.meta["tensor_meta"].dtype, torch.float16)
+
+    def _propagate_with_and_without_fake_tensors(self, m, *inputs):
+        self.maxDiff = None
+        gm = acc_tracer.rewriter_base_trace(m, None, None)
+        acc_shape_prop.AccShapeProp(gm).propagate(*inputs)
+        real_meta = {
+            n.name: (n.meta["type"], n.meta["tensor_meta"]) for n in gm.graph.nodes
+        }
+
+        gm = acc_tracer.rewriter_base_trace(m, None, None)
+        acc_shape_prop.AccShapeProp(gm, use_fake_tensors=True).propagate(*inputs)
+        fake_meta = {
+            n.name: (n.meta["type"], n.meta["tensor_meta"]) for n in gm.graph.nodes
+        }
+        return real_meta, fake_meta
+
+    @parameterized.expand(
+        [
+            param("fp32", dtype=torch.float32),
+            param("fp16", dtype=torch.float16),
+        ]
+    )
+    def test_fake_tensors(self, _, dtype):
+        class TestModule(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.attr = torch.nn.Parameter(torch.randn(3, 4))
+                self.submod = torch.nn.Linear(4, 4)
+
+            def forward(self, x):
+                s = torch.tensor_split(self.submod(x.relu() + self.attr), 2)
+                return s[0].sigmoid(), s[1].to(dtype=torch.float32)
+
+        m = TestModule()
+        if dtype == torch.float16:
+            m.half()
+        real_meta, fake_meta = self._propagate_with_and_without_fake_tensors(
+            m, torch.rand(3, 4, dtype=dtype)
+        )
+        self.assertEqual(real_meta, fake_meta)
+
+    def test_fake_tensors_fallback(self):
+        class TestModule(torch.nn.Module):
+            def forward(self, x, y):
+                # The shape of the output of nonzero depends on the values of x
+                return torch.nonzero(x.relu()).sum(dim=1) + 1, y.sigmoid()
+
+        real_meta, fake_meta = self._propagate_with_and_without_fake_tensors(
+            TestModule(), torch.randn(8, 4), torch.randn(2, 3)
+        )
+        self.assertEqual(real_meta, fake_meta)
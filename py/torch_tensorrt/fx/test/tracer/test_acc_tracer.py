@@ -1,7 +1,12 @@
 # Owner(s): ["oncall: fx"]
+import importlib.util
 import logging
 import operator
+import os
+import tempfile
+import textwrap
 import unittest
+import unittest.mock
 from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 import numpy as np
@@ -920,6 +925,72 @@ class AccTracerTest(unittest.TestCase):
         for _, m in traced.named_children():
             self.assertFalse("__AccRewrittenModule" in str(type(m)), str(type(m)))
 
+    def test_rewritten_module_class_reused(self):
+        """
+        Test that tracing instances of the same module class reuses the rewritten
+        class rather than rewriting the class again, and that replacing a method
+        of the class invalidates it
+        """
+
+        class TestModule(nn.Module):
+            def forward(self, a: torch.Tensor) -> torch.Tensor:
+                if a.shape[0] != 10:
+                    raise ValueError("Unexpected shape")
+                return a.relu()
+
+        input = torch.randn(10)
+        allow_list = {TestModule}
+
+        rewritten = acc_tracer._rewrite(TestModule(), allow_list)
+        with unittest.mock.patch.object(
+            acc_tracer.Acc_Rewriter, "rewrite", wraps=acc_tracer.Acc_Rewriter().rewrite
+        ) as rewrite:
+            rewritten_again = acc_tracer._rewrite(TestModule(), allow_list)
+            traced = acc_tracer.trace(
+                TestModule(), [input], ast_rewriter_allow_list=allow_list
+            )
+        rewrite.assert_not_called()
+        self.assertIs(type(rewritten), type(rewritten_again))
+        self.assertTrue(torch.equal(TestModule()(input), traced(input)))
+
+        def forward(self, a: torch.Tensor) -> torch.Tensor:
+            return a.sigmoid()
+
+        TestModule.forward = forward
+        rewritten = acc_tracer._rewrite(TestModule(), allow_list)
+        self.assertIsNot(type(rewritten), type(rewritten_again))
+        self.assertTrue(torch.equal(rewritten(input), input.sigmoid()))
+
+    def test_rewritten_module_class_invalidated_on_source_change(self):
+        """
+        Test that a rewritten class is not reused once the source of the module
+        changed on disk
+        """
+        source = textwrap.dedent(
+            """
+            import torch
+
+            class TestModule(torch.nn.Module):
+                def forward(self, a):
+                    return a.relu()
+            """
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "acc_tracer_rewrite_test_module.py")
+            with open(path, "w") as f:
+                f.write(source)
+            spec = importlib.util.spec_from_file_location("test_module", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            allow_list = {module.TestModule}
+
+            rewritten = acc_tracer._rewrite(module.TestModule(), allow_list)
+            with open(path, "w") as f:
+                f.write(source.replace("a.relu()", "a.sigmoid()"))
+            rewritten_again = acc_tracer._rewrite(module.TestModule(), allow_list)
+
+        self.assertIsNot(type(rewritten), type(rewritten_again))
+
     def test_sequential(self):
         """
         Test that the tracer works for torch.nn.Sequential.
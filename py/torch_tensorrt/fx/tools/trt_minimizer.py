@@ -1,9 +1,16 @@
+import concurrent.futures
+import copy
+import hashlib
 import logging
-from typing import Any, Callable, Tuple
+import multiprocessing
+import pickle
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import torch
 import torch.fx.passes.net_min_base as net_min_base
-from torch.fx.passes.tools_common import Tensors
+from torch.fx.node import _get_qualified_name, map_arg
+from torch.fx.passes.tools_common import NodeList, NodeSet, Tensors
 
 from .. import InputTensorSpec, TRTInterpreter, TRTModule
 
@@ -47,10 +54,92 @@ def lower_mod_default(
     return res_mod
 
 
+# Number of lowered modules which a TensorRTMinimizer keeps for reuse
+LOWERED_MODULE_CACHE_SIZE = 8
+
+# Outcomes of running a candidate submodule of the parallel search
+_PASSED = "passed"
+_MISMATCH = "mismatch"
+_RUN_ERROR = "run_error"
+
+
+def get_structural_hash(
+    mod: torch.fx.GraphModule,
+    inputs: Tensors,
+    include_weights: bool = True,
+    include_inputs: bool = True,
+) -> str:
+    """
+    Returns a hash of the structure of `mod` and the shapes and types of its inputs
+    and attributes, which is independent of the names of its nodes. Optionally, the
+    values of the attributes and inputs are included as well
+    """
+    structural_hash = hashlib.sha256()
+    node_indices: Dict[torch.fx.Node, int] = {}
+    for i, node in enumerate(mod.graph.nodes):
+        node_indices[node] = i
+        if node.op == "placeholder":
+            target = None
+        elif node.op == "call_function":
+            target = _get_qualified_name(node.target)
+        else:
+            target = node.target
+        args = map_arg((node.args, node.kwargs), lambda n: f"%{node_indices[n]}")
+        structural_hash.update(repr((node.op, target, args)).encode())
+
+        if node.op == "get_attr":
+            _update_hash(
+                structural_hash, _getattr_recursive(mod, node.target), include_weights
+            )
+        elif node.op == "call_module":
+            submod = mod.get_submodule(node.target)
+            structural_hash.update(torch.typename(submod).encode())
+            for value in submod.state_dict().values():
+                _update_hash(structural_hash, value, include_weights)
+
+    for input in inputs:
+        _update_hash(structural_hash, input, include_inputs)
+
+    return structural_hash.hexdigest()
+
+
+def _getattr_recursive(mod: torch.nn.Module, target: str) -> Any:
+    for atom in target.split("."):
+        mod = getattr(mod, atom)
+    return mod
+
+
+def _update_hash(structural_hash: Any, value: Any, include_values: bool) -> None:
+    if not isinstance(value, torch.Tensor):
+        structural_hash.update(repr(value).encode())
+        return
+
+    structural_hash.update(repr((tuple(value.shape), value.dtype)).encode())
+    if include_values:
+        data = value.detach().cpu().contiguous().flatten().view(torch.uint8)
+        structural_hash.update(data.numpy().tobytes())
+
+
+def _ignore_accuracy(a: Any, b: Any, names: Any) -> Tuple[float, bool]:
+    return 1, True
+
+
 class TensorRTMinizerSetting(net_min_base._MinimizerSettingBase):
     def __init__(
-        self, explicit_batch_dimension: Any = True, use_experimental_rt: bool = False
+        self,
+        explicit_batch_dimension: Any = True,
+        use_experimental_rt: bool = False,
+        num_workers: int = 0,
     ):
+        """
+        Args:
+        num_workers: if positive, the "sequential" and "binary" traversals evaluate
+        candidate submodules concurrently in this many worker processes, and reuse
+        the results of structurally identical candidates. Otherwise, candidates are
+        evaluated one at a time in this process. The workers are spawned, so the
+        minimizer, its compare_fn and its lower_fn must be picklable: define them at
+        module level, rather than as lambdas or local functions.
+        """
         if use_experimental_rt and not explicit_batch_dimension:
             raise ValueError(
                 "The experimental unifed runtime only supports explicit batch. Please make sure to set explicit_batch_dimension=True when use_experimental_rt=True"
@@ -58,6 +147,7 @@ class TensorRTMinizerSetting(net_min_base._MinimizerSettingBase):
 
         self.explicit_batch_dimension = explicit_batch_dimension
         self.use_experimental_rt = use_experimental_rt
+        self.num_workers = num_workers
         super(TensorRTMinizerSetting, self).__init__()
 
 
@@ -67,29 +157,46 @@ class TensorRTMinimizer(net_min_base._MinimizerBase):
         module: torch.fx.GraphModule,
         sample_input: Tensors,
         compare_fn: Callable[[Any, Any, Any], Tuple[float, bool]],
-        settings: TensorRTMinizerSetting = TensorRTMinizerSetting(),
+        settings: Optional[TensorRTMinizerSetting] = None,
         max_batch_size: Any = 2048,
         lower_fn: Callable[
             [torch.fx.GraphModule, Tensors, Any, bool], TRTModule
         ] = lower_mod_default,
     ):
+        if settings is None:
+            settings = TensorRTMinizerSetting()
         self.lower_fn = lower_fn
         self.max_batch_size = max_batch_size
         self.use_experiemental_rt = settings.use_experimental_rt
+        # Modules lowered by run_b, by the structural hash of the submodule and its
+        # weights
+        self.lowered_modules: "OrderedDict[str, TRTModule]" = OrderedDict()
+        # Outcomes of the candidates evaluated by the parallel search, by the
+        # structural hash of the candidate and its inputs
+        self.candidate_results: Dict[str, Tuple[str, Any]] = {}
+        self._executor: Optional[concurrent.futures.Executor] = None
         super().__init__(module, sample_input, compare_fn, settings)
 
-    def run_a(self, mod, inputs):
+    def run_a(self, mod, inputs, report_idx: int = -1):
         mod.eval()
         with torch.no_grad():
             return mod(*inputs)
 
-    def run_b(self, mod, inputs):
+    def run_b(self, mod, inputs, report_idx: int = -1):
         mod.eval()
         try:
-            mod = self.lower_fn(
-                mod, inputs, self.max_batch_size, self.use_experiemental_rt
-            )
-            output = mod(*inputs)
+            key = get_structural_hash(mod, inputs, include_inputs=False)
+            if key in self.lowered_modules:
+                self.lowered_modules.move_to_end(key)
+                lowered_mod = self.lowered_modules[key]
+            else:
+                lowered_mod = self.lower_fn(
+                    mod, inputs, self.max_batch_size, self.use_experiemental_rt
+                )
+                self.lowered_modules[key] = lowered_mod
+                if len(self.lowered_modules) > LOWERED_MODULE_CACHE_SIZE:
+                    self.lowered_modules.popitem(last=False)
+            output = lowered_mod(*inputs)
         except RuntimeError as e:
             raise net_min_base.FxNetMinimizerRunFuncError(
                 f"Encounter an error when processing \n{mod.graph}\n {e}"
@@ -102,3 +209,269 @@ class TensorRTMinimizer(net_min_base._MinimizerBase):
         if enable_print:
             _LOGGER.info(f"Nodes fetched from start {start} to end {end} as: {nodes}")
         return nodes
+
+    def minimize(self, *args, **kwargs) -> NodeSet:
+        num_workers = getattr(self.settings, "num_workers", 0)
+        if num_workers <= 0 or self.settings.traverse_method not in (
+            "sequential",
+            "binary",
+        ):
+            return super().minimize(*args, **kwargs)
+
+        if self.settings.accumulate_error:
+            _LOGGER.warning(
+                "Parallel search does not support accumulate_error, searching for "
+                "culprits one candidate at a time"
+            )
+            return super().minimize(*args, **kwargs)
+
+        with self._create_executor() as executor:
+            self._executor = executor
+            try:
+                self._store_reference_outputs()
+                return super().minimize(*args, **kwargs)
+            finally:
+                self._executor = None
+
+    def _create_executor(self) -> concurrent.futures.Executor:
+        """
+        Creates the pool of worker processes of the parallel search. Workers are
+        spawned rather than forked, so that they can initialize CUDA, which requires
+        the state sent to them to be picklable
+        """
+        worker_state = self._get_worker_state()
+        try:
+            pickle.dumps(worker_state)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise ValueError(
+                "The parallel search (num_workers > 0) sends the minimizer, its "
+                "compare_fn and its lower_fn to spawned worker processes, so they must "
+                "be picklable. Define them at module level rather than as lambdas or "
+                f"local functions, or set num_workers=0. Pickling failed with: {e}"
+            ) from e
+
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=getattr(self.settings, "num_workers", 0),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(worker_state,),
+        )
+
+    def _get_worker_state(self) -> "TensorRTMinimizer":
+        # Workers only run candidate submodules, so they don't need the module or
+        # the state of the search
+        state = copy.copy(self)
+        for name in (
+            "module",
+            "sample_input",
+            "fusions",
+            "a_outputs",
+            "b_outputs",
+            "results",
+            "reports",
+            "candidate_results",
+            "lowered_modules",
+        ):
+            state.__dict__.pop(name, None)
+        state.lowered_modules = OrderedDict()
+        return state
+
+    def _store_reference_outputs(self):
+        """
+        Stores the outputs of all nodes on the sample input, which are the inputs of
+        the candidates since errors are not accumulated, so that the candidates can
+        be evaluated independently of each other
+        """
+        interpreter = torch.fx.Interpreter(self.module, garbage_collect_values=False)
+        with torch.no_grad():
+            interpreter.run(*self.sample_input)
+        for node, value in interpreter.env.items():
+            self.a_outputs[node.name] = value
+            self.b_outputs[node.name] = value
+
+    def _run_candidates(
+        self, candidates: List[Tuple[NodeSet, List[str]]]
+    ) -> List[Tuple[str, Any]]:
+        """
+        Evaluates the candidates, each of which is a set of nodes and the names of
+        the nodes to output, concurrently. Returns the outcome of each candidate and
+        its accuracy or error
+        """
+        outcomes: List[Optional[Tuple[str, Any]]] = [None] * len(candidates)
+        futures: Dict[str, List[int]] = {}
+        jobs: Dict[str, concurrent.futures.Future] = {}
+
+        for i, (nodes, output_names) in enumerate(candidates):
+            try:
+                split_module, submod_name = self._build_submodule(nodes)
+            except net_min_base.FxNetMinimizerBadModuleError as e:
+                outcomes[i] = (_RUN_ERROR, str(e))
+                continue
+            submodule = self._set_submodule_outputs(
+                getattr(split_module, submod_name), output_names
+            )
+            a_input, b_input = self._get_submod_inputs(split_module, submod_name)
+
+            key = get_structural_hash(submodule, a_input)
+            if key in self.candidate_results:
+                outcomes[i] = self.candidate_results[key]
+            elif key in jobs:
+                futures[key].append(i)
+            else:
+                jobs[key] = self._executor.submit(
+                    _run_candidate_in_worker,
+                    submodule,
+                    a_input,
+                    b_input,
+                    output_names,
+                )
+                futures[key] = [i]
+
+        for key, job in jobs.items():
+            self.candidate_results[key] = job.result()
+            for i in futures[key]:
+                outcomes[i] = self.candidate_results[key]
+
+        return outcomes  # type: ignore[return-value]
+
+    def _run_candidate(
+        self,
+        submodule: torch.fx.GraphModule,
+        a_input: Tensors,
+        b_input: Tensors,
+        names: List[str],
+    ) -> Tuple[str, Any]:
+        try:
+            a_result = self.run_a(submodule, a_input)
+            b_result = self.run_b(submodule, b_input)
+        except Exception as e:
+            return _RUN_ERROR, str(e)
+
+        numeric_result, bool_result = self.compare_fn(a_result, b_result, names)
+        return (_PASSED if bool_result else _MISMATCH), numeric_result
+
+    def _set_submodule_outputs(
+        self, submodule: torch.fx.GraphModule, output_names: List[str]
+    ) -> torch.fx.GraphModule:
+        output_nodes: NodeList = []
+        for node in submodule.graph.nodes:
+            if node.op == "output":
+                submodule.graph.erase_node(node)
+
+            if node.name in output_names:
+                output_nodes.append(node)
+
+        submodule.graph.output(
+            output_nodes[0] if len(output_nodes) == 1 else tuple(output_nodes)
+        )
+        submodule.graph.lint()
+        submodule.recompile()
+        return submodule
+
+    def _sequential_traverse(self, nodes: NodeList) -> NodeSet:
+        if self._executor is None:
+            return super()._sequential_traverse(nodes)
+
+        candidates = []
+        for node in nodes:
+            if self.exclusion_fn is not None:
+                node_list: NodeList = [node]
+                self.exclusion_fn(node_list, -1, -1)
+                if len(node_list) == 0:
+                    break
+            candidates.append((self.fusions.get(node, {node}), [node.name]))
+
+        culprits: NodeSet = set()
+        outcomes = self._run_candidates(candidates)
+        for (cur_nodes, _), (outcome, result), node in zip(candidates, outcomes, nodes):
+            self.iteration += 1
+            report = [
+                f"Parallel sequential traverse iteration {self.iteration}.",
+                f"Visit node: {node.name}",
+            ]
+            self.reports.append(report)
+
+            if outcome == _MISMATCH:
+                culprits.add(node)
+                report.append(f"Found culprit from numeric error: {node}")
+            elif outcome == _RUN_ERROR:
+                culprits.update(cur_nodes)
+                report.append(f"Found culprit from run error: {node}: {result}")
+            else:
+                report.append(f"Numerical accuracy = {result}")
+            self.print_report(report)
+
+            if culprits and not self.settings.find_all:
+                break
+
+        return culprits
+
+    def _binary_traverse(self, nodes: NodeList) -> NodeSet:
+        if self._executor is None or self.exclusion_fn is not None:
+            return super()._binary_traverse(nodes)
+
+        # Evaluate the ranges of each level of the binary search concurrently. The
+        # first culprit of the serial search is the culprit with the lowest index
+        culprits: NodeSet = set()
+        first_culprit_idx = len(nodes)
+        ranges = [(0, len(nodes))]
+        while ranges:
+            outcomes = self._run_candidates(
+                [
+                    (set(nodes[start:end]), [nodes[end - 1].name])
+                    for start, end in ranges
+                ]
+            )
+
+            next_ranges = []
+            for (start, end), (outcome, result) in zip(ranges, outcomes):
+                self.iteration += 1
+                report = [
+                    f"Parallel binary search iteration {self.iteration}",
+                    f"From node index {start}:{nodes[start].name} to "
+                    f"{end - 1}:{nodes[end - 1].name}. Size of the interested node "
+                    f"list is {end - start}",
+                ]
+                self.reports.append(report)
+
+                if outcome == _PASSED:
+                    report.append("No discrepancy found.")
+                elif end - start == 1:
+                    report.append(f"Found culprit {nodes[start]}: {result}")
+                    culprits.add(nodes[start])
+                    first_culprit_idx = min(first_culprit_idx, start)
+                else:
+                    report.append(
+                        "Proceed to split and lower the halves of the current "
+                        "sub-module individually."
+                    )
+                    mid = start + (end - start) // 2
+                    next_ranges.extend([(start, mid), (mid, end)])
+                self.print_report(report)
+
+            if not self.settings.find_all:
+                next_ranges = [r for r in next_ranges if r[0] < first_culprit_idx]
+            ranges = next_ranges
+
+        if not self.settings.find_all and culprits:
+            return {nodes[first_culprit_idx]}
+        return culprits
+
+
+# The minimizer of a worker process of the parallel search
+_WORKER_MINIMIZER: Optional[TensorRTMinimizer] = None
+
+
+def _init_worker(minimizer: TensorRTMinimizer) -> None:
+    global _WORKER_MINIMIZER
+    _WORKER_MINIMIZER = minimizer
+
+
+def _run_candidate_in_worker(
+    submodule: torch.fx.GraphModule,
+    a_input: Tensors,
+    b_input: Tensors,
+    names: List[str],
+) -> Tuple[str, Any]:
+    assert _WORKER_MINIMIZER is not None
+    return _WORKER_MINIMIZER._run_candidate(submodule, a_input, b_input, names)
@@ -13,7 +13,11 @@ from .. import (
     TRTInterpreter,
     TRTModule,
 )
-from ..tools.trt_minimizer import TensorRTMinimizer
+from ..tools.trt_minimizer import (
+    TensorRTMinimizer,
+    TensorRTMinizerSetting,
+    _ignore_accuracy,
+)
 
 
 def create_trt_operator_support(
@@ -52,6 +56,10 @@ class TRTSplitterSetting(splitter_base._SplitterSettingBase):
         self.use_implicit_batch_dim: bool = True
         self.exclude_support_node_name: set = set()
         self.use_experimental_rt: bool = False
+        # Number of worker processes which evaluate candidate submodules concurrently
+        # when searching for the culprit of a lowering error. If 0, candidates are
+        # evaluated one at a time.
+        self.culprit_search_workers: int = 0
 
         if self.use_experimental_rt and self.use_implicit_batch_dim:
             raise ValueError(
@@ -124,9 +132,13 @@ class TRTSplitter(splitter_base._SplitterBase):
         that is responsible for the error.
         """
         # Since we don't care about accuracy here, we pass in a dummy compare function.
-        minimizer = TensorRTMinimizer(mod, inputs, lambda a, b, c: (1, True))
-        minimizer.settings.traverse_method = "sequential"
-        minimizer.settings.find_all = True
+        settings = TensorRTMinizerSetting(
+            use_experimental_rt=self.settings.use_experimental_rt,
+            num_workers=self.settings.culprit_search_workers,
+        )
+        settings.traverse_method = "sequential"
+        settings.find_all = True
+        minimizer = TensorRTMinimizer(mod, inputs, _ignore_accuracy, settings)
         culprits = minimizer.minimize()
 
         if len(culprits) == 0:
@@ -1,12 +1,21 @@
+import logging
 import os
 import sys
-from typing import Any
+from typing import Any, Dict
 
 import torch.fx
 
 import torch_tensorrt.fx.tracer.acc_tracer.acc_ops as acc_ops
+from torch._subclasses.fake_tensor import (
+    FakeTensor,
+    FakeTensorMode,
+    UnsupportedFakeTensorException,
+)
+from torch.fx.node import map_aggregate, map_arg
 from torch.fx.passes import shape_prop
 
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
 
 class SuppressStderrPrints:
     def __enter__(self):
@@ -29,19 +38,121 @@ class AccShapeProp(shape_prop.ShapeProp):
     shape_prop works for many ops with fp16, such as tensor.cat, tensor slice, tensor.to
     dtype conversion, etc.
 
+    If use_fake_tensors is set, nodes are run on fake tensors, which only carry the
+    shapes and types of the tensors, so that no real compute or memory is spent. Ops
+    which cannot run on fake tensors, e.g. because they have no meta kernel or their
+    output shape depends on data, are run with real tensors, which are computed for
+    the nodes they depend on only.
+
     """
 
+    def __init__(self, gm: torch.fx.GraphModule, use_fake_tensors: bool = False):
+        try:
+            super().__init__(
+                gm,
+                (
+                    FakeTensorMode(allow_non_fake_inputs=True)
+                    if use_fake_tensors
+                    else None
+                ),
+            )
+        except Exception as e:
+            # The module has attributes without fake equivalents, e.g. quantized ones
+            _LOGGER.info(f"Running shape prop with real tensors, since {e}")
+            super().__init__(gm)
+        self.real_env: Dict[torch.fx.Node, Any] = {}
+        self.real_inputs: Dict[torch.fx.Node, Any] = {}
+
+    def propagate(self, *args) -> Any:
+        if self.fake_mode is not None:
+            placeholders = [n for n in self.graph.nodes if n.op == "placeholder"]
+            self.real_inputs = dict(zip(placeholders, args))
+            self.real_env = {}
+        try:
+            return super().propagate(*args)
+        except UnsupportedFakeTensorException as e:
+            # The inputs have no fake equivalent
+            _LOGGER.info(f"Running shape prop with real tensors, since {e}")
+            self.fake_mode = self.fake_module = None
+            return super().propagate(*args)
+        finally:
+            self.real_env = {}
+            self.real_inputs = {}
+
     def _run_node(self, n: torch.fx.Node) -> Any:
         # Run ops with XL weights by clamping their inputs, see
         # docstring for self.run_node_with_xl_weights for more details
-        if any(
-            isinstance(kwarg, torch.fx.Node) and kwarg.target == acc_ops.xl_weight
-            for kwarg in n.kwargs.values()
-        ):
+        if _has_xl_weights(n):
             return self.run_node_with_xl_weights(n)
-        else:
+        elif self.fake_mode is None:
             return super().run_node(n)
 
+        try:
+            result = super().run_node(n)
+        except Exception:
+            if n.op == "placeholder":
+                raise
+            result = self.run_node_with_real_tensors(n)
+
+        # Fake tensors are an implementation detail of the shape prop, so record
+        # the type of the real tensors
+        if isinstance(result, FakeTensor):
+            n.meta["type"] = (
+                type(self.fetch_attr(n.target)) if n.op == "get_attr" else torch.Tensor
+            )
+        return result
+
+    def run_node_with_real_tensors(self, n: torch.fx.Node) -> Any:
+        """
+        Runs n with real tensors, which are computed for the nodes n depends on, and
+        returns its result as fake tensors
+        """
+        dependencies = set()
+        stack = [n]
+        while stack:
+            node = stack.pop()
+            if node not in dependencies and node not in self.real_env:
+                dependencies.add(node)
+                stack.extend(node.all_input_nodes)
+
+        for node in self.graph.nodes:
+            if node not in dependencies:
+                continue
+            if node.op == "placeholder":
+                self.real_env[node] = self.real_inputs.get(node, self.env.get(node))
+            elif _has_xl_weights(node):
+                self.real_env[node] = self.run_node_with_xl_weights(node)
+            else:
+                args, kwargs = map_arg((node.args, node.kwargs), self.real_env.get)
+                self.real_env[node] = getattr(self, node.op)(node.target, args, kwargs)
+
+        result = self.real_env[n]
+        found_tensor = False
+
+        def extract_tensor_meta(obj: Any) -> Any:
+            nonlocal found_tensor
+            if isinstance(obj, torch.Tensor):
+                found_tensor = True
+                return shape_prop._extract_tensor_metadata(obj)
+            return obj
+
+        meta = map_aggregate(result, extract_tensor_meta)
+        if found_tensor:
+            n.meta["tensor_meta"] = meta
+        n.meta["type"] = type(result)
+
+        return map_aggregate(result, self._to_fake_tensor)
+
+    def _to_fake_tensor(self, value: Any) -> Any:
+        if not isinstance(value, torch.Tensor):
+            return value
+        try:
+            return self.fake_mode.from_tensor(value)
+        except Exception:
+            # Some tensors, e.g. quantized ones, have no fake equivalent, so the
+            # ops using them are run with real tensors too
+            return value
+
     def run_node(self, n: torch.fx.Node) -> Any:
         # First try running shape_prop with the original inputs.
         with SuppressStderrPrints():
@@ -128,3 +239,10 @@ class AccShapeProp(shape_prop.ShapeProp):
             )
 
         return result
+
+
+def _has_xl_weights(n: torch.fx.Node) -> bool:
+    return any(
+        isinstance(kwarg, torch.fx.Node) and kwarg.target == acc_ops.xl_weight
+        for kwarg in n.kwargs.values()
+    )
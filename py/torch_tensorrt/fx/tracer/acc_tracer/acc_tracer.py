@@ -1,7 +1,10 @@
 import ast
 import builtins
 import copy
+import functools
+import hashlib
 import inspect
+import linecache
 import logging
 import operator
 import textwrap
@@ -353,6 +356,10 @@ DEFAULT_REWRITE_ALLOW_LIST = {
 }
 
 
+# Bound on the number of rewritten module classes which are kept for reuse
+REWRITTEN_MODULE_CACHE_SIZE = 256
+
+
 def _rewrite(
     mod_to_rewrite: nn.Module,
     allow_list: Optional[Set] = None,
@@ -379,95 +386,147 @@ def _rewrite(
 
         # If m is an already-rewritten RewrittenModule, then use the original base class.
         base_class: Type[nn.Module] = getattr(m, "_base_class_origin", type(m))
+        rewrite = base_class in allow_list
 
-        # Keep track of all the ConditionalExceptionWrappers that the
-        # Acc_Rewriter calls into in this module so we can add them in init
-        # below.
-        all_added_wrappers: Set[Type[Exception]] = set()
-        all_added_bool_wrappers: Set[Type[Exception]] = set()
-
-        # Note: Make this a subclass of our base class.
-        class RewrittenModule(base_class):  # type: ignore[valid-type, misc]
-            # Keep track of the base_class so that symbolic tracing can
-            # determine what kind of module this originally was later on.
-            _base_class_origin = base_class
-            # Add suffix to qualname so it's easier to debug the origin of this module.
-            __qualname__ = f"{base_class.__qualname__}__AccRewrittenModule"
-
-            # Write all of the non-dunder or special methods from base_class
-            # into RewrittenModule.
-            for method_name in dir(base_class):
-                method = getattr(base_class, method_name, None)
-                if method is None and method_name not in {"__doc__"}:
-                    _LOGGER.warning(
-                        f"{__qualname__} does not have attribute {method_name}"
-                    )
-
-                if builtins.type(method) is not FunctionType:
-                    continue
-
-                # Always skip rewriting dunder methods, as they haven't (yet) been
-                # problematic, and modifying them has caused issues previously.
-                if method_name.startswith("__") and method_name.endswith("__"):
-                    continue
-
-                # Only rewrite those Modules explicitly in the allow_list.
-                assert allow_list is not None
-                if base_class not in allow_list:
-                    vars()[method_name] = method
-                else:
-                    (
-                        vars()[method_name],
-                        added_wrappers,
-                        added_bool_wrappers,
-                    ) = Acc_Rewriter().rewrite(method)
-                    all_added_wrappers.update(added_wrappers)
-                    all_added_bool_wrappers.update(added_bool_wrappers)
-
-            def __init__(self, orig):
-                nn.Module.__init__(self)
-
-                # Iterate over all added exception wrappers and add
-                # ConditionalExceptionWrapper attrs for each.
-                for exc_type in all_added_wrappers:
-                    wrapper_name = _get_exception_wrapper_attr_name(exc_type)
-                    assert not hasattr(self, wrapper_name)
-                    setattr(
-                        self,
-                        wrapper_name,
-                        ConditionalExceptionWrapper(exc_type),
-                    )
-
-                for exc_type in all_added_bool_wrappers:
-                    wrapper_name = f"{_get_exception_wrapper_attr_name(exc_type)}_bool"
-                    assert not hasattr(self, wrapper_name)
-                    setattr(
-                        self,
-                        wrapper_name,
-                        ConditionalExceptionBoolCondWrapper(exc_type),
-                    )
-
-                # Recursively rewrite and copy all module attrs of this module.
-                for k, v in orig.__dict__.items():
-                    if k == "_modules":
-                        for mod_k, mod_v in v.items():
-                            if getattr(mod_v, "_base_class_origin", type(mod_v)) in leaf_module_list:  # type: ignore[operator]
-                                _LOGGER.info(
-                                    f"Skip rewriting leaf module {type(mod_v)}"
-                                )
-                                self._modules[mod_k] = mod_v
-                            else:
-                                self._modules[mod_k] = rewrite_module(mod_v)
-                    else:
-                        self.__dict__[k] = v
-
-        # Add suffix to name so it's easier to debug the origin of this module.
-        RewrittenModule.__name__ = f"{base_class.__name__}__AccRewrittenModule"
-        return RewrittenModule(m)
+        methods = _get_rewritable_methods(base_class)
+        source_hash = _get_source_hash(methods) if rewrite else None
+        rewritten_module_class = _get_rewritten_module_class(
+            base_class, rewrite, methods, source_hash
+        )
+        return rewritten_module_class(m, rewrite_submodule)
+
+    def rewrite_submodule(m: nn.Module):
+        if getattr(m, "_base_class_origin", type(m)) in leaf_module_list:  # type: ignore[operator]
+            _LOGGER.info(f"Skip rewriting leaf module {type(m)}")
+            return m
+        return rewrite_module(m)
 
     return rewrite_module(mod_to_rewrite)
 
 
+def _get_rewritable_methods(
+    base_class: Type[nn.Module],
+) -> Tuple[Tuple[str, FunctionType], ...]:
+    """
+    Returns the methods of base_class which are written into its RewrittenModule,
+    i.e. all of the non-dunder or special methods
+    """
+    methods = []
+    for method_name in dir(base_class):
+        method = getattr(base_class, method_name, None)
+        if method is None and method_name not in {"__doc__"}:
+            _LOGGER.warning(
+                f"{base_class.__qualname__} does not have attribute {method_name}"
+            )
+
+        if builtins.type(method) is not FunctionType:
+            continue
+
+        # Always skip rewriting dunder methods, as they haven't (yet) been
+        # problematic, and modifying them has caused issues previously.
+        if method_name.startswith("__") and method_name.endswith("__"):
+            continue
+
+        methods.append((method_name, method))
+
+    return tuple(methods)
+
+
+def _get_source_hash(methods: Tuple[Tuple[str, FunctionType], ...]) -> str:
+    """
+    Returns a hash of the source files of the methods to rewrite. linecache reloads
+    files which changed on disk, so edits to the source are not served from the
+    rewritten module class cache
+    """
+    filenames = {method.__code__.co_filename: method for _, method in methods}
+
+    source_hash = hashlib.sha256()
+    for filename, method in filenames.items():
+        linecache.checkcache(filename)
+        source_hash.update(filename.encode())
+        for line in linecache.getlines(filename, method.__globals__):
+            source_hash.update(line.encode())
+    return source_hash.hexdigest()
+
+
+@functools.lru_cache(maxsize=REWRITTEN_MODULE_CACHE_SIZE)
+def _get_rewritten_module_class(
+    base_class: Type[nn.Module],
+    rewrite: bool,
+    methods: Tuple[Tuple[str, FunctionType], ...],
+    source_hash: Optional[str],
+) -> Type[nn.Module]:
+    """
+    Creates the RewrittenModule class of base_class, with the AST of its methods
+    rewritten if rewrite is set. Classes are memoized by their base class, methods
+    and source hash, since parsing and compiling the methods dominates the cost of
+    rewriting modules which are traced repeatedly
+    """
+    # Keep track of all the ConditionalExceptionWrappers that the
+    # Acc_Rewriter calls into in this module so we can add them in init
+    # below.
+    all_added_wrappers: Set[Type[Exception]] = set()
+    all_added_bool_wrappers: Set[Type[Exception]] = set()
+
+    # Note: Make this a subclass of our base class.
+    class RewrittenModule(base_class):  # type: ignore[valid-type, misc]
+        # Keep track of the base_class so that symbolic tracing can
+        # determine what kind of module this originally was later on.
+        _base_class_origin = base_class
+        # Add suffix to qualname so it's easier to debug the origin of this module.
+        __qualname__ = f"{base_class.__qualname__}__AccRewrittenModule"
+
+        # Write all of the non-dunder or special methods from base_class
+        # into RewrittenModule, rewriting those Modules explicitly in the
+        # allow_list.
+        for method_name, method in methods:
+            if not rewrite:
+                vars()[method_name] = method
+            else:
+                (
+                    vars()[method_name],
+                    added_wrappers,
+                    added_bool_wrappers,
+                ) = Acc_Rewriter().rewrite(method)
+                all_added_wrappers.update(added_wrappers)
+                all_added_bool_wrappers.update(added_bool_wrappers)
+
+        def __init__(self, orig, rewrite_submodule):
+            nn.Module.__init__(self)
+
+            # Iterate over all added exception wrappers and add
+            # ConditionalExceptionWrapper attrs for each.
+            for exc_type in all_added_wrappers:
+                wrapper_name = _get_exception_wrapper_attr_name(exc_type)
+                assert not hasattr(self, wrapper_name)
+                setattr(
+                    self,
+                    wrapper_name,
+                    ConditionalExceptionWrapper(exc_type),
+                )
+
+            for exc_type in all_added_bool_wrappers:
+                wrapper_name = f"{_get_exception_wrapper_attr_name(exc_type)}_bool"
+                assert not hasattr(self, wrapper_name)
+                setattr(
+                    self,
+                    wrapper_name,
+                    ConditionalExceptionBoolCondWrapper(exc_type),
+                )
+
+            # Recursively rewrite and copy all module attrs of this module.
+            for k, v in orig.__dict__.items():
+                if k == "_modules":
+                    for mod_k, mod_v in v.items():
+                        self._modules[mod_k] = rewrite_submodule(mod_v)
+                else:
+                    self.__dict__[k] = v
+
+    # Add suffix to name so it's easier to debug the origin of this module.
+    RewrittenModule.__name__ = f"{base_class.__name__}__AccRewrittenModule"
+    return RewrittenModule
+
+
 def _remove_assertions(gm: torch.fx.GraphModule) -> bool:
     """
     Unconditionally removes all assertions found in GraphModule gm.
@@ -612,6 +671,7 @@ def trace(
     ] = None,
     dont_retrace_gm: bool = False,
     concrete_args: Optional[Dict[str, Any]] = None,
+    use_fake_tensors: bool = False,
 ) -> torch.fx.GraphModule:
     """
     Performs tracing and arg normalization specialized for accelerator lowering.
@@ -664,6 +724,10 @@ def trace(
         dont_retrace_gm (bool): Optional bool for whether to re-trace the provided
                                 module if it's a graph module already.
 
+        use_fake_tensors (bool): Whether to run shape prop on fake tensors, which
+                                    avoids running the model on the sample inputs
+                                    except for ops which cannot run on fake tensors.
+
     """
     if mod.training:
         warnings.warn(
@@ -694,7 +758,7 @@ def trace(
     traced.recompile()
 
     # Run shape prop to add node.meta["type"] to nodes, needed for NormalizeArgs.
-    acc_shape_prop.AccShapeProp(traced).propagate(*sample_inputs)
+    acc_shape_prop.AccShapeProp(traced, use_fake_tensors).propagate(*sample_inputs)
     # Swap out tensor_meta for tensor_rank, because we don't actually want to rely on
     # tensor_meta yet for normalization/lowering, though rank shouldn't change.
     _replace_tensor_meta_with_rank(traced)
@@ -715,6 +779,6 @@ def trace(
     traced.recompile()
 
     # Run shape prop to again to populate tensor_meta after normalize.
-    acc_shape_prop.AccShapeProp(traced).propagate(*sample_inputs)
+    acc_shape_prop.AccShapeProp(traced, use_fake_tensors).propagate(*sample_inputs)
 
     return traced
@@ -1,15 +1,23 @@
-from typing import Any, List, Sequence
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # @manual=//deeplearning/trt/python:py_tensorrt
 import tensorrt as trt
 import torch
 
-from .utils import Frameworks, unified_dtype_converter
+from .utils import Frameworks, supports_profile_sharing, unified_dtype_converter
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
 
 
 class TRTModule(torch.nn.Module):
     def __init__(
-        self, engine=None, input_names=None, output_names=None, cuda_graph_batch_size=-1
+        self,
+        engine=None,
+        input_names=None,
+        output_names=None,
+        cuda_graph_batch_size=-1,
+        num_execution_contexts=1,
     ):
         super(TRTModule, self).__init__()
         self._register_state_dict_hook(TRTModule._on_state_dict)
@@ -17,6 +25,8 @@ class TRTModule(torch.nn.Module):
         self.input_names = input_names
         self.output_names = output_names
         self.cuda_graph_batch_size = cuda_graph_batch_size
+        # Maximum number of execution contexts, which streams beyond it share
+        self.num_execution_contexts = num_execution_contexts
         self.initialized = False
 
         if engine:
@@ -25,6 +35,10 @@ class TRTModule(torch.nn.Module):
     def _initialize(self):
         self.initialized = True
         self.context = self.engine.create_execution_context()
+        self._reset_contexts()
+        self.num_bindings_per_profile = (
+            self.engine.num_bindings // self.engine.num_optimization_profiles
+        )
 
         # Indices of inputs/outputs in the trt engine bindings, in the order
         # as they are in the original PyTorch model.
@@ -39,14 +53,12 @@ class TRTModule(torch.nn.Module):
         primary_input_outputs.update(self.output_binding_indices_in_order)
         self.hidden_output_binding_indices_in_order: Sequence[int] = []
         self.hidden_output_names: Sequence[str] = []
-        for i in range(
-            self.engine.num_bindings // self.engine.num_optimization_profiles
-        ):
+        for i in range(self.num_bindings_per_profile):
             if i not in primary_input_outputs:
                 self.hidden_output_binding_indices_in_order.append(i)
                 self.hidden_output_names.append(self.engine.get_binding_name(i))
 
-        assert (self.engine.num_bindings // self.engine.num_optimization_profiles) == (
+        assert self.num_bindings_per_profile == (
             len(self.input_names)
             + len(self.output_names)
             + len(self.hidden_output_names)
@@ -91,6 +103,84 @@ class TRTModule(torch.nn.Module):
             for idx in self.hidden_output_binding_indices_in_order
         ]
 
+    def _reset_contexts(self):
+        # Execution contexts of the streams the module runs on, and the indices of
+        # their optimization profiles
+        self.contexts: Dict[int, Tuple[Any, int]] = {}
+        # Distinct execution contexts, which are shared by streams once there are
+        # num_execution_contexts of them
+        self.execution_contexts: List[Tuple[Any, int]] = []
+        # Whether the engine lets execution contexts share an optimization profile,
+        # which is only known once a context tries to
+        self.shares_profiles = supports_profile_sharing()
+
+    def _max_execution_contexts(self) -> int:
+        if self.engine.has_implicit_batch_dimension or self.shares_profiles:
+            return max(self.num_execution_contexts, 1)
+        return max(
+            min(self.num_execution_contexts, self.engine.num_optimization_profiles), 1
+        )
+
+    def _get_context(self, stream: int) -> Tuple[Any, int]:
+        """
+        Returns the execution context which runs the engine on the given stream,
+        and the index of its optimization profile. The first stream uses the
+        context created with the module, and contexts for further streams are
+        only created once inputs are run on them, up to num_execution_contexts,
+        or the number of optimization profiles if the engine can't share them.
+        Further streams share the existing contexts.
+        """
+        if stream in self.contexts:
+            return self.contexts[stream]
+
+        if not self.execution_contexts:
+            self.execution_contexts.append((self.context, 0))
+        elif len(self.execution_contexts) < self._max_execution_contexts():
+            context = self._create_context(stream)
+            if context is not None:
+                self.execution_contexts.append(context)
+
+        self.contexts[stream] = self.execution_contexts[
+            len(self.contexts) % len(self.execution_contexts)
+        ]
+        return self.contexts[stream]
+
+    def _create_context(self, stream: int) -> Optional[Tuple[Any, int]]:
+        """
+        Creates an execution context for the given stream, using the next
+        optimization profile the engine was built with or, once these are in use,
+        sharing the first one. Returns None if the engine doesn't allow it
+        """
+        profile_idx = 0
+        if (
+            not self.engine.has_implicit_batch_dimension
+            and len(self.execution_contexts) < self.engine.num_optimization_profiles
+        ):
+            profile_idx = len(self.execution_contexts)
+
+        context = self.engine.create_execution_context()
+        if (
+            context is not None
+            and not self.engine.has_implicit_batch_dimension
+            and not context.set_optimization_profile_async(profile_idx, stream)
+        ):
+            # The engine was built without profile sharing
+            self.shares_profiles = False
+            context = None
+
+        if context is None:
+            _LOGGER.warning(
+                f"Can't create an execution context for stream {stream}, the engine "
+                f"has {self.engine.num_optimization_profiles} optimization profiles "
+                f"for {len(self.execution_contexts) + 1} execution contexts. Running "
+                "on the execution context of another stream."
+            )
+            return None
+
+        if self.context.profiler:
+            context.profiler = self.context.profiler
+        return context, profile_idx
+
     def _check_initialized(self):
         if not self.initialized:
             raise RuntimeError("TRTModule is not initialized.")
@@ -101,6 +191,7 @@ class TRTModule(torch.nn.Module):
         state_dict[prefix + "input_names"] = self.input_names
         state_dict[prefix + "output_names"] = self.output_names
         state_dict[prefix + "cuda_graph_batch_size"] = self.cuda_graph_batch_size
+        state_dict[prefix + "num_execution_contexts"] = self.num_execution_contexts
 
     def _load_from_state_dict(
         self,
@@ -120,12 +211,17 @@ class TRTModule(torch.nn.Module):
 
         self.input_names = state_dict[prefix + "input_names"]
         self.output_names = state_dict[prefix + "output_names"]
+        self.num_execution_contexts = state_dict.get(
+            prefix + "num_execution_contexts", 1
+        )
         self._initialize()
 
     def __getstate__(self):
         state = self.__dict__.copy()
         state["engine"] = bytearray(self.engine.serialize())
         state.pop("context", None)
+        state.pop("contexts", None)
+        state.pop("execution_contexts", None)
         return state
 
     def __setstate__(self, state):
@@ -135,6 +231,7 @@ class TRTModule(torch.nn.Module):
         self.__dict__.update(state)
         if self.engine:
             self.context = self.engine.create_execution_context()
+            self._reset_contexts()
 
     def forward(self, *inputs):
         with torch.autograd.profiler.record_function("TRTModule:Forward"):
@@ -145,13 +242,16 @@ class TRTModule(torch.nn.Module):
                     self.input_names
                 ), f"Wrong number of inputs, expect {len(self.input_names)} get {len(inputs)}."
 
+                stream = torch.cuda.current_stream().cuda_stream
+                context, profile_idx = self._get_context(stream)
+                # Bindings of the optimization profile of the execution context
+                binding_offset = profile_idx * self.num_bindings_per_profile
+
                 # This is only used when the trt engine is using implicit batch dim.
                 batch_size = inputs[0].shape[0]
                 contiguous_inputs: List[torch.Tensor] = [i.contiguous() for i in inputs]
-                bindings: List[Any] = [None] * (
-                    len(self.input_names)
-                    + len(self.output_names)
-                    + len(self.hidden_output_names)
+                bindings: List[Any] = [0] * (
+                    binding_offset + self.num_bindings_per_profile
                 )
 
                 for i, input_name in enumerate(self.input_names):
@@ -162,11 +262,11 @@ class TRTModule(torch.nn.Module):
                         inputs[i].dtype == self.input_dtypes[i]
                     ), f"Dtype mismatch for {i}th input({input_name}). Expect {self.input_dtypes[i]}, got {inputs[i].dtype}."
 
-                    idx = self.input_binding_indices_in_order[i]
+                    idx = binding_offset + self.input_binding_indices_in_order[i]
                     bindings[idx] = contiguous_inputs[i].data_ptr()
 
                     if not self.engine.has_implicit_batch_dimension:
-                        self.context.set_binding_shape(
+                        context.set_binding_shape(
                             idx, tuple(contiguous_inputs[i].shape)
                         )
                     else:
@@ -180,10 +280,11 @@ class TRTModule(torch.nn.Module):
                 outputs: List[torch.Tensor] = []
 
                 for i, idx in enumerate(self.output_binding_indices_in_order):
+                    idx += binding_offset
                     if self.engine.has_implicit_batch_dimension:
                         shape = (batch_size,) + self.output_shapes[i]
                     else:
-                        shape = tuple(self.context.get_binding_shape(idx))
+                        shape = tuple(context.get_binding_shape(idx))
 
                     output = torch.empty(  # type: ignore[call-overload]
                         size=shape,
@@ -194,10 +295,11 @@ class TRTModule(torch.nn.Module):
                     bindings[idx] = output.data_ptr()
 
                 for i, idx in enumerate(self.hidden_output_binding_indices_in_order):
+                    idx += binding_offset
                     if self.engine.has_implicit_batch_dimension:
                         shape = (batch_size,) + self.hidden_output_shapes[i]
                     else:
-                        shape = tuple(self.context.get_binding_shape(idx))
+                        shape = tuple(context.get_binding_shape(idx))
 
                     output = torch.empty(  # type: ignore[call-overload]
                         size=shape,
@@ -208,13 +310,9 @@ class TRTModule(torch.nn.Module):
 
             with torch.autograd.profiler.record_function("TRTModule:TensorRTRuntime"):
                 if self.engine.has_implicit_batch_dimension:
-                    self.context.execute_async(
-                        batch_size, bindings, torch.cuda.current_stream().cuda_stream
-                    )
+                    context.execute_async(batch_size, bindings, stream)
                 else:
-                    self.context.execute_async_v2(
-                        bindings, torch.cuda.current_stream().cuda_stream
-                    )
+                    context.execute_async_v2(bindings, stream)
 
             if len(outputs) == 1:
                 return outputs[0]
@@ -230,6 +328,8 @@ class TRTModule(torch.nn.Module):
 
         if not self.context.profiler:
             self.context.profiler = trt.Profiler() if profiler is None else profiler
+            for context, _ in self.execution_contexts:
+                context.profiler = self.context.profiler
 
     def disable_profiling(self):
         """
@@ -240,6 +340,7 @@ class TRTModule(torch.nn.Module):
         torch.cuda.synchronize()
         del self.context
         self.context = self.engine.create_execution_context()
+        self._reset_contexts()
 
     def get_layer_info(self) -> str:
         """
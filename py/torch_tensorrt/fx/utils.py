@@ -141,6 +141,21 @@ def get_dynamic_dims(shape: Shape) -> List[int]:
     return dynamic_dims
 
 
+def supports_profile_sharing() -> bool:
+    """
+    This function checks whether the installed TensorRT lets several
+    execution contexts of an engine use the same optimization profile,
+    in which case the profiles don't need a replica per execution context.
+
+    Returns:
+        True if optimization profiles can be shared by execution contexts
+    """
+    trt_major_version = int(trt.__version__.split(".")[0])
+    return trt_major_version >= 10 or hasattr(
+        getattr(trt, "PreviewFeature", None), "PROFILE_SHARING_0806"
+    )
+
+
 def proxytensor_trace(mod, inputs):
     mod.eval()
 
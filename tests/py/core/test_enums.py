@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+import torch
+from torch_tensorrt import DeviceType, EngineCapability, dtype, memory_format
+
+import tensorrt as trt
+
+
+class TestEnums(unittest.TestCase):
+    def test_dtype_round_trips(self):
+        for d in (dtype.u8, dtype.i8, dtype.i32, dtype.i64, dtype.f16, dtype.f32):
+            for t in (torch.dtype, trt.DataType, np.dtype):
+                self.assertIs(dtype._from(d.to(t)), d)
+        self.assertIs(dtype._from(np.dtype("float16")), dtype.f16)
+        self.assertIs(dtype.f64.to(np.dtype), np.float64)
+        self.assertIs(dtype.b.to(torch.dtype), torch.bool)
+        self.assertEqual(dtype.bf16.to(trt.DataType), trt.DataType.BF16)
+
+    def test_dtype_unsupported(self):
+        self.assertRaises(TypeError, dtype._from, torch.complex64)
+        self.assertIs(dtype._from(torch.complex64, use_default=True), dtype.float)
+        self.assertRaises(TypeError, dtype.f64.to, trt.DataType)
+        self.assertEqual(
+            dtype.f64.to(trt.DataType, use_default=True), trt.DataType.FLOAT
+        )
+        self.assertRaises(TypeError, dtype.bf16.to, np.dtype)
+        self.assertIsNone(dtype.try_from("float"))
+        self.assertRaises(TypeError, dtype.f32.to, str)
+
+    def test_dtype_equality(self):
+        self.assertEqual(dtype.float, torch.float32)
+        self.assertEqual(dtype.half, trt.DataType.HALF)
+        self.assertEqual(dtype.long, np.int64)
+        self.assertNotEqual(dtype.int32, torch.int64)
+        self.assertEqual(len({dtype.f32, dtype.float, dtype.float32}), 1)
+
+    def test_memory_format_round_trips(self):
+        for f in (torch.contiguous_format, torch.channels_last):
+            self.assertEqual(memory_format._from(f).to(torch.memory_format), f)
+        for f in memory_format:
+            self.assertIs(memory_format._from(f.to(trt.TensorFormat)), f)
+        self.assertRaises(TypeError, memory_format._from, torch.preserve_format)
+
+    def test_device_type_and_engine_capability_round_trips(self):
+        for d in (DeviceType.GPU, DeviceType.DLA):
+            self.assertIs(DeviceType._from(d.to(trt.DeviceType)), d)
+        self.assertRaises(ValueError, DeviceType.UNKNOWN.to, trt.DeviceType)
+        self.assertEqual(
+            DeviceType.UNKNOWN.to(trt.DeviceType, use_default=True),
+            trt.DeviceType.GPU,
+        )
+        for c in EngineCapability:
+            self.assertIs(EngineCapability._from(c.to(trt.EngineCapability)), c)
+        self.assertEqual(EngineCapability.STANDARD, trt.EngineCapability.STANDARD)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import json
+import logging
+import subprocess
+import sys
+import textwrap
+import unittest
+
+# Modules which are only needed to compile models, and so are loaded on first use
+DEFERRED_MODULES = [
+    "torch._dynamo",
+    "torch_tensorrt.ts",
+    "torch_tensorrt.fx",
+    "torch_tensorrt.dynamo",
+    "torch_tensorrt._compile",
+    "torch_tensorrt.dynamo.conversion.aten_ops_converters",
+]
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+def run_in_subprocess(code: str):
+    """Runs the code in a fresh interpreter and returns the JSON it prints"""
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestImport(unittest.TestCase):
+    def test_deferred_modules(self):
+        result = run_in_subprocess(
+            """
+            import json, sys, time
+            import torch
+
+            start = time.perf_counter()
+            import torch_tensorrt
+            import_time = time.perf_counter() - start
+
+            print(json.dumps({"import_time": import_time, "modules": list(sys.modules)}))
+            """
+        )
+        # The import time varies with the machine, so it is only logged
+        _LOGGER.info(f"import torch_tensorrt took {result['import_time']:.3f}s")
+
+        loaded = [m for m in DEFERRED_MODULES if m in result["modules"]]
+        self.assertEqual(
+            loaded, [], f"Modules {loaded} were loaded by import torch_tensorrt"
+        )
+
+    def test_lazy_attributes(self):
+        result = run_in_subprocess(
+            """
+            import json
+            import torch_tensorrt
+
+            print(json.dumps({
+                "compile": torch_tensorrt.compile.__module__,
+                "load": torch_tensorrt.load.__module__,
+                "dynamo": torch_tensorrt.dynamo.__name__,
+                "dir": "dynamo" in dir(torch_tensorrt),
+            }))
+            """
+        )
+        self.assertEqual(result["compile"], "torch_tensorrt._compile")
+        self.assertEqual(result["load"], "torch_tensorrt._compile")
+        self.assertEqual(result["dynamo"], "torch_tensorrt.dynamo")
+        self.assertTrue(result["dir"])
+
+    def test_converters_loaded_on_first_lookup(self):
+        result = run_in_subprocess(
+            """
+            import json, sys
+            import torch
+            from torch_tensorrt.dynamo.conversion import DYNAMO_CONVERTERS
+
+            converters = "torch_tensorrt.dynamo.conversion.aten_ops_converters"
+            loaded_before = converters in sys.modules
+            found = torch.ops.aten.add.Tensor in DYNAMO_CONVERTERS
+
+            print(json.dumps({
+                "loaded_before": loaded_before,
+                "loaded_after": converters in sys.modules,
+                "found": found,
+            }))
+            """
+        )
+        self.assertFalse(result["loaded_before"])
+        self.assertTrue(result["loaded_after"])
+        self.assertTrue(result["found"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 import torch
 from parameterized import parameterized
-from torch.testing._internal.common_utils import run_tests
+from torch.testing._internal.common_utils import TestCase, run_tests
 from torch_tensorrt import Input
+from torch_tensorrt.dynamo import CompilationSettings
+from torch_tensorrt.dynamo.conversion import TRTInterpreter
+from torch_tensorrt.dynamo.conversion.impl.pool import adaptive_avg_pool_weights
 
 from .harness import DispatchTestCase
 
@@ -61,6 +64,10 @@ class TestAdaptiveAvgPoolConverter(DispatchTestCase):
                 (2, 2, 32),
                 (64,),
             ),
+            (
+                (1, 2, 4096),
+                (100,),
+            ),
         ]
     )
     def test_adaptive_avg_pool1d(
@@ -295,6 +302,74 @@ class TestAdaptiveAvgPoolConverter(DispatchTestCase):
             input_specs,
         )
 
+    @parameterized.expand(
+        [
+            ("1d", torch.ops.aten.adaptive_avg_pool1d.default, (1, 2, 4096), (100,), 4),
+            (
+                "2d",
+                torch.ops.aten.adaptive_avg_pool2d.default,
+                (1, 3, 224, 224),
+                (7, 9),
+                8,
+            ),
+            (
+                "3d",
+                torch.ops.aten.adaptive_avg_pool3d.default,
+                (1, 2, 30, 31, 32),
+                (7, 8, 9),
+                14,
+            ),
+        ]
+    )
+    def test_adaptive_avg_pool_layer_count(
+        self, _, op, input_shape, output_size, max_layers
+    ):
+        class TestModule(torch.nn.Module):
+            def forward(self, x):
+                return op(x, output_size)
+
+        inputs = [torch.randn(input_shape)]
+        mod = self.generate_graph(
+            TestModule(), inputs, use_dynamo_tracer=False, enable_passes=True
+        )
+        interp = TRTInterpreter(
+            mod,
+            [Input.from_tensor(i) for i in inputs],
+            compilation_settings=CompilationSettings(),
+        )
+        interp.run()
+
+        # The number of layers must not depend on the number of pooling windows
+        self.assertLessEqual(interp.ctx.net.num_layers, max_layers)
+
+
+class TestAdaptiveAvgPoolWeights(TestCase):
+    @parameterized.expand(
+        [
+            ((1, 2, 4096), (100,)),
+            ((2, 3, 17), (5,)),
+            ((2, 3, 5), (17,)),
+            ((1, 3, 13, 9), (4, 6)),
+            ((1, 2, 7, 10, 11), (3, 4, 5)),
+        ]
+    )
+    def test_adaptive_avg_pool_weights(self, input_shape, output_size):
+        x = torch.randn(input_shape, dtype=torch.float64)
+        out = x
+        for i, out_dim in enumerate(output_size):
+            axis = len(input_shape) - len(output_size) + i
+            weights = torch.from_numpy(
+                adaptive_avg_pool_weights(input_shape[axis], out_dim)
+            ).double()
+            out = torch.movedim(torch.movedim(out, axis, -1) @ weights, -1, axis)
+
+        pool = (
+            torch.nn.functional.adaptive_avg_pool1d,
+            torch.nn.functional.adaptive_avg_pool2d,
+            torch.nn.functional.adaptive_avg_pool3d,
+        )[len(output_size) - 1]
+        torch.testing.assert_close(out, pool(x, output_size))
+
 
 if __name__ == "__main__":
     run_tests()
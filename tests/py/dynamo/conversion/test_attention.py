@@ -3,7 +3,8 @@ import unittest
 import torch
 import torch.nn as nn
 from parameterized import parameterized
-from torch.testing._internal.common_utils import run_tests
+from torch.testing._internal.common_utils import TestCase, run_tests
+from torch_tensorrt.dynamo.conversion.impl.attention import causal_mask_indices
 
 from ..testing_utilities import DECIMALS_OF_AGREEMENT
 from .harness import DispatchTestCase
@@ -40,6 +41,89 @@ class TestScaledDotProductAttention(DispatchTestCase):
         inputs.extend([query, key, value])
         self.run_test(SDPA(), inputs, rtol=1e-2, atol=1e-2, precision=torch.float16)
 
+    @parameterized.expand(
+        [
+            ("query_longer", (2, 4, 96, 64), (2, 4, 32, 64)),
+            ("key_longer", (2, 4, 32, 64), (2, 4, 96, 64)),
+        ]
+    )
+    def test_sdpa_causal_unequal_lengths(self, _, query_shape, key_shape):
+        class SDPA(nn.Module):
+            def forward(self, query, key, value):
+                return torch.nn.functional.scaled_dot_product_attention(
+                    query, key, value, None, 0.0, True, scale=None
+                )
+
+        query = torch.randn(query_shape, dtype=torch.float16)
+        key = torch.rand(key_shape, dtype=torch.float16)
+        value = torch.rand(key_shape, dtype=torch.float16)
+        self.run_test(
+            SDPA(),
+            [query, key, value],
+            rtol=1e-2,
+            atol=1e-2,
+            precision=torch.float16,
+        )
+
+    @parameterized.expand(
+        [
+            ("bool_full", torch.bool, (2, 4, 128, 128)),
+            ("bool_broadcast", torch.bool, (128, 128)),
+            ("float_full", torch.float16, (2, 4, 128, 128)),
+            ("float_broadcast", torch.float16, (1, 4, 1, 128)),
+        ]
+    )
+    def test_sdpa_attn_mask(self, _, mask_dtype, mask_shape):
+        class SDPA(nn.Module):
+            def forward(self, query, key, value, attn_mask):
+                return torch.nn.functional.scaled_dot_product_attention(
+                    query, key, value, attn_mask, 0.0, False, scale=None
+                )
+
+        shape = (2, 4, 128, 64)
+        if mask_dtype == torch.bool:
+            # Every query attends to at least one key, to avoid rows of NaN
+            attn_mask = torch.rand(mask_shape) > 0.5
+            attn_mask[..., 0] = True
+        else:
+            attn_mask = torch.randn(mask_shape, dtype=mask_dtype)
+
+        inputs = [
+            torch.randn(shape, dtype=torch.float16),
+            torch.rand(shape, dtype=torch.float16),
+            torch.rand(shape, dtype=torch.float16),
+            attn_mask,
+        ]
+        self.run_test(SDPA(), inputs, rtol=1e-2, atol=1e-2, precision=torch.float16)
+
+    def test_sdpa_fusion_report(self):
+        class SDPA(nn.Module):
+            def forward(self, query, key, value):
+                return torch.nn.functional.scaled_dot_product_attention(
+                    query, key, value, None, 0.0, True, scale=None
+                )
+
+        # Attention in float32 is not fused, which is reported during conversion
+        inputs = [torch.randn(2, 4, 32, 64) for _ in range(3)]
+        with self.assertLogs(
+            "torch_tensorrt.dynamo.conversion.impl.attention", level="INFO"
+        ) as logs:
+            self.run_test(SDPA(), inputs, rtol=1e-2, atol=1e-2)
+
+        self.assertIn("not float16 or bfloat16", "\n".join(logs.output))
+
+
+class TestCausalMaskIndices(TestCase):
+    @parameterized.expand([(1, 1), (7, 7), (5, 12), (12, 5)])
+    def test_causal_mask_indices(self, L, S):
+        key_positions, query_positions = causal_mask_indices(L, S, 4)
+        self.assertEqual(key_positions.shape, (1, 1, 1, S))
+        self.assertEqual(query_positions.shape, (1, 1, L, 1))
+
+        causal_mask = torch.from_numpy(key_positions < query_positions)
+        expected = torch.ones(L, S, dtype=torch.bool).tril(diagonal=0)
+        torch.testing.assert_close(causal_mask[0, 0], expected)
+
 
 @unittest.skipIf(
     torch.cuda.get_device_properties(torch.cuda.current_device()).major < 8,
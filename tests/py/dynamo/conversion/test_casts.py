@@ -2,9 +2,15 @@
 
 import torch
 import torch.nn as nn
-from torch.testing._internal.common_utils import run_tests
-from torch_tensorrt import dtype
-from torch_tensorrt.dynamo.conversion import UnsupportedOperatorException
+from torch.fx.experimental.proxy_tensor import make_fx
+from torch.testing._internal.common_utils import TestCase, run_tests
+from torch_tensorrt import Input, dtype
+from torch_tensorrt.dynamo import CompilationSettings
+from torch_tensorrt.dynamo.conversion import (
+    TRTInterpreter,
+    UnsupportedOperatorException,
+)
+from torch_tensorrt.dynamo.conversion.dtype_planning import PLANNED_DTYPE, plan_dtypes
 
 from .harness import DispatchTestCase
 
@@ -93,5 +99,92 @@ class TestToCopyConverter(DispatchTestCase):
         )
 
 
+class TestCastReuse(DispatchTestCase):
+    def test_int_div_casts_reused(self):
+        class IntDivs(nn.Module):
+            def forward(self, x, y):
+                return torch.ops.aten.div.Tensor(x, y) + torch.ops.aten.div.Tensor(x, y)
+
+        inputs = [
+            torch.randint(1, 10, (2, 3), dtype=torch.int32),
+            torch.randint(1, 10, (2, 3), dtype=torch.int32),
+        ]
+        self.run_test(IntDivs(), inputs)
+
+        mod = self.generate_graph(
+            IntDivs(), inputs, use_dynamo_tracer=False, enable_passes=False
+        )
+        interp = TRTInterpreter(
+            mod,
+            [Input.from_tensor(i) for i in inputs],
+            compilation_settings=CompilationSettings(),
+        )
+        interp.run()
+
+        # Both divisions use the same float casts of x and y
+        self.assertEqual(interp.cast_layers, 2)
+
+    def test_constant_created_in_planned_dtype(self):
+        class AddOffset(nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.register_buffer("offset", torch.tensor([1, 2, 3]))
+
+            def forward(self, x):
+                return torch.eq(x + self.offset, 3)
+
+        inputs = [torch.randint(0, 5, (2, 3), dtype=torch.int32)]
+        self.run_test(AddOffset(), inputs, use_dynamo_tracer=True)
+
+        mod = self.generate_graph(
+            AddOffset(), inputs, use_dynamo_tracer=True, enable_passes=False
+        )
+        interp = TRTInterpreter(
+            mod,
+            [Input.from_tensor(i) for i in inputs],
+            compilation_settings=CompilationSettings(),
+        )
+        interp.run()
+
+        # The int64 offset is created as int32, instead of casting x to int64
+        self.assertEqual(interp.cast_layers, 0)
+        self.assertEqual(interp.ctx.skipped_casts, 1)
+
+
+class TestDtypePlanning(TestCase):
+    def test_planned_dtypes(self):
+        def fn(x, y, z):
+            return (
+                torch.ops.aten.add.Tensor(x, 2.5),
+                torch.ops.aten.div.Tensor(x, y),
+                torch.ops.aten.eq.Tensor(x, y.to(torch.int64)),
+                torch.ops.aten.mul.Tensor(z, 2),
+                torch.ops.aten.clamp.default(x, 0, 1),
+            )
+
+        gm = make_fx(fn)(
+            torch.ones(2, dtype=torch.int32),
+            torch.ones(2, dtype=torch.int32),
+            torch.ones(2, dtype=torch.float64),
+        )
+        self.assertEqual(plan_dtypes(gm, CompilationSettings(truncate_double=True)), 4)
+
+        planned_dtypes = {
+            node.target: node.meta.get(PLANNED_DTYPE) for node in gm.graph.nodes
+        }
+        self.assertEqual(planned_dtypes[torch.ops.aten.add.Tensor], torch.float32)
+        self.assertEqual(planned_dtypes[torch.ops.aten.div.Tensor], torch.float32)
+        self.assertEqual(planned_dtypes[torch.ops.aten.eq.Tensor], torch.int64)
+        self.assertEqual(planned_dtypes[torch.ops.aten.mul.Tensor], torch.float32)
+        self.assertIsNone(planned_dtypes[torch.ops.aten.clamp.default])
+
+        # Doubles are only planned if they are truncated
+        plan_dtypes(gm, CompilationSettings(truncate_double=False))
+        planned_dtypes = {
+            node.target: node.meta.get(PLANNED_DTYPE) for node in gm.graph.nodes
+        }
+        self.assertIsNone(planned_dtypes[torch.ops.aten.mul.Tensor])
+
+
 if __name__ == "__main__":
     run_tests()
@@ -64,6 +64,22 @@ class TestCatConverter(DispatchTestCase):
             inputs,
         )
 
+    def test_cat_constants_output(self):
+        class Cat(nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.register_buffer("a", torch.randn(2, 3))
+                self.register_buffer("b", torch.randn(1, 3))
+
+            def forward(self, x):
+                return torch.ops.aten.cat.default((self.a, self.b)), x + 1
+
+        inputs = [torch.randn(2, 3)]
+        self.run_test(
+            Cat(),
+            inputs,
+        )
+
     def test_cat_dynamic_shape_no_dim(self):
         class Cat(nn.Module):
             def forward(self, x, y):
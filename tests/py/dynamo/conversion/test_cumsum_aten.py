@@ -1,7 +1,12 @@
 import torch
 import torch.nn as nn
 from parameterized import parameterized
-from torch.testing._internal.common_utils import run_tests
+from torch.testing._internal.common_utils import TestCase, run_tests
+from torch_tensorrt import Input, dtype
+from torch_tensorrt.dynamo.conversion.impl.slice import (
+    CUMSUM_MATMUL_MAX_LENGTH,
+    cumsum_strategy,
+)
 
 from .harness import DispatchTestCase
 
@@ -64,6 +69,76 @@ class TestCumsumConverter(DispatchTestCase):
             inputs,
         )
 
+    @parameterized.expand(
+        [
+            ((2, 4096), -1, torch.float32),
+            ((3, 2000, 2), 1, torch.float32),
+            ((4, 300), 1, torch.int32),
+            ((5, 2, 3), 0, torch.int32),
+        ]
+    )
+    def test_cumsum_long_and_integer(self, shape, dim, input_dtype):
+        class Cumsum(nn.Module):
+            def forward(self, x):
+                return torch.ops.aten.cumsum.default(x, dim)
+
+        if input_dtype == torch.int32:
+            inputs = [torch.randint(-10, 10, shape, dtype=input_dtype)]
+        else:
+            inputs = [torch.rand(shape, dtype=input_dtype)]
+        self.run_test(
+            Cumsum(),
+            inputs,
+            rtol=1e-2,
+            atol=1e-2,
+            check_dtype=False,
+        )
+
+    @parameterized.expand(
+        [
+            ((1, 16), (4, 16), (8, 16), 1),
+            ((1, 2048), (4, 2048), (8, 2048), -1),
+            ((1, 3, 2000), (2, 3, 2000), (4, 3, 2000), 2),
+        ]
+    )
+    def test_cumsum_dynamic_batch(self, min_shape, opt_shape, max_shape, dim):
+        class Cumsum(nn.Module):
+            def forward(self, x):
+                return torch.ops.aten.cumsum.default(x, dim)
+
+        input_specs = [
+            Input(
+                min_shape=min_shape,
+                opt_shape=opt_shape,
+                max_shape=max_shape,
+                dtype=torch.float32,
+            ),
+        ]
+        self.run_test_with_dynamic_shape(
+            Cumsum(),
+            input_specs,
+            rtol=1e-2,
+            atol=1e-2,
+        )
+
+
+class TestCumsumStrategy(TestCase):
+    @parameterized.expand(
+        [
+            (-1, dtype.f32, "loop"),
+            (-1, dtype.i32, "loop"),
+            (1, dtype.f32, "matmul"),
+            (CUMSUM_MATMUL_MAX_LENGTH, dtype.f16, "matmul"),
+            (CUMSUM_MATMUL_MAX_LENGTH, dtype.bf16, "matmul"),
+            (CUMSUM_MATMUL_MAX_LENGTH + 1, dtype.f32, "scan"),
+            (8192, dtype.f16, "scan"),
+            (16, dtype.i32, "scan"),
+            (16, dtype.i64, "scan"),
+        ]
+    )
+    def test_cumsum_strategy(self, length, input_dtype, expected):
+        self.assertEqual(cumsum_strategy(length, input_dtype), expected)
+
 
 if __name__ == "__main__":
     run_tests()
@@ -1,6 +1,8 @@
+import numpy as np
 import torch
 from parameterized import param, parameterized
-from torch.testing._internal.common_utils import run_tests
+from torch.testing._internal.common_utils import TestCase, run_tests
+from torch_tensorrt.dynamo.conversion.impl.embedding import embedding_bag_gather_indices
 
 from .harness import DispatchTestCase
 
@@ -110,6 +112,30 @@ class TestEmbeddingBagConverter(DispatchTestCase):
                 include_last_offset=False,
                 padding_idx=-1,
             ),
+            param(
+                test_name="1d_indices_many_bags",
+                weight=torch.randn((100, 8), dtype=torch.float32),
+                indices=torch.randint(0, 100, (2048,), dtype=torch.int32),
+                offsets=torch.arange(0, 2048, 4, dtype=torch.int32),
+                scale_grad_by_freq=False,
+                mode=2,
+                sparse=False,
+                per_sample_weights=None,
+                include_last_offset=False,
+                padding_idx=-1,
+            ),
+            param(
+                test_name="1d_indices_uneven_bags",
+                weight=torch.randn((100, 8), dtype=torch.float16),
+                indices=torch.randint(0, 100, (2048,), dtype=torch.int32),
+                offsets=torch.tensor([0, 1, 2, 2, 3, 7, 1500], dtype=torch.int32),
+                scale_grad_by_freq=False,
+                mode=2,
+                sparse=False,
+                per_sample_weights=None,
+                include_last_offset=False,
+                padding_idx=-1,
+            ),
         ]
     )
     def test_embedding_bag_with_traversable_offsets(
@@ -406,5 +432,45 @@ class TestEmbeddingBagConverter(DispatchTestCase):
         )
 
 
+class TestEmbeddingBagGatherIndices(TestCase):
+    def test_gather_indices(self):
+        # Bags of sizes 3, 0, 1 and 8, in buckets of sizes up to 4, 1 and 8
+        bounds = np.array([0, 3, 3, 4, 12])
+        bucket_indices, bag_rows, bag_sizes = embedding_bag_gather_indices(bounds, 12)
+
+        # The empty bag only gathers the padding position 12
+        self.assertEqual(len(bucket_indices), 3)
+        np.testing.assert_array_equal(bucket_indices[0], [[12], [3]])
+        np.testing.assert_array_equal(bucket_indices[1], [[0, 1, 2]])
+        np.testing.assert_array_equal(bucket_indices[2], [list(range(4, 12))])
+        np.testing.assert_array_equal(bag_rows, [2, 0, 1, 3])
+        np.testing.assert_array_equal(bag_sizes, [3, 0, 1, 8])
+
+    def test_gather_indices_padding(self):
+        # Bags of sizes 2, 3, 3 and 4, the bags of size 3 are padded to 4
+        bounds = np.array([0, 2, 5, 8, 12])
+        bucket_indices, bag_rows, bag_sizes = embedding_bag_gather_indices(bounds, 12)
+
+        self.assertEqual(len(bucket_indices), 2)
+        np.testing.assert_array_equal(bucket_indices[0], [[0, 1]])
+        np.testing.assert_array_equal(
+            bucket_indices[1], [[2, 3, 4, 12], [5, 6, 7, 12], [8, 9, 10, 11]]
+        )
+        np.testing.assert_array_equal(bag_rows, [0, 1, 2, 3])
+        np.testing.assert_array_equal(bag_sizes, [2, 3, 3, 4])
+
+    def test_gather_indices_uneven_bags(self):
+        # One long bag among many short ones
+        bounds = np.array([0, *range(1, 1000), 1000, 5000])
+        bucket_indices, bag_rows, bag_sizes = embedding_bag_gather_indices(bounds, 5000)
+
+        # Padding every bag to the longest one would gather 1001 * 4000 embeddings
+        self.assertLessEqual(
+            sum(indices.size for indices in bucket_indices),
+            2 * 5000 + len(bag_sizes),
+        )
+        self.assertEqual(sorted(bag_rows), list(range(len(bag_sizes))))
+
+
 if __name__ == "__main__":
     run_tests()
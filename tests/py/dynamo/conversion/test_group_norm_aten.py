@@ -1,6 +1,13 @@
 import torch
-from torch.testing._internal.common_utils import run_tests
+from parameterized import parameterized
+from torch.fx.experimental.proxy_tensor import make_fx
+from torch.testing._internal.common_utils import TestCase, run_tests
 from torch_tensorrt import Input
+from torch_tensorrt.dynamo import CompilationSettings
+from torch_tensorrt.dynamo.conversion import TRTInterpreter
+from torch_tensorrt.dynamo.conversion.aten_ops_converters import (
+    group_norm_validator,
+)
 
 from .harness import DispatchTestCase
 
@@ -43,6 +50,46 @@ class TestGroupNormConverter(DispatchTestCase):
                 inputs,
             )
 
+    def test_groupnorm_affine(self):
+        weight, bias = torch.randn((8,)), torch.randn((8,))
+
+        class GroupNorm(torch.nn.Module):
+            def forward(self, x):
+                return torch.ops.aten.group_norm.default(
+                    x, 4, weight, bias, 1e-05, True
+                )
+
+        inputs = [torch.randn(2, 8, 5, 6, 7)]
+        self.run_test(
+            GroupNorm(),
+            inputs,
+        )
+
+    def test_groupnorm_dynamic_shape(self):
+        class GroupNorm(torch.nn.Module):
+            def forward(self, x):
+                return torch.ops.aten.group_norm.default(
+                    x,
+                    2,
+                    torch.ones((6,)),
+                    torch.zeros((6,)),
+                    1e-05,
+                    True,
+                )
+
+        input_specs = [
+            Input(
+                min_shape=(1, 6, 4, 4),
+                opt_shape=(2, 6, 16, 16),
+                max_shape=(4, 6, 32, 32),
+                dtype=torch.float32,
+            ),
+        ]
+        self.run_test_with_dynamic_shape(
+            GroupNorm(),
+            input_specs,
+        )
+
 
 class TestNativeGroupNormConverter(DispatchTestCase):
     def test_groupnorm1d(self):
@@ -86,6 +133,84 @@ class TestNativeGroupNormConverter(DispatchTestCase):
                 inputs,
             )
 
+    def test_groupnorm_mean_rstd(self):
+        weight, bias = torch.randn((6,)), torch.randn((6,))
+
+        class GroupNorm(torch.nn.Module):
+            def forward(self, x):
+                return torch.ops.aten.native_group_norm.default(
+                    x,
+                    weight,
+                    bias,
+                    3,
+                    6,
+                    16 * 16,
+                    2,
+                    1e-05,
+                )
+
+        inputs = [torch.randn(3, 6, 16, 16)]
+        self.run_test(
+            GroupNorm(),
+            inputs,
+        )
+
+    def _count_layers(self, module, inputs):
+        mod = self.generate_graph(module, inputs, use_dynamo_tracer=False)
+        interp = TRTInterpreter(
+            mod,
+            [Input.from_tensor(i) for i in inputs],
+            compilation_settings=CompilationSettings(),
+        )
+        interp.run()
+        return interp.ctx.net.num_layers
+
+    def test_groupnorm_layer_count(self):
+        weight, bias = torch.randn((32,)), torch.randn((32,))
+
+        class GroupNorm(torch.nn.Module):
+            def __init__(self, return_mean_rstd):
+                super().__init__()
+                self.return_mean_rstd = return_mean_rstd
+
+            def forward(self, x):
+                outputs = torch.ops.aten.native_group_norm.default(
+                    x, weight, bias, 2, 32, 16 * 16, 8, 1e-05
+                )
+                return outputs if self.return_mean_rstd else outputs[0]
+
+        inputs = [torch.randn(2, 32, 16, 16)]
+        native_layers = self._count_layers(GroupNorm(False), inputs)
+        decomposed_layers = self._count_layers(GroupNorm(True), inputs)
+
+        # The normalization layer, its scale and shift constants, and the constants
+        # and elementwise layers applying the weight and bias
+        self.assertLessEqual(native_layers, 7)
+        self.assertLess(native_layers, decomposed_layers)
+
+
+class TestGroupNormValidator(TestCase):
+    @parameterized.expand(
+        [
+            ("static_channels", "fake", True),
+            ("dynamic_channels", "symbolic", False),
+        ]
+    )
+    def test_group_norm_validator(self, _, tracing_mode, supported):
+        def group_norm(x):
+            N, C, H, W = x.shape
+            return torch.ops.aten.native_group_norm.default(
+                x, None, None, N, C, H * W, 2, 1e-05
+            )[0]
+
+        gm = make_fx(group_norm, tracing_mode=tracing_mode)(torch.randn(2, 6, 4, 4))
+        (node,) = [
+            node
+            for node in gm.graph.nodes
+            if node.target == torch.ops.aten.native_group_norm.default
+        ]
+        self.assertEqual(group_norm_validator(node), supported)
+
 
 if __name__ == "__main__":
     run_tests()
@@ -1,10 +1,44 @@
+import numpy as np
 import torch
 import torch.nn as nn
-from torch.testing._internal.common_utils import run_tests
+from parameterized import param, parameterized
+from torch.testing._internal.common_utils import TestCase, run_tests
+from torch_tensorrt import Input
+from torch_tensorrt.dynamo import CompilationSettings
+from torch_tensorrt.dynamo.conversion import TRTInterpreter
+from torch_tensorrt.dynamo.conversion.impl.select import (
+    index_nd_indices,
+    index_output_permutation,
+)
 
 from .harness import DispatchTestCase
 
 
+# Input shape, indexed dimensions and the shapes of their (broadcast) indices
+BROADCAST_INDEX_CASES = [
+    param("leading", (8, 6, 5), (0, 1), ((4, 1), (3,))),
+    param("trailing", (2, 8, 6, 5), (2, 3), ((3, 1, 1), (2, 4))),
+    param("middle", (3, 8, 6, 5, 2), (1, 2, 3), ((4,), (2, 1), (1, 4))),
+    param("non_consecutive", (8, 3, 6, 2), (0, 2), ((2, 3), (3,))),
+    param("many_indices", (2, 64, 3, 48), (1, 3), ((256, 1), (1, 16))),
+]
+
+
+def _random_indices(input_shape, dims, index_shapes):
+    # Negative indices are included to cover wrapping
+    return [
+        torch.randint(-input_shape[dim], input_shape[dim], index_shape)
+        for dim, index_shape in zip(dims, index_shapes)
+    ]
+
+
+def _full_indices(rank, dims, indices):
+    full = [None] * rank
+    for dim, ind in zip(dims, indices):
+        full[dim] = ind
+    return full
+
+
 class TestIndexConverter(DispatchTestCase):
     def test_index_zero_two_dim(self):
         class TestModule(nn.Module):
@@ -183,6 +217,105 @@ class TestIndexConverter(DispatchTestCase):
             input,
         )
 
+    @parameterized.expand(BROADCAST_INDEX_CASES)
+    def test_index_broadcast_constant(self, _, input_shape, dims, index_shapes):
+        class TestModule(nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.indices = _random_indices(input_shape, dims, index_shapes)
+
+            def forward(self, x):
+                indices = _full_indices(len(input_shape), dims, self.indices)
+                return torch.ops.aten.index.Tensor(x, indices)
+
+        self.run_test(TestModule(), [torch.randn(input_shape)])
+
+    @parameterized.expand(BROADCAST_INDEX_CASES)
+    def test_index_broadcast_ITensor(self, _, input_shape, dims, index_shapes):
+        class TestModule(nn.Module):
+            def forward(self, x, *indices):
+                indices = _full_indices(len(input_shape), dims, indices)
+                return torch.ops.aten.index.Tensor(x, indices)
+
+        # Indices computed in the graph are not wrapped, so they are non-negative
+        indices = [
+            torch.randint(0, input_shape[dim], index_shape, dtype=torch.int32)
+            for dim, index_shape in zip(dims, index_shapes)
+        ]
+        self.run_test(TestModule(), [torch.randn(input_shape), *indices])
+
+    @parameterized.expand(
+        [
+            ("constant", True, 4),
+            ("ITensor", False, 14),
+        ]
+    )
+    def test_index_layer_count(self, _, constant_indices, max_layers):
+        input_shape = (4, 64, 3, 48, 5)
+        dims = (1, 2, 3)
+        index_shapes = ((256, 1), (1, 16), (16,))
+        indices = [
+            torch.randint(0, input_shape[dim], index_shape, dtype=torch.int32)
+            for dim, index_shape in zip(dims, index_shapes)
+        ]
+
+        class TestModule(nn.Module):
+            def forward(self, x, *runtime_indices):
+                full = _full_indices(
+                    len(input_shape),
+                    dims,
+                    indices if constant_indices else runtime_indices,
+                )
+                return torch.ops.aten.index.Tensor(x, full)
+
+        inputs = [torch.randn(input_shape)] + ([] if constant_indices else indices)
+        mod = self.generate_graph(TestModule(), inputs, use_dynamo_tracer=False)
+        interp = TRTInterpreter(
+            mod,
+            [Input.from_tensor(i) for i in inputs],
+            compilation_settings=CompilationSettings(),
+        )
+        interp.run()
+
+        # The number of layers must not depend on the number or size of the indices
+        self.assertLessEqual(interp.ctx.net.num_layers, max_layers)
+
+
+class TestIndexHelpers(TestCase):
+    @parameterized.expand(BROADCAST_INDEX_CASES)
+    def test_index_nd_indices(self, _, input_shape, dims, index_shapes):
+        x = torch.randn(input_shape)
+        indices = _random_indices(input_shape, dims, index_shapes)
+        expected = x[
+            tuple(
+                slice(None) if ind is None else ind
+                for ind in _full_indices(len(input_shape), dims, indices)
+            )
+        ]
+
+        # Emulate the ND gather on the input with its indexed dimensions in front
+        remaining = [i for i in range(len(input_shape)) if i not in dims]
+        transposed = x.permute(list(dims) + remaining)
+        nd_indices = torch.from_numpy(
+            index_nd_indices(
+                [ind.numpy() for ind in indices],
+                [input_shape[dim] for dim in dims],
+            )
+        ).long()
+        gathered = transposed[tuple(nd_indices.unbind(-1))]
+        permutation = index_output_permutation(
+            len(input_shape), dims, nd_indices.dim() - 1
+        )
+        torch.testing.assert_close(gathered.permute(permutation), expected)
+
+    def test_index_nd_indices_dtype(self):
+        nd_indices = index_nd_indices(
+            [np.array([[0], [-1]]), np.array([1, -2, 2])], [4, 3]
+        )
+        self.assertEqual(nd_indices.dtype, np.int32)
+        self.assertEqual(nd_indices.shape, (2, 3, 2))
+        np.testing.assert_array_equal(nd_indices[1, 1], [3, 1])
+
 
 if __name__ == "__main__":
     run_tests()
@@ -2,6 +2,7 @@
 import torch
 from parameterized import parameterized
 from torch.testing._internal.common_utils import run_tests
+from torch_tensorrt import Input
 
 from .harness import DispatchTestCase
 
@@ -237,6 +238,33 @@ class TestPadConverter(DispatchTestCase):
             input,
         )
 
+    @parameterized.expand(
+        [
+            ((1, 2, 3), (4, 2, 3), (8, 2, 3), (2, 2), "constant", 1.0),
+            ((2, 1, 4), (2, 3, 4), (2, 6, 4), (1, 1, 2, 0), "constant", None),
+            ((1, 3, 4, 4), (2, 3, 6, 6), (4, 3, 8, 8), (2, 1, 1, 2), "reflect", None),
+            ((1, 1, 3), (2, 4, 3), (3, 8, 3), (2, 1, 1, 2), "replicate", None),
+            ((1, 2, 3, 4), (2, 2, 5, 4), (3, 2, 8, 4), (1, 0, 2, 1), "circular", None),
+        ]
+    )
+    def test_pad_dynamic_shape(self, min_shape, opt_shape, max_shape, pad, mode, value):
+        class TestModule(torch.nn.Module):
+            def forward(self, input):
+                return torch.ops.aten.pad.default(input, pad, mode, value)
+
+        input_specs = [
+            Input(
+                min_shape=min_shape,
+                opt_shape=opt_shape,
+                max_shape=max_shape,
+                dtype=torch.float32,
+            ),
+        ]
+        self.run_test_with_dynamic_shape(
+            TestModule(),
+            input_specs,
+        )
+
 
 if __name__ == "__main__":
     run_tests()
@@ -1,7 +1,11 @@
+import tensorrt as trt
 import torch
 import torch.nn as nn
 from parameterized import parameterized
 from torch.testing._internal.common_utils import run_tests
+from torch_tensorrt import Input
+from torch_tensorrt.dynamo import CompilationSettings
+from torch_tensorrt.dynamo.conversion import TRTInterpreter
 
 from .harness import DispatchTestCase
 
@@ -39,6 +43,52 @@ class TestSymSizeConverter(DispatchTestCase):
             inputs,
         )
 
+    def test_sym_size_arithmetic_static(self):
+        class SizeArithmetic(nn.Module):
+            def forward(self, x):
+                batch = torch.ops.aten.sym_size.int(x, 0)
+                channels = torch.ops.aten.sym_size.int(x, 1)
+                rows = batch * channels // 2
+                return torch.ops.aten.reshape.default(x, [rows, -1])
+
+        inputs = [torch.randn(4, 6, 5)]
+        self.run_test(SizeArithmetic(), inputs)
+
+        mod = self.generate_graph(
+            SizeArithmetic(), inputs, use_dynamo_tracer=False, enable_passes=False
+        )
+        interp = TRTInterpreter(
+            mod,
+            [Input.from_tensor(i) for i in inputs],
+            compilation_settings=CompilationSettings(),
+        )
+        interp.run()
+
+        # The sizes, their product and quotient are evaluated, leaving only the reshape
+        self.assertEqual(interp.folded_nodes, 4)
+        self.assertEqual(interp.ctx.net.num_layers, 1)
+        for i in range(interp.ctx.net.num_layers):
+            self.assertNotEqual(interp.ctx.net.get_layer(i).type, trt.LayerType.SHAPE)
+
+    def test_sym_size_arithmetic_dynamic(self):
+        class SizeArithmetic(nn.Module):
+            def forward(self, x):
+                batch = torch.ops.aten.sym_size.int(x, 0)
+                channels = torch.ops.aten.sym_size.int(x, 1)
+                rows = batch * channels // 2
+                return torch.ops.aten.reshape.default(x, [rows, -1])
+
+        # Only the dynamic batch dimension requires a shape layer
+        input_specs = [
+            Input(
+                min_shape=(2, 6, 5),
+                opt_shape=(4, 6, 5),
+                max_shape=(8, 6, 5),
+                dtype=torch.float32,
+            ),
+        ]
+        self.run_test_with_dynamic_shape(SizeArithmetic(), input_specs)
+
 
 if __name__ == "__main__":
     run_tests()
@@ -1,5 +1,8 @@
+import io
+import logging
 import sys
 import unittest
+from unittest import mock
 
 import torch
 from torch.testing._internal.common_utils import TestCase, run_tests
@@ -570,5 +573,433 @@ class TestLowerViewToReshape(TestCase):
         torch._dynamo.reset()
 
 
+class TestRemoveCommonSubexpressions(TestCase):
+    def test_remove_common_subexpressions(self):
+        from torch_tensorrt.dynamo.lowering.passes import remove_common_subexpressions
+
+        class DuplicateOps(torch.nn.Module):
+            def forward(self, x, y):
+                a = torch.ops.aten.permute.default(x, [1, 0])
+                b = torch.ops.aten.permute.default(x, [1, 0])
+                c = torch.ops.aten.expand.default(y, [4, 4])
+                d = torch.ops.aten.expand.default(y, [4, 4])
+                e = torch.ops.aten.permute.default(x, [0, 1])
+                return a + c, b + d, e
+
+        fx_graph = torch.fx.symbolic_trace(DuplicateOps())
+        inputs = [torch.rand(4, 4), torch.rand(4)]
+        reference = fx_graph(*inputs)
+
+        with self.assertLogs(
+            "torch_tensorrt.dynamo.lowering.passes.remove_common_subexpressions",
+            level="INFO",
+        ) as logs:
+            lowered = remove_common_subexpressions(fx_graph, inputs)
+        targets = [node.target for node in lowered.graph.nodes]
+
+        self.assertEqual(targets.count(torch.ops.aten.permute.default), 2)
+        self.assertEqual(targets.count(torch.ops.aten.expand.default), 1)
+        self.assertEqual(len([t for t in targets if "add" in str(t)]), 1)
+        self.assertIn("Removed 3 common subexpression node(s)", "".join(logs.output))
+        torch.testing.assert_close(lowered(*inputs), reference)
+
+    def test_remove_common_subexpressions_respects_impurity(self):
+        from torch_tensorrt.dynamo.lowering.passes import remove_common_subexpressions
+
+        class RandomAndInplace(torch.nn.Module):
+            def forward(self, x):
+                a = torch.ops.aten.rand_like.default(x)
+                b = torch.ops.aten.rand_like.default(x)
+                torch.ops.aten.add_.Tensor(x, a)
+                torch.ops.aten.add_.Tensor(x, a)
+                return a, b, x
+
+        fx_graph = torch.fx.symbolic_trace(RandomAndInplace())
+        lowered = remove_common_subexpressions(fx_graph, [torch.rand(4)])
+        targets = [node.target for node in lowered.graph.nodes]
+
+        self.assertEqual(targets.count(torch.ops.aten.rand_like.default), 2)
+        self.assertEqual(targets.count(torch.ops.aten.add_.Tensor), 2)
+
+    def test_remove_common_subexpressions_torch_executed_ops(self):
+        from torch_tensorrt.dynamo.conversion._ConverterRegistry import (
+            DYNAMO_CONVERTERS,
+        )
+        from torch_tensorrt.dynamo.lowering.passes import remove_common_subexpressions
+
+        class DuplicateOps(torch.nn.Module):
+            def forward(self, x):
+                a = torch.ops.aten.abs.default(x)
+                b = torch.ops.aten.abs.default(x)
+                c = torch.ops.aten.neg.default(x)
+                d = torch.ops.aten.neg.default(x)
+                return a, b, c, d
+
+        fx_graph = torch.fx.symbolic_trace(DuplicateOps())
+        DYNAMO_CONVERTERS.set_disallowed_targets({"torch.ops.aten.abs.default"})
+        try:
+            lowered = remove_common_subexpressions(fx_graph, [torch.rand(4)])
+        finally:
+            DYNAMO_CONVERTERS.set_disallowed_targets(set())
+        targets = [node.target for node in lowered.graph.nodes]
+
+        self.assertEqual(targets.count(torch.ops.aten.abs.default), 2)
+        self.assertEqual(targets.count(torch.ops.aten.neg.default), 1)
+
+
+class TestFuseSiblingLinear(TestCase):
+    def _lower(self, model, inputs):
+        from torch_tensorrt.dynamo.lowering.passes import (
+            fuse_sibling_linear,
+            lower_linear,
+        )
+
+        gm = torch.export.export(model, tuple(inputs)).run_decompositions().module()
+        gm = lower_linear(gm, inputs)
+        return fuse_sibling_linear(gm, inputs)
+
+    def _count(self, gm, target):
+        return len([node for node in gm.graph.nodes if node.target == target])
+
+    def test_fuse_qkv_projections(self):
+        class QKV(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.q = torch.nn.Linear(32, 32)
+                self.k = torch.nn.Linear(32, 16)
+                self.v = torch.nn.Linear(32, 16)
+
+            def forward(self, x):
+                return self.q(x) * 2, self.k(x) + self.v(x)
+
+        model = QKV().eval()
+        inputs = [torch.rand(8, 32)]
+        lowered = self._lower(model, inputs)
+
+        self.assertEqual(self._count(lowered, torch.ops.aten.linear.default), 1)
+        self.assertEqual(
+            self._count(lowered, torch.ops.aten.split_with_sizes.default), 1
+        )
+        self.assertEqual(len(list(lowered.parameters())), 2)
+        torch.testing.assert_close(lowered(*inputs), model(*inputs))
+
+        # Later passes read the shapes of the fused nodes from their metadata
+        for node in lowered.graph.nodes:
+            if node.target == torch.ops.aten.linear.default:
+                self.assertEqual(node.meta["val"].shape, (8, 64))
+            elif node.target == torch.ops.aten.split_with_sizes.default:
+                self.assertEqual(
+                    [val.shape for val in node.meta["val"]],
+                    [(8, 32), (8, 16), (8, 16)],
+                )
+
+    def test_fuse_without_bias_and_incompatible_siblings(self):
+        class Gates(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.gate = torch.nn.Linear(32, 64, bias=False)
+                self.up = torch.nn.Linear(32, 64, bias=False)
+                self.proj = torch.nn.Linear(32, 64)
+                self.down = torch.nn.Linear(64, 32)
+
+            def forward(self, x):
+                out = torch.nn.functional.silu(self.gate(x)) * self.up(x)
+                return self.down(out + self.proj(x))
+
+        model = Gates().eval()
+        inputs = [torch.rand(8, 32)]
+        lowered = self._lower(model, inputs)
+
+        # Only the bias-free gate and up projections share a fused GEMM
+        self.assertEqual(self._count(lowered, torch.ops.aten.linear.default), 3)
+        self.assertEqual(
+            self._count(lowered, torch.ops.aten.split_with_sizes.default), 1
+        )
+        torch.testing.assert_close(lowered(*inputs), model(*inputs))
+
+
+class TestCanonicalizeLayoutChains(TestCase):
+    def _lower(self, model, inputs):
+        from torch_tensorrt.dynamo.lowering.passes import (
+            canonicalize_layout_chains,
+            view_to_reshape,
+        )
+
+        gm = torch.export.export(model, tuple(inputs)).run_decompositions().module()
+        gm = view_to_reshape(gm, inputs)
+        return canonicalize_layout_chains(gm, inputs)
+
+    def _layout_targets(self, gm):
+        return [
+            node.target
+            for node in gm.graph.nodes
+            if node.target
+            in (torch.ops.aten.reshape.default, torch.ops.aten.permute.default)
+        ]
+
+    def test_cancelling_chain(self):
+        class Cancelling(torch.nn.Module):
+            def forward(self, x):
+                x = x + 1
+                y = x.reshape(2, 8, 4, 16).permute(0, 2, 1, 3)
+                return y.permute(0, 2, 1, 3).reshape(2, 8, 64) * 2
+
+        model = Cancelling()
+        inputs = [torch.rand(2, 8, 64)]
+        with self.assertLogs(
+            "torch_tensorrt.dynamo.lowering.passes.canonicalize_layout_chains",
+            level="INFO",
+        ) as logs:
+            lowered = self._lower(model, inputs)
+
+        self.assertEqual(len(self._layout_targets(lowered)), 0)
+        self.assertIn("reducing 4 layout operators to 0", "".join(logs.output))
+        torch.testing.assert_close(lowered(*inputs), model(*inputs))
+
+    def test_composed_chain(self):
+        class HeadSplit(torch.nn.Module):
+            def forward(self, x):
+                x = x.view(2, 8, 4, 16).permute(0, 2, 1, 3).transpose(2, 3)
+                return x.reshape(2, 4, 16, 8).permute(0, 1, 3, 2)
+
+        model = HeadSplit()
+        inputs = [torch.rand(2, 8, 64)]
+        lowered = self._lower(model, inputs)
+
+        self.assertEqual(
+            self._layout_targets(lowered),
+            [torch.ops.aten.reshape.default, torch.ops.aten.permute.default],
+        )
+        torch.testing.assert_close(lowered(*inputs), model(*inputs))
+
+        # The inserted layout nodes carry the fake tensors of their outputs
+        expected_shapes = [(2, 8, 4, 16), (2, 4, 8, 16)]
+        for node in lowered.graph.nodes:
+            if node.target in (
+                torch.ops.aten.reshape.default,
+                torch.ops.aten.permute.default,
+            ):
+                self.assertEqual(node.meta["val"].shape, expected_shapes.pop(0))
+
+    def test_large_chain(self):
+        class LargeHeadMerge(torch.nn.Module):
+            def forward(self, x):
+                x = torch.ops.aten.permute.default(x, [0, 2, 1, 3])
+                x = torch.ops.aten.reshape.default(x, [16, 1024, 2048])
+                x = torch.ops.aten.reshape.default(x, [16, 1024, 16, 128])
+                return torch.ops.aten.permute.default(x, [0, 2, 1, 3]) * 2
+
+        # Chains are composed from the shapes alone, regardless of the tensor size
+        model = LargeHeadMerge()
+        gm = torch.fx.symbolic_trace(model)
+        with torch._subclasses.FakeTensorMode() as fake_mode:
+            fake_input = torch.empty(16, 16, 1024, 128)
+        torch.fx.passes.fake_tensor_prop.FakeTensorProp(gm, fake_mode).propagate(
+            fake_input
+        )
+
+        from torch_tensorrt.dynamo.lowering.passes import canonicalize_layout_chains
+
+        self.assertEqual(len(self._layout_targets(gm)), 4)
+        lowered = canonicalize_layout_chains(gm, [fake_input])
+        self.assertEqual(len(self._layout_targets(lowered)), 0)
+
+    def test_shared_intermediate_not_composed(self):
+        class SharedIntermediate(torch.nn.Module):
+            def forward(self, x):
+                y = x.permute(1, 0)
+                return y.permute(1, 0) + 1, y
+
+        model = SharedIntermediate()
+        inputs = [torch.rand(4, 8)]
+        lowered = self._lower(model, inputs)
+
+        self.assertEqual(len(self._layout_targets(lowered)), 2)
+        torch.testing.assert_close(lowered(*inputs), model(*inputs))
+
+
+class TestRemoveRedundantCasts(TestCase):
+    def _lower(self, model, inputs):
+        from torch_tensorrt.dynamo.lowering.passes import remove_redundant_casts
+
+        gm = torch.export.export(model, tuple(inputs)).run_decompositions().module()
+        return remove_redundant_casts(gm, inputs)
+
+    def _casts(self, gm):
+        return [
+            node
+            for node in gm.graph.nodes
+            if node.target
+            in (
+                torch.ops.aten._to_copy.default,
+                torch.ops.prims.convert_element_type.default,
+            )
+        ]
+
+    def test_remove_cast_ping_pong(self):
+        class PingPong(torch.nn.Module):
+            def forward(self, x, y):
+                widened = x.to(torch.int64).to(torch.int32)
+                mask = (y > 0).to(torch.float32).to(torch.bool)
+                half = y.to(torch.float16).to(torch.float32)
+                return widened + 1, mask, half
+
+        model = PingPong().eval()
+        inputs = [torch.randint(-5, 5, (4, 8), dtype=torch.int32), torch.randn(4, 8)]
+        lowered = self._lower(model, inputs)
+
+        # Only the float16 round trip loses information and is kept
+        casts = self._casts(lowered)
+        self.assertEqual(len(casts), 2)
+        self.assertEqual(
+            {node.kwargs.get("dtype") for node in casts},
+            {torch.float16, torch.float32},
+        )
+        for out, ref in zip(lowered(*inputs), model(*inputs)):
+            torch.testing.assert_close(out, ref)
+
+    def test_collapse_cast_chain(self):
+        class Chain(torch.nn.Module):
+            def forward(self, x):
+                return x.to(torch.int16).to(torch.int64).to(torch.float32) * 2
+
+        model = Chain().eval()
+        inputs = [torch.randint(-100, 100, (16,), dtype=torch.int8)]
+        lowered = self._lower(model, inputs)
+
+        # Every intermediate type is exact, so a single cast of the input remains
+        casts = self._casts(lowered)
+        self.assertEqual(len(casts), 1)
+        self.assertEqual(casts[0].args[0].op, "placeholder")
+        torch.testing.assert_close(lowered(*inputs), model(*inputs))
+
+    def test_exact_casts(self):
+        from torch_tensorrt.dynamo.lowering.passes.remove_redundant_casts import (
+            is_exact_cast,
+        )
+
+        for src, dst, exact in (
+            (torch.bool, torch.float16, True),
+            (torch.int32, torch.int64, True),
+            (torch.int64, torch.int32, False),
+            (torch.uint8, torch.int8, False),
+            (torch.int8, torch.float16, True),
+            (torch.int32, torch.float32, False),
+            (torch.int32, torch.float64, True),
+            (torch.float16, torch.float32, True),
+            (torch.float16, torch.bfloat16, False),
+            (torch.bfloat16, torch.float16, False),
+            (torch.float32, torch.int64, False),
+            (torch.float32, torch.bool, False),
+        ):
+            self.assertEqual(is_exact_cast(src, dst), exact, msg=f"{src} -> {dst}")
+
+
+class TestFusePadIntoConvolution(TestCase):
+    def _lower(self, model, inputs):
+        from torch_tensorrt.dynamo.lowering.passes.fuse_pad_into_convolution import (
+            fuse_pad_into_convolution,
+        )
+
+        gm = torch.export.export(model, tuple(inputs)).run_decompositions().module()
+        return fuse_pad_into_convolution(gm, inputs)
+
+    def _count(self, gm, target):
+        return len([node for node in gm.graph.nodes if node.target == target])
+
+    def test_fuse_symmetric_zero_pad(self):
+        class PadConv(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.conv = torch.nn.Conv2d(3, 4, 3, padding=1)
+
+            def forward(self, x):
+                return self.conv(torch.nn.functional.pad(x, (2, 2, 1, 1)))
+
+        model = PadConv().eval()
+        inputs = [torch.randn(2, 3, 8, 8)]
+        lowered = self._lower(model, inputs)
+
+        self.assertEqual(
+            self._count(lowered, torch.ops.aten.constant_pad_nd.default), 0
+        )
+        (conv,) = [
+            node
+            for node in lowered.graph.nodes
+            if node.target == torch.ops.aten.convolution.default
+        ]
+        self.assertEqual(list(conv.args[4]), [2, 3])
+        torch.testing.assert_close(lowered(*inputs), model(*inputs))
+
+    def test_keep_unfusable_pads(self):
+        class PadConvs(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.conv = torch.nn.Conv2d(3, 4, 3)
+
+            def forward(self, x):
+                asymmetric = self.conv(torch.nn.functional.pad(x, (1, 2, 1, 1)))
+                nonzero = self.conv(torch.nn.functional.pad(x, (1, 1), value=1.0))
+                reflect = self.conv(
+                    torch.nn.functional.pad(x, (1, 1, 1, 1), mode="reflect")
+                )
+                channels = self.conv(
+                    torch.nn.functional.pad(x, (0, 0, 0, 0, 1, 1))[:, 1:-1]
+                )
+                return asymmetric, nonzero, reflect, channels
+
+        model = PadConvs().eval()
+        inputs = [torch.randn(2, 3, 8, 8)]
+        lowered = self._lower(model, inputs)
+
+        for node in lowered.graph.nodes:
+            if node.target == torch.ops.aten.convolution.default:
+                self.assertEqual(list(node.args[4]), [0, 0])
+        for out, ref in zip(lowered(*inputs), model(*inputs)):
+            torch.testing.assert_close(out, ref)
+
+
+class TestLazyLogging(TestCase):
+    def _count_graph_formatting(self, level):
+        from torch_tensorrt.dynamo.lowering import apply_lowering_passes
+
+        class ViewsAndDuplicates(torch.nn.Module):
+            def forward(self, x):
+                y = torch.relu(x).view(-1)
+                z = torch.relu(x).view(-1)
+                return y + z
+
+        inputs = [torch.randn(4, 8)]
+        gm = torch.export.export(ViewsAndDuplicates(), tuple(inputs)).module()
+
+        logger = logging.getLogger("torch_tensorrt.dynamo")
+        handler = logging.StreamHandler(io.StringIO())
+        previous_level = logger.level
+        logger.addHandler(handler)
+        logger.setLevel(level)
+
+        graph_str = torch.fx.Graph.__str__
+        try:
+            with mock.patch.object(
+                torch.fx.Graph, "__str__", autospec=True, side_effect=graph_str
+            ) as mock_graph_str:
+                apply_lowering_passes(gm, inputs)
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(previous_level)
+
+        return mock_graph_str.call_count
+
+    def test_no_graph_formatting_at_info_level(self):
+        self.assertEqual(
+            self._count_graph_formatting(logging.INFO),
+            0,
+            "Graphs were formatted although debug logging is disabled",
+        )
+
+    def test_graph_formatting_at_debug_level(self):
+        self.assertGreater(self._count_graph_formatting(logging.DEBUG), 0)
+
+
 if __name__ == "__main__":
     run_tests()
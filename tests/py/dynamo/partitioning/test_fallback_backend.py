@@ -0,0 +1,163 @@
+from copy import deepcopy
+
+import torch
+import torch_tensorrt
+from torch._dynamo.backends.registry import register_backend
+from torch._dynamo.eval_frame import OptimizedModule
+from torch.fx.experimental.proxy_tensor import make_fx
+from torch.testing._internal.common_utils import TestCase, run_tests
+from torch_tensorrt.dynamo import partitioning
+from torch_tensorrt.dynamo._compiler import compile_module
+from torch_tensorrt.dynamo._settings import CompilationSettings
+
+# Graphs compiled by the recording fallback backend below
+RECORDED_GRAPHS = []
+
+
+@register_backend(name="torch_tensorrt_test_recorder")
+def recording_backend(gm, example_inputs):
+    RECORDED_GRAPHS.append(gm)
+    return gm.forward
+
+
+class PartiallySupportedMultiOp(torch.nn.Module):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+    def forward(self, x, y):
+        pow_ = torch.ops.aten.pow.Tensor_Scalar(x, 2)
+        sum_ = torch.ops.aten.sum.default(pow_)
+        mul_ = torch.ops.aten.mul.Tensor(sum_, y)
+        add_ = torch.ops.aten.add.Tensor(mul_, y)
+        sub_ = torch.ops.aten.sub.Tensor(add_, x)
+        return torch.ops.aten.relu.default(sub_)
+
+
+class TestFallbackBackend(TestCase):
+    def setUp(self):
+        RECORDED_GRAPHS.clear()
+        torch._dynamo.reset()
+
+    def test_fallback_submodule_inductor_cpu(self):
+        fx_graph = torch.fx.symbolic_trace(PartiallySupportedMultiOp())
+        partitioned_graph, _ = partitioning.fast_partition(
+            deepcopy(fx_graph),
+            min_block_size=2,
+            torch_executed_ops={"torch.ops.aten.add.Tensor"},
+        )
+
+        inputs = [torch.randn(4, 8), torch.randn(4, 8)]
+        reference = partitioned_graph(*inputs)
+
+        fallback_names = [
+            name
+            for name, _ in partitioned_graph.named_children()
+            if "_run_on_acc" not in name
+        ]
+        self.assertGreater(
+            len(fallback_names),
+            0,
+            "Expected at least one Torch-executed segment",
+        )
+
+        for name in fallback_names:
+            setattr(
+                partitioned_graph,
+                name,
+                partitioning.compile_fallback_submodule(
+                    getattr(partitioned_graph, name),
+                    "inductor",
+                    {"max_autotune": False},
+                ),
+            )
+            self.assertIsInstance(getattr(partitioned_graph, name), OptimizedModule)
+
+        torch.testing.assert_close(partitioned_graph(*inputs), reference)
+        torch._dynamo.reset()
+
+    def test_fallback_submodule_recursive_backend(self):
+        class AddOne(torch.nn.Module):
+            def forward(self, x):
+                return torch.ops.aten.add.Tensor(x, 1)
+
+        fx_graph = torch.fx.symbolic_trace(AddOne())
+
+        with self.assertRaises(ValueError):
+            partitioning.compile_fallback_submodule(fx_graph, "torch_tensorrt")
+
+    def test_compile_fallback_backend(self):
+        model = PartiallySupportedMultiOp().eval().cuda()
+        inputs = [torch.randn(4, 8).cuda(), torch.randn(4, 8).cuda()]
+        exported_program = torch.export.export(model, tuple(inputs))
+
+        trt_gm = torch_tensorrt.dynamo.compile(
+            exported_program,
+            inputs,
+            min_block_size=1,
+            torch_executed_ops={"torch.ops.aten.add.Tensor"},
+            fallback_backend="torch_tensorrt_test_recorder",
+        )
+
+        fallback_modules = [
+            module
+            for name, module in trt_gm.named_children()
+            if "_run_on_acc" not in name
+        ]
+        self.assertGreater(
+            len(fallback_modules),
+            0,
+            "Expected at least one Torch-executed segment",
+        )
+        for module in fallback_modules:
+            self.assertIsInstance(module, OptimizedModule)
+
+        torch.testing.assert_close(
+            trt_gm(*inputs), model(*inputs), rtol=1e-3, atol=1e-3
+        )
+
+        # The fallback backend compiles the Torch-executed segment on its first run
+        self.assertGreater(len(RECORDED_GRAPHS), 0)
+        self.assertTrue(
+            any(
+                node.target == torch.ops.aten.add.Tensor
+                for gm in RECORDED_GRAPHS
+                for node in gm.graph.nodes
+            ),
+            "Expected the Torch-executed add to be compiled by the fallback backend",
+        )
+        torch._dynamo.reset()
+
+    def test_compile_module_fallback_backend_global_partitioner(self):
+        inputs = [torch.randn(4, 8).cuda(), torch.randn(4, 8).cuda()]
+        fx_graph = make_fx(PartiallySupportedMultiOp())(*inputs)
+        settings = CompilationSettings(
+            min_block_size=1,
+            torch_executed_ops={"torch.ops.aten.add.Tensor"},
+            use_fast_partitioner=False,
+            fallback_backend="torch_tensorrt_test_recorder",
+            dryrun=True,
+        )
+
+        with self.assertLogs(
+            "torch_tensorrt.dynamo._compiler", level="WARNING"
+        ) as logs:
+            partitioned_graph = compile_module(
+                fx_graph,
+                [torch_tensorrt.Input.from_tensor(t) for t in inputs],
+                settings,
+            )
+
+        self.assertTrue(
+            any("global partitioner" in message for message in logs.output),
+            "Expected a warning that the fallback backend is skipped",
+        )
+
+        # The global partitioner leaves the Torch-executed operators in the top-level graph
+        for module in partitioned_graph.modules():
+            self.assertNotIsInstance(module, OptimizedModule)
+        partitioned_graph(*inputs)
+        self.assertEqual(len(RECORDED_GRAPHS), 0)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -90,6 +90,49 @@ class TestEnableTRTFlags(TestCase):
 
         torch._dynamo.reset()
 
+    def test_channels_last(self):
+        class ConvRelu(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.conv = torch.nn.Conv2d(3, 8, 3, padding=1)
+
+            def forward(self, x):
+                return torch.relu(self.conv(x))
+
+        model = ConvRelu().eval().cuda().to(memory_format=torch.channels_last)
+        inputs = [
+            torch.rand((2, 3, 16, 16)).cuda().to(memory_format=torch.channels_last)
+        ]
+
+        for use_python_runtime in (True, False):
+            optimized_model = torch_tensorrt.compile(
+                model,
+                "dynamo",
+                inputs,
+                min_block_size=1,
+                pass_through_build_failures=True,
+                use_python_runtime=use_python_runtime,
+                channels_last=True,
+            )
+
+            optimized_model_results = optimized_model(*inputs)
+            torch_model_results = model(*inputs)
+
+            # Channels-last outputs are returned without reformatting them
+            self.assertTrue(
+                optimized_model_results.is_contiguous(memory_format=torch.channels_last)
+            )
+            max_diff = float(
+                torch.max(torch.abs(optimized_model_results - torch_model_results))
+            )
+            self.assertAlmostEqual(
+                max_diff,
+                0,
+                DECIMALS_OF_AGREEMENT,
+                msg="ConvRelu TRT outputs don't match with the original model.",
+            )
+            torch._dynamo.reset()
+
 
 if __name__ == "__main__":
     run_tests()
@@ -1,8 +1,17 @@
+import threading
 import unittest
 
+import tensorrt as trt
 import torch
 import torch_tensorrt
+from torch_tensorrt.dynamo.conversion.converter_utils import (
+    count_boundary_reformats,
+    get_tensor_format,
+    get_traced_format,
+)
 from torch_tensorrt.dynamo.utils import (
+    get_torch_inputs,
+    input_materialization_cache,
     prepare_inputs,
     to_torch_device,
     to_torch_tensorrt_device,
@@ -89,5 +98,127 @@ class TestPrepareInputs(unittest.TestCase):
         )
 
 
+class TestGetTorchInputs(unittest.TestCase):
+    def test_inputs_materialized_once(self):
+        static_inputs = [torch_tensorrt.Input(shape=(4, 3))]
+        dynamic_inputs = [
+            torch_tensorrt.Input(
+                min_shape=(1, 3), opt_shape=(4, 3), max_shape=(8, 3), name="x"
+            )
+        ]
+        device = torch.device("cuda:0")
+        with input_materialization_cache():
+            torch_inputs = get_torch_inputs(static_inputs, device)
+            self.assertIs(get_torch_inputs(static_inputs, device)[0], torch_inputs[0])
+
+            max_inputs = get_torch_inputs(dynamic_inputs, device, "max_shape")
+            self.assertEqual(tuple(max_inputs[0].shape), (8, 3))
+            self.assertIs(
+                get_torch_inputs(dynamic_inputs, device, "max_shape")[0], max_inputs[0]
+            )
+
+            # Modes and devices are materialized separately
+            min_inputs = get_torch_inputs(dynamic_inputs, device, "min_shape")
+            self.assertEqual(tuple(min_inputs[0].shape), (1, 3))
+            cpu_inputs = get_torch_inputs(static_inputs, "cpu")
+            self.assertEqual(cpu_inputs[0].device, torch.device("cpu"))
+
+        # Tensors are released once the compilation finishes
+        self.assertIsNot(
+            get_torch_inputs(dynamic_inputs, device, "max_shape")[0], max_inputs[0]
+        )
+
+    def test_nested_caches_are_shared(self):
+        inputs = [
+            torch_tensorrt.Input(
+                min_shape=(1, 3), opt_shape=(4, 3), max_shape=(8, 3), name="x"
+            )
+        ]
+        device = torch.device("cuda:0")
+        with input_materialization_cache():
+            torch_inputs = get_torch_inputs(inputs, device, "opt_shape")
+            with input_materialization_cache():
+                self.assertIs(
+                    get_torch_inputs(inputs, device, "opt_shape")[0], torch_inputs[0]
+                )
+            self.assertIs(
+                get_torch_inputs(inputs, device, "opt_shape")[0], torch_inputs[0]
+            )
+
+    def test_caches_are_not_shared_across_threads(self):
+        inputs = [
+            torch_tensorrt.Input(
+                min_shape=(1, 3), opt_shape=(4, 3), max_shape=(8, 3), name="x"
+            )
+        ]
+        device = torch.device("cuda:0")
+        thread_inputs = []
+
+        def compile_in_thread():
+            with input_materialization_cache():
+                thread_inputs.extend(get_torch_inputs(inputs, device, "opt_shape"))
+
+        with input_materialization_cache():
+            torch_inputs = get_torch_inputs(inputs, device, "opt_shape")
+            thread = threading.Thread(target=compile_in_thread)
+            thread.start()
+            thread.join()
+
+            self.assertIsNot(thread_inputs[0], torch_inputs[0])
+            self.assertIs(
+                get_torch_inputs(inputs, device, "opt_shape")[0], torch_inputs[0]
+            )
+
+
+class TestTensorFormats(unittest.TestCase):
+    def test_traced_format(self):
+        x = torch.rand((2, 3, 4, 5))
+        self.assertEqual(get_traced_format(x), trt.TensorFormat.LINEAR)
+        self.assertEqual(
+            get_traced_format(x.to(memory_format=torch.channels_last)),
+            trt.TensorFormat.HWC,
+        )
+        self.assertEqual(
+            get_traced_format(torch.rand((2, 3, 4, 5, 6)).permute(0, 2, 3, 4, 1)),
+            None,
+        )
+        self.assertEqual(
+            get_traced_format(
+                torch.rand((2, 3, 4, 5, 6)).to(memory_format=torch.channels_last_3d)
+            ),
+            trt.TensorFormat.DHWC,
+        )
+        # Single channel tensors are in both formats
+        self.assertEqual(get_traced_format(torch.rand((2, 1, 4, 5))), None)
+
+    def test_tensor_format(self):
+        x = torch.rand((2, 3, 4, 5)).to(memory_format=torch.channels_last)
+        self.assertEqual(get_tensor_format(x, False), trt.TensorFormat.LINEAR)
+        self.assertEqual(get_tensor_format(x, True), trt.TensorFormat.HWC)
+        self.assertEqual(
+            get_tensor_format(x.contiguous(), True), trt.TensorFormat.LINEAR
+        )
+        self.assertEqual(get_tensor_format(x.int(), True), trt.TensorFormat.LINEAR)
+        self.assertEqual(
+            get_tensor_format(torch.rand((2, 3)), True), trt.TensorFormat.LINEAR
+        )
+
+    def test_count_boundary_reformats(self):
+        class ScaleAndIndex(torch.nn.Module):
+            def forward(self, x, y):
+                return x * 2 + 1, y + 1
+
+        inputs = (
+            torch.rand((2, 3, 4, 5)).to(memory_format=torch.channels_last),
+            torch.randint(0, 10, (2, 3, 4, 5)).to(memory_format=torch.channels_last),
+        )
+        gm = torch.export.export(ScaleAndIndex(), inputs).module()
+
+        # Every input and output is traced in channels-last format, but only the
+        # floating point tensors are bound in it in channels-last mode
+        self.assertEqual(count_boundary_reformats(gm, False), 4)
+        self.assertEqual(count_boundary_reformats(gm, True), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
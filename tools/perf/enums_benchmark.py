@@ -0,0 +1,134 @@
+"""Benchmarks the conversions of the Torch-TensorRT enums to and from other frameworks
+
+Times each conversion of dtype, DeviceType and EngineCapability over all the values it
+supports, then constructs the TensorRT network of a large graph of casts and elementwise
+operators and reports the share of the conversion time spent in the enum conversions.
+
+Usage:
+    python enums_benchmark.py --layers 500 --iterations 100000
+"""
+
+import argparse
+import cProfile
+import pstats
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import tensorrt as trt
+import torch
+from torch.fx.experimental.proxy_tensor import make_fx
+from torch_tensorrt import Input
+from torch_tensorrt._enums import DeviceType, EngineCapability, dtype
+from torch_tensorrt.dynamo._settings import CompilationSettings
+from torch_tensorrt.dynamo.conversion import TRTInterpreter
+
+SUPPORTED_DTYPES = [
+    dtype.u8,
+    dtype.i8,
+    dtype.i32,
+    dtype.i64,
+    dtype.f16,
+    dtype.f32,
+    dtype.b,
+    dtype.bf16,
+]
+
+# Conversions to time, and the values each conversion is applied to
+CONVERSIONS: Dict[str, Tuple[Callable[[Any], Any], List[Any]]] = {
+    "dtype._from(torch.dtype)": (
+        dtype._from,
+        [d.to(torch.dtype) for d in SUPPORTED_DTYPES],
+    ),
+    "dtype._from(trt.DataType)": (
+        dtype._from,
+        [d.to(trt.DataType) for d in SUPPORTED_DTYPES],
+    ),
+    "dtype._from(np.dtype)": (
+        dtype._from,
+        [np.dtype(d.to(np.dtype)) for d in SUPPORTED_DTYPES if d != dtype.bf16],
+    ),
+    "dtype.to(torch.dtype)": (lambda d: d.to(torch.dtype), SUPPORTED_DTYPES),
+    "dtype.to(trt.DataType)": (lambda d: d.to(trt.DataType), SUPPORTED_DTYPES),
+    "dtype.__eq__(torch.dtype)": (
+        lambda t: dtype.bf16 == t,
+        [d.to(torch.dtype) for d in SUPPORTED_DTYPES],
+    ),
+    "DeviceType._from(trt.DeviceType)": (
+        DeviceType._from,
+        [trt.DeviceType.GPU, trt.DeviceType.DLA],
+    ),
+    "DeviceType.to(trt.DeviceType)": (
+        lambda d: d.to(trt.DeviceType),
+        [DeviceType.GPU, DeviceType.DLA],
+    ),
+    "EngineCapability._from(trt.EngineCapability)": (
+        EngineCapability._from,
+        [c.to(trt.EngineCapability) for c in EngineCapability],
+    ),
+    "EngineCapability.to(trt.EngineCapability)": (
+        lambda c: c.to(trt.EngineCapability),
+        list(EngineCapability),
+    ),
+}
+
+
+def cast_graph(num_layers: int) -> torch.fx.GraphModule:
+    """Traces an aten graph of num_layers layers of casts and elementwise operators"""
+
+    def layers(x: torch.Tensor) -> torch.Tensor:
+        for _ in range(num_layers):
+            y = (x.to(torch.float16) * 2).to(torch.float32)
+            x = torch.relu(x + y)
+        return x
+
+    return make_fx(layers)(torch.randn(8, 64))
+
+
+def construct_network(gm: torch.fx.GraphModule) -> None:
+    """Converts the graph to a TensorRT network, without building the engine"""
+    interpreter = TRTInterpreter(
+        gm,
+        [Input(shape=(8, 64), dtype=torch.float32)],
+        output_dtypes=[dtype.f32],
+        compilation_settings=CompilationSettings(),
+    )
+    torch.fx.Interpreter.run(interpreter)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layers", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=100000)
+    args = parser.parse_args()
+
+    for name, (convert, values) in CONVERSIONS.items():
+        elapsed = timeit.timeit(
+            lambda: [convert(value) for value in values],
+            number=args.iterations // len(values),
+        )
+        num_conversions = args.iterations // len(values) * len(values)
+        print(f"{name}: {num_conversions / elapsed / 1e6:.2f}M conversions/s")
+
+    gm = cast_graph(args.layers)
+    construct_network(gm)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    construct_network(gm)
+    profiler.disable()
+
+    stats = pstats.Stats(profiler)
+    enum_time = sum(
+        tottime
+        for (filename, _, _), (_, _, tottime, _, _) in stats.stats.items()  # type: ignore[attr-defined]
+        if filename.endswith("_enums.py")
+    )
+    print(
+        f"Network of {len(gm.graph.nodes)} nodes: {stats.total_tt * 1000:.1f} ms, "  # type: ignore[attr-defined]
+        f"of which {enum_time / stats.total_tt:.1%} in enum conversions"  # type: ignore[attr-defined]
+    )
+
+
+if __name__ == "__main__":
+    main()
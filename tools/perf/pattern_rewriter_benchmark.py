@@ -0,0 +1,113 @@
+"""Benchmarks the single-traversal PatternRewriter against per-pattern subgraph rewriting
+
+Builds a synthetic aten graph resembling an exported transformer encoder (decomposed
+linear layers and memory-efficient attention) and times the attention and linear
+lowering patterns with both engines.
+
+Usage:
+    python pattern_rewriter_benchmark.py --layers 48 --iterations 3
+"""
+
+import argparse
+import copy
+import functools
+import operator
+import timeit
+
+import torch
+from torch_tensorrt.dynamo.lowering.passes.lower_linear import linear_replacement
+from torch_tensorrt.dynamo.lowering.passes.lower_scaled_dot_product_attention import (
+    scaled_dot_product_attention_replacement,
+)
+from torch_tensorrt.fx.passes.pattern_rewriter import PatternRewriter
+
+
+def transformer_graph(num_layers: int) -> torch.fx.GraphModule:
+    """Constructs the aten graph of a transformer encoder with num_layers layers"""
+    graph = torch.fx.Graph()
+    x = graph.placeholder("x")
+    root = torch.nn.Module()
+
+    def linear(input: torch.fx.Node, name: str) -> torch.fx.Node:
+        root.register_parameter(
+            f"{name}_weight", torch.nn.Parameter(torch.empty(0), requires_grad=False)
+        )
+        root.register_parameter(
+            f"{name}_bias", torch.nn.Parameter(torch.empty(0), requires_grad=False)
+        )
+        weight = graph.get_attr(f"{name}_weight")
+        bias = graph.get_attr(f"{name}_bias")
+        weight_t = graph.call_function(torch.ops.aten.permute.default, (weight, [1, 0]))
+        return graph.call_function(
+            torch.ops.aten.addmm.default, (bias, input, weight_t)
+        )
+
+    for i in range(num_layers):
+        q = linear(x, f"layer{i}_q")
+        k = linear(x, f"layer{i}_k")
+        v = linear(x, f"layer{i}_v")
+        attention = graph.call_function(
+            torch.ops.aten._scaled_dot_product_efficient_attention.default,
+            (q, k, v, None, False),
+        )
+        out = graph.call_function(operator.getitem, (attention, 0))
+        out = linear(out, f"layer{i}_out")
+        out = graph.call_function(torch.ops.aten.add.Tensor, (out, x))
+        out = linear(
+            graph.call_function(torch.ops.aten.relu.default, (out,)), f"layer{i}_mlp"
+        )
+        x = graph.call_function(torch.ops.aten.add.Tensor, (out, x))
+
+    graph.output(x)
+    return torch.fx.GraphModule(root, graph)
+
+
+def rewrite_per_pattern(gm: torch.fx.GraphModule) -> int:
+    original_fns, replacement = scaled_dot_product_attention_replacement()
+    replaced = []
+    for original in original_fns:
+        replaced += torch.fx.subgraph_rewriter.replace_pattern_with_filters(
+            gm, original, replacement, ignore_literals=True
+        )
+    replaced += torch.fx.subgraph_rewriter.replace_pattern(gm, *linear_replacement())
+    return len(replaced)
+
+
+@functools.lru_cache(maxsize=None)
+def precompiled_rewriter() -> PatternRewriter:
+    original_fns, replacement = scaled_dot_product_attention_replacement()
+    rewriter = PatternRewriter()
+    for original in original_fns:
+        rewriter.register(original, replacement, ignore_literals=True)
+    rewriter.register(*linear_replacement())
+    return rewriter
+
+
+def rewrite_single_traversal(gm: torch.fx.GraphModule) -> int:
+    return len(precompiled_rewriter()(gm))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layers", type=int, default=48)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    gm = transformer_graph(args.layers)
+    print(f"Graph with {args.layers} layers and {len(gm.graph.nodes)} nodes")
+
+    for name, rewrite in (
+        ("subgraph_rewriter (per pattern)", rewrite_per_pattern),
+        ("PatternRewriter (single traversal)", rewrite_single_traversal),
+    ):
+        graphs = [copy.deepcopy(gm) for _ in range(args.iterations)]
+        replaced = rewrite(copy.deepcopy(gm))
+        elapsed = timeit.timeit(lambda: rewrite(graphs.pop()), number=args.iterations)
+        print(
+            f"{name}: {replaced} replacements, "
+            f"{elapsed / args.iterations * 1000:.1f} ms per graph"
+        )
+
+
+if __name__ == "__main__":
+    main()